@@ -15,6 +15,7 @@ from core.analysis.known_enemy_townhall_analyzer import KnownEnemyTownhallAnalyz
 from core.analysis.threat_map_analyzer import ThreatMapAnalyzer
 from core.analysis.units_analyzer import UnitsAnalyzer
 from core.analysis.base_threat_analyzer import BaseThreatAnalyzer
+from core.analysis.base_registry_analyzer import BaseRegistryAnalyzer
 
 # --- Task Configuration ---
 
@@ -22,6 +23,7 @@ from core.analysis.base_threat_analyzer import BaseThreatAnalyzer
 # For foundational tasks that other analyzers depend on.
 PRE_ANALYSIS_TASK_CLASSES: List[Type[AnalysisTask]] = [
     UnitsAnalyzer,
+    BaseRegistryAnalyzer,
 ]
 
 # HIGH_FREQUENCY: Run one task per frame in a round-robin cycle.
@@ -0,0 +1,35 @@
+from typing import TYPE_CHECKING
+
+from core.interfaces.analysis_task_abc import AnalysisTask
+from core.utilities.base_registry import BaseRegistry
+
+if TYPE_CHECKING:
+    from sc2.bot_ai import BotAI
+    from core.event_bus import EventBus
+    from core.game_analysis import GameAnalyzer
+
+
+class BaseRegistryAnalyzer(AnalysisTask):
+    """
+    A stateful task that owns the BaseRegistry. It indexes every expansion's
+    resources on the first frame and refreshes the tag map on every frame
+    after that, so managers can look up their bases' resources in O(1). The
+    known enemy townhalls mark the expansions the enemy holds.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.registry = BaseRegistry()
+
+    def subscribe_to_events(self, event_bus: "EventBus"):
+        """Townhall ownership follows construction and destruction events."""
+        self.registry.subscribe_to_events(event_bus)
+
+    def execute(self, analyzer: "GameAnalyzer", bot: "BotAI"):
+        if not self.registry.is_built:
+            self.registry.build(bot)
+        else:
+            self.registry.refresh(bot)
+        if analyzer.known_enemy_townhalls is not None:
+            self.registry.mark_enemy_townhalls(analyzer.known_enemy_townhalls)
+        analyzer.base_registry = self.registry
@@ -2,7 +2,8 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 from core.interfaces.analysis_task_abc import AnalysisTask
-from core.utilities.geometry import create_threat_map
+from core.utilities.geometry import create_layered_threat_maps, create_threat_map
+from core.utilities.retreat_field import RetreatField
 
 if TYPE_CHECKING:
     from sc2.bot_ai import BotAI
@@ -10,11 +11,39 @@ if TYPE_CHECKING:
 
 
 class ThreatMapAnalyzer(AnalysisTask):
-    """Generates and updates a 2D map representing enemy threat levels."""
+    """
+    Generates and updates a 2D map representing enemy threat levels, the
+    same split into threats to ground and to air units, and the retreat
+    field that points away from them. The version goes up only when the maps
+    actually change, so users of the maps know when to refresh what they
+    derived.
+    """
 
     def execute(self, analyzer: "GameAnalyzer", bot: "BotAI"):
         map_size = bot.game_info.map_size
         if bot.enemy_units.exists:
-            analyzer.threat_map = create_threat_map(bot.enemy_units, map_size)
+            threat = create_threat_map(bot.enemy_units, map_size)
+            ground, air = create_layered_threat_maps(bot.enemy_units, map_size)
         elif analyzer.threat_map is None:
-            analyzer.threat_map = np.zeros(map_size, dtype=np.float32)
+            threat = np.zeros(map_size, dtype=np.float32)
+            ground, air = threat, threat
+        else:
+            return
+        # Enemies standing still leave the maps as they were: keep the
+        # version, so routes and fields derived from them stay valid.
+        if (
+            _unchanged(analyzer.threat_map, threat)
+            and _unchanged(analyzer.ground_threat_map, ground)
+            and _unchanged(analyzer.air_threat_map, air)
+        ):
+            return
+        analyzer.threat_map = threat
+        analyzer.ground_threat_map, analyzer.air_threat_map = ground, air
+        analyzer.threat_map_version += 1
+
+        pathable = np.asarray(bot.game_info.pathing_grid.data_numpy).T != 0
+        analyzer.retreat_field = RetreatField(analyzer.threat_map, pathable)
+
+
+def _unchanged(old: "np.ndarray | None", new: np.ndarray) -> bool:
+    return old is not None and np.array_equal(old, new)
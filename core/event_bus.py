@@ -28,6 +28,7 @@ EVENT_TYPE_PRIORITIES = {
     # Normal Priority Events (Default)
     EventType.INFRA_BUILD_REQUEST: EVENT_PRIORITY_NORMAL,
     EventType.INFRA_BUILD_REQUEST_FAILED: EVENT_PRIORITY_NORMAL,
+    EventType.INFRA_CONSTRUCTION_STARTED: EVENT_PRIORITY_NORMAL,
     EventType.TACTICS_ENEMY_TECH_SCOUTED: EVENT_PRIORITY_NORMAL,
 }
 
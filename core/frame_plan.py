@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Dict, List, Set, Optional
 
 if TYPE_CHECKING:
     from sc2.ids.unit_typeid import UnitTypeId
+    from core.resource_ledger import ResourceLedger
     from sc2.ids.upgrade_id import UpgradeId
     from sc2.position import Point2
 
@@ -46,6 +47,8 @@ class FramePlan:
     def __init__(self):
         # --- High-Level Intentions (Set by Directors) ---
         self.resource_budget: ResourceBudget = ResourceBudget()
+        # The General's ledger; managers reserve resources through it.
+        self.resource_ledger: Optional["ResourceLedger"] = None
         self.army_stance: ArmyStance = ArmyStance.DEFENSIVE
         self.economic_stance: EconomicStance = EconomicStance.NORMAL
 
@@ -57,6 +60,9 @@ class FramePlan:
         # Defines the target count for each type of addon building.
         # e.g., {UnitTypeId.BARRACKSTECHLAB: 1, UnitTypeId.BARRACKSREACTOR: 2}
         self.addon_goal: Dict[UnitTypeId, int] = field(default_factory=dict)
+        # Production structures already given an order this frame (e.g., an
+        # addon), which the ProductionScheduler must leave alone.
+        self.busy_structure_tags: Set[int] = set()
 
         # --- Tactical Positions (Set by PositioningManager) ---
         self.defensive_position: Optional["Point2"] = None
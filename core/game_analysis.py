@@ -18,6 +18,8 @@ from core.analysis.analysis_configuration import (
 if TYPE_CHECKING:
     from sc2.bot_ai import BotAI
     from sc2.position import Point2
+    from core.utilities.base_registry import BaseRegistry
+    from core.utilities.retreat_field import RetreatField
 
 
 class GameAnalyzer:
@@ -40,6 +42,11 @@ class GameAnalyzer:
         self.friendly_army_units: Units | None = None
         self.idle_production_structures: Units | None = None
         self.threat_map: np.ndarray | None = None
+        self.ground_threat_map: np.ndarray | None = None
+        self.air_threat_map: np.ndarray | None = None
+        # Incremented by ThreatMapAnalyzer whenever the threat maps change.
+        self.threat_map_version: int = 0
+        self.retreat_field: "RetreatField" | None = None
         # known_enemy attributes must be handled carefully, as they are stateful.
         # UnitsAnalyzer is responsible for their initialization and maintenance.
         self.known_enemy_units: Units | None = None
@@ -48,6 +55,7 @@ class GameAnalyzer:
         self.available_expansion_locations: set[Point2] = set()
         self.occupied_locations: set[Point2] = set()
         self.enemy_occupied_locations: set[Point2] = set()
+        self.base_registry: "BaseRegistry" | None = None
 
         # --- Task Pipeline and Scheduler ---
         self._pre_analysis_tasks: List[AnalysisTask] = self._instantiate_tasks(
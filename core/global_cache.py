@@ -12,9 +12,17 @@ if TYPE_CHECKING:
     from sc2.game_info import Ramp
     from sc2.position import Point2
     from core.game_analysis import GameAnalyzer
+    from core.utilities.base_registry import BaseRegistry
+    from core.utilities.retreat_field import RetreatField
 
 from core.event_bus import EventBus
 from core.logger import logger
+from core.utilities.combat_simulator import CombatSimulator
+from core.utilities.ground_distance import GroundDistanceOracle
+from core.utilities.pathfinder import Pathfinder
+from core.utilities.unit_arrays import UnitArrays
+from core.utilities.unit_counts import UnitCounts
+from core.utilities.weapon_table import WeaponTable
 
 
 class GlobalCache:
@@ -40,6 +48,18 @@ class GlobalCache:
         self.enemy_units: "Units" | None = None  # Can be None if no bot object yet
         self.enemy_structures: "Units" | None = None  # Can be None if no bot object yet
         self.map_ramps: list["Ramp"] | None = None
+        # Built from the game data on the first update and shared by everyone
+        # who needs to know what beats what.
+        self.weapon_table: WeaponTable | None = None
+        self.combat_simulator: CombatSimulator | None = None
+        # Ground distances from every start and expansion location, started
+        # at on_start and computed in the background.
+        self.ground_distance: GroundDistanceOracle = GroundDistanceOracle()
+        # Threat-aware routes for ground and air units; set up in on_start.
+        self.pathfinder: Pathfinder | None = None
+        # Per-type counts of our units and structures, ready, in production
+        # and queued, plus upgrades in research.
+        self.unit_counts: UnitCounts = UnitCounts()
 
         # Analyzed State (Copied from GameAnalyzer)
         # MODIFICATION: Initialize with empty values, will be populated on first update
@@ -49,8 +69,13 @@ class GlobalCache:
         self.enemy_structures: "Units" | None = None
         self.friendly_workers: "Units" | None = None
         self.friendly_army_units: "Units" | None = None
+        # Columns of the army and of the visible enemies, read once per frame
+        # and shared by all vectorized code.
+        self.friendly_army_arrays: UnitArrays = UnitArrays([])
+        self.enemy_unit_arrays: UnitArrays = UnitArrays([])
         self.idle_production_structures: "Units" | None = None
         self.threat_map: np.ndarray | None = None
+        self.retreat_field: "RetreatField" | None = None
         self.base_is_under_attack: bool = False
         self.threat_location: "Point2" | None = None
         self.friendly_army_value: int = 0
@@ -61,12 +86,15 @@ class GlobalCache:
         self.available_expansion_locations: set[Point2] = set()
         self.occupied_locations: set[Point2] = set()
         self.enemy_occupied_locations: set[Point2] = set()
+        self.base_registry: "BaseRegistry" | None = None
 
     def update(self, bot: "BotAI", analyzer: "GameAnalyzer", iteration: int):
         """Populates the cache from the raw bot state and the GameAnalyzer."""
         if self.bot is None:
             self.bot = bot
             self.map_ramps = self.bot.game_info.map_ramps
+            self.weapon_table = WeaponTable(bot.game_data)
+            self.combat_simulator = CombatSimulator(self.weapon_table)
             # Initialize empty units objects here where 'bot' is available
             self.friendly_units = Units([], bot)
             self.friendly_structures = Units([], bot)
@@ -95,10 +123,20 @@ class GlobalCache:
         self.friendly_structures = bot.structures
         self.enemy_structures = bot.enemy_structures
         self.friendly_workers = bot.workers
+        self.unit_counts.update(bot.all_own_units, self.friendly_upgrades)
         # --- Copy Final Analyzed State ---
         self.friendly_army_units = analyzer.friendly_army_units
+        self.friendly_army_arrays = UnitArrays(self.friendly_army_units)
+        self.enemy_unit_arrays = UnitArrays(self.enemy_units)
         self.idle_production_structures = analyzer.idle_production_structures
         self.threat_map = analyzer.threat_map
+        self.retreat_field = analyzer.retreat_field
+        if self.pathfinder is not None:
+            self.pathfinder.update_threats(
+                analyzer.ground_threat_map,
+                analyzer.air_threat_map,
+                analyzer.threat_map_version,
+            )
         self.base_is_under_attack = getattr(analyzer, "base_is_under_attack", False)
         self.threat_location = getattr(analyzer, "threat_location", None)
         self.friendly_army_value = analyzer.friendly_army_value
@@ -109,3 +147,4 @@ class GlobalCache:
         self.available_expansion_locations = analyzer.available_expansion_locations
         self.occupied_locations = analyzer.occupied_locations
         self.enemy_occupied_locations = analyzer.enemy_occupied_locations
+        self.base_registry = getattr(analyzer, "base_registry", None)
@@ -0,0 +1,264 @@
+# core/resource_ledger.py
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Hashable, Set
+
+from sc2.ids.unit_typeid import UnitTypeId
+
+if TYPE_CHECKING:
+    from sc2.bot_ai import BotAI
+    from sc2.ids.ability_id import AbilityId
+    from sc2.ids.upgrade_id import UpgradeId
+    from core.global_cache import GlobalCache
+    from core.frame_plan import FramePlan
+
+
+class BudgetCategory(Enum):
+    """The spending categories of the ResourceBudget. Values match its fields."""
+
+    INFRASTRUCTURE = "infrastructure"
+    CAPABILITIES = "capabilities"
+    TACTICS = "tactics"
+
+
+@dataclass
+class Reservation:
+    """An amount of resources claimed by one spender."""
+
+    minerals: int = 0
+    vespene: int = 0
+    supply: float = 0
+
+
+class ResourceLedger:
+    """
+    The Treasury. A single account of what has been promised this frame.
+
+    Every spending manager reserves minerals, gas and supply through the
+    ledger instead of asking `bot.can_afford` on its own, so managers running
+    in the same frame can never spend the same bank twice.
+
+    The ResourceBudget split of the FramePlan is enforced here: each category
+    may spend up to its share of the free bank. When a category's directors
+    are done (`close`), its unspent share is released to the categories that
+    follow, unless it is saving: it was refused a reservation, or said it
+    cannot afford what it wants (`save`). A saving category keeps its unspent
+    share, and its share of each frame's income is set aside for it across
+    frames, so it can bank up for an item that costs more than its share of
+    the current bank while the other categories keep spending theirs.
+
+    Holds are reservations that outlive the frame, such as the cost of a
+    structure whose builder is still walking to the site. They are taken off
+    the top of the bank every frame until released.
+    """
+
+    def __init__(self, bot: "BotAI"):
+        self.bot = bot
+        self.plan: "FramePlan" | None = None
+        self._holds: Dict[Hashable, Reservation] = {}
+        # Income set aside for saving categories, across frames.
+        self._savings: Dict[BudgetCategory, Reservation] = {
+            category: Reservation() for category in BudgetCategory
+        }
+
+        # Per-frame state, reset by begin_frame().
+        self._free = Reservation()
+        self._spent: Dict[BudgetCategory, Reservation] = {
+            category: Reservation() for category in BudgetCategory
+        }
+        self._closed: Set[BudgetCategory] = set()
+        self._saving: Set[BudgetCategory] = set()
+
+    # --- Frame Lifecycle ---
+
+    def begin_frame(self, cache: "GlobalCache", plan: "FramePlan"):
+        """Opens a new frame against the current bank. Called by the General."""
+        self.plan = plan
+        # Without income, the bank would be what was left last frame.
+        expected = self._left()
+        self._free = Reservation(
+            minerals=cache.minerals - self.held_minerals,
+            vespene=cache.vespene - self.held_vespene,
+            supply=cache.supply_left,
+        )
+        self._put_aside_income(expected)
+        self._spent = {category: Reservation() for category in BudgetCategory}
+        self._closed.clear()
+        self._saving.clear()
+
+    def close(self, category: BudgetCategory):
+        """Marks a category as done spending for this frame."""
+        self._closed.add(category)
+
+    def save(self, category: BudgetCategory):
+        """
+        Marks a category as saving up for an item it cannot afford yet. Its
+        unspent share is kept back this frame, and its share of the income
+        is set aside for it until it stops saving.
+        """
+        self._saving.add(category)
+
+    # --- Queries ---
+
+    @property
+    def held_minerals(self) -> int:
+        return sum(hold.minerals for hold in self._holds.values())
+
+    @property
+    def held_vespene(self) -> int:
+        return sum(hold.vespene for hold in self._holds.values())
+
+    @property
+    def supply_left(self) -> float:
+        return self._free.supply - sum(s.supply for s in self._spent.values())
+
+    def available(self, category: BudgetCategory) -> Reservation:
+        """The minerals and gas a category may still spend this frame."""
+        minerals = self._limit(category, "minerals")
+        vespene = self._limit(category, "vespene")
+        return Reservation(minerals=minerals, vespene=vespene, supply=self.supply_left)
+
+    def can_afford(
+        self,
+        category: BudgetCategory,
+        item: "UnitTypeId | UpgradeId | AbilityId",
+        count: int = 1,
+    ) -> bool:
+        """Checks whether `count` of an item fit the category's remaining budget."""
+        return self._fits(category, self._cost_of(item, count))
+
+    # --- Reservations ---
+
+    def reserve(
+        self,
+        category: BudgetCategory,
+        item: "UnitTypeId | UpgradeId | AbilityId",
+        count: int = 1,
+    ) -> bool:
+        """
+        Claims the cost of `count` of an item for this frame.
+
+        :return: True if the reservation was granted. A refusal marks the
+            category as saving, which keeps its unspent share from flowing to
+            later categories.
+        """
+        cost = self._cost_of(item, count)
+        if not self._fits(category, cost):
+            self.save(category)
+            return False
+        self._charge(category, cost)
+        return True
+
+    def hold(
+        self,
+        key: Hashable,
+        category: BudgetCategory,
+        minerals: int,
+        vespene: int = 0,
+    ) -> bool:
+        """
+        Claims resources until `release(key)` is called, across frames.
+
+        :return: True if the hold was granted.
+        """
+        cost = Reservation(minerals=minerals, vespene=vespene)
+        if not self._fits(category, cost):
+            self.save(category)
+            return False
+        self._holds[key] = cost
+        # The bank was measured before this hold existed; charge it to the
+        # category for the rest of this frame.
+        self._charge(category, cost)
+        return True
+
+    def release(self, key: Hashable):
+        """Drops a hold, e.g., once the structure it paid for has started."""
+        self._holds.pop(key, None)
+
+    # --- Internals ---
+
+    def _left(self) -> Reservation:
+        """The free bank minus everything promised this frame."""
+        return Reservation(
+            minerals=self._free.minerals
+            - sum(s.minerals for s in self._spent.values()),
+            vespene=self._free.vespene - sum(s.vespene for s in self._spent.values()),
+        )
+
+    def _put_aside_income(self, expected: Reservation):
+        """
+        Sets each category that saved last frame its share of the income
+        since then; the savings of categories that stopped saving go back to
+        the common bank.
+        """
+        income = Reservation(
+            minerals=max(0, self._free.minerals - expected.minerals),
+            vespene=max(0, self._free.vespene - expected.vespene),
+        )
+        for category, savings in self._savings.items():
+            if category not in self._saving:
+                savings.minerals = savings.vespene = 0
+                continue
+            share = self._share(category)
+            savings.minerals = min(
+                self._free.minerals, savings.minerals + income.minerals * share
+            )
+            savings.vespene = min(
+                self._free.vespene, savings.vespene + income.vespene * share
+            )
+
+    def _charge(self, category: BudgetCategory, cost: Reservation):
+        """Books a granted cost, paid out of the category's savings first."""
+        spent = self._spent[category]
+        spent.minerals += cost.minerals
+        spent.vespene += cost.vespene
+        spent.supply += cost.supply
+        savings = self._savings[category]
+        savings.minerals = max(0, savings.minerals - cost.minerals)
+        savings.vespene = max(0, savings.vespene - cost.vespene)
+
+    def _cost_of(self, item, count: int) -> Reservation:
+        cost = self.bot.calculate_cost(item)
+        supply = 0
+        if isinstance(item, UnitTypeId):
+            supply = self.bot.calculate_supply_cost(item)
+        return Reservation(
+            minerals=cost.minerals * count,
+            vespene=cost.vespene * count,
+            supply=supply * count,
+        )
+
+    def _fits(self, category: BudgetCategory, cost: Reservation) -> bool:
+        if cost.supply > 0 and cost.supply > self.supply_left:
+            return False
+        return cost.minerals <= self._limit(
+            category, "minerals"
+        ) and cost.vespene <= self._limit(category, "vespene")
+
+    def _share(self, category: BudgetCategory) -> float:
+        if self.plan is None:
+            return 1.0
+        return getattr(self.plan.resource_budget, category.value) / 100
+
+    def _limit(self, category: BudgetCategory, resource: str) -> int:
+        """
+        The amount of one resource a category may still spend: its savings and
+        its share of the rest of the bank, plus the unspent shares released by
+        closed, non-saving categories, never more than what is actually left
+        in the bank.
+        """
+        free = getattr(self._free, resource)
+        spent_total = sum(getattr(s, resource) for s in self._spent.values())
+        saved = {c: getattr(s, resource) for c, s in self._savings.items()}
+        pool = max(0, free - sum(saved.values()))
+        limit = saved[category] + pool * self._share(category)
+        for other in self._closed - self._saving - {category}:
+            unspent = (
+                saved[other]
+                + pool * self._share(other)
+                - getattr(self._spent[other], resource)
+            )
+            limit += max(0, unspent)
+        limit -= getattr(self._spent[category], resource)
+        return int(max(0, min(limit, free - spent_total)))
@@ -0,0 +1,204 @@
+# core/utilities/base_registry.py
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+from sc2.constants import geyser_ids, mineral_ids
+
+from core.utilities.events import (
+    Event,
+    EventType,
+    ConstructionStartedPayload,
+    UnitDestroyedPayload,
+)
+from core.utilities.unit_types import TOWNHALL_TYPES_TERRAN
+
+if TYPE_CHECKING:
+    from sc2.bot_ai import BotAI
+    from sc2.position import Point2
+    from sc2.unit import Unit
+    from core.event_bus import EventBus
+
+# A townhall is considered to sit on an expansion within this distance.
+TOWNHALL_CLAIM_RADIUS = 3
+
+
+@dataclass
+class Base:
+    """The static resource topology of one expansion and its current owner."""
+
+    location: "Point2"
+    # Mineral field tags, ranked by mining distance (nearest first).
+    mineral_tags: List[int] = field(default_factory=list)
+    geyser_tags: List[int] = field(default_factory=list)
+    townhall_tag: int | None = None
+    # A known enemy townhall on this expansion, if any.
+    enemy_townhall_tag: int | None = None
+
+    @property
+    def is_owned(self) -> bool:
+        return self.townhall_tag is not None
+
+    @property
+    def is_free(self) -> bool:
+        """Neither we nor the enemy are known to hold this expansion."""
+        return self.townhall_tag is None and self.enemy_townhall_tag is None
+
+
+class BaseRegistry:
+    """
+    The Land Registry. A per-expansion index of mineral patches, geysers and
+    the owning townhall, built once at game start.
+
+    Managers ask the registry which resources belong to a townhall instead of
+    scanning `mineral_field` and `vespene_geyser` around every base on every
+    frame. Ownership follows construction and destruction events; mined-out
+    patches are dropped when the once-per-frame tag map no longer sees them.
+    """
+
+    def __init__(self):
+        self.bases: Dict["Point2", Base] = {}
+        self._base_by_townhall: Dict[int, Base] = {}
+        self._base_by_resource: Dict[int, Base] = {}
+        self._resource_units: Dict[int, "Unit"] = {}
+        self._resource_positions: Dict[int, "Point2"] = {}
+
+    @property
+    def is_built(self) -> bool:
+        return bool(self.bases)
+
+    def subscribe_to_events(self, event_bus: "EventBus"):
+        event_bus.subscribe(
+            EventType.INFRA_CONSTRUCTION_STARTED, self.handle_construction_started
+        )
+        event_bus.subscribe(EventType.UNIT_DESTROYED, self.handle_unit_destroyed)
+
+    # --- Construction ---
+
+    def build(self, bot: "BotAI"):
+        """Indexes every expansion's resources and claims the starting bases."""
+        for location, resources in bot.expansion_locations_dict.items():
+            minerals = sorted(
+                (r for r in resources if r.type_id.value in mineral_ids),
+                key=lambda r: r.distance_to(location),
+            )
+            geysers = sorted(
+                (r for r in resources if r.type_id.value in geyser_ids),
+                key=lambda r: r.distance_to(location),
+            )
+            base = Base(
+                location=location,
+                mineral_tags=[m.tag for m in minerals],
+                geyser_tags=[g.tag for g in geysers],
+            )
+            self.bases[location] = base
+            for resource in list(minerals) + list(geysers):
+                self._base_by_resource[resource.tag] = base
+                self._resource_positions[resource.tag] = resource.position
+
+        for townhall in bot.townhalls:
+            self.claim(townhall.tag, townhall.position)
+        self.refresh(bot)
+
+    def refresh(self, bot: "BotAI"):
+        """
+        Rebuilds the tag -> unit map for this frame and drops mined-out
+        patches. Runs once per frame so every lookup afterwards is O(1).
+        """
+        self._resource_units = {r.tag: r for r in bot.resources}
+        for tag in [t for t in self._base_by_resource if t not in self._resource_units]:
+            # A missing patch is only known to be gone if its spot is in vision.
+            if bot.is_visible(self._resource_positions[tag]):
+                self._forget_resource(tag)
+
+    # --- Ownership ---
+
+    def claim(self, townhall_tag: int, position: "Point2") -> Base | None:
+        """Records a townhall as the owner of the expansion it sits on."""
+        base = self.base_near(position)
+        if base:
+            base.townhall_tag = townhall_tag
+            self._base_by_townhall[townhall_tag] = base
+        return base
+
+    def release(self, townhall_tag: int):
+        base = self._base_by_townhall.pop(townhall_tag, None)
+        if base:
+            base.townhall_tag = None
+
+    def mark_enemy_townhalls(self, townhalls: Iterable["Unit"]):
+        """Records which expansions the known enemy townhalls sit on."""
+        for base in self.bases.values():
+            base.enemy_townhall_tag = None
+        for townhall in townhalls:
+            base = self.base_near(townhall.position)
+            if base:
+                base.enemy_townhall_tag = townhall.tag
+
+    async def handle_construction_started(self, event: Event):
+        payload: ConstructionStartedPayload = event.payload
+        if payload.unit_type in TOWNHALL_TYPES_TERRAN:
+            self.claim(payload.unit_tag, payload.position)
+
+    async def handle_unit_destroyed(self, event: Event):
+        payload: UnitDestroyedPayload = event.payload
+        if payload.unit_tag in self._base_by_townhall:
+            self.release(payload.unit_tag)
+        elif payload.unit_tag in self._base_by_resource:
+            self._forget_resource(payload.unit_tag)
+
+    def _forget_resource(self, tag: int):
+        base = self._base_by_resource.pop(tag, None)
+        self._resource_positions.pop(tag, None)
+        if base:
+            if tag in base.mineral_tags:
+                base.mineral_tags.remove(tag)
+            if tag in base.geyser_tags:
+                base.geyser_tags.remove(tag)
+
+    # --- Lookups ---
+
+    def base_at(self, location: "Point2") -> Base | None:
+        return self.bases.get(location)
+
+    def base_near(self, position: "Point2") -> Base | None:
+        """The expansion a townhall at `position` would occupy, if any."""
+        base = self.bases.get(position)
+        if base:
+            return base
+        closest = min(
+            self.bases.values(),
+            key=lambda b: b.location.distance_to(position),
+            default=None,
+        )
+        if closest and closest.location.distance_to(position) <= TOWNHALL_CLAIM_RADIUS:
+            return closest
+        return None
+
+    def base_of_townhall(self, townhall_tag: int) -> Base | None:
+        return self._base_by_townhall.get(townhall_tag)
+
+    def base_of_resource(self, tag: int) -> Base | None:
+        return self._base_by_resource.get(tag)
+
+    def owned_bases(self) -> List[Base]:
+        return list(self._base_by_townhall.values())
+
+    def free_bases(self) -> List[Base]:
+        """Expansions held by neither side."""
+        return [base for base in self.bases.values() if base.is_free]
+
+    def resource(self, tag: int) -> "Unit" | None:
+        """The current unit for a resource tag, or None if not seen this frame."""
+        return self._resource_units.get(tag)
+
+    def mineral_fields(self, base: Base) -> List["Unit"]:
+        """The base's visible mineral fields, nearest first."""
+        return self._units(base.mineral_tags)
+
+    def geysers(self, base: Base) -> List["Unit"]:
+        return self._units(base.geyser_tags)
+
+    def _units(self, tags: Iterable[int]) -> List["Unit"]:
+        units = self._resource_units
+        return [units[tag] for tag in tags if tag in units]
@@ -0,0 +1,212 @@
+# core/utilities/combat_simulator.py
+from __future__ import annotations
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+import numpy as np
+from sc2.ids.unit_typeid import UnitTypeId
+
+if TYPE_CHECKING:
+    from sc2.unit import Unit
+    from core.utilities.weapon_table import WeaponTable
+
+# --- Tunable Combat Simulation Constants ---
+# Splash weapons hit several units per shot, which the one-on-one weapon data
+# cannot see. Their damage is multiplied by these rough factors.
+SPLASH_FACTORS: Dict[UnitTypeId, float] = {
+    UnitTypeId.SIEGETANKSIEGED: 2.0,
+    UnitTypeId.HELLION: 1.5,
+    UnitTypeId.HELLIONTANK: 1.5,
+    UnitTypeId.THOR: 1.25,
+    UnitTypeId.BANELING: 2.5,
+    UnitTypeId.LURKERMPBURROWED: 1.75,
+    UnitTypeId.ULTRALISK: 1.25,
+    UnitTypeId.COLOSSUS: 1.75,
+    UnitTypeId.ARCHON: 1.5,
+}
+
+# (type, flying, attack upgrade level, armor upgrade level)
+_GroupKey = Tuple[UnitTypeId, bool, int, int]
+
+
+@dataclass(frozen=True)
+class CombatPrediction:
+    """How a fight between two groups of units is expected to end."""
+
+    friendly_wins: bool
+    # Share of each side's health and shields left when the fight is over.
+    friendly_survival: float
+    enemy_survival: float
+    # Seconds until the losing side is wiped out; inf if neither side can be.
+    time_to_kill: float
+    # Expected surviving units of each type.
+    friendly_survivors: Dict[UnitTypeId, int] = field(default_factory=dict)
+    enemy_survivors: Dict[UnitTypeId, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Side:
+    """One side of a fight, with its units grouped by type and upgrades."""
+
+    keys: List[_GroupKey]
+    counts: np.ndarray
+    health: np.ndarray
+
+
+class CombatSimulator:
+    """
+    The Umpire. Predicts the outcome of a fight from the two compositions,
+    without playing it out.
+
+    Units are grouped by type, flying and upgrade levels, and a (group x
+    group) DPS matrix is built from the WeaponTable, with each upgrade level
+    worth one damage or armor per attack and splash weapons scaled by
+    SPLASH_FACTORS. Every group spreads its fire over the enemy groups it can
+    hit in proportion to their health, which gives each side one damage
+    rate against the other's health pool. The fight then follows
+    Lanchester's square law, where a side's damage falls as its health
+    does, and the winner, its share of survivors and the time to kill all
+    have closed forms. Units the other side cannot hit at all are not
+    counted as taking part, unless they can hurt it: then it cannot win.
+    """
+
+    def __init__(self, weapon_table: "WeaponTable"):
+        self.weapon_table = weapon_table
+
+    def predict(
+        self, friendly: Iterable["Unit"], enemy: Iterable["Unit"]
+    ) -> CombatPrediction:
+        """Predicts a fight between our `friendly` units and `enemy` units."""
+        ours, theirs = self._group(friendly), self._group(enemy)
+        our_dps = self._dps_matrix(ours, theirs)
+        their_dps = self._dps_matrix(theirs, ours)
+        our_time = self._time_to_kill(ours, our_dps, theirs, their_dps)
+        their_time = self._time_to_kill(theirs, their_dps, ours, our_dps)
+
+        if math.isinf(our_time) and math.isinf(their_time):
+            # Nobody can finish the other off.
+            return CombatPrediction(
+                friendly_wins=False,
+                friendly_survival=1.0,
+                enemy_survival=1.0,
+                time_to_kill=math.inf,
+                friendly_survivors=self._survivors(ours, their_dps, 1.0),
+                enemy_survivors=self._survivors(theirs, our_dps, 1.0),
+            )
+
+        # Each side's time to kill is taken at its starting damage rate. Under
+        # the square law the winner keeps sqrt(1 - ratio) of its health.
+        friendly_wins = our_time < their_time
+        winner_time, loser_time = sorted((our_time, their_time))
+        ratio = winner_time / loser_time if loser_time > 0 else 0.0
+        survival = math.sqrt(max(1.0 - ratio, 0.0))
+        if math.isinf(loser_time):
+            time_to_kill = winner_time
+        elif ratio >= 1.0:
+            time_to_kill = math.inf
+        else:
+            time_to_kill = math.sqrt(winner_time * loser_time) * math.atanh(
+                math.sqrt(ratio)
+            )
+
+        friendly_survival = enemy_survival = 0.0
+        friendly_survivors: Dict[UnitTypeId, int] = {}
+        enemy_survivors: Dict[UnitTypeId, int] = {}
+        if friendly_wins:
+            friendly_survival = self._survival(ours, their_dps, survival)
+            friendly_survivors = self._survivors(ours, their_dps, survival)
+        else:
+            enemy_survival = self._survival(theirs, our_dps, survival)
+            enemy_survivors = self._survivors(theirs, our_dps, survival)
+        return CombatPrediction(
+            friendly_wins=friendly_wins,
+            friendly_survival=friendly_survival,
+            enemy_survival=enemy_survival,
+            time_to_kill=time_to_kill,
+            friendly_survivors=friendly_survivors,
+            enemy_survivors=enemy_survivors,
+        )
+
+    @staticmethod
+    def _group(units: Iterable["Unit"]) -> _Side:
+        counts: Dict[_GroupKey, int] = {}
+        health: Dict[_GroupKey, float] = {}
+        for unit in units:
+            key = (
+                unit.type_id,
+                unit.is_flying,
+                unit.attack_upgrade_level,
+                unit.armor_upgrade_level,
+            )
+            counts[key] = counts.get(key, 0) + 1
+            health[key] = health.get(key, 0.0) + unit.health + unit.shield
+        keys = list(counts)
+        return _Side(
+            keys=keys,
+            counts=np.array([counts[key] for key in keys], dtype=float),
+            health=np.array([health[key] for key in keys], dtype=float),
+        )
+
+    def _dps_matrix(self, attackers: _Side, targets: _Side) -> np.ndarray:
+        """Damage per second of one attacker of each group against each group."""
+        dps = np.zeros((len(attackers.keys), len(targets.keys)))
+        for i, (attacker, _, attack_level, _) in enumerate(attackers.keys):
+            splash = SPLASH_FACTORS.get(attacker, 1.0)
+            for j, (target, flying, _, armor_level) in enumerate(targets.keys):
+                damage, cooldown, _, attacks = self.weapon_table.stats(
+                    attacker, target, flying
+                )
+                if damage <= 0 or cooldown <= 0:
+                    continue
+                damage = max(
+                    damage + attacks * (attack_level - armor_level), 0.5 * attacks
+                )
+                dps[i, j] = damage / cooldown * splash
+        return dps
+
+    @staticmethod
+    def _time_to_kill(
+        attackers: _Side,
+        dps: np.ndarray,
+        targets: _Side,
+        counter_dps: np.ndarray,
+    ) -> float:
+        """Seconds the attackers need to kill every target they can hit."""
+        if not targets.keys:
+            return 0.0
+        hittable = (dps > 0).any(axis=0)
+        armed = (counter_dps > 0).any(axis=1)
+        if (armed & ~hittable).any():
+            # Some targets fight back but cannot be fought.
+            return math.inf
+        # Every attacker spreads its fire over what it can hit, by health.
+        shares = (dps > 0) * targets.health[None, :]
+        totals = shares.sum(axis=1, keepdims=True)
+        shares = np.divide(shares, totals, out=np.zeros_like(shares), where=totals > 0)
+        rate = (attackers.counts[:, None] * dps * shares).sum()
+        if rate <= 0:
+            return math.inf
+        return targets.health[hittable].sum() / rate
+
+    @staticmethod
+    def _survival(side: _Side, counter_dps: np.ndarray, survival: float) -> float:
+        """Share of the side's health left when its hittable part keeps `survival`."""
+        total = side.health.sum()
+        if total <= 0:
+            return 1.0
+        hittable = (counter_dps > 0).any(axis=0)
+        left = side.health[~hittable].sum() + side.health[hittable].sum() * survival
+        return float(left / total)
+
+    @staticmethod
+    def _survivors(
+        side: _Side, counter_dps: np.ndarray, survival: float
+    ) -> Dict[UnitTypeId, int]:
+        hittable = (counter_dps > 0).any(axis=0)
+        left = np.where(hittable, side.counts * survival, side.counts)
+        survivors: Dict[UnitTypeId, int] = {}
+        for (type_id, *_), count in zip(side.keys, np.rint(left).astype(int)):
+            if count > 0:
+                survivors[type_id] = survivors.get(type_id, 0) + int(count)
+        return survivors
@@ -11,6 +11,9 @@ All values here should be considered a starting point for optimization.
 # A value of 8 means one low-frequency task will be executed every 8 frames.
 LOW_FREQUENCY_TASK_RATE: int = 8
 
+# The number of game loops per in-game second on "Faster" speed.
+GAME_LOOPS_PER_SECOND: float = 22.4
+
 # --- Event Bus Priorities ---
 # Defines the processing order for events within the EventBus.
 EVENT_PRIORITY_CRITICAL: int = 0  # e.g., Dodge spell, Proxy detected
@@ -27,13 +30,13 @@ SCVS_PER_MINERAL_LINE: int = 16
 # The target number of workers per vespene geyser.
 SCVS_PER_GEYSER: int = 3
 
-# The minimum supply buffer to maintain. The bot will request a depot
-# when supply_left falls below this number.
+# A safety margin of supply kept free on top of the forecast production
+# demand, to absorb units queued outside the forecast.
 SUPPLY_BUFFER_BASE: int = 4
 
-# The supply buffer is increased by this amount for each active
-# production structure (Barracks, Factory, Starport).
-SUPPLY_BUFFER_PER_PRODUCTION_STRUCTURE: int = 2
+# A queued build request that has not been serviced within this many
+# seconds is evicted and reported with INFRA_BUILD_REQUEST_FAILED.
+BUILD_REQUEST_TIMEOUT_SECONDS: int = 60
 
 # --- Tactics & Military ---
 # The supply count at which the first scout (usually an SCV) is sent out.
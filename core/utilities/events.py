@@ -31,6 +31,10 @@ class EventType(Enum):
     # Handled by the original requester.
     INFRA_BUILD_REQUEST_FAILED = auto()
 
+    # Published by the main bot's on_building_construction_started hook.
+    # Handled by ConstructionManager to keep its placement grid current.
+    INFRA_CONSTRUCTION_STARTED = auto()
+
     # --- Tactics Events ---
     # Published by ScoutingManager.
     # Handled by various Directors to adapt strategy.
@@ -69,6 +73,8 @@ class BuildRequestPayload(Payload):
     position: "Point2" | None = None
     priority: int = EVENT_PRIORITY_NORMAL
     unique: bool = False
+    # Identifies who asked, so a failure can be routed back to them.
+    requester: str | None = None
 
 
 @dataclass
@@ -77,6 +83,17 @@ class BuildRequestFailedPayload(Payload):
 
     item_id: "UnitTypeId"
     reason: str
+    # The requester of the failed BuildRequestPayload, if it named one.
+    requester: str | None = None
+
+
+@dataclass
+class ConstructionStartedPayload(Payload):
+    """Payload for an INFRA_CONSTRUCTION_STARTED event."""
+
+    unit_tag: int
+    unit_type: "UnitTypeId"
+    position: "Point2"
 
 
 @dataclass
@@ -1,5 +1,5 @@
-import math
-from typing import TYPE_CHECKING, Set
+from functools import lru_cache
+from typing import TYPE_CHECKING, Sequence, Set, Tuple
 
 import numpy as np
 
@@ -26,6 +26,7 @@ def create_threat_map(
     :return: A 2D numpy array where higher values indicate greater danger.
     """
     threat_map = np.zeros(map_size, dtype=np.float32)
+    falloff = _falloff_kernel(threat_radius)
 
     for unit in enemy_units:
         # For simplicity, we can use a basic threat value or incorporate
@@ -33,23 +34,53 @@ def create_threat_map(
         threat_value = 10 + unit.radius  # Basic threat score
         pos = unit.position.rounded
 
-        # Get a bounding box for the threat area to avoid iterating the whole map
+        # Stamp the falloff kernel, clipped to the map, centered on the unit
         x_min = max(0, pos.x - threat_radius)
         x_max = min(map_size[0], pos.x + threat_radius + 1)
         y_min = max(0, pos.y - threat_radius)
         y_max = min(map_size[1], pos.y + threat_radius + 1)
-
-        for x in range(x_min, x_max):
-            for y in range(y_min, y_max):
-                dist_sq = (pos.x - x) ** 2 + (pos.y - y) ** 2
-                if dist_sq <= threat_radius**2:
-                    # Apply a falloff effect: threat is highest at the center
-                    falloff = 1 - (math.sqrt(dist_sq) / threat_radius)
-                    threat_map[x, y] += threat_value * falloff
+        if x_min >= x_max or y_min >= y_max:
+            continue
+        kx, ky = x_min - (pos.x - threat_radius), y_min - (pos.y - threat_radius)
+        threat_map[x_min:x_max, y_min:y_max] += (
+            threat_value * falloff[kx : kx + x_max - x_min, ky : ky + y_max - y_min]
+        )
 
     return threat_map
 
 
+def create_layered_threat_maps(
+    enemy_units: "Units", map_size: tuple[int, int], threat_radius: int = 15
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generates separate threat maps for ground and air units, counting only
+    the enemies that can shoot at each.
+
+    :return: A (ground, air) tuple of threat maps, as from create_threat_map.
+    """
+    ground = create_threat_map(
+        [unit for unit in enemy_units if unit.can_attack_ground],
+        map_size,
+        threat_radius,
+    )
+    air = create_threat_map(
+        [unit for unit in enemy_units if unit.can_attack_air],
+        map_size,
+        threat_radius,
+    )
+    return ground, air
+
+
+@lru_cache(maxsize=8)
+def _falloff_kernel(threat_radius: int) -> np.ndarray:
+    """Threat falloff around a unit, from 1 at its cell to 0 at the radius."""
+    offsets = np.arange(-threat_radius, threat_radius + 1)
+    distance = np.sqrt(offsets[:, None] ** 2 + offsets[None, :] ** 2)
+    kernel = np.where(distance <= threat_radius, 1 - distance / threat_radius, 0)
+    kernel.flags.writeable = False
+    return kernel
+
+
 def find_safe_point_from_threat_map(
     threat_map: np.ndarray, reference_point: "Point2", search_radius: int = 20
 ) -> "Point2":
@@ -78,3 +109,21 @@ def find_safe_point_from_threat_map(
                 best_point = Point2((x, y))
 
     return best_point
+
+
+def distance_to_route(point: "Point2", route: Sequence["Point2"]) -> float:
+    """
+    The distance from a point to the nearest leg of a route.
+
+    :param point: The point to measure from.
+    :param route: The route's points, in order; at least one.
+    :return: The distance to the closest point on any leg.
+    """
+    best = point.distance_to(route[0])
+    for a, b in zip(route, route[1:]):
+        leg, offset = b - a, point - a
+        length_squared = leg.x * leg.x + leg.y * leg.y
+        if length_squared > 0:
+            along = (offset.x * leg.x + offset.y * leg.y) / length_squared
+            best = min(best, point.distance_to(a + leg * min(1.0, max(0.0, along))))
+    return best
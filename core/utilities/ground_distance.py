@@ -0,0 +1,287 @@
+# core/utilities/ground_distance.py
+from __future__ import annotations
+import hashlib
+import math
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Sequence, TypeVar
+
+import numpy as np
+from sc2.position import Point2
+
+from core.logger import logger
+
+if TYPE_CHECKING:
+    from sc2.bot_ai import BotAI
+
+# --- Tunable Ground Distance Constants ---
+DISTANCE_CACHE_DIR = Path("cache") / "distance_fields"
+# Bump this whenever the way fields are computed changes, to invalidate caches.
+DISTANCE_FIELD_VERSION = 1
+# A field starts from every pathable cell this close to its location, as the
+# townhall standing there blocks the location itself.
+SEED_RADIUS = 4.0
+# Unpathable cells this many steps from pathable ground (structures, cliff
+# edges, doodads) get the distance of their closest pathable neighbour plus
+# the steps, so that lookups at a building's position still answer.
+FILL_DEPTH = 4
+# A position this close to a location uses that location's field.
+LOCATION_TOLERANCE = 3.0
+
+# (dx, dy, cost) of the 8 moves between neighbouring cells.
+_MOVES = [
+    (dx, dy, math.sqrt(dx * dx + dy * dy))
+    for dx in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+    if dx or dy
+]
+
+T = TypeVar("T")
+
+
+class GroundDistanceOracle:
+    """
+    The Surveyor. Knows how far every cell of the map is, on foot, from
+    every start location and expansion location.
+
+    One distance field per location is computed from the pathing grid at the
+    start of the game, on a background thread so the first frames are not
+    held up, and cached on disk per map. After that, the ground distance
+    between any position and any of these locations is a single array
+    lookup. Until the fields are ready, and for positions that are not one
+    of the locations, distances fall back to the straight line, so callers
+    never have to check.
+    """
+
+    def __init__(self):
+        self._locations: np.ndarray = np.empty((0, 2))
+        self._fields: Optional[np.ndarray] = None
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        """True once the distance fields can be looked up."""
+        return self._ready.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the fields are ready. Returns whether they are."""
+        return self._ready.wait(timeout)
+
+    # --- Building ---
+
+    def start(self, bot: "BotAI"):
+        """
+        Loads the fields of this map from the disk cache, or starts computing
+        them in the background. Called once, at the start of the game.
+        """
+        pathable = np.asarray(bot.game_info.pathing_grid.data_numpy).T != 0
+        locations = list(
+            dict.fromkeys(
+                [bot.start_location, *bot.enemy_start_locations]
+                + list(bot.expansion_locations_list)
+            )
+        )
+        cache_path = DISTANCE_CACHE_DIR / (
+            f"{self._map_hash(bot.game_info.map_name, pathable, locations)}.npz"
+        )
+        if self._load(cache_path):
+            return
+        self._thread = threading.Thread(
+            target=self._build,
+            args=(pathable, locations, cache_path),
+            name="ground-distance",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def build(self, pathable: np.ndarray, locations: Sequence[Point2]):
+        """Computes the fields of `locations` on the [x, y] `pathable` grid, now."""
+        fields = compute_distance_fields(pathable, locations)
+        self._publish(locations, fields)
+
+    def _build(self, pathable: np.ndarray, locations: List[Point2], cache_path: Path):
+        self.build(pathable, locations)
+        try:
+            DISTANCE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with cache_path.open("wb") as file:
+                np.savez_compressed(
+                    file, locations=self._locations, fields=self._fields
+                )
+        except OSError:
+            logger.warning(f"Could not write distance field cache to {cache_path}.")
+        logger.info(f"Computed ground distance fields for {len(locations)} locations.")
+
+    def _load(self, cache_path: Path) -> bool:
+        if not cache_path.exists():
+            return False
+        try:
+            with np.load(cache_path) as data:
+                locations = [Point2((x, y)) for x, y in data["locations"].tolist()]
+                self._publish(locations, data["fields"])
+        except (OSError, ValueError, KeyError):
+            logger.warning(f"Ignoring unreadable distance field cache at {cache_path}.")
+            return False
+        logger.info(f"Loaded ground distance fields for {len(locations)} locations.")
+        return True
+
+    def _publish(self, locations: Sequence[Point2], fields: np.ndarray):
+        # The fields go in before the locations that index them, so readers
+        # on the game thread never see one without the other.
+        self._fields = fields
+        self._locations = np.array(locations, dtype=float).reshape(-1, 2)
+        self._ready.set()
+
+    @staticmethod
+    def _map_hash(map_name: str, pathable: np.ndarray, locations: List[Point2]) -> str:
+        """A key that changes whenever the map or its locations change."""
+        digest = hashlib.sha1()
+        digest.update(f"v{DISTANCE_FIELD_VERSION}".encode())
+        digest.update(map_name.encode())
+        digest.update(np.packbits(pathable).tobytes())
+        for location in locations:
+            digest.update(f"{location.x:.1f},{location.y:.1f}".encode())
+        return digest.hexdigest()
+
+    # --- Queries ---
+
+    def distance(self, location: Point2, position: Point2) -> float:
+        """
+        The ground distance from one of the locations to `position`; inf if
+        it cannot be walked. The straight line if `location` has no field.
+        """
+        return float(self.distances(location, [position])[0])
+
+    def distances(self, location: Point2, positions: Sequence[Point2]) -> np.ndarray:
+        """The ground distance from `location` to each of `positions`."""
+        xy = np.array(positions, dtype=float).reshape(-1, 2)
+        field = self._field_of(location)
+        if field is None:
+            offsets = xy - np.array(location, dtype=float)
+            return np.sqrt((offsets**2).sum(axis=1))
+        cells = np.clip(xy.astype(np.intp), 0, np.array(field.shape) - 1)
+        return field[cells[:, 0], cells[:, 1]].astype(float)
+
+    def closest_to(self, location: Point2, candidates: Sequence[T]) -> T:
+        """
+        The candidate (a unit or a point) with the shortest walk from
+        `location`. Candidates that cannot be walked to come last, nearest
+        in a straight line first.
+        """
+        if not candidates:
+            raise ValueError("closest_to() needs at least one candidate")
+        return candidates[self._order(location, candidates)[0]]
+
+    def sorted_by_distance(self, location: Point2, candidates: Sequence[T]) -> List[T]:
+        """The candidates, from the shortest walk from `location` to the longest."""
+        return [candidates[i] for i in self._order(location, candidates)]
+
+    def _order(self, location: Point2, candidates: Sequence[T]) -> np.ndarray:
+        positions = [candidate.position for candidate in candidates]
+        ground = self.distances(location, positions)
+        offsets = np.array(positions, dtype=float).reshape(-1, 2) - np.array(
+            location, dtype=float
+        )
+        straight = np.sqrt((offsets**2).sum(axis=1))
+        return np.lexsort((straight, ground))
+
+    def _field_of(self, location: Point2) -> Optional[np.ndarray]:
+        locations, fields = self._locations, self._fields
+        if not len(locations):
+            return None
+        offsets = locations - np.array(location, dtype=float)
+        squared = (offsets**2).sum(axis=1)
+        index = int(squared.argmin())
+        if squared[index] > LOCATION_TOLERANCE * LOCATION_TOLERANCE:
+            return None
+        return fields[index]
+
+
+def compute_distance_fields(
+    pathable: np.ndarray, locations: Sequence[Point2]
+) -> np.ndarray:
+    """
+    Ground distances from each location to every cell, as (k, x, y) float32
+    arrays; inf where a cell cannot be reached.
+
+    Moves go to the 8 neighbouring cells, diagonals only where neither
+    orthogonal cell is blocked, so paths cannot squeeze between two wall
+    corners. All fields are grown together: every round relaxes the cells
+    whose distance improved in the last one, for all locations at once,
+    until no distance improves.
+    """
+    width, height = pathable.shape
+    count = len(locations)
+    # A border of blocked cells keeps every move inside its own field.
+    padded_height = height + 2
+    padded = np.zeros((width + 2, padded_height), dtype=bool)
+    padded[1:-1, 1:-1] = pathable
+    inside = np.zeros_like(padded)
+    inside[1:-1, 1:-1] = True
+    cells = padded.size
+    walkable = np.tile(padded.ravel(), count)
+    wall = np.tile((inside & ~padded).ravel(), count)
+    distance = np.full(count * cells, np.inf)
+
+    # Seed every field with the pathable cells around its location.
+    xs, ys = np.meshgrid(np.arange(width), np.arange(height), indexing="ij")
+    centers = np.stack([xs.ravel() + 0.5, ys.ravel() + 0.5], axis=1)
+    padded_index = (xs.ravel() + 1) * padded_height + ys.ravel() + 1
+    open_cells = pathable.ravel()
+    for field, location in enumerate(locations):
+        offsets = centers - np.array(location, dtype=float)
+        reach = np.sqrt((offsets**2).sum(axis=1))
+        seeds = open_cells & (reach <= SEED_RADIUS)
+        distance[field * cells + padded_index[seeds]] = reach[seeds]
+
+    frontier = np.flatnonzero(np.isfinite(distance))
+    _relax(distance, frontier, walkable, walkable, padded_height, None)
+    # Let distances seep a few steps into the cells nobody can walk.
+    frontier = np.flatnonzero(np.isfinite(distance))
+    _relax(distance, frontier, walkable | wall, wall, padded_height, FILL_DEPTH)
+
+    fields = distance.reshape(count, width + 2, padded_height)[:, 1:-1, 1:-1]
+    return fields.astype(np.float32)
+
+
+def _relax(
+    distance: np.ndarray,
+    frontier: np.ndarray,
+    corners: np.ndarray,
+    enterable: np.ndarray,
+    padded_height: int,
+    rounds: Optional[int],
+):
+    """
+    Improves `distance` in place from `frontier` until nothing improves, or
+    for at most `rounds` rounds. Only `enterable` cells are updated, and a
+    diagonal move needs both cells beside it to be in `corners`.
+    """
+    moves = [
+        (dx * padded_height + dy, dx * padded_height, dy, cost)
+        for dx, dy, cost in _MOVES
+    ]
+    done = 0
+    while frontier.size and (rounds is None or done < rounds):
+        targets, values = [], []
+        base = distance[frontier]
+        for offset, side_x, side_y, cost in moves:
+            neighbours = frontier + offset
+            allowed = enterable[neighbours]
+            if side_x and side_y:
+                allowed &= corners[frontier + side_x] & corners[frontier + side_y]
+            reached = base[allowed] + cost
+            neighbours = neighbours[allowed]
+            better = reached < distance[neighbours]
+            targets.append(neighbours[better])
+            values.append(reached[better])
+        targets = np.concatenate(targets)
+        values = np.concatenate(values)
+        # Keep the best offer to each cell.
+        order = np.lexsort((values, targets))
+        targets, values = targets[order], values[order]
+        first = np.ones(targets.size, dtype=bool)
+        first[1:] = targets[1:] != targets[:-1]
+        frontier, values = targets[first], values[first]
+        distance[frontier] = values
+        done += 1
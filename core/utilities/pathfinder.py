@@ -0,0 +1,348 @@
+# core/utilities/pathfinder.py
+from __future__ import annotations
+import heapq
+import math
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sc2.position import Point2
+
+if TYPE_CHECKING:
+    from sc2.game_info import GameInfo
+
+# --- Tunable Pathfinding Constants ---
+# Extra cost of crossing a cell, per point of threat on it. An enemy's threat
+# peaks around 10, so walking right past one costs twice as much per cell.
+THREAT_COST_WEIGHT = 0.1
+# Paths remembered for repeated queries, per threat map.
+PATH_CACHE_SIZE = 1024
+# A start or goal on an unpathable cell is moved to the nearest pathable cell
+# at most this many cells away.
+SNAP_RADIUS = 4
+
+_SQRT2 = math.sqrt(2)
+_INF = math.inf
+# Octile distance is dx + dy + _OCTILE * min(dx, dy).
+_OCTILE = _SQRT2 - 2
+
+# The 8 moves between neighbouring cells, as (dx, dy).
+_STEPS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+# A cell key: (x, y).
+Cell = Tuple[int, int]
+
+
+class Pathfinder:
+    """
+    The Guide. Finds routes across the map that keep clear of enemy fire,
+    for ground units and for air units.
+
+    Every cell costs 1 to cross, plus THREAT_COST_WEIGHT per point of threat
+    on it from the ground or air threat map; ground routes cannot enter
+    unpathable cells. Queries are answered, in order of cost:
+
+    - from the cache, keyed by start cell, goal cell, layer and threat map
+      version;
+    - by a straight line, when every cell under it is pathable and free of
+      threat;
+    - by A* with the octile heuristic over flat cost arrays. Cells in
+      different ground regions are rejected without a search.
+
+    Routes are returned as waypoints: the cells where the direction changes,
+    then the goal itself. Cost arrays are rebuilt lazily, on the first query
+    after the threat maps change.
+    """
+
+    def __init__(self, pathable: np.ndarray):
+        """
+        :param pathable: A boolean [x, y] array of cells ground units can walk.
+        """
+        self.shape = pathable.shape
+        width, height = self.shape
+        # A border of blocked cells keeps every move on the map.
+        self._stride = height + 2
+        padded = np.zeros((width + 2, height + 2), dtype=bool)
+        padded[1:-1, 1:-1] = pathable
+        self._pathable = padded
+        self._regions = _label_regions(padded)
+        # The moves out of every cell, as an index into the move patterns,
+        # for ground (False) and air (True). Only walls block moves, so they
+        # are worked out once.
+        self._patterns = _move_patterns(self._stride)
+        inside = np.zeros_like(padded)
+        inside[1:-1, 1:-1] = True
+        self._moves = {
+            False: _open_moves(padded, self._stride),
+            True: _open_moves(inside, self._stride),
+        }
+        self._threats: Tuple[Optional[np.ndarray], Optional[np.ndarray]] = (None, None)
+        self._version: Hashable = None
+        # Per layer (False = ground, True = air): the cost of every padded
+        # cell as a flat list, inf where it cannot be entered.
+        self._costs: Dict[bool, List[float]] = {}
+        self._threat_free: Dict[bool, np.ndarray] = {}
+        self._cache: "OrderedDict[Tuple, List[Point2]]" = OrderedDict()
+
+    @classmethod
+    def from_game_info(cls, game_info: "GameInfo") -> "Pathfinder":
+        """A pathfinder over the map's pathing grid."""
+        return cls(np.asarray(game_info.pathing_grid.data_numpy).T != 0)
+
+    @property
+    def version(self) -> Hashable:
+        """The version of the threat maps routes are currently found on."""
+        return self._version
+
+    def update_threats(
+        self,
+        ground_threat: Optional[np.ndarray],
+        air_threat: Optional[np.ndarray],
+        version: Hashable,
+    ):
+        """Takes new [x, y] threat maps; a no-op if `version` is unchanged."""
+        if version == self._version:
+            return
+        self._threats = (ground_threat, air_threat)
+        self._version = version
+        self._costs.clear()
+        self._threat_free.clear()
+        self._cache.clear()
+
+    def find_path(self, start: Point2, goal: Point2, air: bool = False) -> List[Point2]:
+        """
+        Waypoints from `start` to `goal`, ending at `goal`. Empty if there is
+        no way there.
+        """
+        return self.find_paths([(start, goal)], air)[0]
+
+    def find_paths(
+        self, queries: Sequence[Tuple[Point2, Point2]], air: bool = False
+    ) -> List[List[Point2]]:
+        """
+        Waypoints for many (start, goal) pairs at once, in the same order.
+        Queries that share their start and goal cells are searched once.
+        """
+        routes: List[List[Point2]] = []
+        solved: Dict[Tuple[Cell, Cell], List[Point2]] = {}
+        for start, goal in queries:
+            key = (self._cell(start), self._cell(goal))
+            if key not in solved:
+                solved[key] = self._route(key[0], key[1], air)
+            route = solved[key]
+            # Cached routes end at the goal cell's center: finish at the
+            # exact goal instead.
+            routes.append(route[:-1] + [Point2(goal)] if route else [])
+        return routes
+
+    # --- Searching ---
+
+    def _route(self, start: Cell, goal: Cell, air: bool) -> List[Point2]:
+        key = (start, goal, air, self._version)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        route = self._search(start, goal, air)
+        self._cache[key] = route
+        if len(self._cache) > PATH_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return route
+
+    def _search(self, start: Cell, goal: Cell, air: bool) -> List[Point2]:
+        if not air:
+            start, goal = self._snap(start), self._snap(goal)
+            if start is None or goal is None:
+                return []
+        source, target = self._index(start), self._index(goal)
+        if not air and self._regions[source] != self._regions[target]:
+            return []
+        if source == target or self._clear_line(start, goal, air):
+            return [self._center(goal)]
+        cells = self._astar(source, target, air)
+        return self._waypoints(cells) if cells else []
+
+    def _astar(self, source: int, target: int, air: bool) -> List[int]:
+        """The cheapest chain of padded cell indices from source to target."""
+        stride = self._stride
+        target_x, target_y = divmod(target, stride)
+        best = {source: 0.0}
+        came_from = {source: -1}
+        # Ties go to the cell furthest along, which cuts the search short on
+        # open ground where many cells look equally good.
+        frontier = [(0.0, -0.0, source)]
+        push, pop = heapq.heappush, heapq.heappop
+        patterns = self._patterns
+        costs, moves = self._costs_of(air), self._moves[air]
+        while frontier:
+            _, spent, cell = pop(frontier)
+            spent = -spent
+            if cell == target:
+                break
+            if spent > best[cell]:
+                continue
+            for offset, length in patterns[moves[cell]]:
+                neighbour = cell + offset
+                reached = spent + length * costs[neighbour]
+                if reached < best.get(neighbour, _INF):
+                    best[neighbour] = reached
+                    came_from[neighbour] = cell
+                    x, y = divmod(neighbour, stride)
+                    dx = x - target_x if x > target_x else target_x - x
+                    dy = y - target_y if y > target_y else target_y - y
+                    estimate = dx + dy + _OCTILE * (dx if dx < dy else dy)
+                    push(frontier, (reached + estimate, -reached, neighbour))
+        else:
+            return []
+
+        chain = []
+        cell = target
+        while cell != -1:
+            chain.append(cell)
+            cell = came_from[cell]
+        chain.reverse()
+        return chain
+
+    def _waypoints(self, chain: List[int]) -> List[Point2]:
+        """The cells of a chain where its direction changes, then its end."""
+        points: List[Point2] = []
+        for before, cell, after in zip(chain, chain[1:], chain[2:]):
+            if cell - before != after - cell:
+                points.append(self._center(divmod(cell, self._stride), padded=True))
+        points.append(self._center(divmod(chain[-1], self._stride), padded=True))
+        return points
+
+    def _clear_line(self, start: Cell, goal: Cell, air: bool) -> bool:
+        """Whether every cell under the straight line is open and threat-free."""
+        steps = max(abs(goal[0] - start[0]), abs(goal[1] - start[1])) * 4 + 1
+        xs = np.linspace(start[0] + 0.5, goal[0] + 0.5, steps).astype(np.intp)
+        ys = np.linspace(start[1] + 0.5, goal[1] + 0.5, steps).astype(np.intp)
+        return bool(self._threat_free_of(air)[xs + 1, ys + 1].all())
+
+    # --- Grids ---
+
+    def _costs_of(self, air: bool) -> List[float]:
+        costs = self._costs.get(air)
+        if costs is None:
+            threat = self._threats[air]
+            grid = np.ones(self._pathable.shape)
+            if threat is not None:
+                grid[1:-1, 1:-1] += THREAT_COST_WEIGHT * threat
+            open_cells = self._pathable
+            if air:
+                open_cells = np.zeros_like(self._pathable)
+                open_cells[1:-1, 1:-1] = True
+            grid[~open_cells] = np.inf
+            self._threat_free[air] = grid == 1.0
+            costs = self._costs[air] = grid.ravel().tolist()
+        return costs
+
+    def _threat_free_of(self, air: bool) -> np.ndarray:
+        self._costs_of(air)
+        return self._threat_free[air]
+
+    # --- Cells ---
+
+    def _cell(self, point: Point2) -> Cell:
+        width, height = self.shape
+        x = min(max(int(point[0]), 0), width - 1)
+        y = min(max(int(point[1]), 0), height - 1)
+        return x, y
+
+    def _index(self, cell: Cell) -> int:
+        return (cell[0] + 1) * self._stride + cell[1] + 1
+
+    def _snap(self, cell: Cell) -> Optional[Cell]:
+        """The cell itself if pathable, else the nearest pathable one nearby."""
+        x, y = cell[0] + 1, cell[1] + 1
+        if self._pathable[x, y]:
+            return cell
+        window = self._pathable[
+            max(x - SNAP_RADIUS, 0) : x + SNAP_RADIUS + 1,
+            max(y - SNAP_RADIUS, 0) : y + SNAP_RADIUS + 1,
+        ]
+        xs, ys = np.nonzero(window)
+        if not xs.size:
+            return None
+        xs = xs + max(x - SNAP_RADIUS, 0)
+        ys = ys + max(y - SNAP_RADIUS, 0)
+        nearest = ((xs - x) ** 2 + (ys - y) ** 2).argmin()
+        return int(xs[nearest]) - 1, int(ys[nearest]) - 1
+
+    @staticmethod
+    def _center(cell: Tuple[int, int], padded: bool = False) -> Point2:
+        shift = 0.5 - (1 if padded else 0)
+        return Point2((cell[0] + shift, cell[1] + shift))
+
+
+def _move_patterns(stride: int) -> List[Tuple[Tuple[int, float], ...]]:
+    """
+    Every combination of the 8 moves, as (offset, length) pairs, indexed by
+    a bit mask with one bit per move in the order of _STEPS.
+    """
+    steps = [(dx * stride + dy, math.sqrt(dx * dx + dy * dy)) for dx, dy in _STEPS]
+    return [
+        tuple(step for bit, step in enumerate(steps) if mask >> bit & 1)
+        for mask in range(1 << len(steps))
+    ]
+
+
+def _open_moves(open_cells: np.ndarray, stride: int) -> List[int]:
+    """
+    For every padded cell, the bit mask of the moves it can make: onto an
+    open cell, and for diagonals only with both cells beside it open, so no
+    route cuts past a wall corner.
+    """
+    flat = open_cells.ravel()
+    index = np.arange(flat.size)
+    masks = np.zeros(flat.size, dtype=np.int64)
+    # The padding border is never open, so no offset leaves the array from
+    # an open cell; the clipped lookups only matter for border cells.
+    last = flat.size - 1
+
+    def is_open(offset: int) -> np.ndarray:
+        return flat[np.clip(index + offset, 0, last)]
+
+    for bit, (dx, dy) in enumerate(_STEPS):
+        allowed = flat & is_open(dx * stride + dy)
+        if dx and dy:
+            allowed &= is_open(dx * stride) & is_open(dy)
+        masks |= allowed.astype(np.int64) << bit
+    return masks.tolist()
+
+
+def _label_regions(pathable: np.ndarray) -> np.ndarray:
+    """
+    A region label for every cell, as a flat array; cells share a label when
+    ground units can walk between them. Labels spread to the smaller of two
+    neighbouring labels, with pointer jumping to settle long corridors fast.
+    """
+    flat = pathable.ravel()
+    labels = np.where(flat, np.arange(flat.size), -1)
+    # Pairs of orthogonally adjacent open cells. Diagonal moves need both
+    # orthogonal neighbours open, so they never join regions on their own.
+    index = np.arange(flat.size).reshape(pathable.shape)
+    pairs = [
+        (index[:-1, :].ravel(), index[1:, :].ravel()),
+        (index[:, :-1].ravel(), index[:, 1:].ravel()),
+    ]
+    pairs = [(a[flat[a] & flat[b]], b[flat[a] & flat[b]]) for a, b in pairs]
+    first = np.concatenate([a for a, _ in pairs])
+    second = np.concatenate([b for _, b in pairs])
+    while True:
+        low = np.minimum(labels[first], labels[second])
+        changed = False
+        for side in (first, second):
+            roots = labels[side]
+            better = low < labels[roots]
+            if better.any():
+                np.minimum.at(labels, roots[better], low[better])
+                changed = True
+        # Every cell follows its label to that cell's label.
+        open_cells = labels >= 0
+        jumped = labels.copy()
+        jumped[open_cells] = labels[labels[open_cells]]
+        if not changed and (jumped == labels).all():
+            return labels
+        labels = jumped
@@ -0,0 +1,296 @@
+# core/utilities/placement_grid.py
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import numpy as np
+
+from sc2.constants import geyser_ids, mineral_ids
+from sc2.position import Point2
+
+from core.utilities.unit_types import (
+    MINERAL_FIELD_FOOTPRINT,
+    STRUCTURE_FOOTPRINTS_TERRAN,
+    TERRAN_PRODUCTION_TYPES,
+    VESPENE_GEYSER_FOOTPRINT,
+)
+
+if TYPE_CHECKING:
+    from sc2.bot_ai import BotAI
+    from sc2.ids.unit_typeid import UnitTypeId
+    from sc2.unit import Unit
+
+# The number of best local candidates sent to the engine in a single
+# confirmation query before giving up for this frame.
+CONFIRMATION_BATCH_SIZE = 4
+# Seconds a candidate the engine rejected is skipped before it is offered
+# again. Rejections are often temporary, such as units standing on the spot.
+REJECTION_COOLDOWN_SECONDS = 10
+
+Footprint = Tuple[int, int]
+
+
+class PlacementGrid:
+    """
+    A local, incrementally-maintained model of where structures can be placed.
+
+    The grid starts from the map's static `placement_grid` and subtracts the
+    footprints of every structure, mineral field and geyser. It is then kept
+    current by blocking and releasing footprints as structures are started and
+    destroyed, so placement searches are answered from memory instead of a
+    spiral of engine queries.
+
+    Fit queries are answered from a summed-area table of blocked cells. A full
+    fit mask per footprint shape is derived from it in one vectorized pass and
+    cached until the grid changes. All arrays are indexed [x, y], matching the
+    convention used by the threat map.
+    """
+
+    def __init__(self, bot: "BotAI"):
+        self.bot = bot
+        self._base_grid: np.ndarray | None = None
+        self._buildable: np.ndarray | None = None
+        self._integral: np.ndarray | None = None
+        self._fit_masks: Dict[Tuple[Footprint, bool], np.ndarray] = {}
+        # (footprint, center) -> game time until which the engine's rejection
+        # of that placement is trusted.
+        self._rejected: Dict[Tuple[Footprint, Point2], float] = {}
+
+    @property
+    def is_initialized(self) -> bool:
+        return self._buildable is not None
+
+    def initialize(self):
+        """Builds the grid from the map and all currently known obstacles."""
+        placement = self.bot.game_info.placement_grid.data_numpy
+        self.initialize_from_array(np.asarray(placement).T != 0)
+
+        for structure in self.bot.structures:
+            self.block_unit(structure)
+        for structure in self.bot.enemy_structures:
+            self.block_unit(structure)
+        for resource in self.bot.mineral_field:
+            self.block_unit(resource)
+        for resource in self.bot.vespene_geyser:
+            self.block_unit(resource)
+
+    def initialize_from_array(self, buildable: np.ndarray):
+        """
+        Seeds the grid from a boolean [x, y] array of statically buildable cells.
+
+        :param buildable: True where the terrain allows building placement.
+        """
+        self._base_grid = buildable.astype(bool)
+        self._buildable = self._base_grid.copy()
+        self._invalidate()
+
+    def copy(self) -> "PlacementGrid":
+        """Returns an independent grid with the same state, e.g. for planning."""
+        clone = PlacementGrid(self.bot)
+        if self.is_initialized:
+            clone._base_grid = self._base_grid.copy()
+            clone._buildable = self._buildable.copy()
+        return clone
+
+    # --- Incremental Maintenance ---
+
+    @staticmethod
+    def footprint_of(type_id: "UnitTypeId") -> Footprint | None:
+        """Returns the (width, height) a unit type occupies, or None if it does not block."""
+        footprint = STRUCTURE_FOOTPRINTS_TERRAN.get(type_id)
+        if footprint:
+            return footprint
+        if type_id.value in mineral_ids:
+            return MINERAL_FIELD_FOOTPRINT
+        if type_id.value in geyser_ids:
+            return VESPENE_GEYSER_FOOTPRINT
+        return None
+
+    def block_unit(self, unit: "Unit"):
+        """Marks the footprint of an existing unit as occupied."""
+        footprint = self.footprint_of(unit.type_id)
+        if footprint:
+            self.block(unit.position, footprint)
+
+    def block(self, center: Point2, footprint: Footprint):
+        """Marks the cells of a footprint centered on `center` as occupied."""
+        region = self._footprint_slice(center, footprint)
+        if region is not None:
+            self._buildable[region] = False
+            self._invalidate()
+
+    def release(self, center: Point2, footprint: Footprint):
+        """Restores the cells of a footprint to their static buildable state."""
+        region = self._footprint_slice(center, footprint)
+        if region is not None:
+            self._buildable[region] = self._base_grid[region]
+            self._invalidate()
+
+    def _footprint_slice(
+        self, center: Point2, footprint: Footprint
+    ) -> Tuple[slice, slice] | None:
+        if self._buildable is None:
+            return None
+        width, height = footprint
+        x0 = int(round(center.x - width / 2))
+        y0 = int(round(center.y - height / 2))
+        max_x, max_y = self._buildable.shape
+        x0, x1 = max(0, x0), min(max_x, x0 + width)
+        y0, y1 = max(0, y0), min(max_y, y0 + height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return slice(x0, x1), slice(y0, y1)
+
+    def _invalidate(self):
+        self._integral = None
+        self._fit_masks.clear()
+
+    # --- Queries ---
+
+    def _summed_area_table(self) -> np.ndarray:
+        if self._integral is None:
+            blocked = (~self._buildable).astype(np.int32)
+            integral = np.zeros(
+                (blocked.shape[0] + 1, blocked.shape[1] + 1), dtype=np.int32
+            )
+            integral[1:, 1:] = blocked.cumsum(axis=0).cumsum(axis=1)
+            self._integral = integral
+        return self._integral
+
+    def _rect_fit_mask(self, footprint: Footprint) -> np.ndarray:
+        """
+        Returns a [x, y] mask that is True where a rectangle of the given size
+        fits with its lower-left corner on that cell.
+        """
+        width, height = footprint
+        integral = self._summed_area_table()
+        max_x, max_y = self._buildable.shape
+        mask = np.zeros((max_x, max_y), dtype=bool)
+        if width > max_x or height > max_y:
+            return mask
+        blocked_sum = (
+            integral[width:, height:]
+            - integral[: max_x + 1 - width, height:]
+            - integral[width:, : max_y + 1 - height]
+            + integral[: max_x + 1 - width, : max_y + 1 - height]
+        )
+        mask[: max_x + 1 - width, : max_y + 1 - height] = blocked_sum == 0
+        return mask
+
+    def fit_mask(self, footprint: Footprint, with_addon: bool = False) -> np.ndarray:
+        """
+        Returns the cached lower-left fit mask for a footprint, optionally
+        requiring the 2x2 addon slot to the right of the structure to be clear.
+        """
+        key = (footprint, with_addon)
+        mask = self._fit_masks.get(key)
+        if mask is None:
+            mask = self._rect_fit_mask(footprint)
+            if with_addon:
+                addon_mask = self._rect_fit_mask((2, 2))
+                # The addon's lower-left cell sits `width` cells to the right
+                # of the structure's lower-left cell, on the same row.
+                shift = footprint[0]
+                shifted = np.zeros_like(addon_mask)
+                shifted[:-shift, :] = addon_mask[shift:, :]
+                mask = mask & shifted
+            self._fit_masks[key] = mask
+        return mask
+
+    def can_fit(self, type_id: "UnitTypeId", position: Point2) -> bool:
+        """Checks in O(1) whether a structure fits centered on `position`."""
+        footprint = self.footprint_of(type_id)
+        if not footprint or not self.is_initialized:
+            return False
+        width, height = footprint
+        x0 = int(round(position.x - width / 2))
+        y0 = int(round(position.y - height / 2))
+        max_x, max_y = self._buildable.shape
+        if not (0 <= x0 < max_x and 0 <= y0 < max_y):
+            return False
+        return bool(
+            self.fit_mask(footprint, type_id in TERRAN_PRODUCTION_TYPES)[x0, y0]
+        )
+
+    def candidates(
+        self, type_id: "UnitTypeId", near: Point2, max_distance: int = 20
+    ) -> List[Point2]:
+        """
+        Returns every locally valid center position for a structure within
+        `max_distance` of `near`, ordered from closest to farthest.
+        """
+        footprint = self.footprint_of(type_id)
+        if not footprint or not self.is_initialized:
+            return []
+        width, height = footprint
+        mask = self.fit_mask(footprint, type_id in TERRAN_PRODUCTION_TYPES)
+
+        # Restrict the search to the bounding box of the search radius.
+        max_x, max_y = mask.shape
+        x_min = max(0, int(near.x - max_distance - width))
+        x_max = min(max_x, int(near.x + max_distance + 1))
+        y_min = max(0, int(near.y - max_distance - height))
+        y_max = min(max_y, int(near.y + max_distance + 1))
+        xs, ys = np.nonzero(mask[x_min:x_max, y_min:y_max])
+        if xs.size == 0:
+            return []
+
+        centers_x = xs + x_min + width / 2
+        centers_y = ys + y_min + height / 2
+        dist_sq = (centers_x - near.x) ** 2 + (centers_y - near.y) ** 2
+        in_range = dist_sq <= max_distance**2
+        order = np.argsort(dist_sq[in_range], kind="stable")
+        centers_x, centers_y = centers_x[in_range][order], centers_y[in_range][order]
+        return [Point2((float(x), float(y))) for x, y in zip(centers_x, centers_y)]
+
+    async def find_placement(
+        self, type_id: "UnitTypeId", near: Point2, max_distance: int = 20
+    ) -> Point2 | None:
+        """
+        Finds the closest valid placement using the local grid, then confirms
+        the best few candidates with a single batched engine query.
+
+        :return: A confirmed center position, or None if nothing fits.
+        """
+        if not self.is_initialized:
+            self.initialize()
+
+        candidates = [
+            position
+            for position in self.candidates(type_id, near, max_distance)
+            if not self.is_rejected(type_id, position)
+        ]
+        if not candidates:
+            return None
+
+        batch = candidates[:CONFIRMATION_BATCH_SIZE]
+        confirmations = await self.bot.can_place(type_id, batch)
+        for position, is_placeable in zip(batch, confirmations):
+            if is_placeable:
+                return position
+
+        # The engine knows something we do not (e.g., an unseen enemy structure
+        # or units in the way). Skip the rejected spots for a while so the next
+        # query moves on to fresh candidates, without writing the rejection
+        # into the grid for good.
+        for position in batch:
+            self.reject(type_id, position)
+        return None
+
+    def reject(self, type_id: "UnitTypeId", position: Point2):
+        """
+        Records that the engine refused a placement. It is skipped for
+        REJECTION_COOLDOWN_SECONDS, then offered again.
+        """
+        until = self.bot.time + REJECTION_COOLDOWN_SECONDS
+        self._rejected[(self.footprint_of(type_id), position)] = until
+
+    def is_rejected(self, type_id: "UnitTypeId", position: Point2) -> bool:
+        """True while an engine rejection of this placement is still trusted."""
+        key = (self.footprint_of(type_id), position)
+        until = self._rejected.get(key)
+        if until is None:
+            return False
+        if until <= self.bot.time:
+            del self._rejected[key]
+            return False
+        return True
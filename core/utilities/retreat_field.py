@@ -0,0 +1,96 @@
+# core/utilities/retreat_field.py
+from __future__ import annotations
+import math
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from sc2.position import Point2
+
+# The cell itself, then its 8 neighbours. "Stay" comes first so that a cell
+# with no safer neighbour keeps pointing at itself.
+_STEPS = np.array(
+    [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)],
+    dtype=np.intp,
+)
+_STEP_LENGTHS = np.maximum(np.hypot(_STEPS[:, 0], _STEPS[:, 1]), 1.0)
+
+
+class RetreatField:
+    """
+    The Rearguard. Knows, for every cell of the map, which way is safest.
+
+    Built from the threat map and the pathing grid, each cell points at the
+    neighbouring pathable cell where the threat falls fastest. Unpathable cells count
+    as infinitely dangerous, so following the field slides along walls and
+    cliffs instead of running into them. Lookups for a whole squad are a few
+    NumPy indexing operations; nobody has to search for its nearest enemy.
+    All arrays are indexed [x, y], matching the threat map.
+    """
+
+    def __init__(self, threat_map: np.ndarray, pathable: np.ndarray):
+        """
+        :param threat_map: The [x, y] threat map from create_threat_map.
+        :param pathable: A boolean [x, y] array of cells ground units can walk.
+        """
+        self.shape = threat_map.shape
+        width, height = self.shape
+        threat = np.where(pathable, threat_map, np.inf)
+        padded = np.pad(threat, 1, constant_values=np.inf)
+        neighbours = np.stack(
+            [
+                padded[1 + dx : 1 + dx + width, 1 + dy : 1 + dy + height]
+                for dx, dy in _STEPS
+            ]
+        )
+        # Threat shed per unit of distance walked. A unit stuck in an
+        # unpathable cell gains by any pathable step; walls are never stepped
+        # into.
+        here = np.where(pathable, threat_map, np.finfo(np.float32).max)
+        gain = (here[None] - neighbours) / _STEP_LENGTHS[:, None, None]
+        gain[0] = 0.0
+        gain[1:][np.isinf(neighbours[1:])] = -np.inf
+        # (x, y) -> the step towards the safest neighbour, (0, 0) for none.
+        self._step = _STEPS[gain.argmax(axis=0)]
+
+    def directions(self, positions: Sequence["Point2"]) -> np.ndarray:
+        """
+        The safest direction at each position, as (n, 2) unit vectors. Zero
+        where no neighbouring cell is safer.
+        """
+        steps = self._step_at(self._cells(positions)).astype(float)
+        length = np.sqrt((steps**2).sum(axis=1))
+        return steps / np.maximum(length, 1.0)[:, None]
+
+    def retreat_points(
+        self, positions: Sequence["Point2"], distance: float
+    ) -> List[Optional["Point2"]]:
+        """
+        Where each position should fall back to, `distance` away.
+
+        The field is followed cell by cell for `distance` steps, and the point
+        lies `distance` away in the direction of where the walk ended, so a
+        unit next to a wall is sent along it. None where the field leads
+        nowhere, e.g. at a position no enemy threatens.
+        """
+        origins = np.array(positions, dtype=float).reshape(-1, 2)
+        start = self._cells(positions)
+        cells = start
+        for _ in range(max(1, math.ceil(distance))):
+            cells = cells + self._step_at(cells)
+
+        offsets = (cells - start).astype(float)
+        length = np.sqrt((offsets**2).sum(axis=1))
+        points = origins + offsets / np.maximum(length, 1e-9)[:, None] * distance
+        return [
+            Point2((x, y)) if moved > 0 else None
+            for (x, y), moved in zip(points.tolist(), length)
+        ]
+
+    def _cells(self, positions: Sequence["Point2"]) -> np.ndarray:
+        xy = np.array(positions, dtype=float).reshape(-1, 2)
+        limit = np.array(self.shape) - 1
+        return np.clip(xy.astype(np.intp), 0, limit)
+
+    def _step_at(self, cells: np.ndarray) -> np.ndarray:
+        return self._step[cells[:, 0], cells[:, 1]]
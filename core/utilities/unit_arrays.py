@@ -0,0 +1,113 @@
+# core/utilities/unit_arrays.py
+from __future__ import annotations
+from functools import cached_property, wraps
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from sc2.unit import Unit
+
+
+def _column(read: Callable[["UnitArrays"], np.ndarray]) -> cached_property:
+    """A column read from the units once; a subgroup selects it from its group."""
+    name = read.__name__
+
+    @wraps(read)
+    def get(self: "UnitArrays") -> np.ndarray:
+        if self._group is not None:
+            group, indices = self._group
+            return getattr(group, name)[indices]
+        return read(self)
+
+    return cached_property(get)
+
+
+class UnitArrays:
+    """
+    The Census Table. Columns of the attributes vectorized code reads from a
+    group of units, one NumPy array per attribute, in the group's order.
+
+    Reading an attribute of a burnysc2 Unit is a Python call, so a column is
+    read from the units once, on first use, and then shared by everybody who
+    asks for it that frame. A subgroup made by `take` selects its columns
+    from the group's, so the units are never read twice. Real-valued columns
+    are single precision: they are broadcast into (n x m) matrices, and there
+    the cost of every temporary grows with its bytes.
+    """
+
+    def __init__(self, units: Sequence["Unit"]):
+        self.units: List["Unit"] = list(units)
+        self._group: Optional[Tuple["UnitArrays", np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    @_column
+    def tags(self) -> np.ndarray:
+        return np.fromiter((u.tag for u in self.units), np.int64, len(self.units))
+
+    @_column
+    def type_ids(self) -> np.ndarray:
+        """The UnitTypeId values."""
+        return np.fromiter(
+            (u.type_id._value_ for u in self.units), np.int64, len(self.units)
+        )
+
+    @_column
+    def is_flying(self) -> np.ndarray:
+        return np.fromiter((u.is_flying for u in self.units), bool, len(self.units))
+
+    @_column
+    def positions(self) -> np.ndarray:
+        """An (n x 2) array of x, y."""
+        return np.array([u.position for u in self.units], dtype=np.float32).reshape(
+            len(self.units), 2
+        )
+
+    @_column
+    def radius(self) -> np.ndarray:
+        return np.fromiter((u.radius for u in self.units), np.float32, len(self.units))
+
+    @_column
+    def vitality(self) -> np.ndarray:
+        """Health plus shields."""
+        return np.fromiter(
+            (u.health + u.shield for u in self.units), np.float32, len(self.units)
+        )
+
+    @_column
+    def can_be_attacked(self) -> np.ndarray:
+        return np.fromiter(
+            (u.can_be_attacked for u in self.units), bool, len(self.units)
+        )
+
+    @_column
+    def weapon_cooldown(self) -> np.ndarray:
+        return np.fromiter(
+            (u.weapon_cooldown for u in self.units), float, len(self.units)
+        )
+
+    @cached_property
+    def _index(self) -> Dict[int, int]:
+        return {tag: index for index, tag in enumerate(self.tags.tolist())}
+
+    def indices_of(self, tags: Iterable[int]) -> np.ndarray:
+        """The positions of the units with these tags; unknown tags are skipped."""
+        index = self._index
+        return np.array([index[tag] for tag in tags if tag in index], dtype=np.intp)
+
+    def take(self, indices: np.ndarray) -> "UnitArrays":
+        """The subgroup at `indices`, in that order."""
+        subgroup = UnitArrays([self.units[i] for i in indices.tolist()])
+        subgroup._group = (self, indices)
+        return subgroup
@@ -0,0 +1,184 @@
+# core/utilities/unit_counts.py
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Union
+
+import numpy as np
+from sc2.dicts.unit_research_abilities import RESEARCH_INFO
+from sc2.dicts.unit_train_build_abilities import TRAIN_INFO
+from sc2.ids.ability_id import AbilityId
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.ids.upgrade_id import UpgradeId
+
+from core.utilities.unit_types import TERRAN_STRUCTURE_ALIASES, TERRAN_UNIT_ALIASES
+
+if TYPE_CHECKING:
+    from sc2.unit import Unit
+
+TypeQuery = Union[UnitTypeId, Iterable[UnitTypeId]]
+
+# One slot per UnitTypeId value.
+TYPE_COUNT = max(type_id.value for type_id in UnitTypeId) + 1
+
+TERRAN_TRAINERS = {
+    UnitTypeId.SCV,
+    UnitTypeId.COMMANDCENTER,
+    UnitTypeId.ORBITALCOMMAND,
+    UnitTypeId.PLANETARYFORTRESS,
+    UnitTypeId.BARRACKS,
+    UnitTypeId.FACTORY,
+    UnitTypeId.STARPORT,
+}
+# Addons are built by their parent structure and are missing from TRAIN_INFO.
+ADDON_ABILITIES: Dict[AbilityId, UnitTypeId] = {
+    AbilityId.BUILD_TECHLAB_BARRACKS: UnitTypeId.BARRACKSTECHLAB,
+    AbilityId.BUILD_REACTOR_BARRACKS: UnitTypeId.BARRACKSREACTOR,
+    AbilityId.BUILD_TECHLAB_FACTORY: UnitTypeId.FACTORYTECHLAB,
+    AbilityId.BUILD_REACTOR_FACTORY: UnitTypeId.FACTORYREACTOR,
+    AbilityId.BUILD_TECHLAB_STARPORT: UnitTypeId.STARPORTTECHLAB,
+    AbilityId.BUILD_REACTOR_STARPORT: UnitTypeId.STARPORTREACTOR,
+}
+# The tables below are keyed by raw ability id values: hashing an int is much
+# cheaper than hashing an Enum member, and they are hit for every order.
+# Exact ability id -> type id value of the unit, structure or morph it produces.
+ABILITY_TO_TYPE: Dict[int, int] = {
+    info["ability"].value: produced.value
+    for trainer in TERRAN_TRAINERS
+    for produced, info in TRAIN_INFO[trainer].items()
+}
+ABILITY_TO_TYPE.update(
+    {ability.value: addon.value for ability, addon in ADDON_ABILITIES.items()}
+)
+# Abilities that place a structure. The builder keeps the order while the
+# structure is under construction, so the two must not both be counted.
+STRUCTURE_ABILITIES = {
+    info["ability"].value for info in TRAIN_INFO[UnitTypeId.SCV].values()
+} | {ability.value for ability in ADDON_ABILITIES}
+ABILITY_TO_UPGRADE: Dict[int, UpgradeId] = {
+    info["ability"].value: upgrade
+    for researcher in RESEARCH_INFO.values()
+    for upgrade, info in researcher.items()
+}
+# Alternate forms are counted as the type they are built as.
+_ALIASES: Dict[int, int] = {
+    alias.value: base.value
+    for alias, base in {**TERRAN_UNIT_ALIASES, **TERRAN_STRUCTURE_ALIASES}.items()
+}
+
+
+# Rows of the combined histogram taken by `UnitCounts.update`.
+_READY, _CONSTRUCTING, _TRAINING, _QUEUED, _PLACING = (
+    row * TYPE_COUNT for row in range(5)
+)
+
+
+class UnitCounts:
+    """
+    The Census. Dense per-type counts of everything we own or have ordered,
+    taken in a single pass over our units once per frame.
+
+    Every type has three counts:
+    - ready: finished units and structures.
+    - in production: structures under construction, and units and morphs
+      actively being trained.
+    - queued: train orders waiting behind another, and structures a builder
+      has been ordered to place but has not started.
+
+    Alternate forms (sieged, lowered, flying) are counted as the type they
+    are built as, and a structure under construction is never counted twice
+    through its builder's order. Managers query the census instead of
+    rescanning `Units` and calling `already_pending` for every type they care
+    about.
+    """
+
+    def __init__(self):
+        self.ready_counts: np.ndarray = np.zeros(TYPE_COUNT, dtype=np.intp)
+        self.in_production_counts: np.ndarray = np.zeros(TYPE_COUNT, dtype=np.intp)
+        self.queued_counts: np.ndarray = np.zeros(TYPE_COUNT, dtype=np.intp)
+        self.researched: Set[UpgradeId] = set()
+        # Progress (0-1) of every upgrade being researched.
+        self.researching: Dict[UpgradeId, float] = {}
+
+    def update(self, units: Iterable["Unit"], researched: Set[UpgradeId]):
+        """Recounts from all of our units and structures, ready or not."""
+        # Type id values offset by the row they are counted in, so a single
+        # bincount produces every histogram at once.
+        indices: List[int] = []
+        researching: Dict[UpgradeId, float] = {}
+
+        for unit in units:
+            # `_value_` skips the slow `Enum.value` property.
+            value = unit.type_id._value_
+            value = _ALIASES.get(value, value)
+            indices.append(value + (_READY if unit.is_ready else _CONSTRUCTING))
+
+            orders = unit.orders
+            if not orders:
+                continue
+            # A reactor trains two units at once.
+            active = 2 if len(orders) > 1 and unit.has_reactor else 1
+            for position, order in enumerate(orders):
+                ability = order.ability.exact_id._value_
+                produced = ABILITY_TO_TYPE.get(ability)
+                if produced is None:
+                    upgrade = ABILITY_TO_UPGRADE.get(ability)
+                    if upgrade is not None:
+                        researching[upgrade] = order.progress
+                elif ability in STRUCTURE_ABILITIES:
+                    indices.append(produced + _PLACING)
+                elif position < active:
+                    indices.append(produced + _TRAINING)
+                else:
+                    indices.append(produced + _QUEUED)
+
+        ready, constructing, training, queued, placing = np.bincount(
+            np.asarray(indices, dtype=np.intp), minlength=5 * TYPE_COUNT
+        ).reshape(5, TYPE_COUNT)
+        self.ready_counts = ready
+        self.in_production_counts = constructing + training
+        self.queued_counts = queued + np.maximum(placing - constructing, 0)
+        self.researched = researched
+        self.researching = researching
+
+    # --- Queries ---
+
+    def ready(self, types: TypeQuery) -> int:
+        """Finished units and structures of the given type(s)."""
+        return self._sum(self.ready_counts, types)
+
+    def in_production(self, types: TypeQuery) -> int:
+        """Structures under construction and units and morphs being trained."""
+        return self._sum(self.in_production_counts, types)
+
+    def queued(self, types: TypeQuery) -> int:
+        """Waiting train orders, and structures ordered but not yet placed."""
+        return self._sum(self.queued_counts, types)
+
+    def amount(self, types: TypeQuery) -> int:
+        """Ready or in production: what `Units.of_type(...).amount` sees."""
+        return self.ready(types) + self.in_production(types)
+
+    def pending(self, types: TypeQuery) -> int:
+        """In production or queued: what `already_pending` reports."""
+        return self.in_production(types) + self.queued(types)
+
+    def total(self, types: TypeQuery) -> int:
+        """Everything we have or have ordered."""
+        return self.ready(types) + self.pending(types)
+
+    def upgrade_progress(self, upgrade: UpgradeId) -> float:
+        """1 once researched, the research progress while researching, else 0."""
+        if upgrade in self.researched:
+            return 1
+        return self.researching.get(upgrade, 0)
+
+    def upgrade_started(self, upgrade: UpgradeId) -> bool:
+        """True if the upgrade is researched or being researched."""
+        return upgrade in self.researched or upgrade in self.researching
+
+    @staticmethod
+    def _sum(counts: np.ndarray, types: TypeQuery) -> int:
+        if isinstance(types, UnitTypeId):
+            value = types._value_
+            return int(counts[_ALIASES.get(value, value)])
+        values = {_ALIASES.get(t._value_, t._value_) for t in types}
+        return int(sum(counts[value] for value in values))
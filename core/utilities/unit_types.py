@@ -6,6 +6,7 @@ role or other shared characteristics, ensuring consistency and making the
 code easier to read and maintain.
 """
 
+from sc2.dicts.unit_train_build_abilities import TRAIN_INFO
 from sc2.ids.unit_typeid import UnitTypeId
 
 TERRAN_PRODUCTION_TYPES = {
@@ -24,7 +25,26 @@ WORKER_TYPES = {UnitTypeId.SCV, UnitTypeId.PROBE, UnitTypeId.DRONE}
 # A set of all supply provider types across all races.
 SUPPLY_PROVIDER_TYPES = {UnitTypeId.SUPPLYDEPOT, UnitTypeId.OVERLORD, UnitTypeId.PYLON}
 
+# Enemy units and tech that require detection to fight. Seeing any of these
+# raises the detection-need signal, e.g., to bank Orbital energy for scans.
+CLOAK_THREAT_TYPES = {
+    UnitTypeId.DARKSHRINE,
+    UnitTypeId.DARKTEMPLAR,
+    UnitTypeId.OBSERVER,
+    UnitTypeId.BANSHEE,
+    UnitTypeId.GHOST,
+    UnitTypeId.GHOSTACADEMY,
+    UnitTypeId.LURKERDENMP,
+    UnitTypeId.LURKERMP,
+    UnitTypeId.LURKERMPBURROWED,
+}
+
 # --- Terran Specific Types ---
+TOWNHALL_TYPES_TERRAN = {
+    UnitTypeId.COMMANDCENTER,
+    UnitTypeId.ORBITALCOMMAND,
+    UnitTypeId.PLANETARYFORTRESS,
+}
 STRUCTURE_TYPES_TERRAN = {
     UnitTypeId.BARRACKS,
     UnitTypeId.BARRACKSFLYING,
@@ -56,6 +76,95 @@ STRUCTURE_TYPES_TERRAN = {
     UnitTypeId.REFINERY,
 }
 
+# The (width, height) in grid cells that each Terran structure occupies on the
+# placement grid. Addons share the 2x2 footprint regardless of their parent.
+STRUCTURE_FOOTPRINTS_TERRAN = {
+    UnitTypeId.COMMANDCENTER: (5, 5),
+    UnitTypeId.ORBITALCOMMAND: (5, 5),
+    UnitTypeId.PLANETARYFORTRESS: (5, 5),
+    UnitTypeId.BARRACKS: (3, 3),
+    UnitTypeId.FACTORY: (3, 3),
+    UnitTypeId.STARPORT: (3, 3),
+    UnitTypeId.ENGINEERINGBAY: (3, 3),
+    UnitTypeId.ARMORY: (3, 3),
+    UnitTypeId.BUNKER: (3, 3),
+    UnitTypeId.GHOSTACADEMY: (3, 3),
+    UnitTypeId.FUSIONCORE: (3, 3),
+    UnitTypeId.REFINERY: (3, 3),
+    UnitTypeId.SUPPLYDEPOT: (2, 2),
+    UnitTypeId.SUPPLYDEPOTLOWERED: (2, 2),
+    UnitTypeId.MISSILETURRET: (2, 2),
+    UnitTypeId.BARRACKSTECHLAB: (2, 2),
+    UnitTypeId.BARRACKSREACTOR: (2, 2),
+    UnitTypeId.FACTORYTECHLAB: (2, 2),
+    UnitTypeId.FACTORYREACTOR: (2, 2),
+    UnitTypeId.STARPORTTECHLAB: (2, 2),
+    UnitTypeId.STARPORTREACTOR: (2, 2),
+    UnitTypeId.SENSORTOWER: (1, 1),
+}
+
+# Footprints of neutral resources that block placement.
+MINERAL_FIELD_FOOTPRINT = (2, 1)
+VESPENE_GEYSER_FOOTPRINT = (3, 3)
+
+# Offset from a production structure's center to the center of its addon.
+ADDON_OFFSET = (2.5, -0.5)
+
+# The (supply cost, build time in seconds) of each trainable Terran unit.
+TERRAN_UNIT_PRODUCTION = {
+    UnitTypeId.SCV: (1, 12),
+    UnitTypeId.MARINE: (1, 18),
+    UnitTypeId.REAPER: (1, 32),
+    UnitTypeId.MARAUDER: (2, 21),
+    UnitTypeId.GHOST: (2, 29),
+    UnitTypeId.HELLION: (2, 21),
+    UnitTypeId.HELLIONTANK: (2, 21),
+    UnitTypeId.WIDOWMINE: (2, 21),
+    UnitTypeId.CYCLONE: (3, 32),
+    UnitTypeId.SIEGETANK: (3, 32),
+    UnitTypeId.THOR: (6, 43),
+    UnitTypeId.VIKINGFIGHTER: (2, 30),
+    UnitTypeId.MEDIVAC: (2, 30),
+    UnitTypeId.LIBERATOR: (3, 43),
+    UnitTypeId.RAVEN: (2, 34),
+    UnitTypeId.BANSHEE: (3, 43),
+    UnitTypeId.BATTLECRUISER: (6, 64),
+}
+
+# Train ability -> the unit it produces, for reading structure orders.
+TRAIN_ABILITY_TO_UNIT = {
+    info["ability"]: unit
+    for trainer in TRAIN_INFO.values()
+    for unit, info in trainer.items()
+    if unit in TERRAN_UNIT_PRODUCTION
+}
+
+# Alternate modes of Terran units, counted as the unit they are trained as.
+TERRAN_UNIT_ALIASES = {
+    UnitTypeId.SIEGETANKSIEGED: UnitTypeId.SIEGETANK,
+    UnitTypeId.VIKINGASSAULT: UnitTypeId.VIKINGFIGHTER,
+    UnitTypeId.WIDOWMINEBURROWED: UnitTypeId.WIDOWMINE,
+    UnitTypeId.LIBERATORAG: UnitTypeId.LIBERATOR,
+    UnitTypeId.THORAP: UnitTypeId.THOR,
+}
+# Lowered, flying and rich-geyser forms of Terran structures, counted as the
+# structure they are built as.
+TERRAN_STRUCTURE_ALIASES = {
+    UnitTypeId.SUPPLYDEPOTLOWERED: UnitTypeId.SUPPLYDEPOT,
+    UnitTypeId.BARRACKSFLYING: UnitTypeId.BARRACKS,
+    UnitTypeId.FACTORYFLYING: UnitTypeId.FACTORY,
+    UnitTypeId.STARPORTFLYING: UnitTypeId.STARPORT,
+    UnitTypeId.COMMANDCENTERFLYING: UnitTypeId.COMMANDCENTER,
+    UnitTypeId.ORBITALCOMMANDFLYING: UnitTypeId.ORBITALCOMMAND,
+    UnitTypeId.REFINERYRICH: UnitTypeId.REFINERY,
+}
+
+# Supply provided by each Terran structure, and its build time in seconds.
+SUPPLY_DEPOT_SUPPLY = 8
+SUPPLY_DEPOT_BUILD_SECONDS = 21
+COMMAND_CENTER_SUPPLY = 15
+COMMAND_CENTER_BUILD_SECONDS = 71
+
 # --- Zerg Specific Types (Placeholder) ---
 STRUCTURE_TYPES_ZERG = set()
 
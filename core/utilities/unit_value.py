@@ -1,6 +1,8 @@
 # core/utilities/unit_value.py
 
 from typing import TYPE_CHECKING
+
+import numpy as np
 from sc2.ids.unit_typeid import UnitTypeId
 
 # This block was missing. It provides the definitions for type hints.
@@ -51,6 +53,19 @@ THREAT_SCORE_MAP = {
 DEFAULT_THREAT_SCORE = 5
 
 
+def _threat_score_table() -> np.ndarray:
+    """THREAT_SCORE_MAP as a table indexed by UnitTypeId value."""
+    table = np.full(
+        max(t.value for t in UnitTypeId) + 1, DEFAULT_THREAT_SCORE, np.float32
+    )
+    for unit_type_id, score in THREAT_SCORE_MAP.items():
+        table[unit_type_id.value] = score
+    return table
+
+
+_THREAT_SCORES = _threat_score_table()
+
+
 def calculate_threat_value(unit_type_id: UnitTypeId) -> float:
     """
     Calculates the tactical threat of a single unit based on a heuristic map.
@@ -64,6 +79,16 @@ def calculate_threat_value(unit_type_id: UnitTypeId) -> float:
     return THREAT_SCORE_MAP.get(unit_type_id, DEFAULT_THREAT_SCORE)
 
 
+def threat_values(type_ids: np.ndarray) -> np.ndarray:
+    """
+    The threat scores of many units at once.
+
+    :param type_ids: An array of UnitTypeId values.
+    :return: An array of the matching threat scores.
+    """
+    return _THREAT_SCORES[type_ids]
+
+
 def calculate_resource_value(unit_type_id: UnitTypeId, game_data: "GameData") -> int:
     """
     Calculates the combined mineral and vespene cost of a unit.
@@ -0,0 +1,137 @@
+# core/utilities/weapon_table.py
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Tuple
+
+import numpy as np
+from sc2.ids.unit_typeid import UnitTypeId
+
+if TYPE_CHECKING:
+    from sc2.game_data import GameData
+    from core.utilities.unit_arrays import UnitArrays
+
+# Weapon.TargetType values of the game data.
+_TARGETS_GROUND = {1, 3}
+_TARGETS_AIR = {2, 3}
+# The game never lets armor reduce an attack below this.
+MINIMUM_DAMAGE_PER_ATTACK = 0.5
+# Type mixes whose stat tables are kept; the cache starts over when full.
+TYPE_TABLE_CACHE_SIZE = 256
+
+# (damage per shot, cooldown in seconds, range, attacks per shot) of one
+# attacker against one target. All zero when the attacker cannot hit it.
+WeaponStats = Tuple[float, float, float, int]
+_NO_WEAPON: WeaponStats = (0.0, 0.0, 0.0, 0)
+
+
+class WeaponTable:
+    """
+    The Armoury. Damage per shot, cooldown and range of every attacker type
+    against every target type, read from the game data.
+
+    Damage per shot includes every attack of a volley, the bonus against
+    the target's attributes and the target's base armor. Upgrades are not
+    included. Each (attacker, target) pair is worked out once and cached,
+    and `matrices` expands the cache to whole groups of units at once.
+    Armies keep their type mix from frame to frame, so the small table of
+    the mix is cached as well.
+    """
+
+    def __init__(self, game_data: "GameData"):
+        self.game_data = game_data
+        self._stats: Dict[Tuple[int, int, bool], WeaponStats] = {}
+        # Stat tables of the type mixes `matrices` has seen, by the bytes of
+        # their attacker types and target keys.
+        self._tables: Dict[Tuple[bytes, bytes], np.ndarray] = {}
+
+    def stats(
+        self, attacker: UnitTypeId, target: UnitTypeId, target_is_flying: bool
+    ) -> WeaponStats:
+        """Damage per shot, cooldown, range and attacks of the best weapon."""
+        key = (attacker._value_, target._value_, target_is_flying)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = self._calculate(
+                attacker, target, target_is_flying
+            )
+        return stats
+
+    def damage(
+        self, attacker: UnitTypeId, target: UnitTypeId, target_is_flying: bool
+    ) -> float:
+        return self.stats(attacker, target, target_is_flying)[0]
+
+    def matrices(
+        self, attackers: "UnitArrays", targets: "UnitArrays"
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (attacker x target) matrices of damage per shot, cooldown and range.
+        Only distinct type pairs are looked up; the rest is NumPy indexing.
+        """
+        attacker_types, attacker_index = np.unique(
+            attackers.type_ids, return_inverse=True
+        )
+        # Flying is folded into the lowest bit of the target key.
+        target_keys, target_index = np.unique(
+            targets.type_ids * 2 + targets.is_flying, return_inverse=True
+        )
+        table = self._type_table(attacker_types, target_keys)
+        rows, columns = attacker_index.reshape(-1), target_index.reshape(-1)
+        # Rows, then columns: two cheap gathers instead of one 2-D fancy index.
+        return tuple(table[stat][rows][:, columns] for stat in range(3))
+
+    def _type_table(
+        self, attacker_types: np.ndarray, target_keys: np.ndarray
+    ) -> np.ndarray:
+        """
+        The (stat x attacker type x target key) table, cached per type mix.
+        Stat-major, so each stat's slice is contiguous and gathers quickly;
+        single precision, like the UnitArrays columns it is combined with.
+        """
+        key = (attacker_types.tobytes(), target_keys.tobytes())
+        table = self._tables.get(key)
+        if table is None:
+            if len(self._tables) >= TYPE_TABLE_CACHE_SIZE:
+                self._tables.clear()
+            table = np.array(
+                [
+                    [
+                        self.stats(
+                            UnitTypeId(attacker),
+                            UnitTypeId(target_key >> 1),
+                            bool(target_key & 1),
+                        )
+                        for target_key in target_keys.tolist()
+                    ]
+                    for attacker in attacker_types.tolist()
+                ],
+                dtype=np.float32,
+            ).reshape(len(attacker_types), len(target_keys), 4)
+            table = self._tables[key] = np.ascontiguousarray(table.transpose(2, 0, 1))
+        return table
+
+    def _calculate(
+        self, attacker: UnitTypeId, target: UnitTypeId, target_is_flying: bool
+    ) -> WeaponStats:
+        attacker_data = self.game_data.units[attacker._value_]._proto
+        target_data = self.game_data.units[target._value_]._proto
+        usable = set()
+        if target_is_flying or target == UnitTypeId.COLOSSUS:
+            usable |= _TARGETS_AIR
+        if not target_is_flying:
+            usable |= _TARGETS_GROUND
+
+        best = _NO_WEAPON
+        attributes = set(target_data.attributes)
+        for weapon in attacker_data.weapons:
+            if weapon.type not in usable:
+                continue
+            per_attack = weapon.damage + sum(
+                bonus.bonus
+                for bonus in weapon.damage_bonus
+                if bonus.attribute in attributes
+            )
+            per_attack = max(per_attack - target_data.armor, MINIMUM_DAMAGE_PER_ATTACK)
+            damage = per_attack * weapon.attacks
+            if damage > best[0]:
+                best = (damage, weapon.speed, weapon.range, weapon.attacks)
+        return best
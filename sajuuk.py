@@ -11,12 +11,14 @@ from core.global_cache import GlobalCache
 from core.game_analysis import GameAnalyzer
 from core.frame_plan import FramePlan
 from core.types import CommandFunctor
+from core.utilities.pathfinder import Pathfinder
 from core.interfaces.race_general_abc import RaceGeneral
 from core.utilities.events import (
     Event,
     EventType,
     UnitDestroyedPayload,
     EnemyUnitSeenPayload,
+    ConstructionStartedPayload,
 )
 from terran.general.terran_general import TerranGeneral
 
@@ -45,6 +47,8 @@ class Sajuuk(BotAI):
         self.active_general: RaceGeneral | None = None
 
     async def on_start(self):
+        self.global_cache.ground_distance.start(self)
+        self.global_cache.pathfinder = Pathfinder.from_game_info(self.game_info)
         if self.race == Race.Terran:
             self.active_general = TerranGeneral(self)
         else:
@@ -68,6 +72,14 @@ class Sajuuk(BotAI):
             )
         )
 
+    async def on_building_construction_started(self, unit: Unit):
+        self.event_bus.publish(
+            Event(
+                EventType.INFRA_CONSTRUCTION_STARTED,
+                ConstructionStartedPayload(unit.tag, unit.type_id, unit.position),
+            )
+        )
+
     async def on_step(self, iteration: int):
         game_time = self.time_formatted
         log = self.logger.bind(game_time=game_time)
@@ -14,8 +14,10 @@ from .structures.production_structure_manager import ProductionStructureManager
 from .production.barracks_manager import BarracksManager
 from .production.factory_manager import FactoryManager
 from .production.starport_manager import StarportManager
-from .upgrades.engineering_bay_manager import EngineeringBayManager
-from .upgrades.armory_manager import ArmoryManager
+from .production.production_scheduler import ProductionScheduler
+from .upgrades.research_scheduler import ResearchScheduler
+from terran.specialists.build_orders.build_order_engine import BuildOrderEngine
+from terran.specialists.build_orders.build_order_plan import load_build_order
 
 if TYPE_CHECKING:
     from sc2.bot_ai import BotAI
@@ -24,6 +26,8 @@ if TYPE_CHECKING:
     from core.frame_plan import FramePlan
 
 # --- Strategic Production Configuration ---
+# The build order data file played before the dynamic goals take over.
+OPENING_BUILD_ORDER = "two_rax_reaper"
 TARGET_ARMY_SUPPLY_CAP: Dict[int, int] = {1: 40, 2: 100, 3: 160, 4: 180}
 TARGET_UNIT_RATIOS: Dict[UnitTypeId, float] = {
     UnitTypeId.MARINE: 0.60,
@@ -44,6 +48,45 @@ UPGRADE_PRIORITY_PATH: List[UpgradeId] = [
     UpgradeId.TERRANINFANTRYARMORSLEVEL3,
 ]
 
+# Defines which production structures are desired at each base count.
+TECH_TREE_TARGETS: Dict[int, Dict[UnitTypeId, int]] = {
+    1: {
+        UnitTypeId.BARRACKS: 1,
+        UnitTypeId.FACTORY: 1,
+        UnitTypeId.ENGINEERINGBAY: 1,
+    },
+    2: {
+        UnitTypeId.BARRACKS: 3,
+        UnitTypeId.FACTORY: 1,
+        UnitTypeId.STARPORT: 1,
+        UnitTypeId.ENGINEERINGBAY: 1,
+        UnitTypeId.ARMORY: 1,
+    },
+    3: {
+        UnitTypeId.BARRACKS: 5,
+        UnitTypeId.FACTORY: 2,
+        UnitTypeId.STARPORT: 1,
+        UnitTypeId.ENGINEERINGBAY: 1,
+        UnitTypeId.ARMORY: 1,
+    },
+}
+# Defines the target number of each addon type at each base count.
+ADDON_TARGETS: Dict[int, Dict[UnitTypeId, int]] = {
+    1: {UnitTypeId.BARRACKSTECHLAB: 1, UnitTypeId.FACTORYTECHLAB: 1},
+    2: {
+        UnitTypeId.BARRACKSTECHLAB: 1,
+        UnitTypeId.BARRACKSREACTOR: 2,
+        UnitTypeId.FACTORYTECHLAB: 1,
+        UnitTypeId.STARPORTTECHLAB: 1,
+    },
+    3: {
+        UnitTypeId.BARRACKSTECHLAB: 2,
+        UnitTypeId.BARRACKSREACTOR: 3,
+        UnitTypeId.FACTORYTECHLAB: 1,
+        UnitTypeId.STARPORTTECHLAB: 1,
+    },
+}
+
 
 class CapabilityDirector(Director):
     """
@@ -52,75 +95,53 @@ class CapabilityDirector(Director):
     upgrades, structures, and addons to aim for) and populate the FramePlan.
     It then delegates the "how" (executing the builds and research) to its
     specialized managers.
+
+    During the opening, the BuildOrderEngine sets the goals instead, until
+    every step of the opening build order has started.
     """
 
     def __init__(self, bot: "BotAI"):
         super().__init__(bot)
+        self.build_order_engine = BuildOrderEngine(
+            bot, load_build_order(OPENING_BUILD_ORDER)
+        )
         # Instantiate all specialized managers
         self.production_structure_manager = ProductionStructureManager(bot)
         self.barracks_manager = BarracksManager(bot)
         self.factory_manager = FactoryManager(bot)
         self.starport_manager = StarportManager(bot)
-        self.engineering_bay_manager = EngineeringBayManager(bot)
-        self.armory_manager = ArmoryManager(bot)
+        self.research_scheduler = ResearchScheduler(bot)
+        self.production_scheduler = ProductionScheduler(bot)
 
         # Define the execution order
         self.managers: List[Manager] = [
             self.production_structure_manager,
-            self.engineering_bay_manager,
-            self.armory_manager,
+            # Starts research in parallel on every idle research structure.
+            self.research_scheduler,
             self.barracks_manager,
             self.factory_manager,
             self.starport_manager,
+            # Trains units last, on the structures the managers left free.
+            self.production_scheduler,
         ]
 
         # Defines which production structures are desired at each base count
-        self.tech_tree_targets: Dict[int, Dict[UnitTypeId, int]] = {
-            1: {
-                UnitTypeId.BARRACKS: 1,
-                UnitTypeId.FACTORY: 1,
-                UnitTypeId.ENGINEERINGBAY: 1,
-            },
-            2: {
-                UnitTypeId.BARRACKS: 3,
-                UnitTypeId.FACTORY: 1,
-                UnitTypeId.STARPORT: 1,
-                UnitTypeId.ENGINEERINGBAY: 1,
-                UnitTypeId.ARMORY: 1,
-            },
-            3: {
-                UnitTypeId.BARRACKS: 5,
-                UnitTypeId.FACTORY: 2,
-                UnitTypeId.STARPORT: 1,
-                UnitTypeId.ENGINEERINGBAY: 1,
-                UnitTypeId.ARMORY: 1,
-            },
-        }
+        self.tech_tree_targets: Dict[int, Dict[UnitTypeId, int]] = TECH_TREE_TARGETS
         # Defines the target number of each addon type at each base count
-        self.addon_targets: Dict[int, Dict[UnitTypeId, int]] = {
-            1: {UnitTypeId.BARRACKSTECHLAB: 1, UnitTypeId.FACTORYTECHLAB: 1},
-            2: {
-                UnitTypeId.BARRACKSTECHLAB: 1,
-                UnitTypeId.BARRACKSREACTOR: 2,
-                UnitTypeId.FACTORYTECHLAB: 1,
-                UnitTypeId.STARPORTTECHLAB: 1,
-            },
-            3: {
-                UnitTypeId.BARRACKSTECHLAB: 2,
-                UnitTypeId.BARRACKSREACTOR: 3,
-                UnitTypeId.FACTORYTECHLAB: 1,
-                UnitTypeId.STARPORTTECHLAB: 1,
-            },
-        }
+        self.addon_targets: Dict[int, Dict[UnitTypeId, int]] = ADDON_TARGETS
 
     async def execute(
         self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
     ) -> list[CommandFunctor]:
+        actions: list[CommandFunctor] = []
         # 1. Director-level logic: Determine goals and populate the FramePlan
-        self._set_production_goals(cache, plan)
+        if self.build_order_engine.is_complete:
+            self._set_production_goals(cache, plan)
+        else:
+            # The opening build order owns the goals until it hands off.
+            actions.extend(await self.build_order_engine.execute(cache, plan, bus))
 
         # 2. Manager execution: Delegate actions to specialized managers
-        actions: list[CommandFunctor] = []
         for manager in self.managers:
             manager_actions = await manager.execute(cache, plan, bus)
             actions.extend(manager_actions)
@@ -129,8 +150,7 @@ class CapabilityDirector(Director):
     def _set_production_goals(self, cache: "GlobalCache", plan: "FramePlan"):
         """Populates the FramePlan with the strategic goals for this frame."""
         num_bases = self.bot.townhalls.amount
-        s = cache.friendly_structures
-        p = self.bot.already_pending
+        counts = cache.unit_counts
 
         # --- Goal 1: Set desired army composition ---
         target_army_supply = TARGET_ARMY_SUPPLY_CAP.get(num_bases, 180)
@@ -144,12 +164,11 @@ class CapabilityDirector(Director):
         )
         plan.tech_goals = set()
         for building_id, target_count in target_structs.items():
-            current_count = s.of_type(building_id).amount + p(building_id)
-            if current_count < target_count:
+            if counts.total(building_id) < target_count:
                 plan.tech_goals.add(building_id)
 
-        # --- Goal 3: Set desired upgrade ---
-        plan.upgrade_goal = self._get_next_upgrade(cache)
+        # --- Goal 3: Set desired upgrades, in priority order ---
+        plan.upgrade_goal = self._get_upgrade_goals(cache)
 
         # --- Goal 4: Set desired addons ---
         plan.addon_goal = self.addon_targets.get(num_bases, self.addon_targets[3])
@@ -167,12 +186,14 @@ class CapabilityDirector(Director):
                 goals[unit_id] = int(target_army_supply * ratio / unit_supply_cost)
         return goals
 
-    def _get_next_upgrade(self, cache: "GlobalCache") -> List[UpgradeId]:
-        """Finds the next upgrade in the priority path that is not yet started."""
-        for upgrade_id in UPGRADE_PRIORITY_PATH:
-            if (
-                upgrade_id not in cache.friendly_upgrades
-                and self.bot.already_pending_upgrade(upgrade_id) == 0
-            ):
-                return [upgrade_id]
-        return []
+    def _get_upgrade_goals(self, cache: "GlobalCache") -> List[UpgradeId]:
+        """
+        Every upgrade in the priority path that is not yet started. The
+        ResearchScheduler starts as many of them at once as it can.
+        """
+        counts = cache.unit_counts
+        return [
+            upgrade_id
+            for upgrade_id in UPGRADE_PRIORITY_PATH
+            if not counts.upgrade_started(upgrade_id)
+        ]
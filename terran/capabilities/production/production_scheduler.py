@@ -0,0 +1,148 @@
+# terran/capabilities/production/production_scheduler.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List
+
+from sc2.ids.unit_typeid import UnitTypeId
+
+from core.interfaces.manager_abc import Manager
+from core.types import CommandFunctor
+from core.resource_ledger import BudgetCategory
+from core.utilities.unit_types import TERRAN_PRODUCTION_TYPES, TRAIN_ABILITY_TO_UNIT
+from terran.specialists.build_orders.tech_data import TECH_SPECS
+
+if TYPE_CHECKING:
+    from sc2.bot_ai import BotAI
+    from sc2.unit import Unit
+    from core.global_cache import GlobalCache
+    from core.event_bus import EventBus
+    from core.frame_plan import FramePlan
+
+# --- Tunable Production Constants ---
+# Units are assigned in this order. Units that need a tech lab come first,
+# as they can only use the few structures that have one.
+PRODUCTION_PRIORITY: List[UnitTypeId] = [
+    UnitTypeId.GHOST,
+    UnitTypeId.MARAUDER,
+    UnitTypeId.SIEGETANK,
+    UnitTypeId.THOR,
+    UnitTypeId.CYCLONE,
+    UnitTypeId.BANSHEE,
+    UnitTypeId.RAVEN,
+    UnitTypeId.BATTLECRUISER,
+    UnitTypeId.MEDIVAC,
+    UnitTypeId.VIKINGFIGHTER,
+    UnitTypeId.LIBERATOR,
+    UnitTypeId.WIDOWMINE,
+    UnitTypeId.HELLION,
+    UnitTypeId.HELLIONTANK,
+    UnitTypeId.MARINE,
+    UnitTypeId.REAPER,
+]
+
+
+@dataclass
+class ProductionSlot:
+    """One free production queue on a ready Barracks, Factory or Starport."""
+
+    structure: "Unit"
+    has_techlab: bool
+    has_reactor: bool
+    # True for the second slot of a reactor that is already training or
+    # was given a unit earlier this frame.
+    queued: bool = False
+
+
+class ProductionScheduler(Manager):
+    """
+    The Master Scheduler. Plans unit production for every Barracks, Factory
+    and Starport in one pass.
+
+    The composition deficit is read once per frame from the census of our
+    army and of the units already in production. Units are then handed
+    out in priority order to the free production slots that suit them best:
+    tech-lab units to tech labs, everything else to reactors first and tech
+    labs last, so the scarce slots stay open for the units that need them.
+    Every unit is paid for through the ResourceLedger.
+    """
+
+    def __init__(self, bot: "BotAI"):
+        super().__init__(bot)
+
+    async def execute(
+        self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
+    ) -> List[CommandFunctor]:
+        """Assigns the units of the composition goal to free production slots."""
+        goals = plan.unit_composition_goal
+        if not goals:
+            return []
+        slots = self.free_slots(cache, plan)
+        if not slots:
+            return []
+
+        deficits = self.deficits(cache, goals)
+        actions: List[CommandFunctor] = []
+        for unit_id in PRODUCTION_PRIORITY:
+            deficit = deficits.get(unit_id, 0)
+            if deficit <= 0:
+                continue
+            spec = TECH_SPECS[unit_id]
+            candidates = [
+                slot
+                for slot in slots
+                if slot.structure.type_id == spec.producer
+                and (slot.has_techlab or not spec.needs_techlab)
+            ]
+            # Reactors first, tech labs last.
+            candidates.sort(key=lambda slot: (slot.has_techlab, not slot.has_reactor))
+            for slot in candidates[:deficit]:
+                if not plan.resource_ledger.reserve(
+                    BudgetCategory.CAPABILITIES, unit_id
+                ):
+                    break
+                slots.remove(slot)
+                actions.append(
+                    lambda s=slot.structure, u=unit_id, q=slot.queued: s.train(
+                        u, queue=q
+                    )
+                )
+        if actions:
+            cache.logger.debug(f"ProductionScheduler queued {len(actions)} unit(s).")
+        return actions
+
+    def deficits(
+        self, cache: "GlobalCache", goals: Dict[UnitTypeId, int]
+    ) -> Dict[UnitTypeId, int]:
+        """Goal minus (existing + in production + queued) for each goal unit."""
+        counts = cache.unit_counts
+        return {
+            unit_id: target - counts.total(unit_id) for unit_id, target in goals.items()
+        }
+
+    def free_slots(
+        self, cache: "GlobalCache", plan: "FramePlan"
+    ) -> List[ProductionSlot]:
+        """
+        Every open production queue: one per idle structure, two on an idle
+        reactor, and the spare one on a reactor training a single unit.
+        """
+        slots: List[ProductionSlot] = []
+        structures = cache.friendly_structures.of_type(TERRAN_PRODUCTION_TYPES).ready
+        for structure in structures:
+            if structure.tag in plan.busy_structure_tags:
+                continue
+            orders = structure.orders
+            if any(TRAIN_ABILITY_TO_UNIT.get(o.ability.id) is None for o in orders):
+                # Building an addon or lifting off.
+                continue
+            capacity = 2 if structure.has_reactor else 1
+            for queue_index in range(len(orders), capacity):
+                slots.append(
+                    ProductionSlot(
+                        structure,
+                        structure.has_techlab,
+                        structure.has_reactor,
+                        queued=queue_index > 0,
+                    )
+                )
+        return slots
@@ -47,7 +47,7 @@ class ProductionStructureManager(Manager):
 
         payload = BuildRequestPayload(
             item_id=goal_building,
-            position=self.bot.start_location,  # ConstructionManager will find specific placement
+            position=None,  # ConstructionManager assigns a precomputed layout slot
             priority=EVENT_PRIORITY_NORMAL,
             unique=True,  # Prevent spamming requests for the same building type
         )
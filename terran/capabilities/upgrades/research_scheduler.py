@@ -0,0 +1,131 @@
+# terran/capabilities/upgrades/research_scheduler.py
+from __future__ import annotations
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from sc2.dicts.unit_research_abilities import RESEARCH_INFO
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.ids.upgrade_id import UpgradeId
+
+from core.interfaces.manager_abc import Manager
+from core.types import CommandFunctor
+from core.resource_ledger import BudgetCategory
+from core.utilities.constants import GAME_LOOPS_PER_SECOND
+
+if TYPE_CHECKING:
+    from sc2.bot_ai import BotAI
+    from sc2.unit import Unit
+    from core.global_cache import GlobalCache
+    from core.event_bus import EventBus
+    from core.frame_plan import FramePlan
+
+RESEARCH_STRUCTURE_TYPES = {
+    UnitTypeId.ENGINEERINGBAY,
+    UnitTypeId.ARMORY,
+    UnitTypeId.BARRACKSTECHLAB,
+    UnitTypeId.FACTORYTECHLAB,
+    UnitTypeId.STARPORTTECHLAB,
+    UnitTypeId.FUSIONCORE,
+    UnitTypeId.GHOSTACADEMY,
+}
+# Upgrade -> the structure that researches it.
+UPGRADE_RESEARCHER: Dict[UpgradeId, UnitTypeId] = {
+    upgrade: structure
+    for structure in RESEARCH_STRUCTURE_TYPES
+    for upgrade in RESEARCH_INFO.get(structure, {})
+}
+
+
+class ResearchScheduler(Manager):
+    """
+    The Provost. Starts every upgrade of the FramePlan's upgrade goal that
+    can be researched right now, in parallel across all idle Engineering
+    Bays, Armories, tech labs and other research structures.
+
+    Upgrades are taken in goal order. An upgrade is researchable once its
+    previous level is finished and its required building is ready. Research
+    is paid for through the ResourceLedger; when the next upgrade in line is
+    not affordable, nothing behind it is started, so cheaper upgrades never
+    delay a more important one.
+
+    The time research structures sit idle while an upgrade they could
+    research is still waiting is tracked per structure type in
+    `idle_seconds`.
+    """
+
+    def __init__(self, bot: "BotAI"):
+        super().__init__(bot)
+        # Seconds of idle research structure time spent while an upgrade of
+        # the goal was waiting for that structure type.
+        self.idle_seconds: Dict[UnitTypeId, float] = defaultdict(float)
+        self._last_game_loop: Optional[int] = None
+
+    @property
+    def total_idle_seconds(self) -> float:
+        return sum(self.idle_seconds.values())
+
+    async def execute(
+        self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
+    ) -> List[CommandFunctor]:
+        """Assigns researchable upgrades to every idle research structure."""
+        elapsed = self._elapsed_seconds(cache)
+        counts = cache.unit_counts
+        waiting = [
+            upgrade
+            for upgrade in plan.upgrade_goal
+            if upgrade in UPGRADE_RESEARCHER and not counts.upgrade_started(upgrade)
+        ]
+        if not waiting:
+            return []
+        idle = self.idle_structures(cache, plan)
+        if not idle:
+            return []
+
+        actions: List[CommandFunctor] = []
+        for upgrade in waiting:
+            structures = idle.get(UPGRADE_RESEARCHER[upgrade])
+            if not structures or not self.is_researchable(upgrade, cache):
+                continue
+            if not plan.resource_ledger.reserve(BudgetCategory.CAPABILITIES, upgrade):
+                break
+            structure = structures.pop()
+            cache.logger.info(
+                f"ResearchScheduler starting {upgrade.name} at {structure.type_id.name}."
+            )
+            actions.append(lambda s=structure, u=upgrade: s.research(u))
+
+        # Whatever is still idle waited this frame for an upgrade it could do.
+        waiting_types = {UPGRADE_RESEARCHER[upgrade] for upgrade in waiting}
+        for type_id, structures in idle.items():
+            if structures and type_id in waiting_types:
+                self.idle_seconds[type_id] += elapsed * len(structures)
+        return actions
+
+    def idle_structures(
+        self, cache: "GlobalCache", plan: "FramePlan"
+    ) -> Dict[UnitTypeId, List["Unit"]]:
+        """Ready research structures without orders, grouped by type."""
+        idle: Dict[UnitTypeId, List["Unit"]] = defaultdict(list)
+        for structure in cache.friendly_structures.of_type(RESEARCH_STRUCTURE_TYPES):
+            if (
+                structure.is_ready
+                and not structure.orders
+                and structure.tag not in plan.busy_structure_tags
+            ):
+                idle[structure.type_id].append(structure)
+        return idle
+
+    def is_researchable(self, upgrade: UpgradeId, cache: "GlobalCache") -> bool:
+        """True if the upgrade's previous level and required building are done."""
+        info = RESEARCH_INFO[UPGRADE_RESEARCHER[upgrade]][upgrade]
+        required_upgrade = info.get("required_upgrade")
+        if required_upgrade and required_upgrade not in cache.friendly_upgrades:
+            return False
+        required_building = info.get("required_building")
+        return not required_building or cache.unit_counts.ready(required_building) > 0
+
+    def _elapsed_seconds(self, cache: "GlobalCache") -> float:
+        last, self._last_game_loop = self._last_game_loop, cache.game_loop
+        if last is None:
+            return 0.0
+        return (cache.game_loop - last) / GAME_LOOPS_PER_SECOND
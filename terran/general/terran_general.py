@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 # Core architectural components
 from core.interfaces.race_general_abc import RaceGeneral
 from core.types import CommandFunctor
+from core.resource_ledger import BudgetCategory, ResourceLedger
 
 # The Directors this General will orchestrate
 from terran.infrastructure.infrastructure_director import InfrastructureDirector
@@ -36,6 +37,8 @@ class TerranGeneral(RaceGeneral):
         as a "command factory" to create the command functors.
         """
         super().__init__(bot)
+        # The single account all spending managers reserve resources from.
+        self.resource_ledger = ResourceLedger(bot)
         self.infrastructure_director = InfrastructureDirector(bot)
         self.capability_director = CapabilityDirector(bot)
         self.tactical_director = TacticalDirector(bot)
@@ -45,9 +48,9 @@ class TerranGeneral(RaceGeneral):
         Called once at the start of the game. Can be used for one-time
         setup tasks that require async operations.
         """
-        # This is a hook for future use, e.g., pre-calculating optimal
-        # defensive positions or wall-off locations.
-        pass
+        # Precompute the placement grid and per-base building layouts
+        # (ramp wall, production grid, turret spots).
+        await self.infrastructure_director.on_start()
 
     async def execute_step(
         self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
@@ -70,9 +73,16 @@ class TerranGeneral(RaceGeneral):
         """
         actions: list[CommandFunctor] = []
 
+        # Open the frame's account. Each category's unspent share is released
+        # to the next Director once its own Director has finished.
+        self.resource_ledger.begin_frame(cache, plan)
+        plan.resource_ledger = self.resource_ledger
+
         # The core orchestration sequence.
         actions.extend(await self.infrastructure_director.execute(cache, plan, bus))
+        self.resource_ledger.close(BudgetCategory.INFRASTRUCTURE)
         actions.extend(await self.capability_director.execute(cache, plan, bus))
+        self.resource_ledger.close(BudgetCategory.CAPABILITIES)
         actions.extend(await self.tactical_director.execute(cache, plan, bus))
 
         return actions
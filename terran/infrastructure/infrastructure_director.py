@@ -39,7 +39,7 @@ class InfrastructureDirector(Director):
 
         self.scv_manager = SCVManager(bot)
         self.mule_manager = MuleManager(bot)
-        self.supply_manager = SupplyManager(bot)
+        self.supply_manager = SupplyManager(bot, self)
         self.expansion_manager = ExpansionManager(bot)
         # --- MODIFICATION: Pass 'self' (the director instance) to the manager ---
         self.refinery_manager = RefineryManager(bot, self)
@@ -57,6 +57,10 @@ class InfrastructureDirector(Director):
             self.construction_manager,  # Construction is last to fulfill requests made this frame.
         ]
 
+    async def on_start(self):
+        """One-time setup for managers that precompute map data."""
+        await self.construction_manager.on_start()
+
     def _set_economic_goals(self, cache: "GlobalCache", plan: "FramePlan"):
         """
         Analyzes the game state to decide the economic priority for the frame
@@ -67,12 +71,11 @@ class InfrastructureDirector(Director):
 
         # Check if a Command Center is already being built or is in the construction queue.
         # We need to ask the ConstructionManager about its queue.
-        is_expansion_in_queue = any(
-            req.item_id == UnitTypeId.COMMANDCENTER
-            for req in self.construction_manager.build_queue
+        is_expansion_in_queue = self.construction_manager.is_pending(
+            UnitTypeId.COMMANDCENTER
         )
         is_already_expanding = (
-            self.bot.already_pending(UnitTypeId.COMMANDCENTER) > 0
+            cache.unit_counts.pending(UnitTypeId.COMMANDCENTER) > 0
             or is_expansion_in_queue
         )
 
@@ -0,0 +1,190 @@
+# terran/infrastructure/structures/build_queue.py
+from __future__ import annotations
+import heapq
+import itertools
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterator, List
+
+if TYPE_CHECKING:
+    from sc2.ids.unit_typeid import UnitTypeId
+    from sc2.position import Point2
+    from core.utilities.events import BuildRequestPayload
+
+# --- Tunable Constants ---
+# Lazily removed entries are swept out of the heap once at least this many
+# have piled up and they make up half of it.
+COMPACTION_THRESHOLD = 32
+
+
+@dataclass(order=True)
+class BuildRequest:
+    """
+    A queued build request. Wraps the original event payload with the
+    bookkeeping the ConstructionManager needs to age and retry it.
+    """
+
+    priority: int
+    sequence: int
+    payload: "BuildRequestPayload" = field(compare=False)
+    enqueued_at: int = field(default=0, compare=False)
+    # The game loop since which the request has been unserviceable (no
+    # placement or no builder), or None while it is only waiting for money or
+    # for its turn.
+    blocked_since: int | None = field(default=None, compare=False)
+    retries: int = field(default=0, compare=False)
+    removed: bool = field(default=False, compare=False)
+
+    @property
+    def item_id(self) -> "UnitTypeId":
+        return self.payload.item_id
+
+    @property
+    def position(self) -> "Point2" | None:
+        return self.payload.position
+
+    def age(self, game_loop: int) -> int:
+        """The number of game loops this request has been waiting."""
+        return game_loop - self.enqueued_at
+
+    def blocked_for(self, game_loop: int) -> int:
+        """The number of game loops this request has been unserviceable."""
+        if self.blocked_since is None:
+            return 0
+        return game_loop - self.blocked_since
+
+    def mark_blocked(self, game_loop: int):
+        """Starts the unserviceable clock, unless it is already running."""
+        if self.blocked_since is None:
+            self.blocked_since = game_loop
+
+    def mark_waiting(self):
+        """Stops the unserviceable clock: the request can be serviced."""
+        self.blocked_since = None
+
+
+@dataclass
+class InFlightBuild:
+    """
+    A build that has been handed to a worker but not yet placed. Its cost and
+    footprint stay reserved until the structure starts or the builder is lost.
+    """
+
+    request: BuildRequest
+    worker_tag: int
+    position: "Point2"
+    minerals: int
+    vespene: int
+    dispatched_at: int
+
+    @property
+    def item_id(self) -> "UnitTypeId":
+        return self.request.item_id
+
+
+class BuildQueue:
+    """
+    A heap-backed priority queue of build requests.
+
+    Requests are ordered by priority (lower is more urgent) and then by
+    arrival. A per-item-type count index makes "is X queued?" an O(1)
+    question. Removal of arbitrary entries is lazy: the entry is flagged and
+    discarded when it surfaces at the top of the heap, or when flagged
+    entries pile up and the heap is compacted.
+    """
+
+    def __init__(self):
+        self._heap: List[BuildRequest] = []
+        self._counts: Counter = Counter()
+        self._sequence = itertools.count()
+        self._size = 0
+        # Flagged entries still sitting in the heap.
+        self._removed = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[BuildRequest]:
+        """Iterates over all live requests in priority order, in O(n log n)."""
+        return iter(sorted(r for r in self._heap if not r.removed))
+
+    def head(self, count: int) -> List[BuildRequest]:
+        """The `count` most urgent live requests, in priority order."""
+        return heapq.nsmallest(count, (r for r in self._heap if not r.removed))
+
+    def push(self, payload: "BuildRequestPayload", game_loop: int = 0) -> BuildRequest:
+        """Adds a request in O(log n)."""
+        request = BuildRequest(
+            priority=payload.priority,
+            sequence=next(self._sequence),
+            payload=payload,
+            enqueued_at=game_loop,
+        )
+        heapq.heappush(self._heap, request)
+        self._counts[payload.item_id] += 1
+        self._size += 1
+        return request
+
+    def peek(self) -> BuildRequest | None:
+        """Returns the most urgent live request without removing it."""
+        self._discard_removed_head()
+        return self._heap[0] if self._heap else None
+
+    def pop(self) -> BuildRequest | None:
+        """Removes and returns the most urgent live request."""
+        request = self.peek()
+        if request:
+            heapq.heappop(self._heap)
+            self._forget(request)
+        return request
+
+    def remove(self, request: BuildRequest):
+        """Removes an arbitrary request. The heap slot is reclaimed lazily."""
+        if request.removed:
+            return
+        self._forget(request)
+        self._removed += 1
+        self._discard_removed_head()
+        if self._removed >= COMPACTION_THRESHOLD and self._removed * 2 >= len(
+            self._heap
+        ):
+            self._compact()
+
+    def count(self, item_id: "UnitTypeId") -> int:
+        """The number of live requests for an item type, in O(1)."""
+        return self._counts[item_id]
+
+    def contains(self, item_id: "UnitTypeId") -> bool:
+        return self._counts[item_id] > 0
+
+    def stale(self, game_loop: int, max_age: int) -> List[BuildRequest]:
+        """
+        Returns all live requests that have been unserviceable for longer than
+        `max_age` loops. Time spent waiting for money or for a turn does not count.
+        """
+        return [
+            r
+            for r in self._heap
+            if not r.removed and r.blocked_for(game_loop) > max_age
+        ]
+
+    def _forget(self, request: BuildRequest):
+        request.removed = True
+        self._counts[request.item_id] -= 1
+        if self._counts[request.item_id] <= 0:
+            del self._counts[request.item_id]
+        self._size -= 1
+
+    def _discard_removed_head(self):
+        while self._heap and self._heap[0].removed:
+            heapq.heappop(self._heap)
+            self._removed -= 1
+
+    def _compact(self):
+        """Rebuilds the heap from its live entries in O(n)."""
+        self._heap = [r for r in self._heap if not r.removed]
+        heapq.heapify(self._heap)
+        self._removed = 0
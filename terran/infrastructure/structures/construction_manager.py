@@ -1,18 +1,49 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List, Set
 
 from sc2.ids.unit_typeid import UnitTypeId
 
 from core.interfaces.manager_abc import Manager
 from core.types import CommandFunctor
-from core.utilities.events import Event, EventType, BuildRequestPayload
-from core.utilities.unit_types import WORKER_TYPES
+from core.utilities.events import (
+    Event,
+    EventType,
+    BuildRequestPayload,
+    BuildRequestFailedPayload,
+    ConstructionStartedPayload,
+    UnitDestroyedPayload,
+)
+from core.utilities.constants import (
+    BUILD_REQUEST_TIMEOUT_SECONDS,
+    GAME_LOOPS_PER_SECOND,
+)
+from core.utilities.placement_grid import PlacementGrid
+from core.resource_ledger import BudgetCategory
+from .build_queue import BuildQueue, BuildRequest, InFlightBuild
+from .layout_planner import BaseLayoutPlanner
+from core.utilities.unit_types import GAS_BUILDINGS, WORKER_TYPES
 
 if TYPE_CHECKING:
     from sc2.bot_ai import BotAI
+    from sc2.position import Point2
+    from sc2.unit import Unit
     from core.global_cache import GlobalCache
     from core.event_bus import EventBus
     from core.frame_plan import FramePlan
+    from core.resource_ledger import ResourceLedger
+
+# --- Tunable Constants ---
+# The maximum number of builds dispatched in a single frame.
+MAX_BUILDS_PER_FRAME = 4
+# Only this many of the most urgent requests are looked at each frame; the
+# rest wait for their turn.
+MAX_REQUESTS_EXAMINED_PER_FRAME = 16
+# A builder that still has not started its structure after this many seconds
+# is considered stuck: it is stopped, its reservation released and the request
+# re-queued. Builders that drop their build order are let go sooner.
+BUILDER_TRAVEL_TIMEOUT_SECONDS = 45
+# Builders are preferably drawn from workers within this distance.
+BUILDER_SEARCH_RADIUS = 20
 
 
 class ConstructionManager(Manager):
@@ -20,24 +51,49 @@ class ConstructionManager(Manager):
     The Civil Engineering Service. This manager is a service that fulfills
     build requests published to the EventBus. It maintains a prioritized queue
     and handles the low-level logic of finding a placement and assigning a worker.
+
+    Each frame it walks the queue in priority order and dispatches every
+    request it can pay for, holding each cost on the ResourceLedger so the
+    requests never overspend together. Dispatched builds stay "in flight"
+    (holding their builder, cost and footprint) until the structure starts.
     """
 
     def __init__(self, bot: "BotAI"):
         super().__init__(bot)
-        self.build_queue: List[BuildRequestPayload] = []
+        self.build_queue: BuildQueue = BuildQueue()
+        # Builds handed to a worker but not yet placed, keyed by worker tag.
+        self.in_flight: Dict[int, InFlightBuild] = {}
+        # The General's ledger, picked up from the FramePlan on each execute.
+        self.ledger: "ResourceLedger" | None = None
+        # A local placement model, lazily built on the first placement query.
+        self.placement_grid = PlacementGrid(bot)
+        self.layout_planner = BaseLayoutPlanner(bot, self.placement_grid)
         # Subscribe to build requests from the event bus
         bus = getattr(bot, "event_bus", None)
         if bus:
             bus.subscribe(EventType.INFRA_BUILD_REQUEST, self.handle_build_request)
+            bus.subscribe(
+                EventType.INFRA_CONSTRUCTION_STARTED, self.handle_construction_started
+            )
+            bus.subscribe(EventType.UNIT_DESTROYED, self.handle_unit_destroyed)
+
+    async def on_start(self):
+        """Builds the placement grid and precomputes the base layouts."""
+        self.placement_grid.initialize()
+        self.layout_planner.plan()
+
+    def is_pending(self, item_id: UnitTypeId) -> bool:
+        """True if an item is queued or on its way to being placed."""
+        return self.build_queue.contains(item_id) or any(
+            build.item_id == item_id for build in self.in_flight.values()
+        )
 
     async def handle_build_request(self, event: Event):
         """Event handler that adds a new build request to the queue."""
         payload: BuildRequestPayload = event.payload
         if payload.unique:
             # Check for pending buildings of the same type AND requests in our queue
-            is_duplicate_in_queue = any(
-                req.item_id == payload.item_id for req in self.build_queue
-            )
+            is_duplicate_in_queue = self.is_pending(payload.item_id)
             is_already_pending = self.bot.already_pending(payload.item_id) > 0
 
             if is_duplicate_in_queue or is_already_pending:
@@ -45,66 +101,257 @@ class ConstructionManager(Manager):
                     f"Ignoring duplicate build request for unique item: {payload.item_id.name}"
                 )
                 return
-        self.build_queue.append(payload)
+        self.build_queue.push(payload, self.bot.state.game_loop)
+
+    async def handle_construction_started(self, event: Event):
+        """
+        Event handler that blocks the footprint of a newly placed structure
+        and releases the in-flight reservation that produced it.
+        """
+        payload: ConstructionStartedPayload = event.payload
+        footprint = PlacementGrid.footprint_of(payload.unit_type)
+        if footprint:
+            self.placement_grid.block(payload.position, footprint)
+
+        for worker_tag, build in list(self.in_flight.items()):
+            if (
+                build.item_id == payload.unit_type
+                and build.position.distance_to(payload.position) < 1
+            ):
+                del self.in_flight[worker_tag]
+                self._release(worker_tag)
+                break
+
+    async def handle_unit_destroyed(self, event: Event):
+        """
+        Event handler that frees the footprint of a destroyed structure or
+        resource, and re-queues any build whose builder was killed en route.
+        """
+        payload: UnitDestroyedPayload = event.payload
+        build = self.in_flight.pop(payload.unit_tag, None)
+        if build:
+            self._release(payload.unit_tag)
+            self._abandon(build)
+            return
+        footprint = PlacementGrid.footprint_of(payload.unit_type)
+        if footprint:
+            self.placement_grid.release(payload.last_known_position, footprint)
 
     async def execute(
         self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
     ) -> List[CommandFunctor]:
         """
-        Processes the build queue, attempting to construct the highest-priority
-        affordable building each frame.
+        Walks the most urgent requests of the build queue in priority order
+        and dispatches every one that can be paid for, placed and staffed
+        this frame.
         """
+        self.ledger = plan.resource_ledger
+        actions: List[CommandFunctor] = self._expire_in_flight(cache)
         if not self.build_queue:
-            return []
+            return actions
+
+        self._evict_stale_requests(cache, bus)
+
+        busy_workers: Set[int] = set(self.in_flight)
 
-        # Sort queue by priority (lower number is higher priority)
-        self.build_queue.sort(key=lambda req: req.priority)
+        waiting_for_money = False
+        dispatched = 0
+        for request in self.build_queue.head(MAX_REQUESTS_EXAMINED_PER_FRAME):
+            if waiting_for_money:
+                # Waiting for a turn is not being unserviceable.
+                request.mark_waiting()
+                continue
+            if dispatched >= MAX_BUILDS_PER_FRAME:
+                break
+            request.retries += 1
 
-        # Attempt to process the highest priority request
-        request = self.build_queue[0]
+            if not self.ledger.can_afford(
+                BudgetCategory.INFRASTRUCTURE, request.item_id
+            ):
+                # Lower-priority items must not spend the money this one is
+                # waiting for, so they wait for their turn behind it, and the
+                # ledger keeps infrastructure's share back to save up for it.
+                self.ledger.save(BudgetCategory.INFRASTRUCTURE)
+                request.mark_waiting()
+                waiting_for_money = True
+                continue
 
-        if not self.bot.can_afford(request.item_id):
-            return []  # Can't afford the top priority, wait for more resources
+            if request.item_id in GAS_BUILDINGS:
+                target = self._find_geyser(request)
+                position = target.position if target else None
+            else:
+                position = await self._find_placement(request)
+                target = position
+            if not position:
+                # Blocked; let the items behind it try.
+                request.mark_blocked(cache.game_loop)
+                continue
 
-        gas_buildings = {
-            UnitTypeId.REFINERY,
-            UnitTypeId.EXTRACTOR,
-            UnitTypeId.ASSIMILATOR,
-        }
+            worker = self._select_builder(position, busy_workers)
+            if not worker:
+                request.mark_blocked(cache.game_loop)
+                continue
 
-        # --- Special logic for Gas Buildings ---
-        if request.item_id in gas_buildings:
-            search_point = request.position or self.bot.start_location
-            geysers = self.bot.vespene_geyser.filter(
-                # --- THIS IS THE CORRECTED LINE ---
-                # Changed .exists() to .exists
-                lambda g: not self.bot.structures.closer_than(1.0, g).exists
+            # Commit: the request leaves the queue and its cost is held until
+            # the structure starts.
+            cost = self.bot.calculate_cost(request.item_id)
+            self.ledger.hold(
+                worker.tag, BudgetCategory.INFRASTRUCTURE, cost.minerals, cost.vespene
             )
-            if geysers.exists:
-                geyser = geysers.closest_to(search_point)
-                worker = self.bot.select_build_worker(geyser.position)
-                if worker:
-                    self.build_queue.pop(0)  # Remove fulfilled request
-                    # Wrap the command in a lambda to defer execution
-                    return [lambda: worker.build_gas(geyser)]
-            return []  # No available geyser or worker, retry next frame
-
-        # --- Standard logic for all other buildings ---
-        search_origin = request.position or self.bot.start_location
-        placement_position = await self.bot.find_placement(
-            request.item_id, near=search_origin
+            self.build_queue.remove(request)
+            busy_workers.add(worker.tag)
+            dispatched += 1
+            self.in_flight[worker.tag] = InFlightBuild(
+                request=request,
+                worker_tag=worker.tag,
+                position=position,
+                minerals=cost.minerals,
+                vespene=cost.vespene,
+                dispatched_at=cache.game_loop,
+            )
+
+            if request.item_id in GAS_BUILDINGS:
+                # Wrap the command in a lambda to defer execution
+                actions.append(lambda w=worker, g=target: w.build_gas(g))
+            else:
+                # Reserve the footprint so later requests look elsewhere.
+                self.placement_grid.block(
+                    position, PlacementGrid.footprint_of(request.item_id)
+                )
+                self.layout_planner.consume_slot(request.item_id, position)
+                actions.append(
+                    lambda w=worker, t=request.item_id, p=position: w.build(t, p)
+                )
+
+        return actions
+
+    def _select_builder(
+        self, position: "Point2", excluded_tags: Set[int]
+    ) -> "Unit" | None:
+        """
+        Picks the closest worker that is free to build, never one already
+        assigned this frame or still walking to another site.
+        """
+        free_workers = self.bot.workers.filter(
+            lambda w: w.tag not in excluded_tags
+            and (w.is_gathering or w.is_idle)
+            and not w.is_carrying_resource
         )
+        if not free_workers:
+            free_workers = self.bot.workers.filter(
+                lambda w: w.tag not in excluded_tags and (w.is_gathering or w.is_idle)
+            )
+        if not free_workers:
+            return None
+        nearby = free_workers.closer_than(BUILDER_SEARCH_RADIUS, position)
+        return (nearby or free_workers).closest_to(position)
 
-        if not placement_position:
-            # Can't find placement, maybe the area is blocked. Retry next frame.
-            return []
+    def _find_geyser(self, request: BuildRequest) -> "Unit" | None:
+        """Finds the closest untaken geyser that no other builder is heading to."""
+        search_point = request.position or self.bot.start_location
+        claimed = [build.position for build in self.in_flight.values()]
+        geysers = self.bot.vespene_geyser.filter(
+            lambda g: not self.bot.structures.closer_than(1.0, g).exists
+            and all(g.distance_to(p) > 1 for p in claimed)
+        )
+        if not geysers.exists:
+            return None
+        return geysers.closest_to(search_point)
 
-        worker = self.bot.select_build_worker(placement_position)
-        if not worker:
-            # No worker available, retry next frame.
+    def _expire_in_flight(self, cache: "GlobalCache") -> List[CommandFunctor]:
+        """
+        Abandons builds whose worker vanished or dropped its build order. A
+        builder still on its way after the travel timeout is stopped first,
+        so it cannot place a duplicate of the re-queued request.
+        """
+        if not self.in_flight:
             return []
+        max_travel = int(BUILDER_TRAVEL_TIMEOUT_SECONDS * GAME_LOOPS_PER_SECOND)
+        workers = {w.tag: w for w in self.bot.workers}
+        actions: List[CommandFunctor] = []
+        for worker_tag, build in list(self.in_flight.items()):
+            worker = workers.get(worker_tag)
+            if worker is not None:
+                if cache.game_loop <= build.dispatched_at:
+                    continue  # The build command has not been observed yet.
+                if self._is_building(worker, build.item_id):
+                    if cache.game_loop - build.dispatched_at <= max_travel:
+                        continue
+                    actions.append(lambda w=worker: w.stop())
+            del self.in_flight[worker_tag]
+            self._release(worker_tag)
+            self._abandon(build)
+        return actions
+
+    def _is_building(self, worker: "Unit", item_id: UnitTypeId) -> bool:
+        """True if the worker still has an order to build the item."""
+        ability = self.bot.game_data.units[item_id.value].creation_ability.id
+        return any(order.ability.id == ability for order in worker.orders)
 
-        # We have a valid placement, a worker, and can afford it.
-        self.build_queue.pop(0)  # Remove fulfilled request
-        # Wrap the command in a lambda to defer execution
-        return [lambda: worker.build(request.item_id, placement_position)]
+    def _release(self, worker_tag: int):
+        """Returns a builder's held resources to the ledger."""
+        if self.ledger:
+            self.ledger.release(worker_tag)
+
+    def _abandon(self, build: InFlightBuild):
+        """Releases an in-flight reservation and puts its request back in line."""
+        if build.item_id not in GAS_BUILDINGS:
+            self.placement_grid.release(
+                build.position, PlacementGrid.footprint_of(build.item_id)
+            )
+        # Keep the original enqueue time and unserviceable clock.
+        requeued = self.build_queue.push(
+            build.request.payload, build.request.enqueued_at
+        )
+        requeued.retries = build.request.retries
+        requeued.blocked_since = build.request.blocked_since
+
+    def _evict_stale_requests(self, cache: "GlobalCache", bus: "EventBus"):
+        """
+        Drops requests that could not be placed or staffed for longer than the
+        timeout and tells the requesters, who are free to publish a fresh
+        request. Requests only waiting for money or for their turn are kept.
+        """
+        max_age = int(BUILD_REQUEST_TIMEOUT_SECONDS * GAME_LOOPS_PER_SECOND)
+        for request in self.build_queue.stale(cache.game_loop, max_age):
+            self.build_queue.remove(request)
+            reason = (
+                f"Unserviceable for {BUILD_REQUEST_TIMEOUT_SECONDS}s "
+                f"after {request.retries} attempts."
+            )
+            cache.logger.warning(
+                f"Evicting build request for {request.item_id.name}: {reason}"
+            )
+            bus.publish(
+                Event(
+                    EventType.INFRA_BUILD_REQUEST_FAILED,
+                    BuildRequestFailedPayload(
+                        item_id=request.item_id,
+                        reason=reason,
+                        requester=request.payload.requester,
+                    ),
+                )
+            )
+
+    async def _find_placement(self, request: BuildRequest) -> Point2 | None:
+        """
+        Resolves a build position. Requests without an explicit position take
+        the next precomputed layout slot; everything else (or a full layout)
+        falls back to a local grid search around the requested point.
+        """
+        if request.position is None:
+            bases = self.layout_planner.owned_bases(
+                th.position for th in self.bot.townhalls
+            )
+            slot = self.layout_planner.next_slot(request.item_id, bases)
+            if slot:
+                if await self.bot.can_place_single(request.item_id, slot):
+                    return slot
+                # The engine disagrees with our model, often only because a
+                # unit stands there: pass the slot over for a while.
+                self.placement_grid.reject(request.item_id, slot)
+
+        search_origin = request.position or self.bot.start_location
+        return await self.placement_grid.find_placement(
+            request.item_id, near=search_origin
+        )
@@ -0,0 +1,348 @@
+# terran/infrastructure/structures/layout_planner.py
+from __future__ import annotations
+import hashlib
+import json
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from pathlib import Path
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, List
+
+import numpy as np
+
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+
+from core.logger import logger
+from core.utilities.unit_types import ADDON_OFFSET, STRUCTURE_FOOTPRINTS_TERRAN
+
+if TYPE_CHECKING:
+    from sc2.bot_ai import BotAI
+    from core.utilities.placement_grid import PlacementGrid
+
+# --- Tunable Layout Constants ---
+LAYOUT_CACHE_DIR = Path("cache") / "layouts"
+# Bump this whenever the planning rules change to invalidate cached layouts.
+LAYOUT_VERSION = 1
+BASE_BUILD_RADIUS = 20
+MAIN_DEPOT_SLOTS = 16
+MAIN_PRODUCTION_SLOTS = 10
+EXPANSION_DEPOT_SLOTS = 4
+EXPANSION_PRODUCTION_SLOTS = 3
+TURRET_SLOTS_PER_BASE = 1
+# Extra clearance kept free around the mineral line and townhall.
+MINERAL_LINE_MARGIN = 1.5
+# Maximum raw terrain height difference for a slot to count as "on the base".
+HEIGHT_TOLERANCE = 3
+
+# Non-production 3x3 structures share the production grid.
+PRODUCTION_SLOT_TYPES = {
+    UnitTypeId.BARRACKS,
+    UnitTypeId.FACTORY,
+    UnitTypeId.STARPORT,
+    UnitTypeId.ENGINEERINGBAY,
+    UnitTypeId.ARMORY,
+    UnitTypeId.GHOSTACADEMY,
+    UnitTypeId.FUSIONCORE,
+    UnitTypeId.BUNKER,
+}
+
+
+class SlotKind(Enum):
+    """The categories of precomputed building slots."""
+
+    DEPOT = auto()
+    PRODUCTION = auto()
+    TURRET = auto()
+
+
+SLOT_KIND_BY_TYPE: Dict[UnitTypeId, SlotKind] = {
+    UnitTypeId.SUPPLYDEPOT: SlotKind.DEPOT,
+    UnitTypeId.MISSILETURRET: SlotKind.TURRET,
+    **{type_id: SlotKind.PRODUCTION for type_id in PRODUCTION_SLOT_TYPES},
+}
+
+
+@dataclass
+class BaseLayout:
+    """The ordered building slots reserved around a single expansion location."""
+
+    location: Point2
+    depots: Deque[Point2] = field(default_factory=deque)
+    production: Deque[Point2] = field(default_factory=deque)
+    turrets: Deque[Point2] = field(default_factory=deque)
+
+    def slots(self, kind: SlotKind) -> Deque[Point2]:
+        if kind == SlotKind.DEPOT:
+            return self.depots
+        if kind == SlotKind.PRODUCTION:
+            return self.production
+        return self.turrets
+
+    def to_dict(self) -> dict:
+        return {
+            "location": [self.location.x, self.location.y],
+            "depots": [[p.x, p.y] for p in self.depots],
+            "production": [[p.x, p.y] for p in self.production],
+            "turrets": [[p.x, p.y] for p in self.turrets],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BaseLayout":
+        return cls(
+            location=Point2(data["location"]),
+            depots=deque(Point2(p) for p in data["depots"]),
+            production=deque(Point2(p) for p in data["production"]),
+            turrets=deque(Point2(p) for p in data["turrets"]),
+        )
+
+
+class BaseLayoutPlanner:
+    """
+    The Town Planner. Precomputes, once per game, where depots, production
+    structures and turrets go at every expansion location.
+
+    The layouts are planned on a private copy of the placement grid so that
+    slots never overlap each other, the townhall spots or the mineral lines.
+    The main base starts with the ramp wall. Results are cached on disk per
+    map and start location, so subsequent games only pay for a file read.
+    At runtime, the ConstructionManager takes slots from the front of each
+    queue in O(1), skipping any that have since become blocked.
+    """
+
+    def __init__(self, bot: "BotAI", placement_grid: "PlacementGrid"):
+        self.bot = bot
+        self.placement_grid = placement_grid
+        self.layouts: Dict[Point2, BaseLayout] = {}
+
+    # --- Planning ---
+
+    def plan(self):
+        """Loads the layouts from the disk cache, or computes and caches them."""
+        cache_path = LAYOUT_CACHE_DIR / f"{self._map_hash()}.json"
+        if cache_path.exists():
+            try:
+                data = json.loads(cache_path.read_text())
+                self.layouts = {}
+                for entry in data["layouts"]:
+                    layout = BaseLayout.from_dict(entry)
+                    self.layouts[layout.location] = layout
+                logger.info(f"Loaded {len(self.layouts)} base layouts from cache.")
+                return
+            except (OSError, ValueError, KeyError):
+                logger.warning(f"Ignoring unreadable layout cache at {cache_path}.")
+
+        self.layouts = self._compute_layouts()
+        try:
+            LAYOUT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            payload = {"layouts": [l.to_dict() for l in self.layouts.values()]}
+            cache_path.write_text(json.dumps(payload))
+        except OSError:
+            logger.warning(f"Could not write layout cache to {cache_path}.")
+        logger.info(f"Computed layouts for {len(self.layouts)} bases.")
+
+    def _map_hash(self) -> str:
+        """A key that changes whenever the map or our start location changes."""
+        digest = hashlib.sha1()
+        digest.update(f"v{LAYOUT_VERSION}".encode())
+        digest.update(self.bot.game_info.map_name.encode())
+        digest.update(np.ascontiguousarray(self._buildable_array()).tobytes())
+        start = self.bot.start_location
+        digest.update(f"{start.x:.1f},{start.y:.1f}".encode())
+        return digest.hexdigest()
+
+    def _buildable_array(self) -> np.ndarray:
+        return np.asarray(self.bot.game_info.placement_grid.data_numpy)
+
+    def _compute_layouts(self) -> Dict[Point2, BaseLayout]:
+        grid = self.placement_grid.copy()
+        if not grid.is_initialized:
+            self.placement_grid.initialize()
+            grid = self.placement_grid.copy()
+        heights = np.asarray(self.bot.game_info.terrain_height.data_numpy).T
+
+        expansions = self.bot.expansion_locations_dict
+        # Reserve every townhall spot first so no base plans over another.
+        for location in expansions:
+            grid.block(location, (5, 5))
+
+        layouts: Dict[Point2, BaseLayout] = {}
+        start = self.bot.start_location
+        main_location = min(expansions, key=lambda loc: loc.distance_to(start))
+        for location, resources in expansions.items():
+            layout = BaseLayout(location=location)
+            is_main = location == main_location
+            resource_center = resources.center if resources else location
+            allowed = self._allowed_area(heights, location, resource_center)
+
+            if is_main:
+                self._plan_ramp_wall(grid, layout)
+
+            # Turrets first: they belong inside the mineral line.
+            turret_anchor = (location + resource_center) / 2
+            self._fill_slots(
+                grid,
+                layout.turrets,
+                UnitTypeId.MISSILETURRET,
+                turret_anchor,
+                TURRET_SLOTS_PER_BASE,
+                max_distance=6,
+            )
+
+            anchor = location.towards(resource_center, -8)
+            self._fill_slots(
+                grid,
+                layout.production,
+                UnitTypeId.BARRACKS,
+                anchor,
+                MAIN_PRODUCTION_SLOTS if is_main else EXPANSION_PRODUCTION_SLOTS,
+                allowed=allowed,
+                padding=1,
+            )
+            self._fill_slots(
+                grid,
+                layout.depots,
+                UnitTypeId.SUPPLYDEPOT,
+                anchor,
+                MAIN_DEPOT_SLOTS if is_main else EXPANSION_DEPOT_SLOTS,
+                allowed=allowed,
+            )
+            layouts[location] = layout
+        return layouts
+
+    def _allowed_area(
+        self,
+        heights: np.ndarray,
+        location: Point2,
+        resource_center: Point2,
+    ) -> np.ndarray:
+        """Cells on the same level as the base and outside its mineral line."""
+        xs, ys = np.indices(heights.shape)
+        cx, cy = xs + 0.5, ys + 0.5
+        base_height = int(heights[int(location.x), int(location.y)])
+        same_level = np.abs(heights.astype(np.int32) - base_height) <= HEIGHT_TOLERANCE
+        within_radius = (cx - location.x) ** 2 + (
+            cy - location.y
+        ) ** 2 <= BASE_BUILD_RADIUS**2
+        # Keep the mineral line (the disk around the resources that reaches
+        # the townhall) free for worker traffic.
+        line_radius = location.distance_to(resource_center) + MINERAL_LINE_MARGIN
+        in_mineral_line = (cx - resource_center.x) ** 2 + (
+            cy - resource_center.y
+        ) ** 2 <= line_radius**2
+        return same_level & within_radius & ~in_mineral_line
+
+    def _plan_ramp_wall(self, grid: "PlacementGrid", layout: BaseLayout):
+        """Puts the main ramp's wall-off spots at the front of the queues."""
+        try:
+            ramp = self.bot.main_base_ramp
+            wall_depots = sorted(ramp.corner_depots, key=lambda p: (p.x, p.y))
+            wall_barracks = ramp.barracks_correct_placement
+        except (ValueError, AttributeError, IndexError):
+            return
+
+        for depot in wall_depots:
+            layout.depots.append(depot)
+            grid.block(depot, (2, 2))
+        if wall_barracks:
+            layout.production.append(wall_barracks)
+            grid.block(wall_barracks, (3, 3))
+            grid.block(wall_barracks.offset(ADDON_OFFSET), (2, 2))
+
+    def _fill_slots(
+        self,
+        grid: "PlacementGrid",
+        slots: Deque[Point2],
+        type_id: UnitTypeId,
+        anchor: Point2,
+        count: int,
+        allowed: np.ndarray | None = None,
+        padding: int = 0,
+        max_distance: int = BASE_BUILD_RADIUS,
+    ):
+        """Greedily reserves up to `count` slots closest to `anchor`."""
+        footprint = grid.footprint_of(type_id)
+        while len(slots) < count:
+            slot = next(
+                (
+                    c
+                    for c in grid.candidates(type_id, anchor, max_distance)
+                    if allowed is None or self._is_allowed(allowed, c, type_id)
+                ),
+                None,
+            )
+            if slot is None:
+                return
+            slots.append(slot)
+            grid.block(slot, (footprint[0] + 2 * padding, footprint[1] + 2 * padding))
+            if type_id in PRODUCTION_SLOT_TYPES:
+                addon = slot.offset(ADDON_OFFSET)
+                grid.block(addon, (2 + 2 * padding, 2 + 2 * padding))
+
+    @staticmethod
+    def _is_allowed(allowed: np.ndarray, center: Point2, type_id: UnitTypeId) -> bool:
+        """Checks that a structure (and its addon, if any) lies in the allowed area."""
+        width, height = STRUCTURE_FOOTPRINTS_TERRAN[type_id]
+        x0 = int(round(center.x - width / 2))
+        y0 = int(round(center.y - height / 2))
+        if type_id in PRODUCTION_SLOT_TYPES:
+            width += 2
+        return bool(allowed[x0 : x0 + width, y0 : y0 + height].all())
+
+    # --- Runtime Slot Access ---
+
+    @staticmethod
+    def slot_kind_for(type_id: UnitTypeId) -> SlotKind | None:
+        return SLOT_KIND_BY_TYPE.get(type_id)
+
+    def next_slot(self, type_id: UnitTypeId, bases: Iterable[Point2]) -> Point2 | None:
+        """
+        Returns the first still-buildable slot for `type_id` among `bases`,
+        in the given base order. Stale slots at the head of a queue (e.g.,
+        blocked by an enemy structure) are dropped along the way; slots the
+        engine recently rejected are passed over but kept for later.
+        """
+        kind = self.slot_kind_for(type_id)
+        if kind is None:
+            return None
+        for base in bases:
+            layout = self.layouts.get(base)
+            if not layout:
+                continue
+            slots = layout.slots(kind)
+            while slots and not self.placement_grid.can_fit(type_id, slots[0]):
+                slots.popleft()
+            for slot in slots:
+                if not self.placement_grid.is_rejected(
+                    type_id, slot
+                ) and self.placement_grid.can_fit(type_id, slot):
+                    return slot
+        return None
+
+    def consume_slot(self, type_id: UnitTypeId, slot: Point2):
+        """Removes a slot once a builder has been dispatched to it."""
+        kind = self.slot_kind_for(type_id)
+        if kind is None:
+            return
+        for layout in self.layouts.values():
+            slots = layout.slots(kind)
+            if slot in slots:
+                slots.remove(slot)
+                return
+
+    def owned_bases(self, townhall_positions: Iterable[Point2]) -> List[Point2]:
+        """Maps townhall positions to their planned base locations, main first."""
+        owned = []
+        for position in townhall_positions:
+            base = min(
+                self.layouts, key=lambda loc: loc.distance_to(position), default=None
+            )
+            if (
+                base is not None
+                and base.distance_to(position) < 6
+                and base not in owned
+            ):
+                owned.append(base)
+        start = self.bot.start_location
+        owned.sort(key=lambda loc: loc.distance_to(start))
+        return owned
@@ -37,21 +37,24 @@ class RefineryManager(Manager):
         # --- Target Calculation ---
         # A simple heuristic: aim for two refineries for every completed base.
         terran_townhalls = race_townhalls[self.bot.race]
-        ready_bases = cache.friendly_structures.of_type(terran_townhalls).ready
-        target_refinery_count = ready_bases.amount * 2
+        target_refinery_count = cache.unit_counts.ready(terran_townhalls) * 2
 
         # --- Current State Assessment ---
-        current_refinery_count = cache.friendly_structures.of_type(
-            UnitTypeId.REFINERY
-        ).amount + self.bot.already_pending(UnitTypeId.REFINERY)
+        current_refinery_count = cache.unit_counts.total(UnitTypeId.REFINERY)
 
         if current_refinery_count >= target_refinery_count:
             return []
+        ready_bases = cache.friendly_structures.of_type(terran_townhalls).ready
 
         # --- Find a Suitable Geyser ---
         # We need to find a geyser near one of our bases that doesn't already have a refinery on it.
+        registry = cache.base_registry
         for th in ready_bases:
-            geysers = self.bot.vespene_geyser.closer_than(10.0, th)
+            base = registry.base_of_townhall(th.tag) if registry else None
+            if base:
+                geysers = registry.geysers(base)
+            else:
+                geysers = self.bot.vespene_geyser.closer_than(10.0, th)
             for geyser in geysers:
                 # Check if there is already a refinery (or assimilated/extractor) on this geyser
                 if not self.bot.gas_buildings.closer_than(1.0, geyser).exists:
@@ -61,9 +64,8 @@ class RefineryManager(Manager):
                     # Get the construction manager via the director reference
                     construction_manager = self.director.construction_manager
 
-                    is_gas_in_queue = any(
-                        req.item_id == UnitTypeId.REFINERY
-                        for req in construction_manager.build_queue
+                    is_gas_in_queue = construction_manager.is_pending(
+                        UnitTypeId.REFINERY
                     )
 
                     if not is_gas_in_queue:
@@ -0,0 +1,127 @@
+# terran/infrastructure/structures/supply_forecaster.py
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, List, Tuple
+
+from sc2.ids.unit_typeid import UnitTypeId
+
+from core.utilities.constants import SUPPLY_BUFFER_BASE
+from core.utilities.unit_types import (
+    SUPPLY_DEPOT_BUILD_SECONDS,
+    SUPPLY_DEPOT_SUPPLY,
+    TERRAN_UNIT_PRODUCTION,
+    TRAIN_ABILITY_TO_UNIT,
+)
+
+if TYPE_CHECKING:
+    from sc2.unit import Unit
+
+# --- Tunable Forecast Constants ---
+# Time for a builder to reach a depot slot after the request is made.
+DEPOT_TRAVEL_SECONDS = 5
+# A depot requested now provides supply after this long; the forecast looks
+# exactly this far ahead.
+DEPOT_LEAD_SECONDS = DEPOT_TRAVEL_SECONDS + SUPPLY_DEPOT_BUILD_SECONDS
+# Idle producers are assumed to start their usual unit right away.
+DEFAULT_PRODUCTION = {
+    UnitTypeId.COMMANDCENTER: UnitTypeId.SCV,
+    UnitTypeId.ORBITALCOMMAND: UnitTypeId.SCV,
+    UnitTypeId.PLANETARYFORTRESS: UnitTypeId.SCV,
+    UnitTypeId.BARRACKS: UnitTypeId.MARINE,
+    UnitTypeId.FACTORY: UnitTypeId.HELLION,
+    UnitTypeId.STARPORT: UnitTypeId.MEDIVAC,
+}
+
+
+@dataclass
+class SupplyForecast:
+    """The supply outlook at the end of the forecast horizon."""
+
+    demand: int  # Supply production will take within the horizon.
+    projected_cap: int  # Supply cap once the already pending supply lands.
+    depots_needed: int  # New depots to start now to cover the demand.
+
+
+class SupplyForecaster:
+    """
+    The Actuary. Projects supply consumption over the time it takes to get
+    a new depot up, from what every producer is building and how far along
+    it is.
+
+    Every production slot (two for a reactor) is assumed to keep producing
+    the unit it is on back to back; idle slots start their structure's
+    usual unit immediately. Supply is taken when a unit starts, so only
+    starts within the horizon count, less what queued orders already paid.
+    """
+
+    def __init__(self, horizon_seconds: float = DEPOT_LEAD_SECONDS):
+        self.horizon = horizon_seconds
+
+    def slots(self, structure: "Unit") -> List[Tuple[float, int, float]]:
+        """
+        The production slots of a structure.
+
+        :return: (seconds until the slot frees up, supply, build time) for
+            each slot running or able to run a train order.
+        """
+        capacity = 2 if structure.has_reactor else 1
+        orders = structure.orders[:capacity]
+        slots = []
+        for order in orders:
+            unit = TRAIN_ABILITY_TO_UNIT.get(order.ability.id)
+            if unit is None:
+                # Morphing or building an addon; nothing is trained here.
+                continue
+            supply, build_time = TERRAN_UNIT_PRODUCTION[unit]
+            slots.append(((1 - order.progress) * build_time, supply, build_time))
+        default = DEFAULT_PRODUCTION.get(structure.type_id)
+        if default and not orders:
+            supply, build_time = TERRAN_UNIT_PRODUCTION[default]
+            slots.extend([(0.0, supply, build_time)] * capacity)
+        elif default and len(orders) < capacity and slots:
+            slots.append((0.0, slots[0][1], slots[0][2]))
+        return slots
+
+    def production_demand(self, producers: Iterable["Unit"]) -> int:
+        """The supply our producers will take within the horizon."""
+        demand = 0
+        for structure in producers:
+            structure_demand = 0
+            for remaining, supply, build_time in self.slots(structure):
+                if remaining > self.horizon:
+                    continue
+                starts = 1 + int((self.horizon - remaining) // build_time)
+                structure_demand += starts * supply
+            # Units queued behind the active ones hold their supply already.
+            capacity = 2 if structure.has_reactor else 1
+            for order in structure.orders[capacity:]:
+                unit = TRAIN_ABILITY_TO_UNIT.get(order.ability.id)
+                if unit:
+                    structure_demand -= TERRAN_UNIT_PRODUCTION[unit][0]
+            demand += max(0, structure_demand)
+        return demand
+
+    def forecast(
+        self,
+        producers: Iterable["Unit"],
+        supply_used: int,
+        supply_cap: int,
+        incoming: Iterable[Tuple[float, int]] = (),
+    ) -> SupplyForecast:
+        """
+        Computes how many depots to start now.
+
+        :param producers: Ready townhalls and production structures.
+        :param incoming: (seconds until done, supply) for every depot or
+            townhall already under construction or on its way.
+        """
+        demand = self.production_demand(producers)
+        projected_cap = supply_cap + sum(
+            supply for eta, supply in incoming if eta <= self.horizon
+        )
+        projected_cap = min(projected_cap, 200)
+        shortfall = supply_used + demand + SUPPLY_BUFFER_BASE - projected_cap
+        depots = math.ceil(shortfall / SUPPLY_DEPOT_SUPPLY) if shortfall > 0 else 0
+        depots = min(depots, math.ceil((200 - projected_cap) / SUPPLY_DEPOT_SUPPLY))
+        return SupplyForecast(demand, projected_cap, max(0, depots))
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Tuple
 
 from sc2.ids.unit_typeid import UnitTypeId
 
@@ -7,18 +7,27 @@ from core.interfaces.manager_abc import Manager
 from core.frame_plan import EconomicStance
 from core.types import CommandFunctor
 from core.utilities.events import Event, EventType, BuildRequestPayload
-from core.utilities.constants import (
-    SUPPLY_BUFFER_BASE,
-    SUPPLY_BUFFER_PER_PRODUCTION_STRUCTURE,
-    EVENT_PRIORITY_HIGH,
+from core.utilities.constants import EVENT_PRIORITY_HIGH
+from core.utilities.unit_types import (
+    COMMAND_CENTER_BUILD_SECONDS,
+    COMMAND_CENTER_SUPPLY,
+    SUPPLY_DEPOT_BUILD_SECONDS,
+    SUPPLY_DEPOT_SUPPLY,
+    TERRAN_PRODUCTION_TYPES,
+    TOWNHALL_TYPES_TERRAN,
 )
-from core.utilities.unit_types import TERRAN_PRODUCTION_TYPES
+from .supply_forecaster import DEPOT_LEAD_SECONDS, SupplyForecaster
 
 if TYPE_CHECKING:
     from sc2.bot_ai import BotAI
     from core.global_cache import GlobalCache
     from core.event_bus import EventBus
     from core.frame_plan import FramePlan
+    from terran.infrastructure.infrastructure_director import InfrastructureDirector
+
+# --- Tunable Supply Constants ---
+# Never have more depots than this in progress at once.
+MAX_CONCURRENT_DEPOTS = 6
 
 
 class SupplyManager(Manager):
@@ -26,63 +35,89 @@ class SupplyManager(Manager):
     Manages the bot's supply to prevent it from getting supply blocked.
     It does not issue direct build commands but instead publishes a high-priority
     build request to the EventBus.
+
+    The number of depots is driven by a forecast of what the production
+    queues will consume before a new depot could finish, so several depots
+    may be requested at once at high production counts.
     """
 
-    def __init__(self, bot: "BotAI"):
+    def __init__(self, bot: "BotAI", director: "InfrastructureDirector"):
         super().__init__(bot)
+        self.director = director
+        self.forecaster = SupplyForecaster()
 
     async def execute(
         self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
     ) -> List[CommandFunctor]:
         """
-        Checks supply and requests a new Supply Depot if needed.
+        Forecasts supply and requests as many Supply Depots as needed.
         """
         if cache.supply_cap >= 200:
             return []
 
-        # Check for pending depots + depots in construction to avoid over-building.
-        if (
-            self.bot.already_pending(UnitTypeId.SUPPLYDEPOT)
-            + self.bot.structures(UnitTypeId.SUPPLYDEPOT).not_ready.amount
-            > 0
-        ):
-            return []
-
-        required_buffer = 0
-        if plan.economic_stance == EconomicStance.SAVING_FOR_EXPANSION:
-            required_buffer = 2
-        else:
-            num_production_structures = cache.friendly_structures.of_type(
-                TERRAN_PRODUCTION_TYPES
-            ).amount
-            required_buffer = (
-                SUPPLY_BUFFER_BASE
-                + num_production_structures * SUPPLY_BUFFER_PER_PRODUCTION_STRUCTURE
-            )
-
-        if cache.supply_left < required_buffer:
-            # --- CORRECTED: Smarter and Safer Placement Logic ---
-            placement_pos = self.bot.start_location  # Default fallback
-
-            # CRITICAL CHECK: Ensure a ready townhall exists before trying to access it.
-            ready_townhalls = self.bot.townhalls.ready
-            if ready_townhalls.exists:
-                main_th = ready_townhalls.first
-                mineral_fields = self.bot.mineral_field.closer_than(10, main_th)
-                if mineral_fields.exists:
-                    # Calculate a point "behind" the townhall, away from the minerals.
-                    placement_pos = main_th.position.towards(mineral_fields.center, -8)
-            # --- END CORRECTION ---
+        incoming, depots_in_progress = self._incoming_supply(cache)
+        producers = cache.friendly_structures.of_type(
+            TOWNHALL_TYPES_TERRAN | TERRAN_PRODUCTION_TYPES
+        ).ready
+        forecast = self.forecaster.forecast(
+            producers, cache.supply_used, cache.supply_cap, incoming
+        )
 
+        # While saving for a Command Center, only one depot at a time.
+        max_concurrent = (
+            1
+            if plan.economic_stance == EconomicStance.SAVING_FOR_EXPANSION
+            else MAX_CONCURRENT_DEPOTS
+        )
+        requests = min(forecast.depots_needed, max_concurrent - depots_in_progress)
+        for _ in range(requests):
+            # Placement is left to the ConstructionManager, which takes the
+            # next precomputed depot slot (ramp wall first).
             payload = BuildRequestPayload(
                 item_id=UnitTypeId.SUPPLYDEPOT,
-                position=placement_pos,
+                position=None,
                 priority=EVENT_PRIORITY_HIGH,
-                unique=True,
+                unique=False,
             )
             bus.publish(Event(EventType.INFRA_BUILD_REQUEST, payload))
+
+        if requests > 0:
             cache.logger.info(
-                f"Supply low. Requesting SUPPLYDEPOT near {placement_pos.rounded}"
+                f"Supply forecast: {cache.supply_used}+{forecast.demand} used vs "
+                f"{forecast.projected_cap} cap. Requesting {requests} SUPPLYDEPOT(s)."
             )
-
         return []
+
+    def _incoming_supply(
+        self, cache: "GlobalCache"
+    ) -> Tuple[List[Tuple[float, int]], int]:
+        """
+        Collects the supply that is already on its way.
+
+        :return: (seconds until done, supply) for every depot and Command
+            Center in progress, and the number of depots among them.
+        """
+        incoming: List[Tuple[float, int]] = []
+        counts = cache.unit_counts
+        # Only scan for build progress when something is under construction.
+        building = counts.in_production(UnitTypeId.SUPPLYDEPOT)
+        if building:
+            depots = cache.friendly_structures.of_type(UnitTypeId.SUPPLYDEPOT).not_ready
+            for depot in depots:
+                remaining = (1 - depot.build_progress) * SUPPLY_DEPOT_BUILD_SECONDS
+                incoming.append((remaining, SUPPLY_DEPOT_SUPPLY))
+        if counts.in_production(UnitTypeId.COMMANDCENTER):
+            ccs = cache.friendly_structures.of_type(UnitTypeId.COMMANDCENTER).not_ready
+            for cc in ccs:
+                remaining = (1 - cc.build_progress) * COMMAND_CENTER_BUILD_SECONDS
+                incoming.append((remaining, COMMAND_CENTER_SUPPLY))
+
+        # Depots a builder is walking to, or still waiting in the build queue.
+        ordered = counts.queued(UnitTypeId.SUPPLYDEPOT)
+        queued = self.director.construction_manager.build_queue.count(
+            UnitTypeId.SUPPLYDEPOT
+        )
+        incoming.extend(
+            [(DEPOT_LEAD_SECONDS, SUPPLY_DEPOT_SUPPLY)] * (ordered + queued)
+        )
+        return incoming, building + ordered + queued
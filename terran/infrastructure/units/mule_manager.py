@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 from sc2.ids.unit_typeid import UnitTypeId
 from sc2.ids.ability_id import AbilityId
@@ -7,67 +8,207 @@ from sc2.data import race_townhalls
 
 from core.interfaces.manager_abc import Manager
 from core.types import CommandFunctor
+from core.utilities.constants import GAME_LOOPS_PER_SECOND
+from core.utilities.events import (
+    Event,
+    EventType,
+    EnemyTechScoutedPayload,
+    EnemyUnitSeenPayload,
+)
+from core.utilities.unit_types import CLOAK_THREAT_TYPES
 
 if TYPE_CHECKING:
     from sc2.bot_ai import BotAI
+    from sc2.unit import Unit
     from core.global_cache import GlobalCache
     from core.event_bus import EventBus
     from core.frame_plan import FramePlan
 
+# --- Tunable MULE Constants ---
+MULE_ENERGY_COST = 50
+SCAN_ENERGY_COST = 50
+# A MULE lives 64 seconds and mines 225 minerals from a close patch.
+MULE_LIFETIME_SECONDS = 64
+MULE_YIELD = 225
+# A MULE on a far patch makes fewer trips in its lifetime.
+FAR_PATCH_MULE_EFFICIENCY = 0.9
+# The number of scans kept in reserve while the detection-need signal is up.
+SCAN_CHARGES_TO_BANK = 1
+
+
+@dataclass
+class PatchInfo:
+    """A mineral patch of one of our bases, as seen by the MULE scheduler."""
+
+    tag: int
+    townhall_tag: int
+    efficiency: float
+
 
 class MuleManager(Manager):
     """
-    Manages the usage of Orbital Command energy for calling down MULEs.
+    The Quartermaster. Spends Orbital Command energy on MULEs.
+
+    Every eligible Orbital drops in the same frame. Each MULE goes to the
+    patch with the highest expected yield over the MULE's lifetime, given
+    what the patch has left and the MULEs already mining it. While cloaked
+    enemies are known, enough energy is banked for scans.
     """
 
     def __init__(self, bot: "BotAI"):
         super().__init__(bot)
+        # Raised once cloaked units or the tech for them have been seen.
+        self.detection_needed: bool = False
+        # Patch tag -> game loops at which the MULEs mining it expire.
+        self.active_mules: Dict[int, List[int]] = {}
+        # The expected minerals mined by every MULE dropped this game.
+        self.expected_income: int = 0
+        self._patch_index: Dict[int, PatchInfo] = {}
+        self._indexed_townhalls: frozenset = frozenset()
+        bus = getattr(bot, "event_bus", None)
+        if bus:
+            bus.subscribe(
+                EventType.TACTICS_ENEMY_TECH_SCOUTED, self.handle_tech_scouted
+            )
+            bus.subscribe(
+                EventType.TACTICS_ENEMY_UNIT_SEEN, self.handle_enemy_unit_seen
+            )
+
+    async def handle_tech_scouted(self, event: Event):
+        payload: EnemyTechScoutedPayload = event.payload
+        if payload.tech_id in CLOAK_THREAT_TYPES:
+            self.detection_needed = True
+
+    async def handle_enemy_unit_seen(self, event: Event):
+        payload: EnemyUnitSeenPayload = event.payload
+        if payload.unit.type_id in CLOAK_THREAT_TYPES:
+            self.detection_needed = True
 
     async def execute(
         self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
     ) -> List[CommandFunctor]:
         """
-        Finds Orbital Commands with enough energy and calls down MULEs on the
-        most effective mineral patches.
+        Calls down a MULE from every Orbital Command with spare energy onto
+        the patches with the highest expected yield.
         """
-        actions: List[CommandFunctor] = []
-        terran_townhalls = race_townhalls[self.bot.race]
-
-        # Find OCs with enough energy for a MULE
-        orbitals = cache.friendly_structures.of_type(
-            UnitTypeId.ORBITALCOMMAND
-        ).ready.filter(lambda oc: oc.energy >= 50)
-
-        if not orbitals:
+        orbitals = cache.friendly_structures.of_type(UnitTypeId.ORBITALCOMMAND).ready
+        casters = self._casters(orbitals)
+        if not casters:
             return []
 
-        # Find ready townhalls to determine which mineral patches are ours
-        townhalls = cache.friendly_structures.of_type(terran_townhalls).ready
+        townhalls = cache.friendly_structures.of_type(
+            race_townhalls[self.bot.race]
+        ).ready
         if not townhalls:
             return []
+        self._update_patch_index(cache, townhalls)
+        patches = self._live_patches(cache)
+        self._expire_mules(cache.game_loop)
 
-        # Select the OC with the most energy to call down the MULE
-        oc_to_use = orbitals.sorted(lambda o: o.energy, reverse=True).first
-
-        # Find the best mineral patch to drop the MULE on.
-        best_mineral_patch = None
-        highest_minerals = 0
-        for th in townhalls:
-            patches = self.bot.mineral_field.closer_than(10, th)
-            if not patches:
-                continue
-            richest_patch = patches.sorted(
-                lambda p: p.mineral_contents, reverse=True
-            ).first
-            if richest_patch.mineral_contents > highest_minerals:
-                highest_minerals = richest_patch.mineral_contents
-                best_mineral_patch = richest_patch
-
-        if best_mineral_patch:
+        actions: List[CommandFunctor] = []
+        expiry = cache.game_loop + int(MULE_LIFETIME_SECONDS * GAME_LOOPS_PER_SECOND)
+        for orbital in casters:
+            target, expected = self._best_patch(patches)
+            if target is None or expected <= 0:
+                break
+            self.active_mules.setdefault(target.tag, []).append(expiry)
+            self.expected_income += expected
             actions.append(
-                lambda oc=oc_to_use, patch=best_mineral_patch: oc(
+                lambda oc=orbital, patch=target: oc(
                     AbilityId.CALLDOWNMULE_CALLDOWNMULE, patch
                 )
             )
 
+        if actions:
+            cache.logger.debug(
+                f"Calling down {len(actions)} MULE(s); "
+                f"expected MULE income this game: {self.expected_income}."
+            )
         return actions
+
+    def _casters(self, orbitals) -> List["Unit"]:
+        """
+        The Orbitals that can drop a MULE this frame, fullest first. While
+        detection is needed, the fullest Orbitals keep scans in reserve.
+        """
+        reserve = (
+            SCAN_CHARGES_TO_BANK * SCAN_ENERGY_COST if self.detection_needed else 0
+        )
+        casters = []
+        for orbital in sorted(orbitals, key=lambda o: o.energy, reverse=True):
+            banked = min(
+                reserve, int(orbital.energy // SCAN_ENERGY_COST) * SCAN_ENERGY_COST
+            )
+            reserve -= banked
+            if orbital.energy - banked >= MULE_ENERGY_COST:
+                casters.append(orbital)
+        return casters
+
+    # --- Patch Index ---
+
+    def _update_patch_index(self, cache: "GlobalCache", townhalls):
+        """Rebuilds the patch index only when our set of townhalls changes."""
+        townhall_tags = frozenset(th.tag for th in townhalls)
+        if townhall_tags == self._indexed_townhalls and self._patch_index:
+            return
+        self._indexed_townhalls = townhall_tags
+        self._patch_index = {}
+        registry = cache.base_registry
+        for th in townhalls:
+            base = registry.base_of_townhall(th.tag) if registry else None
+            if base:
+                ranked = registry.mineral_fields(base)
+            else:
+                ranked = sorted(
+                    self.bot.mineral_field.closer_than(10, th),
+                    key=lambda p: p.distance_to(th),
+                )
+            near_count = (len(ranked) + 1) // 2
+            for rank, patch in enumerate(ranked):
+                efficiency = 1.0 if rank < near_count else FAR_PATCH_MULE_EFFICIENCY
+                self._patch_index[patch.tag] = PatchInfo(patch.tag, th.tag, efficiency)
+
+    def _live_patches(self, cache: "GlobalCache") -> List["Unit"]:
+        registry = cache.base_registry
+        if registry:
+            units = (registry.resource(tag) for tag in self._patch_index)
+        else:
+            units = (p for p in self.bot.mineral_field if p.tag in self._patch_index)
+        return [p for p in units if p is not None and p.mineral_contents > 0]
+
+    def _expire_mules(self, game_loop: int):
+        for tag in list(self.active_mules):
+            alive = [t for t in self.active_mules[tag] if t > game_loop]
+            if alive:
+                self.active_mules[tag] = alive
+            else:
+                del self.active_mules[tag]
+
+    # --- Targeting ---
+
+    def expected_yield(self, patch: "Unit") -> int:
+        """
+        Minerals a new MULE on `patch` is expected to mine before it expires.
+        Active MULEs on the patch are assumed to take their share first.
+        """
+        info = self._patch_index.get(patch.tag)
+        efficiency = info.efficiency if info else FAR_PATCH_MULE_EFFICIENCY
+        haul = MULE_YIELD * efficiency
+        already_claimed = len(self.active_mules.get(patch.tag, ())) * MULE_YIELD
+        return int(max(0.0, min(haul, patch.mineral_contents - already_claimed)))
+
+    def _best_patch(self, patches: List["Unit"]) -> Tuple["Unit" | None, int]:
+        """
+        The patch with the highest expected yield. Ties go to patches with
+        fewer MULEs already on them, then to the richest.
+        """
+        best, best_key = None, (0,)
+        for patch in patches:
+            key = (
+                self.expected_yield(patch),
+                -len(self.active_mules.get(patch.tag, ())),
+                patch.mineral_contents,
+            )
+            if key > best_key:
+                best, best_key = patch, key
+        return best, best_key[0]
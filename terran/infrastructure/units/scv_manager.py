@@ -1,13 +1,18 @@
 # terran/infrastructure/units/scv_manager.py
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Dict, List
 
 from sc2.ids.unit_typeid import UnitTypeId
 from sc2.data import race_townhalls
+from sc2.position import Point2
 
 from core.interfaces.manager_abc import Manager
 from core.types import CommandFunctor
 from core.utilities.constants import MAX_WORKER_COUNT, SCVS_PER_GEYSER
+from core.resource_ledger import BudgetCategory
+from core.utilities.events import Event, EventType, UnitDestroyedPayload
+from .transfer_planner import TransferPlanner
+from .worker_allocator import WorkerAllocator
 
 if TYPE_CHECKING:
     from sc2.bot_ai import BotAI
@@ -16,6 +21,9 @@ if TYPE_CHECKING:
     from core.event_bus import EventBus
     from core.frame_plan import FramePlan
 
+# Pseudo site tag for workers long-distance mining outside our lines.
+REMOTE_MINING_SITE = -1
+
 
 class SCVManager(Manager):
     """
@@ -24,6 +32,19 @@ class SCVManager(Manager):
 
     def __init__(self, bot: "BotAI"):
         super().__init__(bot)
+        # Per-patch saturation table used to place idle workers.
+        self.allocator = WorkerAllocator()
+        self.transfer_planner = TransferPlanner()
+        # True while bases are being rebalanced after a line was added or lost.
+        self.rebalancing: bool = False
+        bus = getattr(bot, "event_bus", None)
+        if bus:
+            bus.subscribe(EventType.UNIT_DESTROYED, self.handle_unit_destroyed)
+
+    async def handle_unit_destroyed(self, event: Event):
+        """Event handler that frees the patch slot of a killed worker."""
+        payload: UnitDestroyedPayload = event.payload
+        self.allocator.release_worker(payload.unit_tag)
 
     async def execute(
         self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
@@ -37,17 +58,16 @@ class SCVManager(Manager):
         # --- 1. SCV Production ---
         worker_target = MAX_WORKER_COUNT
         current_worker_count = cache.friendly_workers.amount
-        pending_worker_count = self.bot.already_pending(UnitTypeId.SCV)
+        pending_worker_count = cache.unit_counts.pending(UnitTypeId.SCV)
 
-        if (
-            current_worker_count + pending_worker_count < worker_target
-            and self.bot.can_afford(UnitTypeId.SCV)
-        ):
+        if current_worker_count + pending_worker_count < worker_target:
             producible_townhalls: Units = cache.friendly_structures.of_type(
                 terran_townhalls
             ).ready.filter(lambda th: len(th.orders) < 1)
 
-            if producible_townhalls.exists:
+            if producible_townhalls.exists and plan.resource_ledger.reserve(
+                BudgetCategory.INFRASTRUCTURE, UnitTypeId.SCV
+            ):
                 th = producible_townhalls.first
                 cache.logger.debug(
                     f"Training SCV from {th.type_id} at {th.position.rounded}"
@@ -56,8 +76,6 @@ class SCVManager(Manager):
 
         # --- 2. Worker Assignment ---
         idle_workers = cache.friendly_workers.idle
-        if not idle_workers:
-            return actions
 
         # --- 2a. Gas Saturation (Priority) ---
         ready_refineries = cache.friendly_structures.of_type(UnitTypeId.REFINERY).ready
@@ -90,28 +108,109 @@ class SCVManager(Manager):
             idle_workers = workers_to_assign
 
         # --- 2b. Mineral Saturation (Remaining Workers) ---
-        if not idle_workers:
-            return actions
-
         all_townhalls = cache.friendly_structures.of_type(terran_townhalls).ready
         if not all_townhalls.exists:
             return actions
 
-        unsaturated_townhalls = all_townhalls.filter(
-            lambda th: th.surplus_harvesters < 0
+        self.allocator.update(
+            all_townhalls,
+            self.bot.mineral_field,
+            cache.friendly_workers,
+            cache.base_registry,
         )
+        for worker, mineral_field in self.allocator.assign(idle_workers):
+            actions.append(lambda w=worker, m=mineral_field: w.gather(m))
 
-        for worker in idle_workers:
-            if unsaturated_townhalls.exists:
-                target_th = unsaturated_townhalls.closest_to(worker)
-            else:
-                target_th = all_townhalls.closest_to(worker)
+        # --- 3. Inter-Base Transfers ---
+        actions.extend(self._handle_transfers(cache, ready_refineries))
 
-            local_minerals = self.bot.mineral_field.closer_than(10, target_th)
-            if local_minerals.exists:
-                target_mineral = local_minerals.sorted(
-                    key=lambda mf: mf.assigned_harvesters
-                ).first
-                actions.append(lambda w=worker, m=target_mineral: w.gather(m))
+        return actions
 
+    def _handle_transfers(
+        self, cache: "GlobalCache", refineries: "Units"
+    ) -> List[CommandFunctor]:
+        """
+        Rebalances workers between mineral lines, refineries and remote
+        patches after a townhall finishes or a line mines out. Transfers are
+        bounded per frame and continue on later frames until balanced.
+        """
+        if self.allocator.lines_changed:
+            self.allocator.lines_changed = False
+            self.rebalancing = True
+        if not self.rebalancing:
+            return []
+
+        balances, positions, movers = self._site_balances(cache, refineries)
+        transfers = self.transfer_planner.plan(balances, positions)
+        if not transfers:
+            self.rebalancing = False
+            return []
+
+        refineries_by_tag = {r.tag: r for r in refineries}
+        workers_by_tag = {w.tag: w for w in cache.friendly_workers}
+        actions: List[CommandFunctor] = []
+        for transfer in transfers:
+            if transfer.source in self.allocator.lines:
+                worker_tags = self.allocator.workers_to_release(
+                    transfer.source, transfer.count
+                )
+            else:
+                worker_tags = movers.get(transfer.source, [])[: transfer.count]
+
+            for worker_tag in worker_tags:
+                worker = workers_by_tag.get(worker_tag)
+                if not worker:
+                    continue
+                if transfer.destination in self.allocator.lines:
+                    target = self.allocator.claim_slot(transfer.destination, worker_tag)
+                else:
+                    self.allocator.release_worker(worker_tag)
+                    target = refineries_by_tag.get(transfer.destination)
+                if target:
+                    actions.append(lambda w=worker, t=target: w.gather(t))
+
+        cache.logger.debug(
+            f"Transferring {sum(t.count for t in transfers)} workers between bases."
+        )
         return actions
+
+    def _site_balances(self, cache: "GlobalCache", refineries: "Units"):
+        """
+        Builds the surplus/deficit vector over all mining sites.
+
+        :return: Balances and positions keyed by site tag, plus the workers
+            that can be moved off each non-mineral-line site.
+        """
+        balances: Dict[int, int] = {}
+        positions: Dict[int, "Point2"] = {}
+        movers: Dict[int, List[int]] = {}
+
+        for townhall_tag, line in self.allocator.lines.items():
+            balances[townhall_tag] = -self.allocator.deficit(townhall_tag)
+            positions[townhall_tag] = line.position
+
+        # Refinery saturation is counted from worker orders rather than
+        # `assigned_harvesters`, so workers still walking there are included.
+        live_refineries = {r.tag: r for r in refineries if r.vespene_contents > 0}
+        for worker in cache.friendly_workers:
+            if worker.order_target in live_refineries:
+                movers.setdefault(worker.order_target, []).append(worker.tag)
+        for tag, refinery in live_refineries.items():
+            balances[tag] = len(movers.get(tag, [])) - SCVS_PER_GEYSER
+            positions[tag] = refinery.position
+
+        # Remote miners are pure surplus, located where they mine.
+        remote = [
+            (worker_tag, self.allocator.assignments[worker_tag])
+            for worker_tag in self.allocator.remote_workers
+        ]
+        remote_patches = [
+            self.allocator.patch_position(patch_tag) for _, patch_tag in remote
+        ]
+        remote_patches = [p for p in remote_patches if p is not None]
+        if remote_patches:
+            balances[REMOTE_MINING_SITE] = len(remote)
+            positions[REMOTE_MINING_SITE] = Point2.center(remote_patches)
+            movers[REMOTE_MINING_SITE] = [worker_tag for worker_tag, _ in remote]
+
+        return balances, positions, movers
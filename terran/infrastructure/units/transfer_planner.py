@@ -0,0 +1,72 @@
+# terran/infrastructure/units/transfer_planner.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from sc2.position import Point2
+
+# --- Tunable Transfer Constants ---
+# The maximum number of workers re-assigned between sites in a single frame.
+# Larger transfers are spread over consecutive frames.
+MAX_TRANSFERS_PER_FRAME = 8
+# Imbalances smaller than this are not worth a walk across the map.
+MIN_TRANSFER_SIZE = 2
+
+
+@dataclass
+class Transfer:
+    """An order to move `count` workers from one mining site to another."""
+
+    source: int
+    destination: int
+    count: int
+
+
+class TransferPlanner:
+    """
+    The Dispatcher. Turns the per-site surplus/deficit vector into the
+    smallest set of worker transfers that balances it.
+
+    Sites are mineral lines and refineries, identified by the tag of their
+    townhall or refinery. A positive balance is a surplus, a negative one a
+    deficit. Surpluses are matched to deficits greedily by distance, so every
+    pair of sites gets at most one transfer and workers walk the least.
+    """
+
+    def plan(
+        self,
+        balances: Dict[int, int],
+        positions: Dict[int, "Point2"],
+        budget: int = MAX_TRANSFERS_PER_FRAME,
+    ) -> List[Transfer]:
+        """
+        Computes the transfers for this frame.
+
+        :param balances: Site tag -> assigned workers minus ideal workers.
+        :param positions: Site tag -> site position.
+        :param budget: The maximum number of workers to move this frame.
+        :return: Transfers ordered from the shortest walk to the longest.
+        """
+        surplus = {tag: n for tag, n in balances.items() if n >= MIN_TRANSFER_SIZE}
+        deficit = {tag: -n for tag, n in balances.items() if -n >= MIN_TRANSFER_SIZE}
+        if not surplus or not deficit:
+            return []
+
+        pairs = sorted(
+            (positions[s].distance_to(positions[d]), s, d)
+            for s in surplus
+            for d in deficit
+        )
+        transfers: List[Transfer] = []
+        for _, source, destination in pairs:
+            if budget <= 0:
+                break
+            count = min(surplus[source], deficit[destination], budget)
+            if count <= 0:
+                continue
+            transfers.append(Transfer(source, destination, count))
+            surplus[source] -= count
+            deficit[destination] -= count
+            budget -= count
+        return transfers
@@ -0,0 +1,325 @@
+# terran/infrastructure/units/worker_allocator.py
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Set, Tuple
+
+if TYPE_CHECKING:
+    from sc2.position import Point2
+    from sc2.unit import Unit
+    from sc2.units import Units
+    from core.utilities.base_registry import BaseRegistry
+
+# --- Tunable Allocation Constants ---
+# Patches are considered part of a townhall's mineral line within this radius.
+MINERAL_LINE_RADIUS = 10
+# Two workers per patch mine at (almost) full efficiency; a third worker only
+# fills the gaps in the other two's trips.
+OPTIMAL_WORKERS_PER_PATCH = 2
+MAX_WORKERS_PER_PATCH = 3
+# The closest half of a mineral line is mined first, as its trips are shorter.
+NEAR_PATCH_FRACTION = 0.5
+# Workers beyond every line's capacity long-distance mine patches of
+# expansions nobody holds, this many per patch.
+WORKERS_PER_REMOTE_PATCH = 2
+
+
+@dataclass
+class MineralLine:
+    """The mineral patches of one townhall, ordered from nearest to farthest."""
+
+    townhall_tag: int
+    position: "Point2"
+    patches: List[int] = field(default_factory=list)
+    near_patches: Set[int] = field(default_factory=set)
+
+    @property
+    def ideal_workers(self) -> int:
+        return len(self.patches) * OPTIMAL_WORKERS_PER_PATCH
+
+
+class WorkerAllocator:
+    """
+    The Foreman. Tracks which worker mines which mineral patch and hands out
+    patches to idle workers in one batch.
+
+    A per-patch saturation table is kept across frames and updated
+    incrementally: by our own assignments as they are made (so two idle
+    workers never pile onto the same patch in the same frame), and by a
+    cheap sync against the workers' current gather targets.
+
+    Patches are filled in tiers: every patch to two workers first, near
+    patches before far ones, and only then a third worker per patch. Workers
+    left over after that long-distance mine expansions nobody holds, the one
+    nearest our townhalls first.
+    """
+
+    def __init__(self):
+        self.lines: Dict[int, MineralLine] = {}
+        self.patch_owner: Dict[int, int] = {}  # patch tag -> townhall tag
+        self.patch_workers: Dict[int, Set[int]] = {}  # patch tag -> worker tags
+        self.assignments: Dict[int, int] = {}  # worker tag -> patch tag
+        # Set whenever a line is added, shrinks or disappears; cleared by the
+        # consumer once it has rebalanced the bases.
+        self.lines_changed: bool = False
+        self._patch_units: Dict[int, "Unit"] = {}
+        self._registry: "BaseRegistry" | None = None
+
+    # --- Table Maintenance ---
+
+    def update(
+        self,
+        townhalls: "Units",
+        mineral_fields: "Units",
+        workers: Iterable["Unit"],
+        registry: "BaseRegistry" | None = None,
+    ):
+        """
+        Brings the saturation table up to date with the current frame.
+
+        :param townhalls: Ready friendly townhalls.
+        :param mineral_fields: All visible mineral fields.
+        :param workers: All friendly workers.
+        :param registry: If given, new lines take their patches from it
+            instead of scanning `mineral_fields`.
+        """
+        self._patch_units = {mf.tag: mf for mf in mineral_fields}
+        self._registry = registry
+
+        # Forget mined-out patches and lost townhalls.
+        for patch_tag in [t for t in self.patch_workers if t not in self._patch_units]:
+            self.remove_patch(patch_tag)
+        townhall_tags = {th.tag for th in townhalls}
+        for townhall_tag in [t for t in self.lines if t not in townhall_tags]:
+            self.remove_line(townhall_tag)
+
+        for townhall in townhalls:
+            if townhall.tag not in self.lines:
+                self.add_line(townhall, mineral_fields, registry)
+
+        self._sync_workers(workers)
+
+    def add_line(
+        self,
+        townhall: "Unit",
+        mineral_fields: "Units",
+        registry: "BaseRegistry" | None = None,
+    ):
+        """Registers the mineral line of a newly ready townhall."""
+        base = registry.base_of_townhall(townhall.tag) if registry else None
+        if base:
+            # Already ranked by distance.
+            candidates = registry.mineral_fields(base)
+        else:
+            candidates = sorted(
+                mineral_fields.closer_than(MINERAL_LINE_RADIUS, townhall),
+                key=lambda mf: mf.distance_to(townhall),
+            )
+        patches = [mf for mf in candidates if mf.tag not in self.patch_owner]
+        near_count = int(round(len(patches) * NEAR_PATCH_FRACTION))
+        line = MineralLine(
+            townhall_tag=townhall.tag,
+            position=townhall.position,
+            patches=[mf.tag for mf in patches],
+            near_patches={mf.tag for mf in patches[:near_count]},
+        )
+        self.lines[townhall.tag] = line
+        self.lines_changed = True
+        for patch_tag in line.patches:
+            self.patch_owner[patch_tag] = townhall.tag
+            self.patch_workers.setdefault(patch_tag, set())
+
+    def remove_line(self, townhall_tag: int):
+        line = self.lines.pop(townhall_tag, None)
+        if line:
+            self.lines_changed = True
+            for patch_tag in list(line.patches):
+                self.remove_patch(patch_tag)
+
+    def remove_patch(self, patch_tag: int):
+        """Drops a patch, e.g., once it is mined out. Its workers become free."""
+        townhall_tag = self.patch_owner.pop(patch_tag, None)
+        line = self.lines.get(townhall_tag)
+        if line and patch_tag in line.patches:
+            line.patches.remove(patch_tag)
+            line.near_patches.discard(patch_tag)
+            self.lines_changed = True
+        for worker_tag in self.patch_workers.pop(patch_tag, set()):
+            self.assignments.pop(worker_tag, None)
+
+    def release_worker(self, worker_tag: int):
+        """Removes a worker from the table, e.g., when it dies or is pulled."""
+        patch_tag = self.assignments.pop(worker_tag, None)
+        if patch_tag is not None:
+            self.patch_workers.get(patch_tag, set()).discard(worker_tag)
+
+    def _assign(self, worker_tag: int, patch_tag: int):
+        if self.assignments.get(worker_tag) == patch_tag:
+            return
+        self.release_worker(worker_tag)
+        self.assignments[worker_tag] = patch_tag
+        self.patch_workers.setdefault(patch_tag, set()).add(worker_tag)
+
+    def _sync_workers(self, workers: Iterable["Unit"]):
+        """Reconciles the table with what the workers are actually doing."""
+        seen: Set[int] = set()
+        for worker in workers:
+            seen.add(worker.tag)
+            if worker.is_gathering:
+                target = worker.order_target
+                if target in self._patch_units:
+                    self._assign(worker.tag, target)
+                else:
+                    # Mining gas.
+                    self.release_worker(worker.tag)
+            elif not worker.is_returning:
+                self.release_worker(worker.tag)
+        for worker_tag in [t for t in self.assignments if t not in seen]:
+            self.release_worker(worker_tag)
+
+    # --- Queries ---
+
+    def assigned_workers(self, townhall_tag: int) -> int:
+        line = self.lines.get(townhall_tag)
+        if not line:
+            return 0
+        return sum(len(self.patch_workers[p]) for p in line.patches)
+
+    def deficit(self, townhall_tag: int) -> int:
+        """Workers missing for optimal saturation; negative for a surplus."""
+        line = self.lines.get(townhall_tag)
+        if not line:
+            return 0
+        return line.ideal_workers - self.assigned_workers(townhall_tag)
+
+    def patch_position(self, patch_tag: int) -> "Point2" | None:
+        unit = self._patch_units.get(patch_tag)
+        return unit.position if unit else None
+
+    @property
+    def remote_workers(self) -> Set[int]:
+        """Workers long-distance mining patches that belong to no line."""
+        return {
+            worker_tag
+            for worker_tag, patch_tag in self.assignments.items()
+            if patch_tag not in self.patch_owner
+        }
+
+    def workers_to_release(self, townhall_tag: int, count: int) -> List[int]:
+        """
+        Picks up to `count` workers to move off a line, taking them from the
+        most crowded patches first, far patches before near ones.
+        """
+        line = self.lines.get(townhall_tag)
+        if not line or count <= 0:
+            return []
+        picks: List[int] = []
+        counts = {p: len(self.patch_workers[p]) for p in line.patches}
+        pools = {p: sorted(self.patch_workers[p]) for p in line.patches}
+        while len(picks) < count:
+            patch_tag = max(
+                line.patches,
+                key=lambda p: (counts[p], p not in line.near_patches),
+                default=None,
+            )
+            if patch_tag is None or counts[patch_tag] == 0:
+                break
+            picks.append(pools[patch_tag].pop())
+            counts[patch_tag] -= 1
+        return picks
+
+    def claim_slot(self, townhall_tag: int, worker_tag: int) -> "Unit" | None:
+        """
+        Moves a worker into the best open slot of a line.
+
+        :return: The mineral field to gather from, or None if the line is full.
+        """
+        line = self.lines.get(townhall_tag)
+        if not line:
+            return None
+        patch_tag = self._open_patch(line, OPTIMAL_WORKERS_PER_PATCH)
+        if patch_tag is None:
+            return None
+        self._assign(worker_tag, patch_tag)
+        return self._patch_units[patch_tag]
+
+    def _open_patch(self, line: MineralLine, cap: int) -> int | None:
+        """The best patch in a line with fewer than `cap` workers, near first."""
+        best = None
+        for patch_tag in line.patches:
+            count = len(self.patch_workers[patch_tag])
+            if count >= cap:
+                continue
+            if patch_tag in line.near_patches:
+                return patch_tag
+            if best is None:
+                best = patch_tag
+        return best
+
+    # --- Assignment ---
+
+    def assign(self, workers: Iterable["Unit"]) -> List[Tuple["Unit", "Unit"]]:
+        """
+        Assigns a batch of free workers to mineral patches.
+
+        Each worker goes to the closest line that still has a patch below
+        two workers; only when every line is optimally saturated are third
+        workers added. Workers are left unassigned once every line is full.
+
+        :return: A list of (worker, mineral_field) gather orders.
+        """
+        orders: List[Tuple["Unit", "Unit"]] = []
+        if not self.lines:
+            return orders
+
+        for cap in (OPTIMAL_WORKERS_PER_PATCH, MAX_WORKERS_PER_PATCH):
+            pending = []
+            for worker in workers:
+                if worker.tag in self.assignments:
+                    continue
+                open_lines = [
+                    line
+                    for line in self.lines.values()
+                    if self._open_patch(line, cap) is not None
+                ]
+                if not open_lines:
+                    pending.append(worker)
+                    continue
+                line = min(open_lines, key=lambda l: worker.distance_to(l.position))
+                patch_tag = self._open_patch(line, cap)
+                self._assign(worker.tag, patch_tag)
+                orders.append((worker, self._patch_units[patch_tag]))
+            workers = pending
+            if not workers:
+                break
+
+        remote_patches = self._remote_patches()
+        for worker in workers:
+            patch_tag = next(remote_patches, None)
+            if patch_tag is None:
+                break
+            self._assign(worker.tag, patch_tag)
+            orders.append((worker, self._patch_units[patch_tag]))
+        return orders
+
+    def _remote_patches(self) -> Iterator[int]:
+        """
+        Patches with room for a remote miner, once per free slot: those of
+        expansions the BaseRegistry lists as held by neither side, the
+        expansion closest to our townhalls first.
+        """
+        registry = self._registry
+        if registry is None or not self.lines:
+            return
+        townhalls = [line.position for line in self.lines.values()]
+        bases = sorted(
+            registry.free_bases(),
+            key=lambda base: min(base.location.distance_to(p) for p in townhalls),
+        )
+        for base in bases:
+            for patch in registry.mineral_fields(base):
+                tag = patch.tag
+                if tag not in self._patch_units or tag in self.patch_owner:
+                    continue
+                room = WORKERS_PER_REMOTE_PATCH - len(self.patch_workers.get(tag, ()))
+                for _ in range(room):
+                    yield tag
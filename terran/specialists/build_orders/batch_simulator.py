@@ -0,0 +1,719 @@
+# terran/specialists/build_orders/batch_simulator.py
+"""
+The economy simulator vectorized across variants: every quantity of the
+model is a NumPy array with one entry per scenario, so a tick of a thousand
+games costs about as many Python operations as a tick of one.
+"""
+
+from __future__ import annotations
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.ids.upgrade_id import UpgradeId
+
+from core.utilities.constants import SUPPLY_BUFFER_BASE
+from core.utilities.unit_types import COMMAND_CENTER_SUPPLY, SUPPLY_DEPOT_SUPPLY
+from .economy_simulator import (
+    _LEAD_SUPPLY_PER_SLOT,
+    BUILDER_TRAVEL_SECONDS,
+    MINERALS_PER_THIRD_WORKER_SECOND,
+    MINERALS_PER_WORKER_SECOND,
+    MULE_LIFETIME_SECONDS,
+    MULE_MINERALS_PER_SECOND,
+    ORBITAL_ENERGY_PER_SECOND,
+    PATCHES_PER_BASE,
+    PRODUCTION_TYPES,
+    RESEARCH_TYPES,
+    TOWNHALL_TYPES,
+    VESPENE_PER_WORKER_SECOND,
+    WORKERS_PER_GEYSER,
+    Goals,
+    Scenario,
+    SimulationReport,
+)
+from .tech_data import (
+    ADDON_TYPES,
+    MORPH_TYPES,
+    REACTOR_TYPES,
+    REQUIREMENTS,
+    TECH_SPECS,
+    BuildItem,
+)
+
+# --- Tunable Capacity Constants ---
+# Initial per-variant room for producers, in-flight items and MULEs; the
+# arrays double whenever a variant runs out.
+INITIAL_PRODUCERS = 8
+INITIAL_EVENTS = 16
+INITIAL_MULES = 4
+
+# Every build item gets an index; one more index stands for "nothing" and
+# pads the per-variant item lists.
+_ITEMS: List[BuildItem] = list(TECH_SPECS)
+_INDEX = {item: index for index, item in enumerate(_ITEMS)}
+_NOTHING = len(_ITEMS)
+_NO_PRODUCER = -1
+
+_STARTED = 0
+_UNAVAILABLE = 1
+_NO_RESOURCES = 2
+_NO_SUPPLY = 3
+
+
+def _table(value: Callable[[BuildItem], object], dtype, nothing=0) -> np.ndarray:
+    """A per-item lookup table, `nothing` at the padding index."""
+    return np.array([value(item) for item in _ITEMS] + [nothing], dtype=dtype)
+
+
+_MINERALS = _table(lambda item: TECH_SPECS[item].minerals, np.int64)
+_VESPENE = _table(lambda item: TECH_SPECS[item].vespene, np.int64)
+_SECONDS = _table(lambda item: TECH_SPECS[item].seconds, np.float64)
+_SUPPLY = _table(lambda item: TECH_SPECS[item].supply, np.int64)
+_PRODUCER = _table(
+    lambda item: _INDEX[TECH_SPECS[item].producer], np.intp, _NO_PRODUCER
+)
+_BY_SCV = _table(lambda item: TECH_SPECS[item].producer == UnitTypeId.SCV, bool)
+_NEEDS_TECHLAB = _table(lambda item: TECH_SPECS[item].needs_techlab, bool)
+_IS_UPGRADE = _table(lambda item: isinstance(item, UpgradeId), bool)
+_IS_ADDON = _table(lambda item: item in ADDON_TYPES, bool)
+_IS_REACTOR = _table(lambda item: item in REACTOR_TYPES, bool)
+_IS_MORPH = _table(lambda item: item in MORPH_TYPES, bool)
+_IS_PRODUCTION = _table(lambda item: item in PRODUCTION_TYPES, bool)
+_IS_RESEARCH = _table(lambda item: item in RESEARCH_TYPES, bool)
+_IS_TOWNHALL = _table(lambda item: item in TOWNHALL_TYPES, bool)
+_SUPPLY_PER_SLOT = _table(lambda item: _LEAD_SUPPLY_PER_SLOT.get(item, 0), np.int64)
+# Requirements as bit sets, one bit per item that something requires.
+_REQUIREMENT_ITEMS = sorted(
+    {r for rs in REQUIREMENTS.values() for r in rs}, key=_INDEX.get
+)
+_REQUIREMENT_BIT = _table(
+    lambda item: (
+        1 << _REQUIREMENT_ITEMS.index(item) if item in _REQUIREMENT_ITEMS else 0
+    ),
+    np.int64,
+)
+_REQUIRED = _table(
+    lambda item: sum(int(_REQUIREMENT_BIT[_INDEX[r]]) for r in REQUIREMENTS[item]),
+    np.int64,
+)
+
+_SCV = _INDEX[UnitTypeId.SCV]
+_COMMANDCENTER = _INDEX[UnitTypeId.COMMANDCENTER]
+_SUPPLYDEPOT = _INDEX[UnitTypeId.SUPPLYDEPOT]
+_REFINERY = _INDEX[UnitTypeId.REFINERY]
+_ORBITALCOMMAND = _INDEX[UnitTypeId.ORBITALCOMMAND]
+
+
+def _ranked_columns(mask: np.ndarray) -> np.ndarray:
+    """Per row, the columns where `mask` is set, in order; -1 pads."""
+    counts = mask.sum(axis=1)
+    width = int(counts.max()) if counts.size else 0
+    columns = np.argsort(~mask, axis=1, kind="stable")[:, :width]
+    return np.where(np.arange(width) < counts[:, None], columns, -1)
+
+
+def _grow(array: np.ndarray, fill) -> np.ndarray:
+    """The array with its second axis doubled, the new room set to `fill`."""
+    extra = np.full_like(array, fill)
+    return np.concatenate([array, extra], axis=1)
+
+
+def _padded(rows: Sequence[Sequence], fill, dtype) -> np.ndarray:
+    """Ragged per-variant lists as one array, padded with `fill`."""
+    width = max((len(row) for row in rows), default=0)
+    array = np.full((len(rows), width), fill, dtype=dtype)
+    for index, row in enumerate(rows):
+        array[index, : len(row)] = row
+    return array
+
+
+class BatchEconomySimulator:
+    """
+    The Wargame Hall. Plays many variants of the Wargame Table's game side by
+    side, with the same model and the same rules, tick for tick.
+
+    Every quantity the EconomySimulator keeps is an array here, with one row
+    per variant: counts of started and completed items, and padded tables of
+    producers, in-flight items and MULEs. Each decision the EconomySimulator
+    makes in a loop is made for all variants at once, one loop position at a
+    time, so the order of a variant's own decisions, and therefore its
+    report, is exactly that of `simulate`. A variant whose game is over just
+    drops out of the rows being advanced.
+    """
+
+    def __init__(self, scenarios: Sequence[Scenario]):
+        self.scenarios = list(scenarios)
+        n = len(self.scenarios)
+        scenarios = self.scenarios
+        self.duration = np.array([s.duration for s in scenarios], dtype=float)
+        self.tick = np.array([s.tick_seconds for s in scenarios], dtype=float)
+        self.max_workers = np.array([s.max_workers for s in scenarios], np.int64)
+        self.auto_workers = np.array([s.auto_workers for s in scenarios], bool)
+        self.auto_supply = np.array([s.auto_supply for s in scenarios], bool)
+        self.use_mules = np.array([s.use_mules for s in scenarios], bool)
+
+        self.now = np.zeros(n)
+        self.minerals, self.vespene = np.full(n, 50.0), np.zeros(n)
+        self.minerals_mined, self.vespene_mined = np.zeros(n), np.zeros(n)
+        self.supply_used = np.full(n, 12, np.int64)
+        self.supply_cap = np.full(n, COMMAND_CENTER_SUPPLY, np.int64)
+        self.mineral_workers = np.full(n, 12, np.int64)
+        self.gas_workers = np.zeros(n, np.int64)
+        self.bases = np.ones(n, np.int64)
+        self.refineries = np.zeros(n, np.int64)
+        self.started = np.zeros((n, _NOTHING + 1), np.int64)
+        self.started[:, _COMMANDCENTER] = 1
+        self.started[:, _SCV] = 12
+        self.completed = self.started.copy()
+        # The bits of the required items completed at least once.
+        self.completed_requirements = np.full(n, _REQUIREMENT_BIT[_COMMANDCENTER])
+        self.supply_blocked_seconds = np.zeros(n)
+        self.idle_production_seconds = np.zeros(n)
+        # Resources held this tick for goals that are being saved for.
+        self.reserved_minerals, self.reserved_vespene = np.zeros(n), np.zeros(n)
+
+        # Producers, in the order they were completed. A one-slot producer's
+        # second slot is never free.
+        self.producer_count = np.ones(n, np.int64)
+        self.producer_type = np.full((n, INITIAL_PRODUCERS), _NOTHING, np.intp)
+        self.producer_type[:, 0] = _COMMANDCENTER
+        self.free_at = np.full((n, INITIAL_PRODUCERS, 2), np.inf)
+        self.free_at[:, 0, 0] = 0.0
+        self.slot_count = np.zeros((n, INITIAL_PRODUCERS), np.int64)
+        self.slot_count[:, 0] = 1
+        self.addon = np.full((n, INITIAL_PRODUCERS), _NOTHING, np.intp)
+        self.has_techlab = np.zeros((n, INITIAL_PRODUCERS), bool)
+        self.energy = np.zeros((n, INITIAL_PRODUCERS))
+
+        # In-flight items; a free entry finishes at infinity.
+        self.sequence = np.zeros(n, np.int64)
+        self.event_finish = np.full((n, INITIAL_EVENTS), np.inf)
+        self.event_sequence = np.zeros((n, INITIAL_EVENTS), np.int64)
+        self.event_item = np.full((n, INITIAL_EVENTS), _NOTHING, np.intp)
+        self.event_producer = np.full((n, INITIAL_EVENTS), _NO_PRODUCER, np.intp)
+        # Expiry time of each MULE; expired entries are reused.
+        self.mules = np.full((n, INITIAL_MULES), -np.inf)
+        # (variant, item, time) of the items completed, per tick.
+        self._completions: List[np.ndarray] = []
+
+        self._init_build_orders()
+        self._init_goals()
+
+    def _init_build_orders(self):
+        scenarios = self.scenarios
+        orders = [s.build_order for s in scenarios]
+        self.step_item = _padded(
+            [[_INDEX[item] for _, item in order] for order in orders], _NOTHING, np.intp
+        )
+        self.step_supply = _padded(
+            [[supply for supply, _ in order] for order in orders], 0, np.int64
+        )
+        n, steps = self.step_item.shape
+        self.pending = self.step_item != _NOTHING
+        self.step_start_times = np.full((n, steps), np.nan)
+        # depends_on[v, k, d]: step k of variant v waits on step d.
+        self.depends_on = np.zeros((n, steps, steps), bool)
+        for v, scenario in enumerate(scenarios):
+            dependencies = scenario.step_dependencies or [
+                (i - 1,) if i else () for i in range(len(scenario.build_order))
+            ]
+            for k, step_dependencies in enumerate(dependencies):
+                self.depends_on[v, k, list(step_dependencies)] = True
+        self.unmet_dependencies = self.depends_on.sum(axis=2)
+
+    def _init_goals(self):
+        goals = [s.goals or Goals() for s in self.scenarios]
+        self.has_goals = np.array([s.goals is not None for s in self.scenarios])
+        self.goal_structure = _padded(
+            [[_INDEX[item] for item in g.structures] for g in goals], _NOTHING, np.intp
+        )
+        self.goal_structure_target = _padded(
+            [list(g.structures.values()) for g in goals], 0, np.int64
+        )
+        self.goal_upgrade = _padded(
+            [[_INDEX[upgrade] for upgrade in g.upgrades] for g in goals],
+            _NOTHING,
+            np.intp,
+        )
+        self.goal_unit = _padded(
+            [[_INDEX[unit] for unit in g.units] for g in goals], _NOTHING, np.intp
+        )
+        self.goal_unit_target = _padded(
+            [list(g.units.values()) for g in goals], 0, np.int64
+        )
+
+    # --- Main Loop ---
+
+    def run(self) -> List[SimulationReport]:
+        rows = np.flatnonzero(self.now < self.duration)
+        while rows.size:
+            self._tick(rows)
+            rows = rows[self.now[rows] < self.duration[rows]]
+        return self._reports()
+
+    def _tick(self, rows: np.ndarray):
+        """One EconomySimulator.run iteration, for every variant in `rows`."""
+        self._complete_finished(rows)
+        self._balance_gas(rows)
+        self.reserved_minerals[rows] = 0.0
+        self.reserved_vespene[rows] = 0.0
+
+        blocked = np.zeros(len(self.scenarios), dtype=bool)
+        # Infrastructure first, as the General orders its Directors.
+        workers = rows[self.auto_workers[rows]]
+        if workers.size:
+            blocked[workers] |= self._train_workers(workers)
+        supply = rows[self.auto_supply[rows]]
+        if supply.size:
+            self._build_supply(supply)
+        in_order = self.pending[rows].any(axis=1)
+        if in_order.any():
+            blocked[rows[in_order]] |= self._advance_build_order(rows[in_order])
+        pursuing = rows[~in_order & self.has_goals[rows]]
+        if pursuing.size:
+            blocked[pursuing] |= self._pursue_goals(pursuing)
+
+        tick = self.tick[rows]
+        self.supply_blocked_seconds[rows] += np.where(blocked[rows], tick, 0.0)
+        free = (self.free_at[rows] <= self.now[rows, None, None]).sum(axis=2)
+        production = _IS_PRODUCTION[self.producer_type[rows]]
+        self.idle_production_seconds[rows] += tick * (free * production).sum(axis=1)
+        self._mine(rows, tick)
+        self.now[rows] += tick
+
+    def _ready_steps(self, rows: np.ndarray) -> np.ndarray:
+        """Per row, the pending steps whose supply and dependencies are met."""
+        return (
+            self.pending[rows]
+            & (self.supply_used[rows, None] >= self.step_supply[rows])
+            & (self.unmet_dependencies[rows] == 0)
+        )
+
+    def _advance_build_order(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Starts every step whose supply trigger is met and whose dependencies
+        have started, lowest index first; True where one was supply blocked.
+        """
+        blocked = np.zeros(rows.size, dtype=bool)
+        active = np.arange(rows.size)
+        while active.size:
+            # A started step may release its dependents within the same tick.
+            variants = rows[active]
+            blocked[active] = False
+            progressed = np.zeros(active.size, dtype=bool)
+            ranked = _ranked_columns(self._ready_steps(variants))
+            for rank in range(ranked.shape[1]):
+                trying = np.flatnonzero(ranked[:, rank] >= 0)
+                v, steps = variants[trying], ranked[trying, rank]
+                items = self.step_item[v, steps]
+                status = np.full(trying.size, _STARTED)
+                # Worker production is already continuous.
+                tried = ~((items == _SCV) & self.auto_workers[v])
+                if tried.any():
+                    status[tried] = self._try_start(v[tried], items[tried])
+                started = status == _STARTED
+                self._start_steps(v[started], steps[started])
+                progressed[trying[started]] = True
+                blocked[active[trying]] |= status == _NO_SUPPLY
+            active = active[progressed]
+        return blocked
+
+    def _start_steps(self, rows: np.ndarray, steps: np.ndarray):
+        self.step_start_times[rows, steps] = self.now[rows]
+        self.pending[rows, steps] = False
+        self.unmet_dependencies[rows] -= self.depends_on[rows, :, steps]
+
+    def _pursue_goals(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Works towards the standing goals. Structures, addons and upgrades
+        that cannot be afforded yet hold their cost against lower priorities.
+        """
+        for priority in range(self.goal_structure.shape[1]):
+            items = self.goal_structure[rows, priority]
+            short = (
+                self.started[rows, items] < self.goal_structure_target[rows, priority]
+            )
+            if short.any():
+                self._try_or_save(rows[short], items[short])
+        upgrades = self.goal_upgrade[rows]
+        missing = (self.started[rows[:, None], upgrades] == 0) & (upgrades != _NOTHING)
+        researching = missing.any(axis=1)
+        if researching.any():
+            first = missing.argmax(axis=1)
+            self._try_or_save(
+                rows[researching], upgrades[researching, first[researching]]
+            )
+
+        blocked = np.zeros(rows.size, dtype=bool)
+        ranked = _ranked_columns(_IS_PRODUCTION[self.producer_type[rows]])
+        for rank in range(ranked.shape[1]):
+            columns = ranked[:, rank]
+            training = np.flatnonzero(columns >= 0)
+            # Each start takes a slot: at most two rounds per producer.
+            while training.size:
+                v, c = rows[training], columns[training]
+                has_slot = self._free_slot(v, c) >= 0
+                training, v, c = training[has_slot], v[has_slot], c[has_slot]
+                units = self._most_needed_unit(v, c)
+                needed = units != _NOTHING
+                training, v, c = training[needed], v[needed], c[needed]
+                if not training.size:
+                    break
+                status = self._try_start(v, units[needed], c)
+                blocked[training] |= status == _NO_SUPPLY
+                training = training[status == _STARTED]
+        return blocked
+
+    def _try_or_save(self, rows: np.ndarray, items: np.ndarray):
+        poor = self._try_start(rows, items) == _NO_RESOURCES
+        self.reserved_minerals[rows[poor]] += _MINERALS[items[poor]]
+        self.reserved_vespene[rows[poor]] += _VESPENE[items[poor]]
+
+    def _most_needed_unit(self, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        units = self.goal_unit[rows]
+        if not units.shape[1]:
+            return np.full(rows.size, _NOTHING)
+        has_techlab = self.has_techlab[rows, columns]
+        fits = (_PRODUCER[units] == self.producer_type[rows, columns][:, None]) & (
+            ~_NEEDS_TECHLAB[units] | has_techlab[:, None]
+        )
+        deficit = self.goal_unit_target[rows] - self.started[rows[:, None], units]
+        deficit = np.where(fits, deficit, 0)
+        best = deficit.argmax(axis=1)
+        chosen = np.arange(rows.size), best
+        return np.where(deficit[chosen] > 0, units[chosen], _NOTHING)
+
+    def _train_workers(self, rows: np.ndarray) -> np.ndarray:
+        blocked = np.zeros(rows.size, dtype=bool)
+        # Let the townhall go idle for its upgrade.
+        morphing = _IS_MORPH[self.step_item[rows]] & self._ready_steps(rows)
+        training = ~morphing.any(axis=1)
+        ranked = _ranked_columns(_IS_TOWNHALL[self.producer_type[rows]])
+        for rank in range(ranked.shape[1]):
+            trying = np.flatnonzero(training & (ranked[:, rank] >= 0))
+            v, c = rows[trying], ranked[trying, rank]
+            has_slot = self._free_slot(v, c) >= 0
+            trying, v, c = trying[has_slot], v[has_slot], c[has_slot]
+            capped = self.started[v, _SCV] >= self.max_workers[v]
+            training[trying[capped]] = False
+            trying, v, c = trying[~capped], v[~capped], c[~capped]
+            if trying.size:
+                status = self._try_start(v, np.full(v.size, _SCV), c)
+                blocked[trying] |= status == _NO_SUPPLY
+        return blocked
+
+    def _build_supply(self, rows: np.ndarray):
+        """Mirrors the SupplyManager: depots for the forecast production demand."""
+        rows = rows[self.supply_cap[rows] < 200]
+        types = self.producer_type[rows]
+        demand = (self.slot_count[rows] * _SUPPLY_PER_SLOT[types]).sum(axis=1)
+        pending = self.started[rows, _SUPPLYDEPOT] - self.completed[rows, _SUPPLYDEPOT]
+        projected_cap = self.supply_cap[rows] + pending * SUPPLY_DEPOT_SUPPLY
+        shortfall = self.supply_used[rows] + demand + SUPPLY_BUFFER_BASE - projected_cap
+        depots = -(-np.maximum(0, shortfall) // SUPPLY_DEPOT_SUPPLY)
+        for depot in range(int(depots.max(initial=0))):
+            building = np.flatnonzero(depots > depot)
+            items = np.full(building.size, _SUPPLYDEPOT)
+            status = self._try_start(rows[building], items)
+            depots[building[status != _STARTED]] = 0
+
+    # --- Starting and Completing Items ---
+
+    def _try_start(
+        self,
+        rows: np.ndarray,
+        items: np.ndarray,
+        producers: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Starts `items[i]` in variant `rows[i]` where tech, a producer,
+        resources and supply allow; the StartStatus of each, as an index.
+        Rows must be distinct.
+        """
+        required = _REQUIRED[items]
+        unavailable = required & self.completed_requirements[rows] != required
+        unavailable |= _IS_UPGRADE[items] & (self.started[rows, items] > 0)
+        by_scv = _BY_SCV[items]
+        unavailable |= by_scv & (self.mineral_workers[rows] == 0)
+
+        columns = np.full(rows.size, _NO_PRODUCER, dtype=np.intp)
+        slots = np.full(rows.size, -1, dtype=np.intp)
+        needs_producer = np.flatnonzero(~by_scv & ~unavailable)
+        if needs_producer.size:
+            v = rows[needs_producer]
+            if producers is None:
+                columns[needs_producer] = self._find_producer(v, items[needs_producer])
+            else:
+                columns[needs_producer] = producers[needs_producer]
+            slots[needs_producer] = self._free_slot(v, columns[needs_producer])
+        unavailable |= ~by_scv & (slots < 0)
+
+        poor = (
+            self.minerals[rows] - self.reserved_minerals[rows] < _MINERALS[items]
+        ) | (self.vespene[rows] - self.reserved_vespene[rows] < _VESPENE[items])
+        supply = _SUPPLY[items]
+        capped = (supply > 0) & (
+            self.supply_used[rows] + supply > self.supply_cap[rows]
+        )
+        status = np.where(
+            unavailable,
+            _UNAVAILABLE,
+            np.where(poor, _NO_RESOURCES, np.where(capped, _NO_SUPPLY, _STARTED)),
+        )
+
+        go = status == _STARTED
+        if go.any():
+            self._start(rows[go], items[go], columns[go], slots[go])
+        return status
+
+    def _start(
+        self,
+        rows: np.ndarray,
+        items: np.ndarray,
+        columns: np.ndarray,
+        slots: np.ndarray,
+    ):
+        self.minerals[rows] -= _MINERALS[items]
+        self.vespene[rows] -= _VESPENE[items]
+        self.supply_used[rows] += _SUPPLY[items]
+        self.started[rows, items] += 1
+        finish = self.now[rows] + _SECONDS[items]
+
+        by_scv = _BY_SCV[items]
+        self.mineral_workers[rows[by_scv]] -= 1
+        finish[by_scv] += BUILDER_TRAVEL_SECONDS
+        whole = ~by_scv & (_IS_ADDON[items] | _IS_MORPH[items])
+        v, c = rows[whole], columns[whole]
+        self.free_at[v, c, 0] = finish[whole]
+        self.free_at[v, c, 1] = np.where(
+            self.slot_count[v, c] == 2, finish[whole], np.inf
+        )
+        one = ~by_scv & ~whole
+        self.free_at[rows[one], columns[one], slots[one]] = finish[one]
+
+        self.sequence[rows] += 1
+        self._push_events(rows, finish, items, np.where(by_scv, _NO_PRODUCER, columns))
+
+    def _push_events(
+        self,
+        rows: np.ndarray,
+        finish: np.ndarray,
+        items: np.ndarray,
+        producers: np.ndarray,
+    ):
+        free = np.isinf(self.event_finish[rows])
+        while not free.any(axis=1).all():
+            self.event_finish = _grow(self.event_finish, np.inf)
+            self.event_sequence = _grow(self.event_sequence, 0)
+            self.event_item = _grow(self.event_item, _NOTHING)
+            self.event_producer = _grow(self.event_producer, _NO_PRODUCER)
+            free = np.isinf(self.event_finish[rows])
+        entries = free.argmax(axis=1)
+        self.event_finish[rows, entries] = finish
+        self.event_sequence[rows, entries] = self.sequence[rows]
+        self.event_item[rows, entries] = items
+        self.event_producer[rows, entries] = producers
+
+    def _find_producer(self, rows: np.ndarray, items: np.ndarray) -> np.ndarray:
+        # Few producers are of the right type: look only at those.
+        width = self.producer_type.shape[1]
+        match = self.producer_type[rows] == _PRODUCER[items][:, None]
+        row, column = np.nonzero(match)
+        v, items = rows[row], items[row]
+        free_at, now = self.free_at[v, column], self.now[v]
+        first_free, second_free = free_at[:, 0] <= now, free_at[:, 1] <= now
+        idle = first_free & (second_free | (self.slot_count[v, column] == 1))
+        has_techlab = self.has_techlab[v, column]
+
+        addon, morph = _IS_ADDON[items], _IS_MORPH[items]
+        trains = ~addon & ~morph
+        fits = np.where(
+            addon,
+            idle & (self.addon[v, column] == _NOTHING),
+            np.where(
+                morph,
+                idle,
+                (first_free | second_free) & (~_NEEDS_TECHLAB[items] | has_techlab),
+            ),
+        )
+        # Keep tech labs free for the units that need them.
+        preference = column + width * (trains & has_techlab)
+        best = np.full(rows.size, 2 * width)
+        np.minimum.at(best, row[fits], preference[fits])
+        return np.where(best < 2 * width, best % width, _NO_PRODUCER)
+
+    def _free_slot(self, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        """The first free slot of each producer, -1 if busy or missing."""
+        free_at = self.free_at[rows, columns]
+        now = self.now[rows]
+        slots = np.where(free_at[:, 0] <= now, 0, np.where(free_at[:, 1] <= now, 1, -1))
+        return np.where(columns >= 0, slots, -1)
+
+    def _complete_finished(self, rows: np.ndarray):
+        due = self.event_finish[rows] <= self.now[rows, None]
+        if not due.any():
+            return
+        row, entry = np.nonzero(due)
+        v = rows[row]
+        items, producers = self.event_item[v, entry], self.event_producer[v, entry]
+        finish, sequence = self.event_finish[v, entry], self.event_sequence[v, entry]
+        self.event_finish[v, entry] = np.inf
+        now = self.now[v]
+
+        np.add.at(self.completed, (v, items), 1)
+        np.bitwise_or.at(self.completed_requirements, v, _REQUIREMENT_BIT[items])
+        self._completions.append(np.stack([v, items, now]))
+        # Builders return to mining, trained SCVs join them.
+        returning = _BY_SCV[items].astype(np.int64) + (items == _SCV)
+        np.add.at(self.mineral_workers, v, returning)
+        depots, townhalls = items == _SUPPLYDEPOT, items == _COMMANDCENTER
+        np.add.at(self.bases, v, townhalls)
+        np.add.at(self.refineries, v, items == _REFINERY)
+        supply = np.zeros(len(self.scenarios), np.int64)
+        np.add.at(
+            supply, v, depots * SUPPLY_DEPOT_SUPPLY + townhalls * COMMAND_CENTER_SUPPLY
+        )
+        self.supply_cap[rows] = np.minimum(200, self.supply_cap[rows] + supply[rows])
+
+        addons = _IS_ADDON[items]
+        reactors = addons & _IS_REACTOR[items]
+        techlabs = addons & ~reactors
+        self.addon[v[addons], producers[addons]] = items[addons]
+        self.free_at[v[reactors], producers[reactors]] = now[reactors, None]
+        self.slot_count[v[reactors], producers[reactors]] = 2
+        self.has_techlab[v[techlabs], producers[techlabs]] = True
+        morphs = _IS_MORPH[items]
+        self.producer_type[v[morphs], producers[morphs]] = items[morphs]
+        self.energy[v[morphs], producers[morphs]] = 50.0
+
+        new = townhalls | techlabs
+        new |= ~addons & (_IS_PRODUCTION[items] | _IS_RESEARCH[items])
+        if new.any():
+            # Appended in the order the events complete.
+            order = np.lexsort((sequence[new], finish[new], v[new]))
+            self._add_producers(v[new][order], items[new][order], now[new][order])
+
+    def _add_producers(self, rows: np.ndarray, types: np.ndarray, now: np.ndarray):
+        """Appends producers; `rows` is sorted, one entry per new producer."""
+        group_start = np.flatnonzero(np.concatenate(([True], rows[1:] != rows[:-1])))
+        group_size = np.diff(np.append(group_start, rows.size))
+        rank = np.arange(rows.size) - np.repeat(group_start, group_size)
+        columns = self.producer_count[rows] + rank
+        while columns.max() >= self.producer_type.shape[1]:
+            self.producer_type = _grow(self.producer_type, _NOTHING)
+            self.free_at = np.concatenate(
+                [self.free_at, np.full_like(self.free_at, np.inf)], axis=1
+            )
+            self.slot_count = _grow(self.slot_count, 0)
+            self.addon = _grow(self.addon, _NOTHING)
+            self.has_techlab = _grow(self.has_techlab, False)
+            self.energy = _grow(self.energy, 0.0)
+        self.producer_type[rows, columns] = types
+        self.free_at[rows, columns, 0] = now
+        self.slot_count[rows, columns] = 1
+        np.add.at(self.producer_count, rows, 1)
+
+    # --- Economy ---
+
+    def _balance_gas(self, rows: np.ndarray):
+        """Fills every refinery with three workers, as the SCVManager does."""
+        wanted = self.refineries[rows] * WORKERS_PER_GEYSER - self.gas_workers[rows]
+        moved = np.where(
+            wanted > 0, np.minimum(wanted, self.mineral_workers[rows]), wanted
+        )
+        self.gas_workers[rows] += moved
+        self.mineral_workers[rows] -= moved
+
+    def _mine(self, rows: np.ndarray, tick: np.ndarray):
+        bases = self.bases[rows]
+        optimal = bases * PATCHES_PER_BASE * 2
+        third = bases * PATCHES_PER_BASE
+        workers = self.mineral_workers[rows]
+        rate = (
+            np.minimum(workers, optimal) * MINERALS_PER_WORKER_SECOND
+            + np.minimum(np.maximum(0, workers - optimal), third)
+            * MINERALS_PER_THIRD_WORKER_SECOND
+        )
+        # Only variants with an Orbital Command ever have MULEs.
+        with_mules = self.use_mules[rows] & (self.completed[rows, _ORBITALCOMMAND] > 0)
+        if with_mules.any():
+            rate[with_mules] += self._call_mules(rows[with_mules], tick[with_mules])
+        minerals = rate * tick
+        vespene = np.minimum(
+            self.gas_workers[rows], self.refineries[rows] * WORKERS_PER_GEYSER
+        ) * (VESPENE_PER_WORKER_SECOND * tick)
+        self.minerals[rows] += minerals
+        self.vespene[rows] += vespene
+        self.minerals_mined[rows] += minerals
+        self.vespene_mined[rows] += vespene
+
+    def _call_mules(self, rows: np.ndarray, tick: np.ndarray) -> np.ndarray:
+        """Charges the orbitals and calls down MULEs; the MULE mining rate."""
+        orbitals = self.producer_type[rows] == _ORBITALCOMMAND
+        energy = self.energy[rows]
+        energy = np.where(
+            orbitals, energy + (ORBITAL_ENERGY_PER_SECOND * tick)[:, None], energy
+        )
+        calls = orbitals & (energy >= 50)
+        self.energy[rows] = np.where(calls, energy - 50, energy)
+
+        now = self.now[rows]
+        new = calls.sum(axis=1)
+        expired = self.mules[rows] <= now[:, None]
+        while (expired.sum(axis=1) < new).any():
+            self.mules = _grow(self.mules, -np.inf)
+            expired = self.mules[rows] <= now[:, None]
+        # The first `new` expired entries of each row take the new MULEs.
+        taken = expired & (np.cumsum(expired, axis=1) <= new[:, None])
+        expiry = np.where(
+            taken, (now + MULE_LIFETIME_SECONDS)[:, None], self.mules[rows]
+        )
+        self.mules[rows] = expiry
+        return (expiry > now[:, None]).sum(axis=1) * MULE_MINERALS_PER_SECOND
+
+    # --- Reports ---
+
+    def _reports(self) -> List[SimulationReport]:
+        completions = self._completion_lists()
+        reports = []
+        for v, scenario in enumerate(self.scenarios):
+            steps = len(scenario.build_order)
+            times = self.step_start_times[v, :steps].tolist()
+            reports.append(
+                SimulationReport(
+                    duration=scenario.duration,
+                    supply_blocked_seconds=float(self.supply_blocked_seconds[v]),
+                    idle_production_seconds=float(self.idle_production_seconds[v]),
+                    step_start_times=[None if t != t else t for t in times],
+                    completions=completions[v],
+                    minerals_mined=float(self.minerals_mined[v]),
+                    vespene_mined=float(self.vespene_mined[v]),
+                    supply_used=int(self.supply_used[v]),
+                )
+            )
+        return reports
+
+    def _completion_lists(self) -> List[dict]:
+        """Per variant, the completion times of each item, in order."""
+        completions: List[dict] = [{} for _ in self.scenarios]
+        if not self._completions:
+            return completions
+        variants, items, times = np.concatenate(self._completions, axis=1)
+        order = np.lexsort((items, variants), axis=0)
+        variants, items = variants[order].astype(np.intp), items[order].astype(np.intp)
+        times = times[order]
+        starts = np.flatnonzero(
+            np.concatenate(
+                ([True], (variants[1:] != variants[:-1]) | (items[1:] != items[:-1]))
+            )
+        )
+        for group in np.split(np.arange(variants.size), starts[1:]):
+            first = group[0]
+            completions[variants[first]][_ITEMS[items[first]]] = times[group].tolist()
+        return completions
+
+
+def simulate_batch(scenarios: Sequence[Scenario]) -> List[SimulationReport]:
+    """Runs every scenario to completion, side by side; reports in order."""
+    return BatchEconomySimulator(scenarios).run()
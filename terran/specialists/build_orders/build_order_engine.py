@@ -0,0 +1,298 @@
+# terran/specialists/build_orders/build_order_engine.py
+from __future__ import annotations
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.ids.upgrade_id import UpgradeId
+
+from core.interfaces.manager_abc import Manager
+from core.types import CommandFunctor
+from core.resource_ledger import BudgetCategory
+from core.utilities.constants import EVENT_PRIORITY_HIGH, GAME_LOOPS_PER_SECOND
+from core.utilities.events import (
+    Event,
+    EventType,
+    BuildRequestPayload,
+    BuildRequestFailedPayload,
+)
+from .build_order_plan import PLAN_HORIZON_SECONDS, CompiledBuildOrder
+from .tech_data import ADDON_TYPES, MORPH_TYPES, REQUIREMENTS, TECH_SPECS, BuildItem
+
+if TYPE_CHECKING:
+    from sc2.bot_ai import BotAI
+    from core.global_cache import GlobalCache
+    from core.event_bus import EventBus
+    from core.frame_plan import FramePlan
+
+# --- Tunable Build Order Constants ---
+# A step this far behind its simulated start is considered stuck, and the
+# build order is abandoned in favour of the CapabilityDirector's goals.
+STEP_STALL_SECONDS = 90
+# A morph command that has not shown up as pending after this long is retried.
+MORPH_CONFIRM_SECONDS = 3
+# Structures are also counted in their morphed forms. Lowered and flying
+# forms are already folded in by the census.
+COUNTED_AS: Dict[UnitTypeId, set] = {
+    UnitTypeId.COMMANDCENTER: {
+        UnitTypeId.COMMANDCENTER,
+        UnitTypeId.ORBITALCOMMAND,
+        UnitTypeId.PLANETARYFORTRESS,
+    },
+}
+
+
+class StepStatus(Enum):
+    PENDING = auto()
+    DISPATCHED = auto()  # Handed to a manager; not yet seen in the game.
+    STARTED = auto()
+    DONE = auto()
+
+
+class BuildOrderEngine(Manager):
+    """
+    The Conductor. Executes a compiled build order as a dependency graph.
+
+    Every step whose supply trigger, predecessors and tech are met is handed
+    to the manager that owns it in the same frame: structures go to the
+    ConstructionManager as build requests, units, addons and upgrades to the
+    production managers through the FramePlan, SCVs to the SCVManager, and
+    townhall morphs are ordered directly. A step only counts as started once
+    the game shows it (placed, queued or researching), never merely because
+    it was asked for.
+
+    The engine stands in for the CapabilityDirector's goals until every
+    step has started, or until a step falls too far behind its simulated
+    schedule, and then hands production back.
+    """
+
+    def __init__(self, bot: "BotAI", build_order: CompiledBuildOrder):
+        super().__init__(bot)
+        self.build_order = build_order
+        steps = build_order.steps
+        self.status: List[StepStatus] = [StepStatus.PENDING] * len(steps)
+        self.abandoned: bool = False
+        # Game loop each dispatched step was handed over.
+        self._dispatched_at: Dict[int, int] = {}
+        # (started, done) counts of each item when the build order began.
+        self._baseline: Optional[Dict[BuildItem, Tuple[int, int]]] = None
+        # Per-frame memo of (started, done) counts.
+        self._counts: Dict[BuildItem, Tuple[int, int]] = {}
+        bus = getattr(bot, "event_bus", None)
+        if bus:
+            bus.subscribe(
+                EventType.INFRA_BUILD_REQUEST_FAILED, self.handle_build_request_failed
+            )
+
+    @property
+    def is_complete(self) -> bool:
+        """True once every step has started or the build order was abandoned."""
+        return self.abandoned or all(
+            status in (StepStatus.STARTED, StepStatus.DONE) for status in self.status
+        )
+
+    async def handle_build_request_failed(self, event: Event):
+        """
+        Event handler that re-opens the structure step whose request the
+        ConstructionManager dropped. Failures of other managers' requests for
+        the same structure are ignored.
+        """
+        payload: BuildRequestFailedPayload = event.payload
+        for index in range(len(self.build_order.steps)):
+            if (
+                payload.requester == self._requester(index)
+                and self.status[index] is StepStatus.DISPATCHED
+            ):
+                self.status[index] = StepStatus.PENDING
+                self._dispatched_at.pop(index, None)
+                return
+
+    def _requester(self, index: int) -> str:
+        """The requester name the engine's build requests for a step carry."""
+        return f"build_order:{self.build_order.name}:{index}"
+
+    async def execute(
+        self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
+    ) -> List[CommandFunctor]:
+        """
+        Confirms the steps the game shows as started or done, then dispatches
+        every step that has become ready. Sets the FramePlan's production goals.
+        """
+        self._counts = {}
+        if self._baseline is None:
+            self._baseline = {
+                step.item: self._count(cache, step.item)
+                for step in self.build_order.steps
+            }
+
+        plan.unit_composition_goal = {}
+        plan.tech_goals = set()
+        plan.upgrade_goal = []
+        plan.addon_goal = {}
+
+        self._confirm_steps(cache)
+        if self._is_stalled(cache):
+            self.abandoned = True
+        if self.is_complete:
+            cache.logger.info(
+                f"Build order '{self.build_order.name}' finished; handing off to the "
+                f"CapabilityDirector."
+            )
+            return []
+
+        actions: List[CommandFunctor] = []
+        for index in self._ready_steps(cache):
+            actions.extend(self._dispatch(index, cache, plan, bus))
+        return actions
+
+    # --- Step State ---
+
+    def _confirm_steps(self, cache: "GlobalCache"):
+        """Advances steps from what the game shows, never from what was asked."""
+        timeout = MORPH_CONFIRM_SECONDS * GAME_LOOPS_PER_SECOND
+        for index, step in enumerate(self.build_order.steps):
+            status = self.status[index]
+            if status is StepStatus.DONE:
+                continue
+            started, done = self._progress(cache, step.item)
+            if done >= step.count:
+                self.status[index] = StepStatus.DONE
+            elif started >= step.count:
+                self.status[index] = StepStatus.STARTED
+            elif (
+                status is StepStatus.DISPATCHED
+                and step.item in MORPH_TYPES
+                and cache.game_loop - self._dispatched_at[index] > timeout
+            ):
+                # The morph order did not take; try again.
+                self.status[index] = StepStatus.PENDING
+            if self.status[index] is not StepStatus.DISPATCHED:
+                self._dispatched_at.pop(index, None)
+
+    def _ready_steps(self, cache: "GlobalCache") -> List[int]:
+        ready = []
+        status = self.status
+        for index, step in enumerate(self.build_order.steps):
+            if (
+                status[index] is not StepStatus.PENDING
+                or cache.supply_used < step.supply
+            ):
+                continue
+            if any(
+                status[d] not in (StepStatus.STARTED, StepStatus.DONE)
+                for d in step.after
+            ):
+                continue
+            if any(status[d] is not StepStatus.DONE for d in step.requires):
+                continue
+            # Tech the build order does not build itself must exist already.
+            if any(self._count(cache, r)[1] == 0 for r in REQUIREMENTS[step.item]):
+                continue
+            ready.append(index)
+        return ready
+
+    def _is_stalled(self, cache: "GlobalCache") -> bool:
+        now = cache.game_loop / GAME_LOOPS_PER_SECOND
+        for index, status in enumerate(self.status):
+            if status in (StepStatus.STARTED, StepStatus.DONE):
+                continue
+            earliest = self.build_order.earliest_start[index]
+            deadline = PLAN_HORIZON_SECONDS if earliest is None else earliest
+            if now > deadline + STEP_STALL_SECONDS:
+                cache.logger.warning(
+                    f"Build order step {self.build_order.steps[index].name} is "
+                    f"{now - deadline:.0f}s behind schedule; abandoning the build order."
+                )
+                return True
+        return False
+
+    # --- Dispatching ---
+
+    def _dispatch(
+        self, index: int, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
+    ) -> List[CommandFunctor]:
+        """Hands a ready step to the manager that produces its item."""
+        step = self.build_order.steps[index]
+        item = step.item
+        target = self._baseline[item][0] + step.count
+
+        if isinstance(item, UpgradeId):
+            plan.upgrade_goal.append(item)
+        elif item == UnitTypeId.SCV:
+            # The SCVManager trains workers continuously.
+            pass
+        elif item in MORPH_TYPES:
+            return self._morph(index, cache, plan)
+        elif item in ADDON_TYPES:
+            plan.addon_goal[item] = max(plan.addon_goal.get(item, 0), target)
+        elif TECH_SPECS[item].producer == UnitTypeId.SCV:
+            cache.logger.info(f"Build order: requesting {step.name}.")
+            payload = BuildRequestPayload(
+                item_id=item,
+                position=None,
+                priority=EVENT_PRIORITY_HIGH,
+                unique=False,
+                requester=self._requester(index),
+            )
+            bus.publish(Event(EventType.INFRA_BUILD_REQUEST, payload))
+            self.status[index] = StepStatus.DISPATCHED
+            self._dispatched_at[index] = cache.game_loop
+        else:
+            goals = plan.unit_composition_goal
+            goals[item] = max(goals.get(item, 0), target)
+        return []
+
+    def _morph(
+        self, index: int, cache: "GlobalCache", plan: "FramePlan"
+    ) -> List[CommandFunctor]:
+        """
+        Orders a townhall morph. A townhall still training an SCV gets the
+        morph queued behind it, which also stops further SCVs there.
+        """
+        step = self.build_order.steps[index]
+        townhalls = cache.friendly_structures.of_type(
+            TECH_SPECS[step.item].producer
+        ).ready.filter(lambda th: len(th.orders) < 2)
+        if not townhalls or not plan.resource_ledger.reserve(
+            BudgetCategory.CAPABILITIES, step.item
+        ):
+            return []
+        townhall = min(townhalls, key=lambda th: len(th.orders))
+        cache.logger.info(f"Build order: morphing {townhall.tag} into {step.name}.")
+        self.status[index] = StepStatus.DISPATCHED
+        self._dispatched_at[index] = cache.game_loop
+        return [lambda th=townhall, i=step.item: th.build(i, queue=True)]
+
+    # --- Counting ---
+
+    def _progress(self, cache: "GlobalCache", item: BuildItem) -> Tuple[int, int]:
+        """(started, done) of an item since the build order began."""
+        started, done = self._count(cache, item)
+        base_started, base_done = self._baseline[item]
+        return started - base_started, done - base_done
+
+    def _count(self, cache: "GlobalCache", item: BuildItem) -> Tuple[int, int]:
+        """
+        How many of an item have started and finished, as the game shows it.
+        Started includes paid train orders, morphs and structures under
+        construction, but not builders still walking to their site.
+        """
+        if item in self._counts:
+            return self._counts[item]
+        counts = cache.unit_counts
+        if isinstance(item, UpgradeId):
+            done = int(item in cache.friendly_upgrades)
+            started = int(counts.upgrade_started(item))
+        elif item in MORPH_TYPES:
+            # A morph is paid, and so started, as soon as it is queued.
+            done = counts.ready(item)
+            started = counts.total(item)
+        elif TECH_SPECS[item].producer == UnitTypeId.SCV or item in ADDON_TYPES:
+            types = COUNTED_AS.get(item, item)
+            done = counts.ready(types)
+            started = counts.amount(types)
+        else:
+            done = counts.ready(item)
+            started = counts.total(item)
+        self._counts[item] = (started, done)
+        return started, done
@@ -0,0 +1,156 @@
+# terran/specialists/build_orders/build_order_plan.py
+"""
+Declarative build orders: loading them from data files and compiling them
+into a dependency graph of steps with precomputed timings.
+"""
+
+from __future__ import annotations
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.ids.upgrade_id import UpgradeId
+
+from .economy_simulator import Scenario, simulate
+from .tech_data import REQUIREMENTS, TECH_SPECS, BuildItem
+
+# --- Tunable Plan Constants ---
+# Build order data files live here; they are looked up by file stem.
+BUILD_ORDER_DIRECTORY = Path(__file__).parent / "data"
+# How far ahead the compiler simulates to find each step's earliest start.
+PLAN_HORIZON_SECONDS = 600.0
+
+
+@dataclass(frozen=True)
+class BuildStep:
+    """One node of a compiled build order."""
+
+    name: str  # e.g., "BARRACKS#2", the second Barracks of the order
+    item: BuildItem
+    supply: int  # The step is not started below this supply.
+    # The `count`-th step of its item; the step is met once that many exist
+    # on top of what we had when the build order began.
+    count: int
+    # Steps that must have started first, explicit or implied by order.
+    after: Tuple[int, ...] = ()
+    # Steps that must have finished first: tech and producers.
+    requires: Tuple[int, ...] = ()
+
+    @property
+    def dependencies(self) -> Tuple[int, ...]:
+        return self.after + self.requires
+
+
+@dataclass(frozen=True)
+class CompiledBuildOrder:
+    """A build order ready to execute, with a simulated schedule."""
+
+    name: str
+    steps: Tuple[BuildStep, ...]
+    # The simulated game second each step starts, None if not in the horizon.
+    earliest_start: Tuple[Optional[float], ...]
+
+    def scenario(self, duration: float = PLAN_HORIZON_SECONDS) -> Scenario:
+        """The economy simulator scenario that replays this build order."""
+        return Scenario(
+            build_order=[(step.supply, step.item) for step in self.steps],
+            step_dependencies=[step.dependencies for step in self.steps],
+            duration=duration,
+        )
+
+
+# Compiled plans keyed by data file and its modification time.
+_COMPILED_PLANS: Dict[Tuple[Path, int], CompiledBuildOrder] = {}
+
+
+def load_build_order(name_or_path: Union[str, Path]) -> CompiledBuildOrder:
+    """
+    Loads and compiles a build order data file, e.g. "two_rax_reaper".
+    Compiled plans are cached until the file changes on disk.
+    """
+    path = Path(name_or_path)
+    if path.suffix != ".json":
+        path = BUILD_ORDER_DIRECTORY / f"{name_or_path}.json"
+    path = path.resolve()
+    key = (path, path.stat().st_mtime_ns)
+    compiled = _COMPILED_PLANS.get(key)
+    if compiled is None:
+        with open(path, encoding="utf-8") as file:
+            compiled = compile_build_order(json.load(file))
+        _COMPILED_PLANS[key] = compiled
+    return compiled
+
+
+def compile_build_order(data: dict) -> CompiledBuildOrder:
+    """
+    Turns the data of a build order into a dependency graph.
+
+    Each step of `data["steps"]` names an `item` and its `supply` trigger,
+    and may list the names of earlier steps it comes `after`. Repeats of an
+    item come after each other, and an item requires the first earlier step
+    that provides its tech or producer. Steps without a dependency between
+    them may run concurrently.
+
+    :raises ValueError: For unknown items, or dependencies that are not
+        earlier steps.
+    """
+    steps: List[BuildStep] = []
+    names: Dict[str, int] = {}
+    last_of_item: Dict[BuildItem, int] = {}
+
+    for index, raw in enumerate(data["steps"]):
+        item = _parse_item(raw["item"])
+        count = sum(1 for step in steps if step.item == item) + 1
+        name = f"{item.name}#{count}"
+
+        after = []
+        for dependency in raw.get("after", []):
+            if dependency not in names:
+                raise ValueError(
+                    f"Step {name} comes after {dependency}, which is not an earlier step."
+                )
+            after.append(names[dependency])
+        if item in last_of_item:
+            after.append(last_of_item[item])
+
+        spec = TECH_SPECS[item]
+        providers = REQUIREMENTS[item]
+        if spec.producer != UnitTypeId.SCV:
+            providers += (spec.producer,)
+        requires = [
+            first
+            for first in (
+                next((i for i, s in enumerate(steps) if s.item == p), None)
+                for p in providers
+            )
+            if first is not None
+        ]
+
+        steps.append(
+            BuildStep(
+                name=name,
+                item=item,
+                supply=int(raw.get("supply", 0)),
+                count=count,
+                after=tuple(sorted(set(after))),
+                requires=tuple(sorted(set(requires))),
+            )
+        )
+        names[name] = index
+        last_of_item[item] = index
+
+    compiled = CompiledBuildOrder(data.get("name", ""), tuple(steps), ())
+    report = simulate(compiled.scenario())
+    return CompiledBuildOrder(
+        compiled.name, compiled.steps, tuple(report.step_start_times)
+    )
+
+
+def _parse_item(name: str) -> BuildItem:
+    for enum in (UnitTypeId, UpgradeId):
+        item = enum.__members__.get(name)
+        if item is not None and item in TECH_SPECS:
+            return item
+    raise ValueError(f"Unknown build item: {name}")
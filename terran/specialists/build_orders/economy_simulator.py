@@ -0,0 +1,573 @@
+# terran/specialists/build_orders/economy_simulator.py
+"""
+A fast, discrete-time model of a Terran economy for evaluating build orders
+and production goals offline, without running StarCraft II.
+"""
+
+from __future__ import annotations
+import heapq
+import math
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.ids.upgrade_id import UpgradeId
+
+from core.utilities.constants import MAX_WORKER_COUNT, SUPPLY_BUFFER_BASE
+from core.utilities.unit_types import (
+    COMMAND_CENTER_SUPPLY,
+    SUPPLY_DEPOT_SUPPLY,
+    TERRAN_UNIT_PRODUCTION,
+)
+from terran.infrastructure.structures.supply_forecaster import (
+    DEFAULT_PRODUCTION,
+    DEPOT_LEAD_SECONDS,
+)
+from .tech_data import (
+    ADDON_TYPES,
+    MORPH_TYPES,
+    REACTOR_TYPES,
+    REQUIREMENTS,
+    TECH_SPECS,
+    TECHLAB_TYPES,
+    BuildItem,
+    TechSpec,
+)
+
+# --- Tunable Economy Constants ---
+# Minerals per second mined by each of the first two workers on a patch,
+# and by a third worker. Eight patches per base.
+MINERALS_PER_WORKER_SECOND = 0.95
+MINERALS_PER_THIRD_WORKER_SECOND = 0.4
+PATCHES_PER_BASE = 8
+# Vespene per second mined by each of the (up to three) workers on a geyser.
+VESPENE_PER_WORKER_SECOND = 0.9
+WORKERS_PER_GEYSER = 3
+# A MULE mines 225 minerals over its 64 second lifetime.
+MULE_MINERALS_PER_SECOND = 225 / 64
+MULE_LIFETIME_SECONDS = 64
+ORBITAL_ENERGY_PER_SECOND = 0.7875
+# The time an SCV spends walking to a building site and back.
+BUILDER_TRAVEL_SECONDS = 4
+# The simulation advances in steps of this many game seconds, by default.
+# One-second ticks simulate a 10-minute game in about 30 ms on one core, or
+# about 2 ms per game when a BatchEconomySimulator plays a thousand at once;
+# four-second ticks are several times as fast again, for wide parameter
+# searches, at the cost of up to a tick of delay per item.
+TICK_SECONDS = 1.0
+
+PRODUCTION_TYPES = {UnitTypeId.BARRACKS, UnitTypeId.FACTORY, UnitTypeId.STARPORT}
+TOWNHALL_TYPES = {
+    UnitTypeId.COMMANDCENTER,
+    UnitTypeId.ORBITALCOMMAND,
+    UnitTypeId.PLANETARYFORTRESS,
+}
+RESEARCH_TYPES = TECHLAB_TYPES | {UnitTypeId.ENGINEERINGBAY, UnitTypeId.ARMORY}
+
+_LEAD_SUPPLY_PER_SLOT = {
+    structure: (1 + int(DEPOT_LEAD_SECONDS // TERRAN_UNIT_PRODUCTION[unit][1]))
+    * TERRAN_UNIT_PRODUCTION[unit][0]
+    for structure, unit in DEFAULT_PRODUCTION.items()
+}
+
+
+class StartStatus(Enum):
+    STARTED = auto()
+    UNAVAILABLE = auto()  # Missing tech or no free producer.
+    NO_RESOURCES = auto()
+    NO_SUPPLY = auto()
+
+
+@dataclass
+class Goals:
+    """Standing production goals, as the CapabilityDirector sets them."""
+
+    units: Dict[UnitTypeId, int] = field(default_factory=dict)
+    # Structures and addons, in priority order.
+    structures: Dict[UnitTypeId, int] = field(default_factory=dict)
+    upgrades: List[UpgradeId] = field(default_factory=list)
+
+
+@dataclass
+class Scenario:
+    """One variant to simulate."""
+
+    build_order: Sequence[Tuple[int, BuildItem]] = ()
+    # The steps each build order step waits on to have started. None replays
+    # the build order strictly in sequence.
+    step_dependencies: Optional[Sequence[Sequence[int]]] = None
+    goals: Optional[Goals] = None
+    duration: float = 360.0
+    max_workers: int = MAX_WORKER_COUNT
+    # Keep every idle townhall training SCVs, as the SCVManager does.
+    auto_workers: bool = True
+    # Build depots from the supply forecast, as the SupplyManager does.
+    auto_supply: bool = True
+    use_mules: bool = True
+    # Coarser ticks trade timing precision for speed.
+    tick_seconds: float = TICK_SECONDS
+
+
+@dataclass
+class SimulationReport:
+    """Timings and totals of one simulated game."""
+
+    duration: float
+    supply_blocked_seconds: float
+    # Summed over every Barracks, Factory and Starport production slot.
+    idle_production_seconds: float
+    # The time each build order step was started, None if it never was.
+    step_start_times: List[Optional[float]]
+    completions: Dict[BuildItem, List[float]]
+    minerals_mined: float
+    vespene_mined: float
+    supply_used: int
+
+    def time_to(self, item: BuildItem, count: int = 1) -> Optional[float]:
+        """The time the `count`-th `item` finished, or None if it never did."""
+        times = self.completions.get(item, [])
+        return times[count - 1] if len(times) >= count else None
+
+
+@dataclass
+class _Producer:
+    type_id: UnitTypeId
+    # The time each production slot frees up; two slots with a reactor.
+    slots: List[float]
+    addon: Optional[UnitTypeId] = None
+    energy: float = 0.0
+    # Set-membership tests resolved once; enum hashing dominates the hot loop.
+    is_production: bool = field(init=False)
+    is_townhall: bool = field(init=False)
+    has_techlab: bool = False
+    # Supply each slot takes within the depot lead time, for the forecast.
+    supply_per_slot: int = field(init=False)
+
+    def __post_init__(self):
+        self.set_type(self.type_id)
+
+    def set_type(self, type_id: UnitTypeId):
+        self.type_id = type_id
+        self.is_production = type_id in PRODUCTION_TYPES
+        self.is_townhall = type_id in TOWNHALL_TYPES
+        self.supply_per_slot = _LEAD_SUPPLY_PER_SLOT.get(type_id, 0)
+
+    def free_slot(self, now: float) -> Optional[int]:
+        for i, busy_until in enumerate(self.slots):
+            if busy_until <= now:
+                return i
+        return None
+
+    def is_idle(self, now: float) -> bool:
+        return all(busy_until <= now for busy_until in self.slots)
+
+
+class EconomySimulator:
+    """
+    The Wargame Table. Replays a build order, then the standing goals, against
+    a model of mining income, build times, production slots and supply.
+
+    The model is deliberately coarse: workers mine at fixed per-worker rates
+    with diminishing returns past two per patch, builders leave the mineral
+    line for the build time plus a fixed walk, and every item is started as
+    soon as its tech, producer, resources and supply allow. Games are played
+    tick by tick in pure Python, some tens of games per second per core; for
+    searches, evaluate() plays chunks of variants in a BatchEconomySimulator,
+    which runs this same model with one NumPy axis per variant, and
+    Scenario.tick_seconds coarsens the ticks.
+    """
+
+    def __init__(self, scenario: Scenario):
+        self.scenario = scenario
+        self.now = 0.0
+        self.minerals, self.vespene = 50.0, 0.0
+        self.minerals_mined, self.vespene_mined = 0.0, 0.0
+        self.supply_used, self.supply_cap = 12, COMMAND_CENTER_SUPPLY
+        self.mineral_workers, self.gas_workers = 12, 0
+        self.bases, self.refineries = 1, 0
+        self.mules: List[float] = []  # Expiry time of each active MULE.
+        self.started: Counter = Counter(
+            {UnitTypeId.COMMANDCENTER: 1, UnitTypeId.SCV: 12}
+        )
+        self.completed: Counter = Counter(self.started)
+        self.producers: List[_Producer] = [_Producer(UnitTypeId.COMMANDCENTER, [0.0])]
+        self.completions: Dict[BuildItem, List[float]] = {}
+        self._events: List[Tuple[float, int, BuildItem, Optional[_Producer]]] = []
+        self._sequence = 0
+        steps = len(scenario.build_order)
+        self.step_dependencies = scenario.step_dependencies or [
+            (i - 1,) if i else () for i in range(steps)
+        ]
+        self.pending_steps: List[int] = list(range(steps))
+        self.step_start_times: List[Optional[float]] = [None] * len(
+            scenario.build_order
+        )
+        self.supply_blocked_seconds = 0.0
+        self.idle_production_seconds = 0.0
+        # Resources held this tick for goals that are being saved for.
+        self._reserved = [0.0, 0.0]
+        # Goals resolved to their specs once, units grouped by producer.
+        goals = scenario.goals or Goals()
+        self._goal_structures = [
+            (item, TECH_SPECS[item], target)
+            for item, target in goals.structures.items()
+        ]
+        self._goal_units: Dict[UnitTypeId, List[Tuple[UnitTypeId, TechSpec, int]]] = {}
+        for unit, target in goals.units.items():
+            spec = TECH_SPECS[unit]
+            self._goal_units.setdefault(spec.producer, []).append((unit, spec, target))
+
+    # --- Main Loop ---
+
+    def run(self) -> SimulationReport:
+        tick = self.scenario.tick_seconds
+        while self.now < self.scenario.duration:
+            self._complete_finished()
+            self._balance_gas()
+            self._reserved = [0.0, 0.0]
+
+            blocked = False
+            # Infrastructure first, as the General orders its Directors.
+            if self.scenario.auto_workers:
+                blocked |= self._train_workers()
+            if self.scenario.auto_supply:
+                self._build_supply()
+            if self.pending_steps:
+                blocked |= self._advance_build_order()
+            elif self.scenario.goals:
+                blocked |= self._pursue_goals(self.scenario.goals)
+
+            if blocked:
+                self.supply_blocked_seconds += tick
+            now = self.now
+            self.idle_production_seconds += tick * sum(
+                sum(1 for t in p.slots if t <= now)
+                for p in self.producers
+                if p.is_production
+            )
+            self._mine(tick)
+            self.now += tick
+
+        return SimulationReport(
+            duration=self.scenario.duration,
+            supply_blocked_seconds=self.supply_blocked_seconds,
+            idle_production_seconds=self.idle_production_seconds,
+            step_start_times=self.step_start_times,
+            completions=self.completions,
+            minerals_mined=self.minerals_mined,
+            vespene_mined=self.vespene_mined,
+            supply_used=self.supply_used,
+        )
+
+    def _advance_build_order(self) -> bool:
+        """
+        Starts every step whose supply trigger is met and whose dependencies
+        have started, lowest index first; True if one was supply blocked.
+        """
+        blocked, progressed = False, True
+        while progressed:
+            # A started step may release its dependents within the same tick.
+            blocked, progressed = False, False
+            for index in self._ready_steps():
+                item = self.scenario.build_order[index][1]
+                if item == UnitTypeId.SCV and self.scenario.auto_workers:
+                    # Worker production is already continuous.
+                    status = StartStatus.STARTED
+                else:
+                    status = self.try_start(item)
+                if status is StartStatus.STARTED:
+                    self.step_start_times[index] = self.now
+                    self.pending_steps.remove(index)
+                    progressed = True
+                else:
+                    blocked |= status is StartStatus.NO_SUPPLY
+        return blocked
+
+    def _ready_steps(self) -> List[int]:
+        times = self.step_start_times
+        return [
+            index
+            for index in self.pending_steps
+            if self.supply_used >= self.scenario.build_order[index][0]
+            and all(times[d] is not None for d in self.step_dependencies[index])
+        ]
+
+    def _pursue_goals(self, goals: Goals) -> bool:
+        """
+        Works towards the standing goals. Structures, addons and upgrades
+        that cannot be afforded yet hold their cost against lower priorities,
+        so a Command Center is saved for instead of starved by units.
+        """
+        for item, spec, target in self._goal_structures:
+            if self.started[item] < target:
+                self._try_or_save(item, spec)
+        for upgrade in goals.upgrades:
+            if self.started[upgrade] == 0:
+                self._try_or_save(upgrade, TECH_SPECS[upgrade])
+                break
+
+        blocked = False
+        for producer in self.producers:
+            if not producer.is_production:
+                continue
+            while producer.free_slot(self.now) is not None:
+                unit = self._most_needed_unit(producer)
+                if unit is None:
+                    break
+                status = self.try_start(unit, producer)
+                if status is not StartStatus.STARTED:
+                    blocked |= status is StartStatus.NO_SUPPLY
+                    break
+        return blocked
+
+    def _try_or_save(self, item: BuildItem, spec: TechSpec):
+        if self.try_start(item) is StartStatus.NO_RESOURCES:
+            self._reserved[0] += spec.minerals
+            self._reserved[1] += spec.vespene
+
+    def _most_needed_unit(self, producer: _Producer) -> Optional[UnitTypeId]:
+        best, best_deficit = None, 0
+        for unit, spec, target in self._goal_units.get(producer.type_id, ()):
+            if spec.needs_techlab and not producer.has_techlab:
+                continue
+            deficit = target - self.started[unit]
+            if deficit > best_deficit:
+                best, best_deficit = unit, deficit
+        return best
+
+    def _train_workers(self) -> bool:
+        steps = self.scenario.build_order
+        if any(steps[index][1] in MORPH_TYPES for index in self._ready_steps()):
+            # Let the townhall go idle for its upgrade.
+            return False
+        blocked = False
+        for producer in self.producers:
+            if not producer.is_townhall or producer.free_slot(self.now) is None:
+                continue
+            if self.started[UnitTypeId.SCV] >= self.scenario.max_workers:
+                break
+            status = self.try_start(UnitTypeId.SCV, producer)
+            blocked |= status is StartStatus.NO_SUPPLY
+        return blocked
+
+    def _build_supply(self):
+        """Mirrors the SupplyManager: depots for the forecast production demand."""
+        if self.supply_cap >= 200:
+            return
+        demand = sum(len(p.slots) * p.supply_per_slot for p in self.producers)
+        pending = (
+            self.started[UnitTypeId.SUPPLYDEPOT]
+            - self.completed[UnitTypeId.SUPPLYDEPOT]
+        )
+        projected_cap = self.supply_cap + pending * SUPPLY_DEPOT_SUPPLY
+        shortfall = self.supply_used + demand + SUPPLY_BUFFER_BASE - projected_cap
+        for _ in range(math.ceil(max(0, shortfall) / SUPPLY_DEPOT_SUPPLY)):
+            if self.try_start(UnitTypeId.SUPPLYDEPOT) is not StartStatus.STARTED:
+                break
+
+    # --- Starting and Completing Items ---
+
+    def try_start(
+        self, item: BuildItem, producer: Optional[_Producer] = None
+    ) -> StartStatus:
+        """Starts `item` now if tech, a producer, resources and supply allow."""
+        spec = TECH_SPECS[item]
+        completed = self.completed
+        for requirement in REQUIREMENTS[item]:
+            if not completed[requirement]:
+                return StartStatus.UNAVAILABLE
+        if isinstance(item, UpgradeId) and self.started[item] > 0:
+            return StartStatus.UNAVAILABLE
+
+        slot = None
+        if spec.producer == UnitTypeId.SCV:
+            if self.mineral_workers == 0:
+                return StartStatus.UNAVAILABLE
+        else:
+            producer = producer or self._find_producer(item)
+            if producer is None:
+                return StartStatus.UNAVAILABLE
+            slot = producer.free_slot(self.now)
+            if slot is None:
+                return StartStatus.UNAVAILABLE
+
+        if (
+            self.minerals - self._reserved[0] < spec.minerals
+            or self.vespene - self._reserved[1] < spec.vespene
+        ):
+            return StartStatus.NO_RESOURCES
+        if spec.supply and self.supply_used + spec.supply > self.supply_cap:
+            return StartStatus.NO_SUPPLY
+
+        self.minerals -= spec.minerals
+        self.vespene -= spec.vespene
+        self.supply_used += spec.supply
+        self.started[item] += 1
+        finish = self.now + spec.seconds
+        if spec.producer == UnitTypeId.SCV:
+            self.mineral_workers -= 1
+            finish += BUILDER_TRAVEL_SECONDS
+        elif item in ADDON_TYPES or item in MORPH_TYPES:
+            producer.slots = [finish] * len(producer.slots)
+        else:
+            producer.slots[slot] = finish
+        self._sequence += 1
+        heapq.heappush(self._events, (finish, self._sequence, item, producer))
+        return StartStatus.STARTED
+
+    def _find_producer(self, item: BuildItem) -> Optional[_Producer]:
+        spec = TECH_SPECS[item]
+        candidates = [p for p in self.producers if p.type_id == spec.producer]
+        if item in ADDON_TYPES:
+            candidates = [
+                p for p in candidates if p.addon is None and p.is_idle(self.now)
+            ]
+        elif item in MORPH_TYPES:
+            candidates = [p for p in candidates if p.is_idle(self.now)]
+        else:
+            if spec.needs_techlab:
+                candidates = [p for p in candidates if p.has_techlab]
+            candidates = [p for p in candidates if p.free_slot(self.now) is not None]
+            # Keep tech labs free for the units that need them.
+            candidates.sort(key=lambda p: p.has_techlab)
+        return candidates[0] if candidates else None
+
+    def _complete_finished(self):
+        while self._events and self._events[0][0] <= self.now:
+            _, _, item, producer = heapq.heappop(self._events)
+            self._complete(item, producer)
+
+    def _complete(self, item: BuildItem, producer: Optional[_Producer]):
+        spec = TECH_SPECS[item]
+        self.completed[item] += 1
+        self.completions.setdefault(item, []).append(self.now)
+        if spec.producer == UnitTypeId.SCV:
+            # The builder returns to mining.
+            self.mineral_workers += 1
+
+        if item == UnitTypeId.SCV:
+            self.mineral_workers += 1
+        elif item == UnitTypeId.SUPPLYDEPOT:
+            self.supply_cap = min(200, self.supply_cap + SUPPLY_DEPOT_SUPPLY)
+        elif item == UnitTypeId.COMMANDCENTER:
+            self.bases += 1
+            self.supply_cap = min(200, self.supply_cap + COMMAND_CENTER_SUPPLY)
+            self.producers.append(_Producer(item, [self.now]))
+        elif item == UnitTypeId.REFINERY:
+            self.refineries += 1
+        elif item in ADDON_TYPES:
+            # Before the research types: a tech lab is one, but it also
+            # belongs to the structure it was built on.
+            producer.addon = item
+            if item in REACTOR_TYPES:
+                producer.slots = [self.now, self.now]
+            else:
+                producer.has_techlab = True
+                self.producers.append(_Producer(item, [self.now]))
+        elif item in PRODUCTION_TYPES or item in RESEARCH_TYPES:
+            self.producers.append(_Producer(item, [self.now]))
+        elif item in MORPH_TYPES:
+            producer.set_type(item)
+            producer.energy = 50.0
+
+    # --- Economy ---
+
+    def _balance_gas(self):
+        """Fills every refinery with three workers, as the SCVManager does."""
+        wanted = self.refineries * WORKERS_PER_GEYSER - self.gas_workers
+        moved = min(wanted, self.mineral_workers) if wanted > 0 else wanted
+        self.gas_workers += moved
+        self.mineral_workers -= moved
+
+    def _mine(self, tick: float):
+        optimal = self.bases * PATCHES_PER_BASE * 2
+        third = self.bases * PATCHES_PER_BASE
+        workers = self.mineral_workers
+        rate = (
+            min(workers, optimal) * MINERALS_PER_WORKER_SECOND
+            + min(max(0, workers - optimal), third) * MINERALS_PER_THIRD_WORKER_SECOND
+        )
+        if self.scenario.use_mules:
+            for producer in self.producers:
+                if producer.type_id != UnitTypeId.ORBITALCOMMAND:
+                    continue
+                producer.energy += ORBITAL_ENERGY_PER_SECOND * tick
+                if producer.energy >= 50:
+                    producer.energy -= 50
+                    self.mules.append(self.now + MULE_LIFETIME_SECONDS)
+            self.mules = [expiry for expiry in self.mules if expiry > self.now]
+            rate += len(self.mules) * MULE_MINERALS_PER_SECOND
+        minerals = rate * tick
+        vespene = min(self.gas_workers, self.refineries * WORKERS_PER_GEYSER) * (
+            VESPENE_PER_WORKER_SECOND * tick
+        )
+        self.minerals += minerals
+        self.vespene += vespene
+        self.minerals_mined += minerals
+        self.vespene_mined += vespene
+
+
+# --- Entry Points ---
+
+
+def simulate(scenario: Scenario) -> SimulationReport:
+    """Runs one scenario to completion."""
+    return EconomySimulator(scenario).run()
+
+
+def evaluate(
+    scenarios: Iterable[Scenario],
+    processes: Optional[int] = None,
+    chunksize: int = 1024,
+) -> List[SimulationReport]:
+    """
+    Simulates many variants, e.g., for a parameter search: each process plays
+    `chunksize` of them at once in a BatchEconomySimulator. Reports are
+    returned in the order of `scenarios`.
+    """
+    from .batch_simulator import simulate_batch
+
+    scenarios = list(scenarios)
+    chunks = [
+        scenarios[start : start + chunksize]
+        for start in range(0, len(scenarios), chunksize)
+    ]
+    if len(chunks) <= 1:
+        return simulate_batch(scenarios)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return [
+            report for chunk in pool.map(simulate_batch, chunks) for report in chunk
+        ]
+
+
+def director_goals(
+    num_bases: int,
+    unit_ratios: Optional[Dict[UnitTypeId, float]] = None,
+    upgrade_path: Optional[List[UpgradeId]] = None,
+) -> Goals:
+    """
+    The CapabilityDirector's goals at a base count, with optional overrides
+    for the hand-tuned ratios and upgrade path being evaluated.
+    """
+    from terran.capabilities import capability_director as director
+
+    ratios = director.TARGET_UNIT_RATIOS if unit_ratios is None else unit_ratios
+    army_supply = director.TARGET_ARMY_SUPPLY_CAP.get(num_bases, 180)
+    units = {
+        unit: int(army_supply * ratio / TERRAN_UNIT_PRODUCTION[unit][0])
+        for unit, ratio in ratios.items()
+    }
+    tech = director.TECH_TREE_TARGETS.get(num_bases, director.TECH_TREE_TARGETS[3])
+    addons = director.ADDON_TARGETS.get(num_bases, director.ADDON_TARGETS[3])
+    # Expansions and gas first, as the InfrastructureDirector runs first.
+    structures = {
+        UnitTypeId.COMMANDCENTER: num_bases,
+        UnitTypeId.REFINERY: 2 * num_bases,
+        **tech,
+        **addons,
+    }
+    path = director.UPGRADE_PRIORITY_PATH if upgrade_path is None else upgrade_path
+    return Goals(units=units, structures=structures, upgrades=list(path))
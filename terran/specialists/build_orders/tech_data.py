@@ -0,0 +1,160 @@
+# terran/specialists/build_orders/tech_data.py
+"""
+Static Terran tech data: what every structure, addon, unit and upgrade
+costs, how long it takes, what produces it and what it requires.
+
+The values mirror the game data for the current ladder patch. They are kept
+here, rather than read from `bot.game_data`, so they are available offline
+(e.g., to the economy simulator) without a running game.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, Tuple, Union
+
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.ids.upgrade_id import UpgradeId
+
+from core.utilities.unit_types import TERRAN_UNIT_PRODUCTION
+
+# A build item can be a UnitTypeId for training/building, or an UpgradeId for research.
+BuildItem = Union[UnitTypeId, UpgradeId]
+
+
+@dataclass(frozen=True)
+class TechSpec:
+    """How one build item is produced."""
+
+    minerals: int
+    vespene: int
+    seconds: float
+    # The SCV for structures; otherwise the structure that trains, morphs
+    # into or researches the item.
+    producer: UnitTypeId
+    requires: Tuple[UnitTypeId, ...] = ()
+    supply: int = 0
+    needs_techlab: bool = False
+
+
+ADDON_TYPES = {
+    UnitTypeId.BARRACKSTECHLAB,
+    UnitTypeId.BARRACKSREACTOR,
+    UnitTypeId.FACTORYTECHLAB,
+    UnitTypeId.FACTORYREACTOR,
+    UnitTypeId.STARPORTTECHLAB,
+    UnitTypeId.STARPORTREACTOR,
+}
+TECHLAB_TYPES = {
+    UnitTypeId.BARRACKSTECHLAB,
+    UnitTypeId.FACTORYTECHLAB,
+    UnitTypeId.STARPORTTECHLAB,
+}
+REACTOR_TYPES = ADDON_TYPES - TECHLAB_TYPES
+# Townhall upgrades that occupy the Command Center while morphing.
+MORPH_TYPES = {UnitTypeId.ORBITALCOMMAND, UnitTypeId.PLANETARYFORTRESS}
+
+_SCV = UnitTypeId.SCV
+_CC = UnitTypeId.COMMANDCENTER
+_RAX = UnitTypeId.BARRACKS
+_FACTORY = UnitTypeId.FACTORY
+_STARPORT = UnitTypeId.STARPORT
+
+# (minerals, vespene, build seconds, producer, requirements)
+_STRUCTURES = {
+    UnitTypeId.COMMANDCENTER: (400, 0, 71, _SCV, ()),
+    UnitTypeId.SUPPLYDEPOT: (100, 0, 21, _SCV, ()),
+    UnitTypeId.REFINERY: (75, 0, 21, _SCV, ()),
+    UnitTypeId.BARRACKS: (150, 0, 46, _SCV, (UnitTypeId.SUPPLYDEPOT,)),
+    UnitTypeId.ENGINEERINGBAY: (125, 0, 25, _SCV, ()),
+    UnitTypeId.BUNKER: (100, 0, 29, _SCV, (_RAX,)),
+    UnitTypeId.MISSILETURRET: (100, 0, 18, _SCV, (UnitTypeId.ENGINEERINGBAY,)),
+    UnitTypeId.SENSORTOWER: (125, 100, 18, _SCV, (UnitTypeId.ENGINEERINGBAY,)),
+    UnitTypeId.GHOSTACADEMY: (150, 50, 29, _SCV, (_RAX,)),
+    UnitTypeId.FACTORY: (150, 100, 43, _SCV, (_RAX,)),
+    UnitTypeId.ARMORY: (150, 100, 46, _SCV, (_FACTORY,)),
+    UnitTypeId.STARPORT: (150, 100, 36, _SCV, (_FACTORY,)),
+    UnitTypeId.FUSIONCORE: (150, 150, 46, _SCV, (_STARPORT,)),
+    UnitTypeId.ORBITALCOMMAND: (150, 0, 25, _CC, (_RAX,)),
+    UnitTypeId.PLANETARYFORTRESS: (150, 150, 36, _CC, (UnitTypeId.ENGINEERINGBAY,)),
+    UnitTypeId.BARRACKSTECHLAB: (50, 25, 18, _RAX, ()),
+    UnitTypeId.BARRACKSREACTOR: (50, 50, 36, _RAX, ()),
+    UnitTypeId.FACTORYTECHLAB: (50, 25, 18, _FACTORY, ()),
+    UnitTypeId.FACTORYREACTOR: (50, 50, 36, _FACTORY, ()),
+    UnitTypeId.STARPORTTECHLAB: (50, 25, 18, _STARPORT, ()),
+    UnitTypeId.STARPORTREACTOR: (50, 50, 36, _STARPORT, ()),
+}
+
+# (minerals, vespene, producer, requirements, needs a tech lab)
+_UNITS = {
+    UnitTypeId.SCV: (50, 0, _CC, (), False),
+    UnitTypeId.MARINE: (50, 0, _RAX, (), False),
+    UnitTypeId.REAPER: (50, 50, _RAX, (), False),
+    UnitTypeId.MARAUDER: (100, 25, _RAX, (), True),
+    UnitTypeId.GHOST: (150, 125, _RAX, (UnitTypeId.GHOSTACADEMY,), True),
+    UnitTypeId.HELLION: (100, 0, _FACTORY, (), False),
+    UnitTypeId.HELLIONTANK: (100, 0, _FACTORY, (UnitTypeId.ARMORY,), False),
+    UnitTypeId.WIDOWMINE: (75, 25, _FACTORY, (), False),
+    UnitTypeId.CYCLONE: (150, 100, _FACTORY, (), True),
+    UnitTypeId.SIEGETANK: (150, 125, _FACTORY, (), True),
+    UnitTypeId.THOR: (300, 200, _FACTORY, (UnitTypeId.ARMORY,), True),
+    UnitTypeId.VIKINGFIGHTER: (150, 75, _STARPORT, (), False),
+    UnitTypeId.MEDIVAC: (100, 100, _STARPORT, (), False),
+    UnitTypeId.LIBERATOR: (150, 150, _STARPORT, (), False),
+    UnitTypeId.RAVEN: (100, 200, _STARPORT, (), True),
+    UnitTypeId.BANSHEE: (150, 100, _STARPORT, (), True),
+    UnitTypeId.BATTLECRUISER: (400, 300, _STARPORT, (UnitTypeId.FUSIONCORE,), True),
+}
+
+_EBAY = UnitTypeId.ENGINEERINGBAY
+_ARMORY = UnitTypeId.ARMORY
+# (minerals, vespene, research seconds, researched from, requirements)
+_UPGRADES = {
+    UpgradeId.STIMPACK: (100, 100, 100, UnitTypeId.BARRACKSTECHLAB, ()),
+    UpgradeId.SHIELDWALL: (100, 100, 79, UnitTypeId.BARRACKSTECHLAB, ()),
+    UpgradeId.PUNISHERGRENADES: (50, 50, 43, UnitTypeId.BARRACKSTECHLAB, ()),
+    UpgradeId.TERRANINFANTRYWEAPONSLEVEL1: (100, 100, 114, _EBAY, ()),
+    UpgradeId.TERRANINFANTRYWEAPONSLEVEL2: (175, 175, 136, _EBAY, (_ARMORY,)),
+    UpgradeId.TERRANINFANTRYWEAPONSLEVEL3: (250, 250, 157, _EBAY, (_ARMORY,)),
+    UpgradeId.TERRANINFANTRYARMORSLEVEL1: (100, 100, 114, _EBAY, ()),
+    UpgradeId.TERRANINFANTRYARMORSLEVEL2: (175, 175, 136, _EBAY, (_ARMORY,)),
+    UpgradeId.TERRANINFANTRYARMORSLEVEL3: (250, 250, 157, _EBAY, (_ARMORY,)),
+    UpgradeId.TERRANVEHICLEWEAPONSLEVEL1: (100, 100, 114, _ARMORY, ()),
+    UpgradeId.TERRANVEHICLEWEAPONSLEVEL2: (175, 175, 136, _ARMORY, ()),
+    UpgradeId.TERRANVEHICLEWEAPONSLEVEL3: (250, 250, 157, _ARMORY, ()),
+    UpgradeId.TERRANSHIPWEAPONSLEVEL1: (100, 100, 114, _ARMORY, ()),
+    UpgradeId.TERRANVEHICLEANDSHIPARMORSLEVEL1: (100, 100, 114, _ARMORY, ()),
+}
+# Each upgrade level requires the previous one.
+_UPGRADE_CHAINS = [
+    ("TERRANINFANTRYWEAPONSLEVEL", 3),
+    ("TERRANINFANTRYARMORSLEVEL", 3),
+    ("TERRANVEHICLEWEAPONSLEVEL", 3),
+]
+UPGRADE_PREREQUISITES: Dict[UpgradeId, UpgradeId] = {
+    UpgradeId[f"{name}{level}"]: UpgradeId[f"{name}{level - 1}"]
+    for name, top in _UPGRADE_CHAINS
+    for level in range(2, top + 1)
+}
+
+
+def _build_specs() -> Dict[BuildItem, TechSpec]:
+    specs: Dict[BuildItem, TechSpec] = {}
+    for item, (minerals, vespene, seconds, producer, requires) in _STRUCTURES.items():
+        specs[item] = TechSpec(minerals, vespene, seconds, producer, requires)
+    for item, (minerals, vespene, producer, requires, techlab) in _UNITS.items():
+        supply, seconds = TERRAN_UNIT_PRODUCTION[item]
+        specs[item] = TechSpec(
+            minerals, vespene, seconds, producer, requires, supply, techlab
+        )
+    for item, (minerals, vespene, seconds, producer, requires) in _UPGRADES.items():
+        specs[item] = TechSpec(minerals, vespene, seconds, producer, requires)
+    return specs
+
+
+TECH_SPECS: Dict[BuildItem, TechSpec] = _build_specs()
+# Everything that must be complete before an item starts, upgrade levels included.
+REQUIREMENTS: Dict[BuildItem, Tuple[BuildItem, ...]] = {
+    item: spec.requires
+    + ((UPGRADE_PREREQUISITES[item],) if item in UPGRADE_PREREQUISITES else ())
+    for item, spec in TECH_SPECS.items()
+}
@@ -9,6 +9,7 @@ from sc2.unit import Unit
 from core.interfaces.controller_abc import ControllerABC
 from core.types import CommandFunctor
 from core.utilities.unit_types import WORKER_TYPES
+from terran.specialists.micro.target_selector import TargetingProfile, select_targets
 
 if TYPE_CHECKING:
     from sc2.units import Units
@@ -32,6 +33,16 @@ HARASS_TARGET_PRIORITIES: Set[UnitTypeId] = WORKER_TYPES | {
     UnitTypeId.SPAWNINGPOOL,
     UnitTypeId.PYLON,  # Specifically ones powering production
 }
+# Banshees hunt anywhere in sight, and only priority targets or ground units
+# that cannot shoot back.
+HARASS_TARGETING = TargetingProfile(
+    priorities=[HARASS_TARGET_PRIORITIES],
+    preferred=lambda u: not u.can_attack_air,
+    preferred_only=True,
+    focus_fire_if=lambda u: u.type_id in HARASS_TARGET_PRIORITIES,
+    targets_air=False,
+    in_range_only=False,
+)
 
 
 class BansheeController(ControllerABC):
@@ -54,13 +65,14 @@ class BansheeController(ControllerABC):
         if not banshees:
             return [], set()
 
-        nearby_enemies = cache.enemy_units.closer_than(
-            HARASS_ENGAGEMENT_RANGE, banshees.center
-        )
+        nearby_enemies = context.enemies_near(HARASS_ENGAGEMENT_RANGE, context.center)
 
-        for banshee in banshees:
+        targets = select_targets(
+            banshees, nearby_enemies, HARASS_TARGETING, context.focus_fire_target
+        )
+        for banshee, best_target in zip(banshees, targets):
             action = self._handle_single_banshee(
-                banshee, nearby_enemies, strategic_target, cache, plan
+                banshee, best_target, nearby_enemies, strategic_target, cache, plan
             )
             if action:
                 actions.append(action)
@@ -70,6 +82,7 @@ class BansheeController(ControllerABC):
     def _handle_single_banshee(
         self,
         banshee: Unit,
+        best_target: Unit | None,
         nearby_enemies: "Units",
         strategic_target: "Point2",
         cache: "GlobalCache",
@@ -90,9 +103,7 @@ class BansheeController(ControllerABC):
         if cloak_action:
             return cloak_action
 
-        # 3. Target Selection and Engagement
-        best_target = self._find_best_target(banshee, nearby_enemies)
-
+        # 3. Engagement
         if best_target:
             # If a priority target is found, attack it.
             return lambda b=banshee, t=best_target: b.attack(t)
@@ -129,34 +140,3 @@ class BansheeController(ControllerABC):
             return lambda b=banshee: b(AbilityId.BEHAVIOR_CLOAKOFF_BANSHEE)
 
         return None
-
-    def _find_best_target(
-        self, banshee: Unit, nearby_enemies: "Units", context: "MicroContext"
-    ) -> Unit | None:
-        """Finds the highest-priority harassment target in range."""
-        attackable_enemies = nearby_enemies.filter(
-            lambda u: u.can_be_attacked and not u.is_flying
-        )
-        if not attackable_enemies:
-            return None
-
-        # 1. Obey focus fire if it's a priority harassment target
-        focus_target = context.focus_fire_target
-        if (
-            focus_target
-            and focus_target in attackable_enemies
-            and focus_target.type_id in HARASS_TARGET_PRIORITIES
-        ):
-            return focus_target
-
-        # 2. Fallback: Prioritize key harassment targets.
-        priority_targets = attackable_enemies.of_type(HARASS_TARGET_PRIORITIES)
-        if priority_targets.exists:
-            return priority_targets.closest_to(banshee)
-
-        # 3. Fallback: Attack any non-threatening ground unit.
-        non_threatening = attackable_enemies.filter(lambda u: u.can_attack_air is False)
-        if non_threatening.exists:
-            return non_threatening.closest_to(banshee)
-
-        return None
@@ -8,6 +8,7 @@ from sc2.unit import Unit
 
 from core.interfaces.controller_abc import ControllerABC
 from core.types import CommandFunctor
+from terran.specialists.micro.target_selector import TargetingProfile, select_targets
 
 if TYPE_CHECKING:
     from sc2.units import Units
@@ -34,6 +35,10 @@ YAMATO_TARGET_PRIORITIES: List[UnitTypeId] = [
     UnitTypeId.SIEGETANKSIEGED,
     UnitTypeId.LURKERMPBURROWED,
 ]
+# Regular attacks prefer expensive units and units that can shoot back.
+STANDARD_TARGETING = TargetingProfile(
+    preferred=lambda u: u.can_attack_air, preferred_value=100
+)
 
 
 class BattlecruiserController(ControllerABC):
@@ -56,13 +61,19 @@ class BattlecruiserController(ControllerABC):
         if not battlecruisers:
             return [], set()
 
-        nearby_enemies = cache.enemy_units.closer_than(
-            ENGAGEMENT_RANGE, battlecruisers.center
-        )
+        nearby_enemies = context.enemies_near(ENGAGEMENT_RANGE, context.center)
 
-        for bc in battlecruisers:
+        targets = select_targets(
+            battlecruisers,
+            nearby_enemies,
+            STANDARD_TARGETING,
+            context.focus_fire_target,
+            game_data=cache.bot.game_data,
+            assigned=context.assigned_targets,
+        )
+        for bc, best_target in zip(battlecruisers, targets):
             action = self._handle_single_bc(
-                bc, nearby_enemies, strategic_target, cache, plan
+                bc, best_target, nearby_enemies, strategic_target, cache, plan
             )
             if action:
                 actions.append(action)
@@ -72,6 +83,7 @@ class BattlecruiserController(ControllerABC):
     def _handle_single_bc(
         self,
         bc: Unit,
+        best_target: Unit | None,
         nearby_enemies: "Units",
         strategic_target: "Point2",
         cache: "GlobalCache",
@@ -100,7 +112,6 @@ class BattlecruiserController(ControllerABC):
                 return lambda b=bc, t=yamato_target: b(AbilityId.YAMATO_YAMATOGUN, t)
 
         # 3. Target Selection: Standard attack on the best available target.
-        best_target = self._find_standard_attack_target(bc, nearby_enemies)
         if best_target:
             return lambda b=bc, t=best_target: b.attack(t)
 
@@ -125,28 +136,3 @@ class BattlecruiserController(ControllerABC):
                 return potential_targets.closest_to(bc)
 
         return None
-
-    def _find_standard_attack_target(
-        self, bc: Unit, nearby_enemies: "Units", context: "MicroContext"
-    ) -> Unit | None:
-        """Finds the best target for regular attacks."""
-        attackable_enemies = nearby_enemies.in_attack_range_of(bc).filter(
-            lambda u: u.can_be_attacked
-        )
-        if not attackable_enemies:
-            return None
-
-        # 1. Obey focus fire command
-        focus_target = context.focus_fire_target
-        if focus_target and focus_target in attackable_enemies:
-            return focus_target
-
-        # 2. Fallback: Prioritize expensive units or units that can shoot back.
-        high_value_targets = attackable_enemies.filter(
-            lambda u: u.cost > 100 or u.can_attack_air
-        )
-        if high_value_targets.exists:
-            return high_value_targets.closest_to(bc)
-
-        # 3. Default: shoot the closest thing.
-        return attackable_enemies.closest_to(bc)
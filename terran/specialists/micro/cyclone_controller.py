@@ -8,6 +8,7 @@ from sc2.unit import Unit
 
 from core.interfaces.controller_abc import ControllerABC
 from core.types import CommandFunctor
+from terran.specialists.micro.target_selector import TargetingProfile, select_targets
 
 if TYPE_CHECKING:
     from sc2.units import Units
@@ -42,6 +43,8 @@ LOCK_ON_TARGET_PRIORITIES: List[UnitTypeId] = [
     UnitTypeId.CORRUPTOR,
     UnitTypeId.VOIDRAY,
 ]
+# Standard auto-attacks prefer armored targets.
+CYCLONE_TARGETING = TargetingProfile(preferred=lambda u: u.is_armored)
 
 
 class CycloneController(ControllerABC):
@@ -57,19 +60,25 @@ class CycloneController(ControllerABC):
         # --- Unpack Context ---
         cyclones = context.units_to_control
         strategic_target = context.target
-        cache = context.cache
 
         actions: List[CommandFunctor] = []
         if not cyclones:
             return [], set()
 
-        nearby_enemies = cache.enemy_units.closer_than(
-            LOCK_ON_ACQUISITION_RANGE + 5, cyclones.center
+        nearby_enemies = context.enemies_near(
+            LOCK_ON_ACQUISITION_RANGE + 5, context.center
         )
 
-        for cyclone in cyclones:
+        targets = select_targets(
+            cyclones,
+            nearby_enemies,
+            CYCLONE_TARGETING,
+            context.focus_fire_target,
+            assigned=context.assigned_targets,
+        )
+        for cyclone, best_target in zip(cyclones, targets):
             action = self._handle_single_cyclone(
-                cyclone, nearby_enemies, strategic_target, cache
+                cyclone, best_target, nearby_enemies, strategic_target
             )
             if action:
                 actions.append(action)
@@ -79,9 +88,9 @@ class CycloneController(ControllerABC):
     def _handle_single_cyclone(
         self,
         cyclone: Unit,
+        best_target: Unit | None,
         nearby_enemies: "Units",
         strategic_target: "Point2",
-        context: "MicroContext",  # Add context here
     ) -> CommandFunctor | None:
         """The core decision tree for an individual Cyclone."""
 
@@ -95,33 +104,9 @@ class CycloneController(ControllerABC):
                 # ...
                 return lambda c=cyclone, t=lock_on_target: c(AbilityId.LOCKON_LOCKON, t)
 
-        # 3. Standard Engagement: Use the new unified targeting logic
-        best_target = self._find_best_standard_target(cyclone, nearby_enemies, context)
+        # 3. Standard Engagement: Attack the target picked for this Cyclone.
         if best_target:
             return lambda c=cyclone, t=best_target: c.attack(t)
 
         # (Positioning logic remains the same)
         # ...
-
-    def _find_best_standard_target(
-        self, cyclone: Unit, nearby_enemies: "Units", context: "MicroContext"
-    ) -> Unit | None:
-        """Finds the best target for the Cyclone's standard auto-attack."""
-        attackable_enemies = nearby_enemies.in_attack_range_of(cyclone).filter(
-            lambda u: u.can_be_attacked
-        )
-        if not attackable_enemies:
-            return None
-
-        # 1. Obey focus fire command
-        focus_target = context.focus_fire_target
-        if focus_target and focus_target in attackable_enemies:
-            return focus_target
-
-        # 2. Fallback: Prioritize armored targets
-        armored_targets = attackable_enemies.filter(lambda u: u.is_armored)
-        if armored_targets.exists:
-            return armored_targets.closest_to(cyclone)
-
-        # 3. Default: Closest enemy
-        return attackable_enemies.closest_to(cyclone)
@@ -67,7 +67,7 @@ class GhostController(ControllerABC):
         if not ghosts:
             return [], set()
 
-        nearby_enemies = cache.enemy_units.closer_than(ENGAGEMENT_RANGE, ghosts.center)
+        nearby_enemies = context.enemies_near(ENGAGEMENT_RANGE, context.center)
 
         for ghost in ghosts:
             action = self._handle_single_ghost(
@@ -9,8 +9,10 @@ from sc2.unit import Unit
 from core.interfaces.controller_abc import ControllerABC
 from core.types import CommandFunctor
 from core.utilities.unit_types import WORKER_TYPES
+from terran.specialists.micro.target_selector import TargetingProfile, select_targets
 
 if TYPE_CHECKING:
+    from sc2.position import Point2
     from sc2.units import Units
     from terran.tactics.micro_context import MicroContext
 
@@ -21,6 +23,14 @@ KITE_DISTANCE = 2.5
 MELEE_THREATS: Set[UnitTypeId] = {UnitTypeId.ZERGLING, UnitTypeId.ZEALOT}
 # Minimum number of melee threats to consider morphing
 HELLBAT_MORPH_THRESHOLD = 4
+# Hellions hunt workers, then other light units, and only join a focus fire
+# on a light target.
+HELLION_TARGETING = TargetingProfile(
+    priorities=[WORKER_TYPES],
+    preferred=lambda u: u.is_light,
+    focus_fire_if=lambda u: u.is_light,
+    targets_air=False,
+)
 
 
 class HellionController(ControllerABC):
@@ -44,11 +54,22 @@ class HellionController(ControllerABC):
 
         hellions = units.of_type(UnitTypeId.HELLION)
         hellbats = units.of_type(UnitTypeId.HELLIONTANK)
-        nearby_enemies = cache.enemy_units.closer_than(ENGAGEMENT_RANGE, units.center)
+        nearby_enemies = context.enemies_near(ENGAGEMENT_RANGE, context.center)
 
-        for hellion in hellions:
+        targets = select_targets(
+            hellions, nearby_enemies, HELLION_TARGETING, context.focus_fire_target
+        )
+        kites = [None] * hellions.amount
+        if nearby_enemies:
+            kites = context.retreat_positions(hellions, KITE_DISTANCE, nearby_enemies)
+        for hellion, best_target, kite_position in zip(hellions, targets, kites):
             action = self._handle_single_hellion(
-                hellion, nearby_enemies, strategic_target, cache
+                hellion,
+                best_target,
+                nearby_enemies,
+                strategic_target,
+                kite_position,
+                cache,
             )
             if action:
                 actions.append(action)
@@ -65,8 +86,10 @@ class HellionController(ControllerABC):
     def _handle_single_hellion(
         self,
         hellion: Unit,
+        best_target: Unit | None,
         nearby_enemies: "Units",
         strategic_target: "Point2",
+        kite_position: "Point2" | None,
         cache: "GlobalCache",
     ) -> CommandFunctor | None:
         """The core decision tree for a Hellion."""
@@ -75,18 +98,12 @@ class HellionController(ControllerABC):
         if self._should_morph_to_hellbat(hellion, nearby_enemies, cache):
             return lambda h=hellion: h(AbilityId.MORPH_HELLBAT)
 
-        # 2. Target Selection and Kiting
-        best_target = self._find_best_target(hellion, nearby_enemies)
-
+        # 2. Kiting around the selected target
         if best_target:
             if hellion.weapon_cooldown == 0:
                 return lambda h=hellion, t=best_target: h.attack(t)
             else:
-                # Kite away from the closest threat while weapon is on cooldown
-                closest_enemy = nearby_enemies.closest_to(hellion)
-                kite_position = hellion.position.towards(
-                    closest_enemy.position, -KITE_DISTANCE
-                )
+                # Kite towards safety while weapon is on cooldown
                 return lambda h=hellion, p=kite_position: h.move(p)
 
         # 3. Positioning: No valid targets, move to the strategic target.
@@ -119,38 +136,6 @@ class HellionController(ControllerABC):
 
         return None
 
-    def _find_best_target(
-        self, hellion: Unit, nearby_enemies: "Units", context: "MicroContext"
-    ) -> Unit | None:
-        """Finds the best harassment target for a Hellion."""
-        attackable_enemies = nearby_enemies.in_attack_range_of(hellion).filter(
-            lambda u: not u.is_flying and u.can_be_attacked
-        )
-        if not attackable_enemies:
-            return None
-
-        # 1. Obey focus fire command IF the target is a light unit.
-        focus_target = context.focus_fire_target
-        if (
-            focus_target
-            and focus_target in attackable_enemies
-            and focus_target.is_light
-        ):
-            return focus_target
-
-        # 2. Fallback to specialist logic: Workers
-        workers = attackable_enemies.of_type(WORKER_TYPES)
-        if workers.exists:
-            return workers.closest_to(hellion)
-
-        # 3. Fallback: Other light units
-        light_units = attackable_enemies.filter(lambda u: u.is_light)
-        if light_units.exists:
-            return light_units.closest_to(hellion)
-
-        # 4. Default: Closest enemy if no light units are available.
-        return attackable_enemies.closest_to(hellion)
-
     def _should_morph_to_hellbat(
         self, hellion: Unit, nearby_enemies: "Units", cache: "GlobalCache"
     ) -> bool:
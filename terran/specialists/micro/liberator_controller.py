@@ -64,9 +64,7 @@ class LiberatorController(ControllerABC):
         if not liberators:
             return [], set()
 
-        nearby_enemies = cache.enemy_units.closer_than(
-            ENGAGEMENT_RANGE, liberators.center
-        )
+        nearby_enemies = context.enemies_near(ENGAGEMENT_RANGE, context.center)
 
         # Separate liberators by their current mode
         sieged_libs = liberators.of_type(UnitTypeId.LIBERATORAG)
@@ -10,6 +10,7 @@ from sc2.unit import Unit
 
 from core.interfaces.controller_abc import ControllerABC
 from core.types import CommandFunctor
+from terran.specialists.micro.target_selector import TargetingProfile, select_targets
 
 if TYPE_CHECKING:
     from sc2.units import Units
@@ -20,6 +21,7 @@ ENGAGEMENT_RANGE = 15
 SURVIVAL_HEALTH_THRESHOLD = 0.4
 STIM_HEALTH_THRESHOLD = 35  # Marauders have more health than marines
 KITE_DISTANCE = 1.0
+RETREAT_DISTANCE = 5
 STIM_OFFENSIVE_TRIGGER_COUNT = 3
 
 # Priority targets for Marauders, focusing on armored units they counter.
@@ -33,6 +35,11 @@ MARAUDER_TARGET_PRIORITIES: List[UnitTypeId] = [
     UnitTypeId.COLOSSUS,
     UnitTypeId.ULTRALISK,
 ]
+MARAUDER_TARGETING = TargetingProfile(
+    priorities=MARAUDER_TARGET_PRIORITIES,
+    preferred=lambda u: u.is_armored,
+    targets_air=False,
+)
 
 
 class MarauderController(ControllerABC):
@@ -54,18 +61,34 @@ class MarauderController(ControllerABC):
         if not marauders:
             return [], set()
 
-        nearby_enemies = cache.enemy_units.closer_than(
-            ENGAGEMENT_RANGE, marauders.center
-        )
+        nearby_enemies = context.enemies_near(ENGAGEMENT_RANGE, context.center)
 
         # 1. Squad-level Stimpack logic
         stim_actions = self._handle_stim(marauders, nearby_enemies, cache)
         actions.extend(stim_actions)
 
         # 2. Individual Marauder Micro
-        for marauder in marauders:
+        targets = select_targets(
+            marauders,
+            nearby_enemies,
+            MARAUDER_TARGETING,
+            context.focus_fire_target,
+            assigned=context.assigned_targets,
+        )
+        retreats = [None] * marauders.amount
+        if nearby_enemies:
+            retreats = context.retreat_positions(
+                marauders, RETREAT_DISTANCE, nearby_enemies
+            )
+        for marauder, best_target, retreat_position in zip(
+            marauders, targets, retreats
+        ):
             action = self._handle_single_marauder(
-                marauder, nearby_enemies, strategic_target
+                marauder,
+                best_target,
+                nearby_enemies,
+                strategic_target,
+                retreat_position,
             )
             if action:
                 actions.append(action)
@@ -103,8 +126,10 @@ class MarauderController(ControllerABC):
     def _handle_single_marauder(
         self,
         marauder: Unit,
+        best_target: Unit | None,
         nearby_enemies: "Units",
         strategic_target: Point2,
+        retreat_position: Point2 | None,
     ) -> CommandFunctor | None:
         """The core decision tree for an individual Marauder."""
         # Rule 1: Survival
@@ -112,12 +137,9 @@ class MarauderController(ControllerABC):
             marauder.health_percentage < SURVIVAL_HEALTH_THRESHOLD
             and nearby_enemies.exists
         ):
-            closest_enemy = nearby_enemies.closest_to(marauder)
-            retreat_position = marauder.position.towards(closest_enemy.position, -5)
             return lambda m=marauder, p=retreat_position: m.move(p)
 
         # Rule 2: Find and engage the best target
-        best_target = self._find_best_target(marauder, nearby_enemies)
         if best_target:
             if marauder.weapon_cooldown == 0:
                 return lambda m=marauder, t=best_target: m.attack(t)
@@ -127,32 +149,3 @@ class MarauderController(ControllerABC):
 
         # Rule 3: No enemies in range, move to the strategic target.
         return lambda m=marauder, t=strategic_target: m.attack(t)
-
-    def _find_best_target(
-        self, marauder: Unit, nearby_enemies: "Units", context: "MicroContext"
-    ) -> Unit | None:
-        """Finds the most valuable enemy for a Marauder to attack."""
-        attackable_enemies = nearby_enemies.in_attack_range_of(marauder).filter(
-            lambda u: not u.is_flying and u.can_be_attacked
-        )
-        if not attackable_enemies:
-            return None
-
-        # 1. Obey focus fire command
-        focus_target = context.focus_fire_target
-        if focus_target and focus_target in attackable_enemies:
-            return focus_target
-
-        # 2. Fallback to specialist logic: high-priority armored targets
-        for priority_id in MARAUDER_TARGET_PRIORITIES:
-            priority_targets = attackable_enemies.of_type(priority_id)
-            if priority_targets.exists:
-                return priority_targets.closest_to(marauder)
-
-        # 3. Fallback: any armored unit
-        armored_units = attackable_enemies.filter(lambda u: u.is_armored)
-        if armored_units.exists:
-            return armored_units.closest_to(marauder)
-
-        # 4. Default: closest enemy
-        return attackable_enemies.closest_to(marauder)
@@ -10,6 +10,7 @@ from sc2.unit import Unit
 
 from core.interfaces.controller_abc import ControllerABC
 from core.types import CommandFunctor
+from terran.specialists.micro.target_selector import TargetingProfile, select_targets
 
 if TYPE_CHECKING:
     from sc2.units import Units
@@ -22,6 +23,7 @@ ENGAGEMENT_RANGE = 15
 SURVIVAL_HEALTH_THRESHOLD = 0.4
 STIM_HEALTH_THRESHOLD = 20
 KITE_DISTANCE = 1.5
+RETREAT_DISTANCE = 5
 STIM_OFFENSIVE_TRIGGER_COUNT = 4
 
 MARINE_TARGET_PRIORITIES: List[UnitTypeId] = [
@@ -34,6 +36,9 @@ MARINE_TARGET_PRIORITIES: List[UnitTypeId] = [
     UnitTypeId.COLOSSUS,
     UnitTypeId.LURKERMPBURROWED,
 ]
+MARINE_TARGETING = TargetingProfile(
+    priorities=MARINE_TARGET_PRIORITIES, targets_air=False, range_bonus=1
+)
 
 
 class MarineController(ControllerABC):
@@ -55,16 +60,36 @@ class MarineController(ControllerABC):
         if not marines:
             return [], set()
 
-        nearby_enemies = cache.enemy_units.closer_than(ENGAGEMENT_RANGE, marines.center)
+        nearby_enemies = context.enemies_near(ENGAGEMENT_RANGE, context.center)
 
         # 1. Squad-level Decision: Stimpack
         stim_actions = self._handle_stim(marines, nearby_enemies, cache)
         actions.extend(stim_actions)
 
         # 2. Individual Marine Micro
-        for marine in marines:
+        targets = select_targets(
+            marines,
+            nearby_enemies,
+            MARINE_TARGETING,
+            context.focus_fire_target,
+            assigned=context.assigned_targets,
+        )
+        retreats = kites = [None] * marines.amount
+        if nearby_enemies:
+            retreats = context.retreat_positions(
+                marines, RETREAT_DISTANCE, nearby_enemies
+            )
+            kites = context.retreat_positions(marines, KITE_DISTANCE, nearby_enemies)
+        for marine, best_target, retreat_position, kite_position in zip(
+            marines, targets, retreats, kites
+        ):
             action = self._handle_single_marine(
-                marine, nearby_enemies, strategic_target
+                marine,
+                best_target,
+                nearby_enemies,
+                strategic_target,
+                retreat_position,
+                kite_position,
             )
             if action:
                 actions.append(action)
@@ -98,54 +123,28 @@ class MarineController(ControllerABC):
         return []
 
     def _handle_single_marine(
-        self, marine: Unit, nearby_enemies: "Units", strategic_target: Point2
+        self,
+        marine: Unit,
+        best_target: Unit | None,
+        nearby_enemies: "Units",
+        strategic_target: Point2,
+        retreat_position: Point2 | None,
+        kite_position: Point2 | None,
     ) -> CommandFunctor | None:
         """The core decision tree for an individual marine."""
         if (
             marine.health_percentage < SURVIVAL_HEALTH_THRESHOLD
             and nearby_enemies.exists
         ):
-            closest_enemy = nearby_enemies.closest_to(marine)
-            retreat_position = marine.position.towards(closest_enemy.position, -5)
             return lambda m=marine, p=retreat_position: m.move(p)
 
-        best_target = self._find_best_target_for_marine(marine, nearby_enemies)
-
         if best_target:
             if marine.weapon_cooldown == 0:
                 return lambda m=marine, t=best_target: m.attack(t)
             else:
                 if best_target.ground_range <= 2:
-                    kite_position = marine.position.towards(
-                        best_target.position, -KITE_DISTANCE
-                    )
                     return lambda m=marine, p=kite_position: m.move(p)
                 else:
                     return lambda m=marine, t=strategic_target: m.move(t)
 
         return lambda m=marine, t=strategic_target: m.attack(t)
-
-    def _find_best_target_for_marine(
-        self, marine: Unit, nearby_enemies: "Units", context: "MicroContext"
-    ) -> Unit | None:
-        """Finds the most dangerous enemy unit for a single marine to focus fire."""
-        attackable_enemies = nearby_enemies.in_attack_range_of(
-            marine, bonus_distance=1
-        ).filter(lambda e: not e.is_flying and e.can_be_attacked)
-
-        if not attackable_enemies:
-            return None
-
-        # 1. Obey focus fire command from the ArmyControlManager
-        focus_target = context.focus_fire_target
-        if focus_target and focus_target in attackable_enemies:
-            return focus_target
-
-        # 2. Fallback to specialist logic: Check for top-priority threats
-        for priority_id in MARINE_TARGET_PRIORITIES:
-            priority_targets = attackable_enemies.of_type(priority_id)
-            if priority_targets.exists:
-                return priority_targets.closest_to(marine)
-
-        # 3. Default: Target the closest enemy unit.
-        return attackable_enemies.closest_to(marine)
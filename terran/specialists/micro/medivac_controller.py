@@ -65,17 +65,16 @@ class MedivacController(ControllerABC):
                     actions.append(lambda m=medivac, p=rally_point: m.move(p))
             return actions, medivacs.tags
 
-        army_center = (medivacs.center + bio_squad.center) / 2
-        nearby_enemies = cache.enemy_units.closer_than(
-            THREAT_ASSESSMENT_RANGE, army_center
-        )
+        bio_center = context.main_army_center
+        army_center = (context.center + bio_center) / 2
+        nearby_enemies = context.enemies_near(THREAT_ASSESSMENT_RANGE, army_center)
 
         use_boost = self._should_boost(
-            medivacs, bio_squad, target, nearby_enemies, cache
+            medivacs, bio_squad, bio_center, target, nearby_enemies, cache
         )
 
         for medivac in medivacs:
-            support_target = self._get_support_target(medivac, bio_squad)
+            support_target = self._get_support_target(medivac, bio_squad, bio_center)
             safe_position = self._calculate_safe_leash_point(
                 medivac, support_target, nearby_enemies
             )
@@ -91,7 +90,9 @@ class MedivacController(ControllerABC):
 
         return actions, medivacs.tags
 
-    def _get_support_target(self, medivac: Unit, bio_squad: "Units") -> Unit | "Units":
+    def _get_support_target(
+        self, medivac: Unit, bio_squad: "Units", bio_center: Point2
+    ) -> Unit | Point2:
         """Determines if the Medivac should follow a single critical unit or the squad."""
         critically_wounded = bio_squad.filter(
             lambda u: u.health_percentage < PRIORITY_HEAL_THRESHOLD
@@ -99,16 +100,16 @@ class MedivacController(ControllerABC):
 
         if critically_wounded.exists:
             return min(critically_wounded, key=lambda u: u.health)
-        return bio_squad
+        return bio_center
 
     def _calculate_safe_leash_point(
-        self, medivac: Unit, support_target: Unit | "Units", enemies: "Units"
+        self, medivac: Unit, support_target: Unit | Point2, enemies: "Units"
     ) -> Point2:
         """Calculates a follow position behind the support target, away from enemies."""
         target_center = (
             support_target.position
             if isinstance(support_target, Unit)
-            else support_target.center
+            else support_target
         )
 
         if not enemies.exists:
@@ -125,6 +126,7 @@ class MedivacController(ControllerABC):
         self,
         medivacs: "Units",
         bio_squad: "Units",
+        bio_center: Point2,
         target: Point2,
         enemies: "Units",
         cache: "GlobalCache",
@@ -141,10 +143,7 @@ class MedivacController(ControllerABC):
             cache.logger.info("Medivacs boosting to retreat.")
             return True
 
-        if (
-            avg_health > BOOST_HEALTH_MINIMUM
-            and bio_squad.center.distance_to(target) > 25
-        ):
+        if avg_health > BOOST_HEALTH_MINIMUM and bio_center.distance_to(target) > 25:
             enemies_at_target = cache.known_enemy_units.closer_than(15, target)
             if enemies_at_target.of_type(ANTI_AIR_THREATS).amount < 3:
                 cache.logger.info("Medivacs boosting to engage.")
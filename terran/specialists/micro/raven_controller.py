@@ -70,7 +70,7 @@ class RavenController(ControllerABC):
 
         # Get main army squad for positioning
         main_army = context.bio_squad or context.mech_squad or Units([], self.bot)
-        nearby_enemies = cache.enemy_units.closer_than(ENGAGEMENT_RANGE, ravens.center)
+        nearby_enemies = context.enemies_near(ENGAGEMENT_RANGE, context.center)
 
         for raven in ravens:
             action = self._handle_single_raven(
@@ -10,6 +10,7 @@ from sc2.position import Point2
 from core.interfaces.controller_abc import ControllerABC
 from core.types import CommandFunctor
 from core.utilities.unit_types import WORKER_TYPES
+from terran.specialists.micro.target_selector import TargetingProfile, select_targets
 
 if TYPE_CHECKING:
     from sc2.units import Units
@@ -21,6 +22,14 @@ KITE_DISTANCE = 3.0  # Reapers are fast and should kite far
 GRENADE_RANGE = 5
 GRENADE_TARGET_COUNT = 2  # Use grenade on 2 or more workers/light units
 RETREAT_HEALTH_THRESHOLD = 0.6  # Reapers should retreat early to heal
+# Reapers only pick on workers and other light units.
+REAPER_TARGETING = TargetingProfile(
+    priorities=[WORKER_TYPES],
+    preferred=lambda u: u.is_light,
+    preferred_only=True,
+    focus_fire_if=lambda u: u.is_light,
+    targets_air=False,
+)
 
 
 class ReaperController(ControllerABC):
@@ -43,11 +52,23 @@ class ReaperController(ControllerABC):
         if not reapers:
             return [], set()
 
-        nearby_enemies = cache.enemy_units.closer_than(ENGAGEMENT_RANGE, reapers.center)
+        nearby_enemies = context.enemies_near(ENGAGEMENT_RANGE, context.center)
 
-        for reaper in reapers:
+        targets = select_targets(
+            reapers, nearby_enemies, REAPER_TARGETING, context.focus_fire_target
+        )
+        kites = [None] * reapers.amount
+        if nearby_enemies:
+            kites = context.retreat_positions(reapers, KITE_DISTANCE, nearby_enemies)
+        for reaper, best_target, kite_position in zip(reapers, targets, kites):
             action = self._handle_single_reaper(
-                reaper, nearby_enemies, strategic_target, cache, plan
+                reaper,
+                best_target,
+                nearby_enemies,
+                strategic_target,
+                kite_position,
+                cache,
+                plan,
             )
             if action:
                 actions.append(action)
@@ -57,8 +78,10 @@ class ReaperController(ControllerABC):
     def _handle_single_reaper(
         self,
         reaper: Unit,
+        best_target: Unit | None,
         nearby_enemies: "Units",
         strategic_target: "Point2",
+        kite_position: "Point2" | None,
         cache: "GlobalCache",
         plan: "FramePlan",
     ) -> CommandFunctor | None:
@@ -82,16 +105,11 @@ class ReaperController(ControllerABC):
                 )
 
         # 3. Kiting and Engagement
-        best_target = self._find_best_target(reaper, nearby_enemies)
         if best_target:
             if reaper.weapon_cooldown == 0:
                 return lambda r=reaper, t=best_target: r.attack(t)
             else:
-                # Always kite away from the closest enemy while reloading.
-                closest_enemy = nearby_enemies.closest_to(reaper)
-                kite_position = reaper.position.towards(
-                    closest_enemy.position, -KITE_DISTANCE
-                )
+                # Always kite towards safety while reloading.
                 return lambda r=reaper, p=kite_position: r.move(p)
 
         # 4. Positioning: No enemies, move to the strategic target.
@@ -99,55 +117,3 @@ class ReaperController(ControllerABC):
             return lambda r=reaper, t=strategic_target: r.attack(t)
 
         return None
-
-    def _find_best_target(self, reaper: Unit, nearby_enemies: "Units") -> Unit | None:
-        """Finds the best harassment target for a Reaper."""
-        # Reapers can only attack ground units.
-        attackable_enemies = nearby_enemies.in_attack_range_of(reaper).filter(
-            lambda u: not u.is_flying and u.can_be_attacked
-        )
-        if not attackable_enemies:
-            return None
-
-        # Priority 1: Workers
-        workers = attackable_enemies.of_type(WORKER_TYPES)
-        if workers.exists:
-            return workers.closest_to(reaper)
-
-        # Priority 2: Other light units that can't easily fight back (e.g., Queens)
-        light_units = attackable_enemies.filter(lambda u: u.is_light)
-        if light_units.exists:
-            return light_units.closest_to(reaper)
-
-        return None  # Avoid fighting non-light units unless necessary
-
-    def _find_best_target(
-        self, reaper: Unit, nearby_enemies: "Units", context: "MicroContext"
-    ) -> Unit | None:
-        """Finds the best harassment target for a Reaper."""
-        attackable_enemies = nearby_enemies.in_attack_range_of(reaper).filter(
-            lambda u: not u.is_flying and u.can_be_attacked
-        )
-        if not attackable_enemies:
-            return None
-
-        # 1. Obey focus fire command (but only if it's a valid light unit)
-        focus_target = context.focus_fire_target
-        if (
-            focus_target
-            and focus_target in attackable_enemies
-            and focus_target.is_light
-        ):
-            return focus_target
-
-        # 2. Fallback to specialist logic: Workers
-        workers = attackable_enemies.of_type(WORKER_TYPES)
-        if workers.exists:
-            return workers.closest_to(reaper)
-
-        # 3. Fallback: Other light units
-        light_units = attackable_enemies.filter(lambda u: u.is_light)
-        if light_units.exists:
-            return light_units.closest_to(reaper)
-
-        return None  # Avoid fighting non-light units
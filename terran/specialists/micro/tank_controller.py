@@ -44,7 +44,7 @@ class TankController(ControllerABC):
         if not tanks:
             return [], set()
 
-        nearby_enemies = cache.enemy_units.closer_than(SIEGE_RANGE + 5, tanks.center)
+        nearby_enemies = context.enemies_near(SIEGE_RANGE + 5, context.center)
 
         for tank in tanks:
             if tank.type_id == UnitTypeId.SIEGETANKSIEGED:
@@ -0,0 +1,228 @@
+# terran/specialists/micro/target_selector.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import numpy as np
+from sc2.ids.unit_typeid import UnitTypeId
+
+from core.utilities.unit_value import calculate_resource_value
+
+if TYPE_CHECKING:
+    from sc2.game_data import GameData
+    from sc2.unit import Unit
+
+# --- Tunable Targeting Constants ---
+# Score tiers, from the strongest to the weakest reason to pick a target.
+# Each tier outweighs everything below it; within a tier the closer target
+# wins, as one unit of distance costs one point.
+FOCUS_FIRE_BONUS = 1_000_000.0
+PRIORITY_STEP = 1_000.0
+PREFERRED_BONUS = 500.0
+# A dying enemy is worth walking this much further for.
+LOW_HEALTH_BONUS = 4.0
+
+
+@dataclass(frozen=True)
+class TargetingProfile:
+    """How one kind of unit ranks the enemies it can shoot at."""
+
+    # Enemy types in falling priority. An entry may be a set of types that
+    # are equally important.
+    priorities: Sequence[Union[UnitTypeId, AbstractSet[UnitTypeId]]] = ()
+    # Enemies that beat any unlisted type, but not the priorities.
+    preferred: Optional[Callable[["Unit"], bool]] = None
+    # Enemies worth more resources than this are preferred as well.
+    preferred_value: Optional[int] = None
+    # Ignore enemies that are neither a priority nor preferred.
+    preferred_only: bool = False
+    # The army's focus-fire target is obeyed if this holds (always if None).
+    focus_fire_if: Optional[Callable[["Unit"], bool]] = None
+    targets_ground: bool = True
+    targets_air: bool = True
+    # Only enemies in weapon range, plus `range_bonus`, are candidates.
+    in_range_only: bool = True
+    range_bonus: float = 0.0
+    # Score per resource an enemy is worth, for units that hunt big game.
+    value_weight: float = 0.0
+
+    @property
+    def needs_value(self) -> bool:
+        return self.value_weight > 0 or self.preferred_value is not None
+
+
+def select_targets(
+    units: Sequence["Unit"],
+    enemies: Sequence["Unit"],
+    profile: TargetingProfile,
+    focus_fire_target: Optional["Unit"] = None,
+    avoid_overkill: bool = False,
+    game_data: Optional["GameData"] = None,
+    assigned: Optional[Mapping[int, "Unit"]] = None,
+) -> List[Optional["Unit"]]:
+    """
+    Picks the best target of every unit in one call.
+
+    A (unit x enemy) score matrix is built from the enemies' priority,
+    attributes, health and the focus-fire order, minus the distance to each
+    unit, with enemies out of range masked out. The best target of each unit
+    is the argmax of its row.
+
+    With `avoid_overkill`, units are then walked in order and an enemy that
+    has already been dealt enough damage to die is skipped in favour of
+    the unit's next best target, spreading fire instead of wasting shots.
+
+    :param game_data: Required to look up costs when the profile values
+        enemies by their resources.
+    :param assigned: Targets handed out by the army's fire distribution, by
+        unit tag. They are kept whenever the profile allows them.
+    :return: The target of each unit, in the same order, or None.
+    """
+    if not units or not enemies:
+        return [None] * len(units)
+
+    base_scores = _enemy_scores(enemies, profile, focus_fire_target, game_data)
+    unit_xy = np.array([unit.position for unit in units], dtype=float)
+    enemy_xy = np.array([enemy.position for enemy in enemies], dtype=float)
+    distances = np.linalg.norm(unit_xy[:, None, :] - enemy_xy[None, :, :], axis=2)
+
+    scores = base_scores[None, :] - distances
+    if profile.in_range_only:
+        scores[distances > _reach(units, enemies, profile)] = -np.inf
+
+    best = scores.argmax(axis=1)
+    valid = np.isfinite(scores[np.arange(len(units)), best])
+    if avoid_overkill:
+        _spread_fire(units, enemies, scores, best, valid)
+    if assigned:
+        _keep_assigned(units, enemies, scores, best, valid, assigned)
+    return [enemies[j] if ok else None for j, ok in zip(best, valid)]
+
+
+def _enemy_scores(
+    enemies: Sequence["Unit"],
+    profile: TargetingProfile,
+    focus_fire_target: Optional["Unit"],
+    game_data: Optional["GameData"],
+) -> np.ndarray:
+    """The part of every score that depends on the enemy alone."""
+    priority_of: Dict[UnitTypeId, float] = {}
+    for rank, entry in enumerate(profile.priorities):
+        types = (entry,) if isinstance(entry, UnitTypeId) else entry
+        for type_id in types:
+            priority_of.setdefault(
+                type_id, (len(profile.priorities) - rank) * PRIORITY_STEP
+            )
+    focus_tag = focus_fire_target.tag if focus_fire_target is not None else None
+
+    scores = np.empty(len(enemies), dtype=float)
+    for index, enemy in enumerate(enemies):
+        if not enemy.can_be_attacked or not (
+            profile.targets_air if enemy.is_flying else profile.targets_ground
+        ):
+            scores[index] = -np.inf
+            continue
+        value = (
+            calculate_resource_value(enemy.type_id, game_data)
+            if profile.needs_value
+            else 0
+        )
+        preferred = (profile.preferred is not None and profile.preferred(enemy)) or (
+            profile.preferred_value is not None and value > profile.preferred_value
+        )
+        priority = priority_of.get(enemy.type_id, 0.0)
+        if profile.preferred_only and not (priority or preferred):
+            scores[index] = -np.inf
+            continue
+
+        score = priority + (PREFERRED_BONUS if preferred else 0.0)
+        score += profile.value_weight * value
+        score += LOW_HEALTH_BONUS * (1 - enemy.shield_health_percentage)
+        if enemy.tag == focus_tag and (
+            profile.focus_fire_if is None or profile.focus_fire_if(enemy)
+        ):
+            score += FOCUS_FIRE_BONUS
+        scores[index] = score
+    return scores
+
+
+def _reach(
+    units: Sequence["Unit"], enemies: Sequence["Unit"], profile: TargetingProfile
+) -> np.ndarray:
+    """
+    The (unit x enemy) center distance within which each unit can shoot each
+    enemy, following `Unit.target_in_range`. -inf where it cannot at all.
+    """
+    ground = np.array(
+        [unit.ground_range if unit.can_attack_ground else -np.inf for unit in units]
+    )
+    air = np.array(
+        [unit.air_range if unit.can_attack_air else -np.inf for unit in units]
+    )
+    flying = np.array([enemy.is_flying for enemy in enemies], dtype=bool)
+    # Colossi are tall enough to be shot by anti-air weapons.
+    colossus = np.array(
+        [enemy.type_id == UnitTypeId.COLOSSUS for enemy in enemies], dtype=bool
+    )
+    weapon_range = np.where(flying[None, :], air[:, None], ground[:, None])
+    weapon_range = np.where(
+        colossus[None, :] & np.isneginf(weapon_range), air[:, None], weapon_range
+    )
+    unit_radius = np.array([unit.radius for unit in units])
+    enemy_radius = np.array([enemy.radius for enemy in enemies])
+    return (
+        weapon_range
+        + unit_radius[:, None]
+        + enemy_radius[None, :]
+        + profile.range_bonus
+    )
+
+
+def _spread_fire(
+    units: Sequence["Unit"],
+    enemies: Sequence["Unit"],
+    scores: np.ndarray,
+    best: np.ndarray,
+    valid: np.ndarray,
+):
+    """Moves units off enemies that earlier units already kill, in place."""
+    remaining = np.array([enemy.health + enemy.shield for enemy in enemies])
+    for i, unit in enumerate(units):
+        if not valid[i]:
+            continue
+        target = best[i]
+        if remaining[target] <= 0:
+            row = np.where(remaining > 0, scores[i], -np.inf)
+            alternative = row.argmax()
+            # With nothing else in range, another shot beats no shot.
+            if np.isfinite(row[alternative]):
+                target = best[i] = alternative
+        remaining[target] -= unit.calculate_damage_vs_target(enemies[target])[0]
+
+
+def _keep_assigned(
+    units: Sequence["Unit"],
+    enemies: Sequence["Unit"],
+    scores: np.ndarray,
+    best: np.ndarray,
+    valid: np.ndarray,
+    assigned: Mapping[int, "Unit"],
+):
+    """Replaces the choice of every unit with its allowed assignment, in place."""
+    column_of = {enemy.tag: j for j, enemy in enumerate(enemies)}
+    for i, unit in enumerate(units):
+        target = assigned.get(unit.tag)
+        j = column_of.get(target.tag) if target is not None else None
+        if j is not None and np.isfinite(scores[i, j]):
+            best[i] = j
+            valid[i] = True
@@ -9,6 +9,7 @@ from sc2.position import Point2
 
 from core.interfaces.controller_abc import ControllerABC
 from core.types import CommandFunctor
+from terran.specialists.micro.target_selector import TargetingProfile, select_targets
 from terran.tactics.micro_context import MicroContext
 
 if TYPE_CHECKING:
@@ -37,6 +38,9 @@ THOR_TARGET_PRIORITIES: List[UnitTypeId] = [
     UnitTypeId.CORRUPTOR,
     UnitTypeId.VOIDRAY,
 ]
+# Past the priorities, Thors go for the most expensive unit in range: ten
+# resources of value outweigh one unit of distance.
+THOR_TARGETING = TargetingProfile(priorities=THOR_TARGET_PRIORITIES, value_weight=0.1)
 
 
 class ThorController(ControllerABC):
@@ -52,18 +56,25 @@ class ThorController(ControllerABC):
         # --- Unpack Context ---
         thors = context.units_to_control
         strategic_target = context.target
-        cache = context.cache
-        main_army = context.bio_squad or context.mech_squad or Units([], self.bot)
+        army_center = context.main_army_center
 
         actions: List[CommandFunctor] = []
         if not thors:
             return [], set()
 
-        nearby_enemies = cache.enemy_units.closer_than(ENGAGEMENT_RANGE, thors.center)
+        nearby_enemies = context.enemies_near(ENGAGEMENT_RANGE, context.center)
 
-        for thor in thors:
+        targets = select_targets(
+            thors,
+            nearby_enemies,
+            THOR_TARGETING,
+            context.focus_fire_target,
+            game_data=context.cache.bot.game_data,
+            assigned=context.assigned_targets,
+        )
+        for thor, best_target in zip(thors, targets):
             action = self._handle_single_thor(
-                thor, nearby_enemies, strategic_target, main_army
+                thor, best_target, nearby_enemies, strategic_target, army_center
             )
             if action:
                 actions.append(action)
@@ -73,9 +84,10 @@ class ThorController(ControllerABC):
     def _handle_single_thor(
         self,
         thor: Unit,
+        best_target: Unit | None,
         nearby_enemies: "Units",
         strategic_target: "Point2",
-        main_army: "Units",
+        army_center: "Point2" | None,
     ) -> CommandFunctor | None:
         """The core decision tree for an individual Thor."""
 
@@ -84,14 +96,13 @@ class ThorController(ControllerABC):
         if mode_switch_action:
             return mode_switch_action
 
-        # 2. Target Selection and Engagement.
-        best_target = self._find_best_target(thor, nearby_enemies)
+        # 2. Engagement.
         if best_target:
             return lambda t=thor, tgt=best_target: t.attack(tgt)
 
         # 3. Positioning: Stay with the main army.
-        if main_army.exists and thor.distance_to(main_army.center) > 5:
-            return lambda t=thor, p=main_army.center: t.move(p)
+        if army_center is not None and thor.distance_to(army_center) > 5:
+            return lambda t=thor, p=army_center: t.move(p)
         elif thor.distance_to(strategic_target) > 8:
             return lambda t=thor, tgt=strategic_target: t.attack(tgt)
 
@@ -128,28 +139,3 @@ class ThorController(ControllerABC):
             if light_air_threats.center.distance_to_closest(light_air_threats) < 3:
                 return True
         return False
-
-
-def _find_best_target(
-    self, thor: Unit, nearby_enemies: "Units", context: "MicroContext"
-) -> Unit | None:
-    """Finds the highest-priority target for the Thor."""
-    attackable_enemies = nearby_enemies.in_attack_range_of(thor).filter(
-        lambda u: u.can_be_attacked
-    )
-    if not attackable_enemies:
-        return None
-
-    # 1. Obey focus fire command
-    focus_target = context.focus_fire_target
-    if focus_target and focus_target in attackable_enemies:
-        return focus_target
-
-    # 2. Fallback to specialist logic: high-value massive units
-    for unit_type in THOR_TARGET_PRIORITIES:
-        potential_targets = attackable_enemies.of_type(unit_type)
-        if potential_targets.exists:
-            return potential_targets.closest_to(thor)
-
-    # 3. Default: attack the most expensive unit in range.
-    return max(attackable_enemies, key=lambda u: u.cost, default=None)
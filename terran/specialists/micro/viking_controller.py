@@ -9,6 +9,7 @@ from sc2.position import Point2
 
 from core.interfaces.controller_abc import ControllerABC
 from core.types import CommandFunctor
+from terran.specialists.micro.target_selector import TargetingProfile, select_targets
 from terran.tactics.micro_context import MicroContext
 
 if TYPE_CHECKING:
@@ -38,6 +39,8 @@ GROUND_TARGET_PRIORITIES: List[UnitTypeId] = [
     UnitTypeId.THOR,
     UnitTypeId.IMMORTAL,
 ]
+FIGHTER_TARGETING = TargetingProfile(priorities=AIR_TARGET_PRIORITIES)
+ASSAULT_TARGETING = TargetingProfile(priorities=GROUND_TARGET_PRIORITIES)
 
 
 class VikingController(ControllerABC):
@@ -53,31 +56,44 @@ class VikingController(ControllerABC):
         # --- Unpack Context ---
         vikings = context.units_to_control
         strategic_target = context.target
-        cache = context.cache
-        main_army = context.bio_squad or context.mech_squad or Units([], self.bot)
+        army_center = context.main_army_center
 
         actions: List[CommandFunctor] = []
         if not vikings:
             return [], set()
 
-        nearby_enemies = cache.enemy_units.closer_than(ENGAGEMENT_RANGE, vikings.center)
-
-        for viking in vikings:
-            action = self._handle_single_viking(
-                viking, nearby_enemies, strategic_target, main_army, cache
+        nearby_enemies = context.enemies_near(ENGAGEMENT_RANGE, context.center)
+
+        # Each mode ranks the targets of its own weapons.
+        fighters = vikings.filter(lambda v: v.is_flying)
+        assaults = vikings.filter(lambda v: not v.is_flying)
+        for group, profile in (
+            (fighters, FIGHTER_TARGETING),
+            (assaults, ASSAULT_TARGETING),
+        ):
+            targets = select_targets(
+                group,
+                nearby_enemies,
+                profile,
+                context.focus_fire_target,
+                assigned=context.assigned_targets,
             )
-            if action:
-                actions.append(action)
+            for viking, best_target in zip(group, targets):
+                action = self._handle_single_viking(
+                    viking, best_target, nearby_enemies, strategic_target, army_center
+                )
+                if action:
+                    actions.append(action)
 
         return actions, vikings.tags
 
     def _handle_single_viking(
         self,
         viking: Unit,
+        best_target: Unit | None,
         nearby_enemies: "Units",
         strategic_target: "Point2",
-        main_army: "Units",
-        cache: "GlobalCache",
+        army_center: "Point2" | None,
     ) -> CommandFunctor | None:
         """The core decision tree for an individual Viking."""
 
@@ -86,14 +102,13 @@ class VikingController(ControllerABC):
         if mode_switch_action:
             return mode_switch_action
 
-        # 2. Target Selection and Engagement.
-        best_target = self._find_best_target(viking, nearby_enemies)
+        # 2. Engagement.
         if best_target:
             return lambda v=viking, t=best_target: v.attack(t)
 
         # 3. Positioning: Stay with the main army for support.
-        if main_army.exists and viking.distance_to(main_army.center) > LEASH_DISTANCE:
-            safe_position = main_army.center.towards(viking.position, -LEASH_DISTANCE)
+        if army_center is not None and viking.distance_to(army_center) > LEASH_DISTANCE:
+            safe_position = army_center.towards(viking.position, -LEASH_DISTANCE)
             return lambda v=viking, p=safe_position: v.move(p)
         elif viking.distance_to(strategic_target) > 10:
             return lambda v=viking, t=strategic_target: v.attack(t)
@@ -123,30 +138,3 @@ class VikingController(ControllerABC):
                 return lambda v=viking: v(AbilityId.MORPH_VIKINGFIGHTERMODE)
 
         return None
-
-    def _find_best_target(
-        self, viking: Unit, nearby_enemies: "Units", context: "MicroContext"
-    ) -> Unit | None:
-        """Finds the highest-priority target for the Viking's current mode."""
-        attackable_enemies = nearby_enemies.in_attack_range_of(viking).filter(
-            lambda u: u.can_be_attacked
-        )
-        if not attackable_enemies:
-            return None
-
-        # 1. Obey focus fire command
-        focus_target = context.focus_fire_target
-        if focus_target and focus_target in attackable_enemies:
-            return focus_target
-
-        # 2. Fallback to specialist logic based on current mode
-        priorities = (
-            AIR_TARGET_PRIORITIES if viking.is_flying else GROUND_TARGET_PRIORITIES
-        )
-        for unit_type in priorities:
-            potential_targets = attackable_enemies.of_type(unit_type)
-            if potential_targets.exists:
-                return potential_targets.closest_to(viking)
-
-        # 3. Default: attack the closest valid enemy.
-        return attackable_enemies.closest_to(viking)
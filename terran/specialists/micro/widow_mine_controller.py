@@ -12,7 +12,6 @@ from core.types import CommandFunctor
 from terran.tactics.micro_context import MicroContext
 
 if TYPE_CHECKING:
-    from sc2.units import Units
     from core.frame_plan import FramePlan
 
 # --- Tunable Constants ---
@@ -35,9 +34,8 @@ class WidowMineController(ControllerABC):
         # --- Unpack Context ---
         mines = context.units_to_control
         strategic_target = context.target
-        cache = context.cache
         plan = context.plan
-        main_army = context.bio_squad or context.mech_squad or Units([], self.bot)
+        army_center = context.main_army_center
 
         actions: List[CommandFunctor] = []
         if not mines:
@@ -47,19 +45,19 @@ class WidowMineController(ControllerABC):
         mobile_mines = mines.filter(lambda m: not m.is_burrowed)
 
         for mine in burrowed_mines:
-            action = self._handle_burrowed_mine(mine, main_army, plan)
+            action = self._handle_burrowed_mine(mine, army_center, plan)
             if action:
                 actions.append(action)
 
         for mine in mobile_mines:
-            action = self._handle_mobile_mine(mine, strategic_target, main_army, plan)
+            action = self._handle_mobile_mine(mine, strategic_target, army_center, plan)
             if action:
                 actions.append(action)
 
         return actions, mines.tags
 
     def _handle_burrowed_mine(
-        self, mine: Unit, main_army: "Units", plan: "FramePlan"
+        self, mine: Unit, army_center: "Point2" | None, plan: "FramePlan"
     ) -> CommandFunctor | None:
         """Decides if a burrowed mine should unburrow to reposition."""
 
@@ -68,10 +66,10 @@ class WidowMineController(ControllerABC):
             return None
 
         # Determine the army's current frontline position.
-        if not main_army.exists:
+        if army_center is None:
             frontline = plan.defensive_position or self.bot.start_location
         else:
-            frontline = main_army.center
+            frontline = army_center
 
         # Unburrow if the army has moved too far away.
         if mine.distance_to(frontline) > REPOSITION_DISTANCE:
@@ -83,7 +81,7 @@ class WidowMineController(ControllerABC):
         self,
         mine: Unit,
         strategic_target: "Point2",
-        main_army: "Units",
+        army_center: "Point2" | None,
         plan: "FramePlan",
     ) -> CommandFunctor | None:
         """Decides where a mobile mine should move and when it should burrow."""
@@ -91,9 +89,9 @@ class WidowMineController(ControllerABC):
         # A burrowed mine's attack is an ability, so we can check can_cast.
         if not self.bot.can_cast(mine, AbilityId.WIDOWMINEATTACK_WIDOWMINEATTACK):
             # Weapon is on cooldown, stay mobile.
-            if main_army.exists:
+            if army_center is not None:
                 # Follow the army while waiting for cooldown.
-                follow_position = main_army.center.towards(mine.position, -3)
+                follow_position = army_center.towards(mine.position, -3)
                 if mine.distance_to(follow_position) > 2:
                     return lambda m=mine, p=follow_position: m.move(p)
             return None  # Wait for cooldown to finish.
@@ -102,8 +100,8 @@ class WidowMineController(ControllerABC):
         if plan.army_stance == ArmyStance.DEFENSIVE:
             target_pos = plan.defensive_position
         else:  # AGGRESSIVE or HARASS
-            if main_army.exists:
-                target_pos = main_army.center.towards(
+            if army_center is not None:
+                target_pos = army_center.towards(
                     strategic_target, OFFENSIVE_LEAPFROG_DISTANCE
                 )
             else:
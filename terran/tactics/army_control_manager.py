@@ -1,16 +1,23 @@
 # terran/tactics/army_control_manager.py
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Dict, Set
+from collections import defaultdict
+from typing import TYPE_CHECKING, List, Dict, Tuple
 
 from sc2.ids.unit_typeid import UnitTypeId
 from sc2.units import Units
 from sc2.position import Point2
 from sc2.unit import Unit
 
+from core.frame_plan import ArmyStance
+from core.interfaces.controller_abc import ControllerABC
 from core.interfaces.manager_abc import Manager
 from core.types import CommandFunctor
+from core.utilities.events import EventType
 from .squad import Squad, SquadObjective
 from .micro_context import MicroContext
+from .fire_distribution import FireDistribution
+from .squad_clustering import SquadClusterer
+from .squad_roster import SquadRoster
 
 # Import all specialist micro-controllers
 from terran.specialists.micro.marine_controller import MarineController
@@ -62,6 +69,14 @@ AIR_UNIT_TYPES = {
 }
 SUPPORT_UNIT_TYPES = {UnitTypeId.MEDIVAC, UnitTypeId.RAVEN}
 
+# --- Tunable Micro Constants ---
+# The largest radius any micro-controller searches for enemies around the
+# center of its units. A squad's enemy neighbourhood is found once with this
+# reach, and every controller narrows it down from there.
+MICRO_ENGAGEMENT_RANGE = 20
+# Radius around the squad center searched for a focus-fire target.
+FOCUS_FIRE_RANGE = 20
+
 # --- Centralized Army Target Priorities ---
 FOCUS_FIRE_PRIORITIES: List[UnitTypeId] = [
     UnitTypeId.SIEGETANKSIEGED,
@@ -82,12 +97,25 @@ FOCUS_FIRE_PRIORITIES: List[UnitTypeId] = [
 class ArmyControlManager(Manager):
     """
     Field Commander. Orchestrates the army by managing squads, selecting a
-    focus-fire target, and delegating control to specialist micro-controllers.
+    focus-fire target, distributing fire across the whole army, and
+    delegating control to specialist micro-controllers.
+
+    The army is sorted into squads and controllers in a single pass per
+    frame, and the enemies around each squad are found once and shared by
+    all of its controllers. Only controllers with units to control are run.
+    Units that no squad was created for are grouped into squads by where
+    they stand, and sent to the plan's target location. Which created squad
+    a unit belongs to is kept in the SquadRoster, which changes only when
+    squads are created, dissolved or lose a unit.
     """
 
     def __init__(self, bot: "BotAI"):
         super().__init__(bot)
         self.squads: Dict[str, Squad] = {}
+        self.roster = SquadRoster()
+        bus = getattr(bot, "event_bus", None)
+        if bus:
+            bus.subscribe(EventType.UNIT_DESTROYED, self.roster.handle_unit_destroyed)
         self.controller_map = {
             frozenset({UnitTypeId.MARINE}): MarineController(),
             frozenset({UnitTypeId.MARAUDER}): MarauderController(),
@@ -115,15 +143,32 @@ class ArmyControlManager(Manager):
             frozenset({UnitTypeId.RAVEN}): RavenController(),
             frozenset({UnitTypeId.MEDIVAC}): MedivacController(),
         }
+        self.fire_distribution = FireDistribution()
+        self.squad_clusterer = SquadClusterer()
+        # Squads formed from the units of no created squad, anew every frame.
+        self.formed_squads: Dict[str, Squad] = {}
+        self.controllers: List[ControllerABC] = list(self.controller_map.values())
+        # Unit type -> the controller that micro-manages it.
+        self.controller_of_type: Dict[UnitTypeId, ControllerABC] = {
+            unit_type: controller
+            for unit_types, controller in self.controller_map.items()
+            for unit_type in unit_types
+        }
 
     def create_squad(
         self, squad_id: str, units: "Units", objective: SquadObjective, target: "Point2"
     ):
         """Creates a new squad or updates an existing one. Called by the TacticalDirector."""
-        if squad_id in self.squads:
-            self.squads[squad_id].units.extend(units)
-            self.squads[squad_id].objective = objective
-            self.squads[squad_id].target = target
+        # Units already in another squad move over to this one.
+        self.roster.assign(units.tags, squad_id)
+        squad = self.squads.get(squad_id)
+        if squad is not None:
+            by_tag = {unit.tag: unit for unit in squad.units}
+            by_tag.update((unit.tag, unit) for unit in units)
+            squad.units = Units(by_tag.values(), self.bot)
+            squad.objective = objective
+            squad.target = target
+            squad.invalidate_geometry()
         else:
             self.squads[squad_id] = Squad(
                 id=squad_id, units=units, objective=objective, target=target
@@ -135,70 +180,160 @@ class ArmyControlManager(Manager):
     async def execute(
         self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
     ) -> List[CommandFunctor]:
-        self._update_squad_units(cache)
+        members, buckets, unassigned = self._partition_army(cache)
+        self._update_squad_units(cache, members)
+        self._form_squads(unassigned, plan, members, buckets)
+        squads = {**self.squads, **self.formed_squads}
         actions: List[CommandFunctor] = []
-        handled_tags: Set[int] = set()
+        no_units = Units([], self.bot)
+        bio_squad, mech_squad, air_squad, support_squad = (
+            self.squads[squad_id].units if squad_id in self.squads else no_units
+            for squad_id in ("main_bio", "main_mech", "main_air", "main_support")
+        )
+        bio_geometry, mech_geometry = (
+            self.squads[squad_id].geometry if squad_id in self.squads else None
+            for squad_id in ("main_bio", "main_mech")
+        )
 
-        for squad_id, squad in self.squads.items():
-            if squad.is_empty:
-                continue
+        neighbourhoods: Dict[str, Tuple[Point2, float, Units, Unit | None]] = {}
+        for squad_id, squad in squads.items():
+            center = squad.geometry.center
+            # Every controller looks at most MICRO_ENGAGEMENT_RANGE around the
+            # center of its own units, which lies within the squad's radius.
+            reach = squad.geometry.radius + MICRO_ENGAGEMENT_RANGE
+            nearby_enemies = cache.enemy_units.closer_than(reach, center)
+            focus_target = self._find_focus_fire_target(
+                nearby_enemies.closer_than(FOCUS_FIRE_RANGE, center), center
+            )
+            neighbourhoods[squad_id] = (center, reach, nearby_enemies, focus_target)
 
-            nearby_enemies = cache.enemy_units.closer_than(20, squad.center)
-            focus_target = self._find_focus_fire_target(nearby_enemies, squad.center)
+        assigned_targets = self._distribute_fire(cache, members, neighbourhoods)
 
+        for squad_id, squad in squads.items():
+            center, reach, nearby_enemies, focus_target = neighbourhoods[squad_id]
             context = MicroContext(
                 units_to_control=Units([], self.bot),
                 target=squad.target or plan.rally_point or self.bot.start_location,
                 cache=cache,
                 plan=plan,
+                nearby_enemies=nearby_enemies,
+                neighbourhood_center=center,
+                neighbourhood_radius=reach,
+                squad_geometry=squad.geometry,
                 focus_fire_target=focus_target,
-                bio_squad=self.squads.get(
-                    "main_bio", Squad("bio", Units([], self.bot))
-                ).units,
-                mech_squad=self.squads.get(
-                    "main_mech", Squad("mech", Units([], self.bot))
-                ).units,
-                air_squad=self.squads.get(
-                    "main_air", Squad("air", Units([], self.bot))
-                ).units,
-                support_squad=self.squads.get(
-                    "main_support", Squad("support", Units([], self.bot))
-                ).units,
+                assigned_targets=assigned_targets,
+                bio_squad=bio_squad,
+                mech_squad=mech_squad,
+                air_squad=air_squad,
+                support_squad=support_squad,
+                bio_geometry=bio_geometry,
+                mech_geometry=mech_geometry,
             )
 
-            for unit_types, controller in self.controller_map.items():
-                squad_units_of_type = squad.units.of_type(unit_types)
-                if squad_units_of_type.exists:
-                    context.units_to_control = squad_units_of_type
-                    controller_actions, tags = controller.execute(context)
+            squad_buckets = buckets[squad_id]
+            for controller in self.controllers:
+                units = squad_buckets.get(controller)
+                if units:
+                    context.units_to_control = Units(units, self.bot)
+                    controller_actions, _ = controller.execute(context)
                     actions.extend(controller_actions)
-                    handled_tags.update(tags)
 
-        # Handle any army units that somehow were not assigned to a squad
-        unassigned_units = cache.friendly_army_units.tags_not_in(
-            self._get_all_assigned_tags()
+        return actions
+
+    def _form_squads(
+        self,
+        units: List[Unit],
+        plan: "FramePlan",
+        members: Dict[str, List[Unit]],
+        buckets: Dict[str, Dict[ControllerABC, List[Unit]]],
+    ):
+        """
+        Clusters the units of no created squad into formed squads, and adds
+        their members and controller buckets to those of the created squads.
+        """
+        target = plan.target_location or plan.rally_point or self.bot.start_location
+        objective = (
+            SquadObjective.ATTACK
+            if plan.army_stance == ArmyStance.AGGRESSIVE
+            else SquadObjective.DEFEND
         )
-        if unassigned_units.exists:
-            rally = plan.rally_point or self.bot.start_location
-            for unit in unassigned_units:
-                actions.append(lambda u=unit, t=rally: u.attack(t))
+        self.formed_squads = {}
+        for cluster in self.squad_clusterer.cluster(units):
+            self.formed_squads[cluster.id] = Squad(
+                cluster.id, Units(cluster.units, self.bot), objective, target
+            )
+            members[cluster.id] = cluster.units
+            squad_buckets = buckets[cluster.id] = defaultdict(list)
+            for unit in cluster.units:
+                controller = self.controller_of_type.get(unit.type_id)
+                if controller is not None:
+                    squad_buckets[controller].append(unit)
 
-        return actions
+    def _distribute_fire(
+        self,
+        cache: "GlobalCache",
+        members: Dict[str, List[Unit]],
+        neighbourhoods: Dict[str, Tuple[Point2, float, Units, Unit | None]],
+    ) -> Dict[int, Unit]:
+        """Hands a target to every loaded weapon of the army at once."""
+        enemy_tags = set()
+        for _, _, nearby_enemies, _ in neighbourhoods.values():
+            enemy_tags.update(nearby_enemies.tags)
+        if not enemy_tags:
+            return {}
+        army, enemies = cache.friendly_army_arrays, cache.enemy_unit_arrays
+        return self.fire_distribution.assign(
+            army.take(
+                army.indices_of(
+                    unit.tag for units in members.values() for unit in units
+                )
+            ),
+            enemies.take(enemies.indices_of(enemy_tags)),
+            cache.weapon_table,
+            [focus.tag for *_, focus in neighbourhoods.values() if focus is not None],
+        )
+
+    def _partition_army(self, cache: "GlobalCache") -> Tuple[
+        Dict[str, List[Unit]],
+        Dict[str, Dict[ControllerABC, List[Unit]]],
+        List[Unit],
+    ]:
+        """
+        Sorts the army, in a single pass, into the members of each squad,
+        the units each squad hands to each controller, and the units that
+        belong to no squad.
+        """
+        squad_of = self.roster.squad_of
+        members: Dict[str, List[Unit]] = {squad_id: [] for squad_id in self.squads}
+        buckets: Dict[str, Dict[ControllerABC, List[Unit]]] = {
+            squad_id: defaultdict(list) for squad_id in self.squads
+        }
+        unassigned: List[Unit] = []
+        controller_of_type = self.controller_of_type
 
-    def _get_all_assigned_tags(self) -> Set[int]:
-        """Helper to get all tags from all squads."""
-        return {tag for squad in self.squads.values() for tag in squad.tags}
+        for unit in cache.friendly_army_units:
+            squad_id = squad_of(unit.tag)
+            if squad_id is None:
+                unassigned.append(unit)
+                continue
+            members[squad_id].append(unit)
+            controller = controller_of_type.get(unit.type_id)
+            if controller is not None:
+                buckets[squad_id][controller].append(unit)
+        return members, buckets, unassigned
 
-    def _update_squad_units(self, cache: "GlobalCache"):
+    def _update_squad_units(self, cache: "GlobalCache", members: Dict[str, List[Unit]]):
         """Refreshes the units in each squad and removes empty squads."""
         squads_to_remove = []
         for squad_id, squad in self.squads.items():
-            squad.units = cache.friendly_army_units.tags_in(squad.tags)
+            squad.units = Units(members[squad_id], self.bot)
+            squad.invalidate_geometry()
             if squad.is_empty:
                 squads_to_remove.append(squad_id)
 
         for squad_id in squads_to_remove:
             del self.squads[squad_id]
+            self.roster.dissolve(squad_id)
             cache.logger.info(f"Squad '{squad_id}' dissolved as it has no more units.")
 
     def _find_focus_fire_target(
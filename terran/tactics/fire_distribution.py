@@ -0,0 +1,159 @@
+# terran/tactics/fire_distribution.py
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Iterable
+
+import numpy as np
+
+from core.utilities.unit_value import threat_values
+
+if TYPE_CHECKING:
+    from sc2.unit import Unit
+    from core.utilities.unit_arrays import UnitArrays
+    from core.utilities.weapon_table import WeaponTable
+
+# --- Tunable Fire Distribution Constants ---
+# Units whose weapon is ready within this many game loops are given a target.
+READY_WITHIN_LOOPS = 4
+# Added to the value of the squads' focus-fire targets, so they are served
+# before anything else.
+FOCUS_FIRE_VALUE = 1_000.0
+
+
+class FireDistribution:
+    """
+    The Fire Direction Centre. Decides, for the whole army at once, which
+    enemy every unit with a loaded weapon shoots, so that the damage heading
+    for each enemy just exceeds its health and shields.
+
+    Every shooter wants the enemy where its shot buys the most: the enemy's
+    threat per point of health, times the shooter's damage against it (from
+    the WeaponTable, so armor and attribute bonuses count). Each enemy then
+    keeps its biggest hitters until they are enough to kill it; the rest of
+    its shooters are turned away and choose again among enemies that are
+    still alive. When no enemy draws enough fire to die, everyone who can
+    reach the one drawing the most concentrates on it instead of wounding
+    several. Each round is a handful of NumPy operations over the
+    (shooter x enemy) matrices, built from the frame's UnitArrays without
+    reading unit attributes. Shooters left with only dead enemies in range
+    fire at their best one anyway.
+    """
+
+    def assign(
+        self,
+        units: "UnitArrays",
+        enemies: "UnitArrays",
+        weapon_table: "WeaponTable",
+        focus_fire_tags: Iterable[int] = (),
+    ) -> Dict[int, "Unit"]:
+        """Returns the target of every unit that should fire now, by tag."""
+        cooldown = units.weapon_cooldown
+        ready = np.flatnonzero((cooldown >= 0) & (cooldown <= READY_WITHIN_LOOPS))
+        if ready.size == 0 or not len(enemies):
+            return {}
+        shooters = units.take(ready)
+
+        damage, _, weapon_range = weapon_table.matrices(shooters, enemies)
+        # Built in place: at this size a temporary costs as much as the math.
+        shooter_xy, enemy_xy = shooters.positions, enemies.positions
+        squared_distances = np.subtract.outer(shooter_xy[:, 0], enemy_xy[:, 0])
+        squared_distances *= squared_distances
+        dy = np.subtract.outer(shooter_xy[:, 1], enemy_xy[:, 1])
+        dy *= dy
+        squared_distances += dy
+        reach = np.add.outer(shooters.radius, enemies.radius, out=dy)
+        reach += weapon_range
+        reach *= reach
+        allowed = squared_distances <= reach
+        allowed &= damage > 0
+        allowed &= enemies.can_be_attacked
+
+        # Only shooters with something in reach, and enemies somebody can reach,
+        # take part in the distribution.
+        rows = np.flatnonzero(allowed.any(axis=1))
+        if rows.size == 0:
+            return {}
+        columns = np.flatnonzero(allowed.any(axis=0))
+        allowed = allowed[rows][:, columns]
+        damage = damage[rows][:, columns]
+
+        health = enemies.vitality[columns]
+        value = threat_values(enemies.type_ids[columns]) / np.maximum(health, 1)
+        focused = np.isin(enemies.tags[columns], list(focus_fire_tags))
+        value += focused * FOCUS_FIRE_VALUE
+        scores = damage * value
+        # Closer enemies break ties.
+        tie_break = squared_distances[rows][:, columns]
+        tie_break *= 1e-6
+        scores -= tie_break
+        scores[~allowed] = -np.inf
+
+        targets = self._distribute(scores, damage, health)
+        firing = targets >= 0
+        enemy_units = enemies.units
+        return {
+            tag: enemy_units[target]
+            for tag, target in zip(
+                shooters.tags[rows[firing]].tolist(), columns[targets[firing]].tolist()
+            )
+        }
+
+    @staticmethod
+    def _distribute(
+        scores: np.ndarray, damage: np.ndarray, health: np.ndarray
+    ) -> np.ndarray:
+        """The enemy index of every shooter, or -1 with nothing in range."""
+        targets = np.full(scores.shape[0], -1, dtype=np.intp)
+        remaining = health.astype(float)
+        # The scores of free shooters against living enemies; -inf elsewhere.
+        live = scores.copy()
+        every_shooter = np.arange(len(live))
+
+        while True:
+            choice = live.argmax(axis=1)
+            shooters = np.flatnonzero(np.isfinite(live[every_shooter, choice]))
+            if shooters.size == 0:
+                break
+            choice = choice[shooters]
+            hits = damage[shooters, choice]
+            incoming = np.bincount(choice, weights=hits, minlength=len(remaining))
+            chosen = np.flatnonzero(incoming)
+            killed = chosen[incoming[chosen] >= remaining[chosen]]
+
+            if killed.size == 0:
+                # Nobody can be killed this round: everyone who can reach
+                # the enemy taking the most damage joins in on it.
+                best = chosen[incoming[chosen].argmax()]
+                joining = np.flatnonzero(np.isfinite(live[:, best]))
+                targets[joining] = best
+                live[joining] = -np.inf
+                remaining[best] -= damage[joining, best].sum()
+            else:
+                # Per killed enemy, biggest hitters first; keep shooters while
+                # the damage of those before them does not kill it yet. The
+                # others choose again in the next round.
+                is_killed = np.zeros(len(remaining), dtype=bool)
+                is_killed[killed] = True
+                on_killed = is_killed[choice]
+                shooters, choice, hits = (
+                    shooters[on_killed],
+                    choice[on_killed],
+                    hits[on_killed],
+                )
+                order = np.lexsort((-hits, choice))
+                shooters, choice, hits = shooters[order], choice[order], hits[order]
+                dealt_before = np.cumsum(hits) - hits
+                first_of_enemy = np.concatenate(([True], choice[1:] != choice[:-1]))
+                enemy_of = np.cumsum(first_of_enemy) - 1
+                enemy_start = dealt_before[first_of_enemy][enemy_of]
+                kept = dealt_before - enemy_start < remaining[choice]
+
+                targets[shooters[kept]] = choice[kept]
+                live[shooters[kept]] = -np.inf
+                live[:, killed] = -np.inf
+                remaining[killed] = 0
+
+        # Enough damage is on its way to everything in range: spare shots go
+        # to the best target anyway.
+        spare = np.flatnonzero((targets < 0) & np.isfinite(scores).any(axis=1))
+        targets[spare] = scores[spare].argmax(axis=1)
+        return targets
@@ -1,14 +1,16 @@
 # terran/tactics/micro_context.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 if TYPE_CHECKING:
     from sc2.position import Point2
     from sc2.units import Units
     from sc2.unit import Unit
     from core.global_cache import GlobalCache
+    from core.utilities.combat_simulator import CombatPrediction
     from core.frame_plan import FramePlan
+    from .squad import SquadGeometry
 
 
 @dataclass
@@ -31,9 +33,21 @@ class MicroContext:
     # The high-level plan and strategic stances for this frame.
     plan: "FramePlan"
 
+    # --- Shared Enemy Neighbourhood ---
+    # Enemy units within `neighbourhood_radius` of `neighbourhood_center`,
+    # found once per squad and shared by all of its controllers.
+    nearby_enemies: Optional["Units"] = None
+    neighbourhood_center: Optional["Point2"] = None
+    neighbourhood_radius: float = 0.0
+    # The cached geometry of the squad the controlled units belong to.
+    squad_geometry: Optional["SquadGeometry"] = None
+
     # --- Coordinated Action Information ---
     # The single, highest-priority enemy unit for the entire army to focus fire.
     focus_fire_target: Optional["Unit"] = None
+    # Targets handed out by the army-wide fire distribution, by unit tag, to
+    # the units whose weapon is ready.
+    assigned_targets: Dict[int, "Unit"] = field(default_factory=dict)
 
     # --- Optional Squad Information ---
     # Provides context about other friendly forces for coordination.
@@ -41,3 +55,82 @@ class MicroContext:
     mech_squad: Optional["Units"] = None
     air_squad: Optional["Units"] = None
     support_squad: Optional["Units"] = None
+    bio_geometry: Optional["SquadGeometry"] = None
+    mech_geometry: Optional["SquadGeometry"] = None
+
+    @property
+    def center(self) -> "Point2":
+        """
+        The center of the controlled units. Read from the squad's geometry
+        when they are the whole squad, as they usually are.
+        """
+        geometry = self.squad_geometry
+        if geometry is not None and geometry.size == self.units_to_control.amount:
+            return geometry.center
+        return self.units_to_control.center
+
+    @property
+    def main_army_center(self) -> Optional["Point2"]:
+        """
+        The center of the bio squad, or of the mech squad without bio; None
+        with neither. Read from the squads' geometry when it is known.
+        """
+        geometry = self.bio_geometry or self.mech_geometry
+        if geometry is not None:
+            return geometry.center
+        main_army = self.bio_squad or self.mech_squad
+        return main_army.center if main_army else None
+
+    def enemies_near(self, radius: float, position: "Point2") -> "Units":
+        """
+        Enemy units within `radius` of `position`. Served from the squad's
+        shared neighbourhood when the circle lies inside it, and from every
+        known enemy otherwise.
+        """
+        enemies = self.cache.enemy_units
+        if (
+            self.nearby_enemies is not None
+            and position.distance_to(self.neighbourhood_center) + radius
+            <= self.neighbourhood_radius
+        ):
+            enemies = self.nearby_enemies
+        return enemies.closer_than(radius, position)
+
+    def retreat_positions(
+        self, units: "Units", distance: float, threats: "Units"
+    ) -> List["Point2"]:
+        """
+        Where each unit should fall back to, `distance` away, in the same
+        order. Looked up for the whole group in the retreat field; a unit the
+        field has no way out for steps straight away from the threats' center.
+        """
+        if not units:
+            return []
+        field = self.cache.retreat_field
+        points = (
+            field.retreat_points([unit.position for unit in units], distance)
+            if field is not None
+            else [None] * len(units)
+        )
+        if all(points):
+            return points
+        danger = threats.center if threats else None
+        return [
+            point
+            or (
+                unit.position.towards(danger, -distance)
+                if danger is not None
+                else unit.position
+            )
+            for unit, point in zip(units, points)
+        ]
+
+    def predict_fight(self, units: Optional["Units"] = None) -> "CombatPrediction":
+        """
+        How a fight between `units` (the controlled units by default) and the
+        squad's nearby enemies would end.
+        """
+        if units is None:
+            units = self.units_to_control
+        enemies = self.nearby_enemies if self.nearby_enemies is not None else []
+        return self.cache.combat_simulator.predict(units, enemies)
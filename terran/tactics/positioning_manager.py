@@ -7,7 +7,11 @@ from sc2.position import Point2
 from core.frame_plan import ArmyStance
 from core.interfaces.manager_abc import Manager
 from core.types import CommandFunctor
-from core.utilities.geometry import find_safe_point_from_threat_map
+from core.utilities.constants import GAME_LOOPS_PER_SECOND
+from core.utilities.geometry import (
+    distance_to_route,
+    find_safe_point_from_threat_map,
+)
 from core.utilities.unit_types import TERRAN_PRODUCTION_TYPES
 
 if TYPE_CHECKING:
@@ -21,6 +25,11 @@ if TYPE_CHECKING:
 RALLY_BEHIND_DISTANCE = 8
 STAGING_DISTANCE_FROM_TARGET = 25  # Increased for safety
 RAMP_SEARCH_RADIUS = 15
+# The route to the attack target is planned once and reused while the army
+# stays within this distance of it...
+STAGING_ROUTE_TOLERANCE = 8
+# ...for at most this long, so it still bends around new threats.
+STAGING_REPLAN_SECONDS = 5
 
 
 class PositioningManager(Manager):
@@ -31,6 +40,11 @@ class PositioningManager(Manager):
 
     def __init__(self, bot: "BotAI"):
         super().__init__(bot)
+        # The planned route to the attack target: its points from where the
+        # army was, the target, and the game loop it was planned on.
+        self._route: List[Point2] = []
+        self._route_target: Point2 | None = None
+        self._route_planned_at: int = 0
 
     async def execute(
         self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
@@ -62,20 +76,23 @@ class PositioningManager(Manager):
                 cache.known_enemy_townhalls.center
             )
         else:
-            frontier_base = self.bot.townhalls.ready.closest_to(enemy_main_base)
+            # The base the enemy reaches first on foot, not as the crow flies.
+            frontier_base = cache.ground_distance.closest_to(
+                enemy_main_base, self.bot.townhalls.ready
+            )
 
         try:
+            ramps = self.bot.game_info.map_ramps
+            walks = cache.ground_distance.distances(
+                frontier_base.position, [r.bottom_center for r in ramps]
+            )
             ramps_near_base = [
-                r
-                for r in self.bot.game_info.map_ramps
-                if r.bottom_center.distance_to(frontier_base.position)
-                < RAMP_SEARCH_RADIUS
+                (walk, index)
+                for index, walk in enumerate(walks.tolist())
+                if walk < RAMP_SEARCH_RADIUS
             ]
             if ramps_near_base:
-                defensive_pos = min(
-                    ramps_near_base,
-                    key=lambda r: r.bottom_center.distance_to(frontier_base.position),
-                ).top_center
+                defensive_pos = ramps[min(ramps_near_base)[1]].top_center
             else:  # Fallback for bases not near a ramp
                 defensive_pos = frontier_base.position.towards(
                     self.bot.start_location, 5
@@ -107,8 +124,8 @@ class PositioningManager(Manager):
             else defensive_pos
         )
 
-        ideal_staging_point = attack_target.towards(
-            army_center, STAGING_DISTANCE_FROM_TARGET
+        ideal_staging_point = self._staging_point_on_route(
+            cache, army_center, attack_target
         )
 
         if cache.threat_map is not None:
@@ -121,6 +138,58 @@ class PositioningManager(Manager):
         cache.logger.debug(f"Staging point calculated at {safe_staging_point.rounded}")
         return safe_staging_point
 
+    def _staging_point_on_route(
+        self, cache: "GlobalCache", army_center: Point2, attack_target: Point2
+    ) -> Point2:
+        """
+        The point STAGING_DISTANCE_FROM_TARGET short of the target along the
+        safest route from the army, so the army stages on the side it will
+        attack from rather than across a cliff. In a straight line from the
+        target if there is no route.
+        """
+        points = self._route_to(cache, army_center, attack_target)
+        if not points:
+            return attack_target.towards(army_center, STAGING_DISTANCE_FROM_TARGET)
+
+        # Walk back from the target, one leg of the route at a time.
+        remaining = STAGING_DISTANCE_FROM_TARGET
+        for near, far in zip(reversed(points), reversed(points[:-1])):
+            leg = near.distance_to(far)
+            if leg >= remaining:
+                return near.towards(far, remaining)
+            remaining -= leg
+        return points[0]
+
+    def _route_to(
+        self, cache: "GlobalCache", army_center: Point2, attack_target: Point2
+    ) -> List[Point2]:
+        """
+        The route from the army to the target, starting with the army's
+        position, or empty if there is none. The last route is reused while
+        it leads to the same target, is recent, and the army has not strayed
+        from it, so the search runs a few times per attack instead of every
+        frame.
+        """
+        if cache.pathfinder is None:
+            return []
+        replan_loops = STAGING_REPLAN_SECONDS * GAME_LOOPS_PER_SECOND
+        if (
+            self._route_target == attack_target
+            and cache.game_loop - self._route_planned_at < replan_loops
+            and (
+                not self._route
+                or distance_to_route(army_center, self._route)
+                <= STAGING_ROUTE_TOLERANCE
+            )
+        ):
+            return self._route
+
+        route = cache.pathfinder.find_path(army_center, attack_target)
+        self._route = [army_center] + route if route else []
+        self._route_target = attack_target
+        self._route_planned_at = cache.game_loop
+        return self._route
+
     def _calculate_rally_point(
         self,
         cache: "GlobalCache",
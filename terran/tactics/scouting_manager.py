@@ -2,11 +2,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, List, Set
 
 from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
 
 from core.interfaces.manager_abc import Manager
 from core.types import CommandFunctor
 from core.utilities.events import Event, EventType, EnemyTechScoutedPayload
-from core.utilities.constants import SCOUT_AT_SUPPLY
+from core.utilities.constants import GAME_LOOPS_PER_SECOND, SCOUT_AT_SUPPLY
+from core.utilities.geometry import distance_to_route
 
 if TYPE_CHECKING:
     from sc2.bot_ai import BotAI
@@ -16,6 +18,15 @@ if TYPE_CHECKING:
     from core.event_bus import EventBus
     from core.frame_plan import FramePlan
 
+# --- Tunable Scouting Constants ---
+# The scout heads for the next waypoint of its route once this close.
+WAYPOINT_REACHED_DISTANCE = 3
+# The route to the scouting target is reused while the scout stays within
+# this distance of it...
+SCOUT_ROUTE_TOLERANCE = 6
+# ...for at most this long, so it still bends around new threats.
+SCOUT_REPLAN_SECONDS = 5
+
 KEY_ENEMY_TECH_STRUCTURES: Set[UnitTypeId] = {
     UnitTypeId.SPAWNINGPOOL,
     UnitTypeId.ROACHWARREN,
@@ -47,6 +58,12 @@ class ScoutingManager(Manager):
         self.scout_tag: int | None = None
         self._scouting_plan: List[tuple[float, float]] = []
         self._known_enemy_tech: Set[UnitTypeId] = set()
+        # Waypoints to the current scouting target, the point the scout left
+        # for the first of them, the target, and the game loop it was planned.
+        self._route: List[Point2] = []
+        self._route_from: Point2 | None = None
+        self._route_target: Point2 | None = None
+        self._route_planned_at: int = 0
 
     async def execute(
         self, cache: "GlobalCache", plan: "FramePlan", bus: "EventBus"
@@ -77,7 +94,45 @@ class ScoutingManager(Manager):
             if not self._scouting_plan:
                 return []
 
-        return [lambda s=scout, t=target_pos: s.move(t)]
+        waypoint = self._next_waypoint(scout, Point2(target_pos), cache)
+        return [lambda s=scout, t=waypoint: s.move(t)]
+
+    def _next_waypoint(
+        self, scout: "Unit", target: Point2, cache: "GlobalCache"
+    ) -> Point2:
+        """
+        Where the scout should move to reach `target` while keeping out of
+        enemy fire. The route is found again for a new target, when the scout
+        strays from it, or when it is old enough to miss new threats; the
+        threat maps change too often to re-plan on every change.
+        """
+        pathfinder = cache.pathfinder
+        if pathfinder is None:
+            return target
+
+        replan_loops = SCOUT_REPLAN_SECONDS * GAME_LOOPS_PER_SECOND
+        if (
+            target != self._route_target
+            or cache.game_loop - self._route_planned_at >= replan_loops
+            or (
+                self._route
+                and distance_to_route(scout.position, [self._route_from] + self._route)
+                > SCOUT_ROUTE_TOLERANCE
+            )
+        ):
+            self._route = pathfinder.find_path(
+                scout.position, target, air=scout.is_flying
+            )
+            self._route_from = scout.position
+            self._route_target = target
+            self._route_planned_at = cache.game_loop
+        while len(self._route) > 1 and (
+            scout.distance_to(self._route[0]) < WAYPOINT_REACHED_DISTANCE
+        ):
+            self._route_from = self._route.pop(0)
+        # No route means the target cannot be reached safely on this layer;
+        # head straight for it and let the game's pathing sort it out.
+        return self._route[0] if self._route else target
 
     def _assign_new_scout(self, cache: "GlobalCache"):
         """Selects and assigns the best available unit to be the scout."""
@@ -101,9 +156,9 @@ class ScoutingManager(Manager):
         """Creates a list of points for the scout to visit."""
         enemy_start = self.bot.enemy_start_locations[0]
 
-        expansion_locations = sorted(
-            self.bot.expansion_locations_list,
-            key=lambda loc: loc.distance_to(enemy_start),
+        # Scout the bases the enemy can walk to soonest first.
+        expansion_locations = cache.ground_distance.sorted_by_distance(
+            enemy_start, self.bot.expansion_locations_list
         )
 
         self._scouting_plan = [enemy_start] + expansion_locations
@@ -1,11 +1,14 @@
 # terran/tactics/squad.py
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Optional
 
+import numpy as np
+from sc2.position import Point2
+
 if TYPE_CHECKING:
-    from sc2.position import Point2
+    from sc2.unit import Unit
     from sc2.units import Units
 
 
@@ -22,6 +25,50 @@ class SquadObjective(Enum):
     IDLE = auto()  # No current objective; gather at a rally point.
 
 
+@dataclass(frozen=True)
+class SquadGeometry:
+    """
+    Where a squad stands this frame, worked out once from its position array.
+    """
+
+    size: int
+    center: "Point2"
+    # Root mean square distance of the units from the center.
+    spread: float
+    # Distance from the center to the furthest unit.
+    radius: float
+    # Center weighted by each unit's health and shields.
+    health_center: "Point2"
+    # The unit closest to the squad's target; None without a target.
+    front: Optional["Unit"] = None
+
+    @classmethod
+    def of(cls, units: "Units", target: Optional["Point2"] = None) -> "SquadGeometry":
+        """Measures a non-empty group of units."""
+        positions = np.array([unit.position for unit in units], dtype=float)
+        center = positions.mean(axis=0)
+        offsets = positions - center
+        squared = (offsets**2).sum(axis=1)
+        health = np.array([unit.health + unit.shield for unit in units], dtype=float)
+        health_center = (
+            (positions * health[:, None]).sum(axis=0) / health.sum()
+            if health.sum() > 0
+            else center
+        )
+        front = None
+        if target is not None:
+            to_target = positions - np.array(target, dtype=float)
+            front = units[int((to_target**2).sum(axis=1).argmin())]
+        return cls(
+            size=len(positions),
+            center=Point2((float(center[0]), float(center[1]))),
+            spread=float(np.sqrt(squared.mean())),
+            radius=float(np.sqrt(squared.max())),
+            health_center=Point2((float(health_center[0]), float(health_center[1]))),
+            front=front,
+        )
+
+
 @dataclass
 class Squad:
     """
@@ -30,22 +77,40 @@ class Squad:
     This is a stateful object that allows the TacticalDirector and
     ArmyControlManager to issue high-level commands to a specific group of
     units without needing to manage them individually.
+
+    The squad's geometry is measured on first use and kept until its units
+    or target change, which must be followed by `invalidate_geometry`.
     """
 
     id: str
     units: "Units"
     objective: SquadObjective = SquadObjective.IDLE
     target: Optional["Point2"] = None
+    _geometry: Optional[SquadGeometry] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def tags(self) -> set[int]:
         """Returns a set of all unit tags within this squad."""
         return self.units.tags
 
+    @property
+    def geometry(self) -> Optional[SquadGeometry]:
+        """Returns the squad's cached geometry, or None if it has no units."""
+        if self._geometry is None and self.units.exists:
+            self._geometry = SquadGeometry.of(self.units, self.target)
+        return self._geometry
+
+    def invalidate_geometry(self):
+        """Drops the cached geometry after the units or target changed."""
+        self._geometry = None
+
     @property
     def center(self) -> "Point2" | None:
         """Returns the geometric center of the squad's units."""
-        return self.units.center if self.units.exists else None
+        geometry = self.geometry
+        return geometry.center if geometry is not None else None
 
     @property
     def is_empty(self) -> bool:
@@ -0,0 +1,190 @@
+# terran/tactics/squad_clustering.py
+from __future__ import annotations
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+from sc2.position import Point2
+
+if TYPE_CHECKING:
+    from sc2.unit import Unit
+
+# --- Tunable Clustering Constants ---
+# Units at most this far apart are neighbours.
+CLUSTER_RADIUS = 8.0
+# A unit with this many neighbours, itself included, anchors a squad. Units
+# near an anchor join its squad; units near none form a squad of their own.
+MIN_ANCHOR_NEIGHBOURS = 3
+SQUAD_ID_PREFIX = "group"
+
+# A cell and the neighbours "after" it, so every pair of cells is visited once.
+_FORWARD_CELLS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+@dataclass
+class SquadCluster:
+    """A group of units that are together, with its geometry worked out once."""
+
+    id: str
+    units: List["Unit"]
+    center: Point2
+    # Distance from the center to the furthest unit.
+    radius: float
+
+
+class SquadClusterer:
+    """
+    The Adjutant. Sorts units into squads by where they stand, every frame.
+
+    Squads are found with DBSCAN on a grid of CLUSTER_RADIUS cells: only
+    units in the same or adjacent cells can be neighbours, so the cost grows
+    with the army rather than with its square. Squads keep their ids across
+    frames by tag overlap: each squad takes the id of the previous squad it
+    shares the most units with, so merged squads keep the id of the bigger
+    part and split squads hand theirs to the bigger half.
+    """
+
+    def __init__(
+        self,
+        radius: float = CLUSTER_RADIUS,
+        min_neighbours: int = MIN_ANCHOR_NEIGHBOURS,
+    ):
+        self.radius = radius
+        self.min_neighbours = min_neighbours
+        self._previous: Dict[str, Set[int]] = {}
+        self._next_id = 0
+
+    def cluster(self, units: Sequence["Unit"]) -> List[SquadCluster]:
+        """Groups `units` into squads, reusing the ids of the last call."""
+        if not units:
+            self._previous = {}
+            return []
+
+        points = np.array([unit.position for unit in units], dtype=float)
+        labels = grid_dbscan(points, self.radius, self.min_neighbours)
+        count = labels.max() + 1
+
+        sizes = np.bincount(labels, minlength=count)
+        centers = (
+            np.stack(
+                [
+                    np.bincount(labels, weights=points[:, 0], minlength=count),
+                    np.bincount(labels, weights=points[:, 1], minlength=count),
+                ],
+                axis=1,
+            )
+            / sizes[:, None]
+        )
+        offsets = points - centers[labels]
+        radii = np.zeros(count)
+        np.maximum.at(radii, labels, np.sqrt((offsets**2).sum(axis=1)))
+
+        members: List[List["Unit"]] = [[] for _ in range(count)]
+        for unit, label in zip(units, labels.tolist()):
+            members[label].append(unit)
+        ids = self._assign_ids(members)
+
+        self._previous = {
+            squad_id: {unit.tag for unit in group}
+            for squad_id, group in zip(ids, members)
+        }
+        return [
+            SquadCluster(
+                id=squad_id,
+                units=group,
+                center=Point2((float(x), float(y))),
+                radius=float(radius),
+            )
+            for squad_id, group, (x, y), radius in zip(ids, members, centers, radii)
+        ]
+
+    def _assign_ids(self, members: List[List["Unit"]]) -> List[str]:
+        """Gives each group the id of the previous squad it overlaps most."""
+        id_of_tag = {
+            tag: squad_id for squad_id, tags in self._previous.items() for tag in tags
+        }
+        ids: List[str] = [""] * len(members)
+        taken: Set[str] = set()
+        # Bigger groups choose first.
+        for index in sorted(range(len(members)), key=lambda i: -len(members[i])):
+            overlap = Counter(
+                id_of_tag[unit.tag] for unit in members[index] if unit.tag in id_of_tag
+            )
+            for squad_id, _ in overlap.most_common():
+                if squad_id not in taken:
+                    ids[index] = squad_id
+                    break
+            else:
+                ids[index] = f"{SQUAD_ID_PREFIX}_{self._next_id}"
+                self._next_id += 1
+            taken.add(ids[index])
+        return ids
+
+
+def grid_dbscan(points: np.ndarray, radius: float, min_neighbours: int) -> np.ndarray:
+    """
+    DBSCAN over a grid of `radius` cells.
+
+    :param points: (n, 2) positions.
+    :return: A cluster label from 0 for every point. Points that are no
+        cluster's neighbour get a label of their own.
+    """
+    first, second = _neighbour_pairs(points, radius)
+    count = len(points)
+    neighbours = 1 + np.bincount(first, minlength=count)
+    neighbours += np.bincount(second, minlength=count)
+    anchor = neighbours >= min_neighbours
+
+    parent = list(range(count))
+
+    def root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    linked = anchor[first] & anchor[second]
+    for i, j in zip(first[linked].tolist(), second[linked].tolist()):
+        root_i, root_j = root(i), root(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    # Units near an anchor join its cluster.
+    joined = [False] * count
+    for i, j in zip(first[~linked].tolist(), second[~linked].tolist()):
+        if anchor[i] and not anchor[j] and not joined[j]:
+            parent[j], joined[j] = root(i), True
+        elif anchor[j] and not anchor[i] and not joined[i]:
+            parent[i], joined[i] = root(j), True
+
+    roots = np.array([root(i) for i in range(count)])
+    return np.unique(roots, return_inverse=True)[1].reshape(-1)
+
+
+def _neighbour_pairs(
+    points: np.ndarray, radius: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Index pairs (i, j), i != j, of points at most `radius` apart, each once."""
+    cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for index, cell in enumerate(np.floor(points / radius).astype(int).tolist()):
+        cells[tuple(cell)].append(index)
+    cell_members = {cell: np.array(indices) for cell, indices in cells.items()}
+
+    firsts, seconds = [], []
+    for (x, y), here in cell_members.items():
+        for dx, dy in _FORWARD_CELLS:
+            there = cell_members.get((x + dx, y + dy))
+            if there is None:
+                continue
+            offsets = points[here][:, None, :] - points[there][None, :, :]
+            close = (offsets**2).sum(axis=2) <= radius * radius
+            if dx == 0 and dy == 0:
+                close = np.triu(close, k=1)
+            i, j = np.nonzero(close)
+            firsts.append(here[i])
+            seconds.append(there[j])
+    if not firsts:
+        empty = np.array([], dtype=int)
+        return empty, empty
+    return np.concatenate(firsts), np.concatenate(seconds)
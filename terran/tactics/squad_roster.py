@@ -0,0 +1,77 @@
+# terran/tactics/squad_roster.py
+from __future__ import annotations
+from typing import TYPE_CHECKING, AbstractSet, Dict, Iterable, Optional, Set
+
+if TYPE_CHECKING:
+    from core.utilities.events import Event, UnitDestroyedPayload
+
+_NO_TAGS: AbstractSet[int] = frozenset()
+
+
+class SquadRoster:
+    """
+    The Muster Roll. Knows which squad every army unit was assigned to.
+
+    Membership is kept in both directions, tag -> squad and squad -> tags,
+    and updated only when something changes: a unit is assigned, moved
+    between squads, or destroyed. Looking up a unit's squad, moving it and
+    listing a squad's tags therefore cost the same however big the army
+    and however many squads there are, and a unit can never be in two
+    squads, or twice in one.
+    """
+
+    def __init__(self):
+        self._squad_of: Dict[int, str] = {}
+        self._members: Dict[str, Set[int]] = {}
+
+    def __contains__(self, tag: int) -> bool:
+        return tag in self._squad_of
+
+    def __len__(self) -> int:
+        return len(self._squad_of)
+
+    def squad_of(self, tag: int) -> Optional[str]:
+        """The id of the squad the unit belongs to, or None."""
+        return self._squad_of.get(tag)
+
+    def tags(self, squad_id: str) -> AbstractSet[int]:
+        """The tags of a squad's units. Read-only; empty for unknown squads."""
+        return self._members.get(squad_id, _NO_TAGS)
+
+    def assign(self, tags: Iterable[int], squad_id: str):
+        """Puts units in a squad, taking them out of any other first."""
+        members = self._members.setdefault(squad_id, set())
+        for tag in tags:
+            previous = self._squad_of.get(tag)
+            if previous == squad_id:
+                continue
+            if previous is not None:
+                self._leave(tag, previous)
+            self._squad_of[tag] = squad_id
+            members.add(tag)
+
+    def release(self, tags: Iterable[int]):
+        """Takes units out of whatever squad they are in."""
+        for tag in tags:
+            squad_id = self._squad_of.pop(tag, None)
+            if squad_id is not None:
+                self._leave(tag, squad_id)
+
+    def dissolve(self, squad_id: str) -> AbstractSet[int]:
+        """Removes a squad, releasing its units. Returns their tags."""
+        members = self._members.pop(squad_id, set())
+        for tag in members:
+            del self._squad_of[tag]
+        return members
+
+    async def handle_unit_destroyed(self, event: "Event"):
+        """Event handler that drops a killed unit from its squad."""
+        payload: "UnitDestroyedPayload" = event.payload
+        self.release((payload.unit_tag,))
+
+    def _leave(self, tag: int, squad_id: str):
+        """Drops a tag from the squad's side of the index."""
+        members = self._members[squad_id]
+        members.discard(tag)
+        if not members:
+            del self._members[squad_id]
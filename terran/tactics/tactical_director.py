@@ -6,6 +6,7 @@ from core.frame_plan import ArmyStance
 from core.interfaces.director_abc import Director
 from core.interfaces.manager_abc import Manager
 from core.types import CommandFunctor
+from core.utilities.unit_types import WORKER_TYPES
 from .scouting_manager import ScoutingManager
 from .positioning_manager import PositioningManager
 from .army_control_manager import ArmyControlManager
@@ -20,6 +21,15 @@ if TYPE_CHECKING:
 # Launch a major attack when the bot reaches this supply count.
 PRIMARY_ATTACK_SUPPLY_TRIGGER = 140
 
+# --- Engagement Decision Constants ---
+# Go on the attack when the simulated fight against the visible enemy army
+# is won with at least this share of our army's health left...
+ATTACK_SURVIVAL_THRESHOLD = 0.35
+# ...and fall back once it would leave less than this.
+RETREAT_SURVIVAL_THRESHOLD = 0.1
+# With no enemy army in sight, attack with at least this much army value.
+UNOPPOSED_ATTACK_ARMY_VALUE = 1500
+
 
 class TacticalDirector(Director):
     def __init__(self, bot: "BotAI"):
@@ -59,23 +69,30 @@ class TacticalDirector(Director):
         # --- Reactive Stance Logic ---
         else:
             is_currently_aggressive = plan.army_stance == ArmyStance.AGGRESSIVE
-            # Be more willing to attack
-            go_aggressive_threshold = cache.enemy_army_value * 1.35
-            # Fall back if we are losing the advantage
-            go_defensive_threshold = cache.enemy_army_value * 1.1
+            enemy_army = cache.enemy_units.exclude_type(WORKER_TYPES)
+            prediction = cache.combat_simulator.predict(
+                cache.friendly_army_units, enemy_army
+            )
 
             stance = plan.army_stance
             if is_currently_aggressive:
-                if cache.friendly_army_value < go_defensive_threshold:
-                    stance = ArmyStance.DEFENSIVE
-            else:  # Defensive
-                no_known_enemy_army = (
-                    cache.enemy_army_value == 0 and cache.friendly_army_value > 1500
-                )
+                # Fall back if we are losing the advantage
                 if (
-                    cache.friendly_army_value > go_aggressive_threshold
-                    or no_known_enemy_army
+                    not prediction.friendly_wins
+                    or prediction.friendly_survival < RETREAT_SURVIVAL_THRESHOLD
                 ):
+                    stance = ArmyStance.DEFENSIVE
+            else:  # Defensive
+                if not enemy_army:
+                    go_aggressive = (
+                        cache.friendly_army_value > UNOPPOSED_ATTACK_ARMY_VALUE
+                    )
+                else:
+                    go_aggressive = (
+                        prediction.friendly_wins
+                        and prediction.friendly_survival >= ATTACK_SURVIVAL_THRESHOLD
+                    )
+                if go_aggressive:
                     stance = ArmyStance.AGGRESSIVE
 
             plan.set_army_stance(stance)
@@ -83,12 +100,12 @@ class TacticalDirector(Director):
         # --- Target Selection ---
         if plan.army_stance == ArmyStance.AGGRESSIVE:
             if cache.known_enemy_townhalls.exists:
-                target = cache.known_enemy_townhalls.closest_to(
-                    self.bot.start_location
+                target = cache.ground_distance.closest_to(
+                    self.bot.start_location, cache.known_enemy_townhalls
                 ).position
             elif cache.known_enemy_structures.exists:
-                target = cache.known_enemy_structures.closest_to(
-                    self.bot.enemy_start_locations[0]
+                target = cache.ground_distance.closest_to(
+                    self.bot.enemy_start_locations[0], cache.known_enemy_structures
                 ).position
             else:
                 target = self.bot.enemy_start_locations[0]
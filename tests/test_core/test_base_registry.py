@@ -0,0 +1,128 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+
+from core.utilities.base_registry import BaseRegistry
+from core.utilities.events import (
+    ConstructionStartedPayload,
+    Event,
+    EventType,
+    UnitDestroyedPayload,
+)
+
+MAIN = Point2((50.5, 50.5))
+NATURAL = Point2((80.5, 50.5))
+
+
+def create_resource(tag: int, type_id: UnitTypeId, position: Point2) -> MagicMock:
+    resource = MagicMock()
+    resource.tag = tag
+    resource.type_id = type_id
+    resource.position = position
+    resource.distance_to = lambda p: position.distance_to(p)
+    return resource
+
+
+def create_expansion(first_tag: int, location: Point2):
+    """Eight patches at increasing distance and two geysers."""
+    minerals = [
+        create_resource(
+            first_tag + i, UnitTypeId.MINERALFIELD, location.offset((i - 4, 6 + i % 2))
+        )
+        for i in range(8)
+    ]
+    geysers = [
+        create_resource(
+            first_tag + 8, UnitTypeId.VESPENEGEYSER, location.offset((-7, 0))
+        ),
+        create_resource(
+            first_tag + 9, UnitTypeId.VESPENEGEYSER, location.offset((7, 0))
+        ),
+    ]
+    return minerals + geysers
+
+
+def create_bot():
+    bot = MagicMock()
+    main, natural = create_expansion(100, MAIN), create_expansion(200, NATURAL)
+    bot.expansion_locations_dict = {MAIN: main, NATURAL: natural}
+    bot.resources = main + natural
+    townhall = MagicMock()
+    townhall.tag, townhall.position = 1, MAIN
+    bot.townhalls = [townhall]
+    bot.is_visible.return_value = True
+    return bot
+
+
+class TestBaseRegistry(unittest.TestCase):
+    """Tests the per-expansion resource index."""
+
+    def setUp(self):
+        self.bot = create_bot()
+        self.registry = BaseRegistry()
+        self.registry.build(self.bot)
+
+    def test_indexes_resources_per_base_and_claims_the_start(self):
+        main = self.registry.base_of_townhall(1)
+
+        self.assertIs(main, self.registry.base_at(MAIN))
+        self.assertEqual(len(main.mineral_tags), 8)
+        self.assertEqual(main.geyser_tags, [108, 109])
+        self.assertEqual([b.location for b in self.registry.owned_bases()], [MAIN])
+
+    def test_mineral_fields_are_ranked_by_distance(self):
+        fields = self.registry.mineral_fields(self.registry.base_at(MAIN))
+
+        distances = [f.distance_to(MAIN) for f in fields]
+        self.assertEqual(distances, sorted(distances))
+
+    def test_ownership_follows_construction_and_destruction(self):
+        started = ConstructionStartedPayload(
+            unit_tag=2, unit_type=UnitTypeId.COMMANDCENTER, position=NATURAL
+        )
+        asyncio.run(
+            self.registry.handle_construction_started(
+                Event(EventType.INFRA_CONSTRUCTION_STARTED, started)
+            )
+        )
+        self.assertEqual(self.registry.base_of_townhall(2).location, NATURAL)
+
+        destroyed = UnitDestroyedPayload(2, UnitTypeId.COMMANDCENTER, NATURAL)
+        asyncio.run(
+            self.registry.handle_unit_destroyed(
+                Event(EventType.UNIT_DESTROYED, destroyed)
+            )
+        )
+        self.assertIsNone(self.registry.base_of_townhall(2))
+        self.assertFalse(self.registry.base_at(NATURAL).is_owned)
+
+    def test_refresh_drops_mined_out_patches_only_when_visible(self):
+        self.bot.resources = [r for r in self.bot.resources if r.tag not in (100, 200)]
+        self.bot.is_visible.side_effect = lambda p: p.distance_to(MAIN) < 20
+
+        self.registry.refresh(self.bot)
+
+        self.assertNotIn(100, self.registry.base_at(MAIN).mineral_tags)
+        # The natural's patch is merely out of sight.
+        self.assertIn(200, self.registry.base_at(NATURAL).mineral_tags)
+        self.assertEqual(
+            len(self.registry.mineral_fields(self.registry.base_at(NATURAL))), 7
+        )
+
+    def test_enemy_townhalls_mark_their_expansions_as_taken(self):
+        enemy = MagicMock()
+        enemy.tag, enemy.position = 9, NATURAL.offset((0.5, 0))
+
+        self.registry.mark_enemy_townhalls([enemy])
+        self.assertEqual(self.registry.base_at(NATURAL).enemy_townhall_tag, 9)
+        self.assertEqual(self.registry.free_bases(), [])
+
+        self.registry.mark_enemy_townhalls([])
+        self.assertEqual([b.location for b in self.registry.free_bases()], [NATURAL])
+
+
+if __name__ == "__main__":
+    unittest.main()
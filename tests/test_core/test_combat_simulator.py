@@ -0,0 +1,108 @@
+import math
+import unittest
+from types import SimpleNamespace
+
+from sc2.ids.unit_typeid import UnitTypeId
+
+from core.utilities.combat_simulator import CombatSimulator
+from core.utilities.weapon_table import WeaponTable
+from tests.test_core.test_weapon_table import fake_game_data
+
+U = UnitTypeId
+HEALTH = {U.MARINE: 45, U.MARAUDER: 125, U.SIEGETANK: 175, U.ZERGLING: 35}
+HEALTH.update({U.ROACH: 145, U.MUTALISK: 120, U.MEDIVAC: 150})
+
+
+def army(type_id, count, attack_level=0, armor_level=0):
+    return [
+        SimpleNamespace(
+            type_id=type_id,
+            is_flying=type_id in {U.MUTALISK, U.MEDIVAC},
+            attack_upgrade_level=attack_level,
+            armor_upgrade_level=armor_level,
+            health=HEALTH[type_id],
+            shield=0,
+        )
+        for _ in range(count)
+    ]
+
+
+def scripted_fight(count_a, count_b, dps, health, step=0.001):
+    """Plays out a fight of identical units in small time steps."""
+    a, b, t = count_a * health, count_b * health, 0.0
+    while a > 0 and b > 0:
+        a, b = a - dps * b / health * step, b - dps * a / health * step
+        t += step
+    return max(a, 0) / (count_a * health), max(b, 0) / (count_b * health), t
+
+
+class TestCombatSimulator(unittest.TestCase):
+    """Tests fight predictions against scripted scenarios."""
+
+    def setUp(self):
+        self.simulator = CombatSimulator(WeaponTable(fake_game_data()))
+
+    def test_matches_a_scripted_fight_of_identical_units(self):
+        prediction = self.simulator.predict(army(U.MARINE, 20), army(U.MARINE, 10))
+        survival, _, duration = scripted_fight(20, 10, 6 / 0.61, 45)
+
+        self.assertTrue(prediction.friendly_wins)
+        # Square law: sqrt(20^2 - 10^2) of 20 marines are left.
+        self.assertAlmostEqual(prediction.friendly_survival, math.sqrt(0.75))
+        self.assertAlmostEqual(prediction.friendly_survival, survival, places=2)
+        self.assertAlmostEqual(prediction.time_to_kill, duration, delta=0.05)
+        self.assertEqual(prediction.friendly_survivors, {U.MARINE: 17})
+        self.assertEqual(prediction.enemy_survivors, {})
+
+    def test_mirror_matches_are_not_won_and_upgrades_tip_them(self):
+        even = self.simulator.predict(army(U.MARINE, 10), army(U.MARINE, 10))
+        upgraded = self.simulator.predict(
+            army(U.MARINE, 10, attack_level=1), army(U.MARINE, 10)
+        )
+        armored = self.simulator.predict(
+            army(U.MARINE, 10), army(U.MARINE, 10, armor_level=1)
+        )
+
+        self.assertFalse(even.friendly_wins)
+        self.assertEqual(even.enemy_survival, 0)
+        self.assertTrue(upgraded.friendly_wins)
+        self.assertFalse(armored.friendly_wins)
+        self.assertGreater(armored.enemy_survival, 0)
+
+    def test_bonus_damage_decides_the_matchup(self):
+        # Marauders deal bonus damage to armored roaches, but not zerglings.
+        versus_roaches = self.simulator.predict(army(U.MARAUDER, 8), army(U.ROACH, 8))
+        versus_zerglings = self.simulator.predict(
+            army(U.MARAUDER, 8), army(U.ZERGLING, 40)
+        )
+
+        self.assertTrue(versus_roaches.friendly_wins)
+        self.assertFalse(versus_zerglings.friendly_wins)
+
+    def test_cannot_win_against_what_it_cannot_hit(self):
+        prediction = self.simulator.predict(army(U.SIEGETANK, 10), army(U.MUTALISK, 2))
+
+        self.assertFalse(prediction.friendly_wins)
+        self.assertEqual(prediction.enemy_survival, 1)
+        self.assertEqual(prediction.enemy_survivors, {U.MUTALISK: 2})
+
+    def test_units_out_of_the_fight_survive_it(self):
+        # Zerglings cannot touch medivacs, and medivacs do not shoot.
+        prediction = self.simulator.predict(
+            army(U.MARINE, 10) + army(U.MEDIVAC, 2), army(U.ZERGLING, 4)
+        )
+
+        self.assertTrue(prediction.friendly_wins)
+        self.assertEqual(prediction.friendly_survivors[U.MEDIVAC], 2)
+        self.assertGreater(prediction.friendly_survival, 0.9)
+
+    def test_nothing_to_fight_is_an_immediate_win(self):
+        prediction = self.simulator.predict(army(U.MARINE, 3), [])
+
+        self.assertTrue(prediction.friendly_wins)
+        self.assertEqual(prediction.friendly_survival, 1)
+        self.assertEqual(prediction.time_to_kill, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -209,6 +209,9 @@ class TestAnalysisTasks(unittest.TestCase):
     def test_threat_map_analyzer(self):
         # Arrange
         self.mock_bot.game_info.map_size = (100, 100)
+        self.mock_bot.game_info.pathing_grid.data_numpy = np.ones(
+            (100, 100), dtype=np.uint8
+        )
         enemy_marine = create_mock_unit(UnitTypeId.MARINE, position=(50, 50))
         enemy_marine.radius = 0.5
         self.mock_bot.enemy_units = Units([enemy_marine], self.mock_bot)
@@ -224,6 +227,33 @@ class TestAnalysisTasks(unittest.TestCase):
         self.assertGreater(self.analyzer.threat_map[50, 50], 0)
         # Threat should be zero far away from the marine
         self.assertEqual(self.analyzer.threat_map[10, 10], 0)
+        # The retreat field leads away from the marine
+        direction = self.analyzer.retreat_field.directions([Point2((55, 50))])[0]
+        self.assertGreater(direction[0], 0)
+
+    def test_threat_map_version_changes_only_with_the_maps(self):
+        # Arrange
+        self.mock_bot.game_info.map_size = (100, 100)
+        self.mock_bot.game_info.pathing_grid.data_numpy = np.ones(
+            (100, 100), dtype=np.uint8
+        )
+        enemy_marine = create_mock_unit(UnitTypeId.MARINE, position=(50, 50))
+        enemy_marine.radius = 0.5
+        self.mock_bot.enemy_units = Units([enemy_marine], self.mock_bot)
+        task = ThreatMapAnalyzer()
+        task.execute(self.analyzer, self.mock_bot)
+        version = self.analyzer.threat_map_version
+
+        # Act: the marine stands still, then moves.
+        task.execute(self.analyzer, self.mock_bot)
+        unchanged_version = self.analyzer.threat_map_version
+        enemy_marine.position = Point2((60, 50))
+        task.execute(self.analyzer, self.mock_bot)
+
+        # Assert
+        self.assertEqual(unchanged_version, version)
+        self.assertEqual(self.analyzer.threat_map_version, version + 1)
+        self.assertGreater(self.analyzer.threat_map[60, 50], 0)
 
 
 class TestUnitsAnalyzerEvents(unittest.IsolatedAsyncioTestCase):
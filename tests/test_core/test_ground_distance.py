@@ -0,0 +1,137 @@
+import math
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+from sc2.position import Point2
+
+from core.utilities import ground_distance
+from core.utilities.ground_distance import GroundDistanceOracle, compute_distance_fields
+
+
+def walled_grid(size=40):
+    """Open ground split by a wall at x = 20, with a gap at the top."""
+    pathable = np.ones((size, size), bool)
+    pathable[20, : size - 4] = False
+    return pathable
+
+
+class TestComputeDistanceFields(unittest.TestCase):
+    """Tests the ground distances grown from each location."""
+
+    def test_open_ground_matches_octile_distance(self):
+        (field,) = compute_distance_fields(
+            np.ones((20, 20), bool), [Point2((2.5, 2.5))]
+        )
+
+        self.assertEqual(field[2, 2], 0)
+        self.assertAlmostEqual(float(field[12, 2]), 10)
+        self.assertAlmostEqual(float(field[7, 7]), 5 * math.sqrt(2), places=5)
+
+    def test_walks_around_walls(self):
+        (field,) = compute_distance_fields(walled_grid(), [Point2((10.5, 5.5))])
+
+        # Straight across the wall is 20; the walk goes round the gap.
+        self.assertGreater(float(field[30, 5]), 40)
+        self.assertTrue(np.isfinite(field[30, 5]))
+
+    def test_unreachable_cells_are_infinite(self):
+        pathable = np.ones((20, 20), bool)
+        pathable[10, :] = False
+        (field,) = compute_distance_fields(pathable, [Point2((2.5, 2.5))])
+
+        self.assertTrue(np.isinf(field[15, 15]))
+
+    def test_no_squeezing_between_wall_corners(self):
+        pathable = np.ones((10, 10), bool)
+        pathable[:5, 5] = False
+        pathable[5, :5] = False
+        pathable[5, 5] = True
+        pathable[4, 4] = True
+        pathable[6, 6] = True
+        # (4, 4) touches (5, 5) only diagonally, past two walls.
+        pathable[4, 5] = pathable[5, 4] = False
+        (field,) = compute_distance_fields(pathable, [Point2((1.5, 1.5))])
+
+        self.assertTrue(np.isinf(field[8, 8]))
+
+    def test_blocked_location_is_reached_from_around_it(self):
+        pathable = np.ones((20, 20), bool)
+        pathable[8:13, 8:13] = False  # A townhall on the location.
+        (field,) = compute_distance_fields(pathable, [Point2((10.5, 10.5))])
+
+        self.assertAlmostEqual(float(field[10, 14]), 4, places=5)
+        # The townhall's own cells are filled in from around it.
+        self.assertTrue(np.isfinite(field[10, 10]))
+
+
+class TestGroundDistanceOracle(unittest.TestCase):
+    """Tests lookups against precomputed fields."""
+
+    def setUp(self):
+        self.oracle = GroundDistanceOracle()
+        self.home = Point2((10.5, 5.5))
+
+    def test_falls_back_to_straight_line_until_ready(self):
+        self.assertFalse(self.oracle.ready)
+        self.assertAlmostEqual(self.oracle.distance(self.home, Point2((30.5, 5.5))), 20)
+
+    def test_ground_distance_from_a_location(self):
+        self.oracle.build(walled_grid(), [self.home])
+
+        self.assertTrue(self.oracle.ready)
+        self.assertGreater(self.oracle.distance(self.home, Point2((30.5, 5.5))), 40)
+        # Positions near, but not at, the location share its field.
+        near = Point2((11.5, 6.5))
+        self.assertGreater(self.oracle.distance(near, Point2((30.5, 5.5))), 40)
+        # Other positions have no field.
+        self.assertAlmostEqual(
+            self.oracle.distance(Point2((30.5, 30.5)), Point2((30.5, 5.5))), 25
+        )
+
+    def test_closest_and_sorted_by_walking_distance(self):
+        self.oracle.build(walled_grid(), [self.home])
+        across = SimpleNamespace(position=Point2((22.5, 5.5)))
+        around = SimpleNamespace(position=Point2((10.5, 30.5)))
+
+        self.assertIs(self.oracle.closest_to(self.home, [across, around]), around)
+        self.assertEqual(
+            self.oracle.sorted_by_distance(self.home, [across, around]),
+            [around, across],
+        )
+
+    def test_start_computes_in_the_background_and_caches_to_disk(self):
+        bot = SimpleNamespace(
+            game_info=SimpleNamespace(
+                map_name="Walled",
+                pathing_grid=SimpleNamespace(data_numpy=walled_grid().T.astype(int)),
+            ),
+            start_location=self.home,
+            enemy_start_locations=[Point2((30.5, 5.5))],
+            expansion_locations_list=[self.home, Point2((30.5, 30.5))],
+        )
+        with tempfile.TemporaryDirectory() as directory, patch.object(
+            ground_distance, "DISTANCE_CACHE_DIR", Path(directory)
+        ):
+            self.oracle.start(bot)
+            self.assertTrue(self.oracle.wait(30))
+            self.oracle._thread.join(30)
+            self.assertEqual(len(list(Path(directory).glob("*.npz"))), 1)
+
+            cached = GroundDistanceOracle()
+            cached.start(bot)
+            self.assertTrue(cached.ready)
+            self.assertIsNone(cached._thread)
+
+        target = Point2((30.5, 5.5))
+        self.assertEqual(
+            cached.distance(self.home, target), self.oracle.distance(self.home, target)
+        )
+        self.assertGreater(cached.distance(self.home, target), 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
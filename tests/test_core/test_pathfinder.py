@@ -0,0 +1,148 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+from sc2.position import Point2
+
+from core.utilities.geometry import create_layered_threat_maps
+from core.utilities.pathfinder import Pathfinder
+
+
+def walled_grid(size=40):
+    """Open ground split by a wall at x = 20, with a gap at the top."""
+    pathable = np.ones((size, size), bool)
+    pathable[20, : size - 4] = False
+    return pathable
+
+
+def route_cells(pathfinder, start, route):
+    """Every cell a route crosses, sampled finely along its legs."""
+    cells = set()
+    for a, b in zip([start] + route, route):
+        for t in np.linspace(0, 1, int(a.distance_to(b) * 4) + 2):
+            cells.add((int(a.x + (b.x - a.x) * t), int(a.y + (b.y - a.y) * t)))
+    return cells
+
+
+class TestPathfinder(unittest.TestCase):
+    """Tests the threat-aware routes for ground and air units."""
+
+    def test_straight_line_when_nothing_is_in_the_way(self):
+        pathfinder = Pathfinder(np.ones((30, 30), bool))
+
+        route = pathfinder.find_path(Point2((2.5, 2.5)), Point2((25.2, 20.7)))
+
+        self.assertEqual(route, [Point2((25.2, 20.7))])
+
+    def test_ground_routes_go_around_walls(self):
+        pathfinder = Pathfinder(walled_grid())
+        start = Point2((10.5, 5.5))
+
+        route = pathfinder.find_path(start, Point2((30.5, 5.5)))
+
+        self.assertGreater(len(route), 1)
+        self.assertEqual(route[-1], Point2((30.5, 5.5)))
+        self.assertTrue(any(point.y >= 36 for point in route))
+        for x, y in route_cells(pathfinder, start, route):
+            self.assertTrue(walled_grid()[x, y], (x, y))
+
+    def test_air_routes_fly_over_walls(self):
+        pathfinder = Pathfinder(walled_grid())
+
+        route = pathfinder.find_path(Point2((10.5, 5.5)), Point2((30.5, 5.5)), air=True)
+
+        self.assertEqual(route, [Point2((30.5, 5.5))])
+
+    def test_unreachable_goals_have_no_route(self):
+        pathable = np.ones((20, 20), bool)
+        pathable[10, :] = False
+        pathfinder = Pathfinder(pathable)
+
+        self.assertEqual(pathfinder.find_path(Point2((2, 2)), Point2((15, 15))), [])
+
+    def test_routes_keep_clear_of_threats(self):
+        threat = np.zeros((40, 40), np.float32)
+        threat[15:25, 0:30] = 50
+        pathfinder = Pathfinder(np.ones((40, 40), bool))
+        pathfinder.update_threats(threat, None, 1)
+        start = Point2((5.5, 10.5))
+
+        route = pathfinder.find_path(start, Point2((35.5, 10.5)))
+
+        crossed = route_cells(pathfinder, start, route)
+        self.assertFalse(any(threat[x, y] for x, y in crossed))
+        # The air layer has no threats, so it still flies straight.
+        self.assertEqual(
+            pathfinder.find_path(start, Point2((35.5, 10.5)), air=True),
+            [Point2((35.5, 10.5))],
+        )
+
+    def test_routes_are_cached_per_threat_map_version(self):
+        pathfinder = Pathfinder(walled_grid())
+        start, goal = Point2((10.5, 5.5)), Point2((30.5, 5.5))
+
+        first = pathfinder.find_path(start, goal)
+        calls = []
+        pathfinder._astar = lambda *args: calls.append(args) or []
+        self.assertEqual(pathfinder.find_path(start, goal), first)
+        self.assertEqual(calls, [])
+
+        pathfinder.update_threats(None, None, 1)
+        self.assertEqual(pathfinder.find_path(start, goal), [])
+        self.assertEqual(len(calls), 1)
+
+    def test_batched_queries_search_each_cell_pair_once(self):
+        pathfinder = Pathfinder(walled_grid())
+        calls = []
+        search = pathfinder._astar
+        pathfinder._astar = lambda *args: calls.append(args) or search(*args)
+
+        routes = pathfinder.find_paths(
+            [
+                (Point2((10.2, 5.2)), Point2((30.5, 5.5))),
+                (Point2((10.8, 5.8)), Point2((30.5, 5.5))),
+                (Point2((12.5, 5.5)), Point2((30.5, 5.5))),
+            ]
+        )
+
+        self.assertEqual(len(routes), 3)
+        self.assertEqual(routes[0], routes[1])
+        self.assertEqual(len(calls), 2)
+
+    def test_unpathable_starts_snap_to_nearby_ground(self):
+        pathable = walled_grid()
+        pathable[8:13, 3:8] = False
+        pathfinder = Pathfinder(pathable)
+
+        route = pathfinder.find_path(Point2((10.5, 5.5)), Point2((30.5, 5.5)))
+
+        self.assertEqual(route[-1], Point2((30.5, 5.5)))
+
+
+class TestCreateLayeredThreatMaps(unittest.TestCase):
+    """Tests the split of enemy threat into ground and air layers."""
+
+    def test_enemies_only_threaten_what_they_can_shoot(self):
+        anti_ground = SimpleNamespace(
+            position=Point2((5, 5)),
+            radius=0.5,
+            can_attack_ground=True,
+            can_attack_air=False,
+        )
+        anti_air = SimpleNamespace(
+            position=Point2((25, 25)),
+            radius=0.5,
+            can_attack_ground=False,
+            can_attack_air=True,
+        )
+
+        ground, air = create_layered_threat_maps([anti_ground, anti_air], (30, 30))
+
+        self.assertGreater(ground[5, 5], 0)
+        self.assertEqual(ground[25, 25], 0)
+        self.assertGreater(air[25, 25], 0)
+        self.assertEqual(air[5, 5], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+
+from core.utilities.placement_grid import REJECTION_COOLDOWN_SECONDS, PlacementGrid
+
+
+def create_open_grid(width: int = 40, height: int = 40) -> PlacementGrid:
+    """Helper that returns a PlacementGrid seeded with a fully buildable area."""
+    grid = PlacementGrid(MagicMock())
+    grid.initialize_from_array(np.ones((width, height), dtype=bool))
+    return grid
+
+
+class TestPlacementGrid(unittest.TestCase):
+    """
+    Tests the local placement model: footprint bookkeeping and the
+    summed-area-table fit queries.
+    """
+
+    def test_can_fit_on_open_ground(self):
+        grid = create_open_grid()
+
+        self.assertTrue(grid.can_fit(UnitTypeId.SUPPLYDEPOT, Point2((10, 10))))
+        self.assertTrue(grid.can_fit(UnitTypeId.ENGINEERINGBAY, Point2((10.5, 10.5))))
+
+    def test_block_and_release_update_fit_queries(self):
+        grid = create_open_grid()
+        depot_spot = Point2((10, 10))
+
+        # Act: Occupy the spot, then free it again.
+        grid.block(depot_spot, (2, 2))
+        blocked = grid.can_fit(UnitTypeId.SUPPLYDEPOT, depot_spot)
+        grid.release(depot_spot, (2, 2))
+        released = grid.can_fit(UnitTypeId.SUPPLYDEPOT, depot_spot)
+
+        # Assert
+        self.assertFalse(blocked)
+        self.assertTrue(released)
+
+    def test_release_does_not_unblock_static_terrain(self):
+        buildable = np.ones((20, 20), dtype=bool)
+        buildable[9:11, 9:11] = False  # An unbuildable rock
+        grid = PlacementGrid(MagicMock())
+        grid.initialize_from_array(buildable)
+
+        grid.release(Point2((10, 10)), (2, 2))
+
+        self.assertFalse(grid.can_fit(UnitTypeId.SUPPLYDEPOT, Point2((10, 10))))
+
+    def test_production_structures_require_addon_clearance(self):
+        grid = create_open_grid()
+        barracks_spot = Point2((10.5, 10.5))
+        # The addon of a barracks at (10.5, 10.5) is centered at (13, 10).
+        grid.block(Point2((13, 10)), (2, 2))
+
+        self.assertFalse(grid.can_fit(UnitTypeId.BARRACKS, barracks_spot))
+        # An Engineering Bay has the same footprint but no addon.
+        self.assertTrue(grid.can_fit(UnitTypeId.ENGINEERINGBAY, barracks_spot))
+
+    def test_candidates_are_sorted_by_distance_and_valid(self):
+        grid = create_open_grid()
+        grid.block(Point2((20, 20)), (4, 4))
+        near = Point2((20, 20))
+
+        candidates = grid.candidates(UnitTypeId.SUPPLYDEPOT, near, max_distance=6)
+
+        self.assertTrue(candidates)
+        distances = [c.distance_to(near) for c in candidates]
+        self.assertEqual(distances, sorted(distances))
+        for candidate in candidates:
+            self.assertLessEqual(candidate.distance_to(near), 6)
+            self.assertTrue(grid.can_fit(UnitTypeId.SUPPLYDEPOT, candidate))
+
+    def test_candidates_never_fall_off_the_map(self):
+        grid = create_open_grid(10, 10)
+
+        candidates = grid.candidates(
+            UnitTypeId.COMMANDCENTER, Point2((0, 0)), max_distance=20
+        )
+
+        for candidate in candidates:
+            self.assertGreaterEqual(candidate.x - 2.5, 0)
+            self.assertLessEqual(candidate.x + 2.5, 10)
+            self.assertGreaterEqual(candidate.y - 2.5, 0)
+            self.assertLessEqual(candidate.y + 2.5, 10)
+
+
+class TestPlacementGridConfirmation(IsolatedAsyncioTestCase):
+    """Tests the engine confirmation fallback of find_placement."""
+
+    async def test_find_placement_returns_first_confirmed_candidate(self):
+        grid = create_open_grid()
+        grid.bot.can_place = AsyncMock(
+            side_effect=lambda t, ps: [False, True][: len(ps)]
+        )
+
+        position = await grid.find_placement(UnitTypeId.SUPPLYDEPOT, Point2((20, 20)))
+
+        grid.bot.can_place.assert_awaited_once()
+        self.assertEqual(position, grid.bot.can_place.await_args.args[1][1])
+
+    async def test_find_placement_skips_rejected_candidates_for_a_while(self):
+        grid = create_open_grid()
+        grid.bot.time = 100.0
+        grid.bot.can_place = AsyncMock(side_effect=lambda t, ps: [False] * len(ps))
+        near = Point2((20, 20))
+
+        first = await grid.find_placement(UnitTypeId.SUPPLYDEPOT, near)
+        rejected = grid.bot.can_place.await_args.args[1]
+        await grid.find_placement(UnitTypeId.SUPPLYDEPOT, near)
+        retried = grid.bot.can_place.await_args.args[1]
+
+        self.assertIsNone(first)
+        self.assertFalse(set(rejected) & set(retried))
+        # The rejection is not written into the grid itself.
+        for position in rejected:
+            self.assertTrue(grid.can_fit(UnitTypeId.SUPPLYDEPOT, position))
+
+    async def test_rejected_candidates_are_offered_again_after_the_cooldown(self):
+        grid = create_open_grid()
+        grid.bot.time = 100.0
+        grid.bot.can_place = AsyncMock(side_effect=lambda t, ps: [False] * len(ps))
+        near = Point2((20, 20))
+
+        await grid.find_placement(UnitTypeId.SUPPLYDEPOT, near)
+        rejected = grid.bot.can_place.await_args.args[1]
+        grid.bot.time += REJECTION_COOLDOWN_SECONDS + 1
+        await grid.find_placement(UnitTypeId.SUPPLYDEPOT, near)
+
+        self.assertEqual(grid.bot.can_place.await_args.args[1], rejected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import unittest
+from unittest.mock import MagicMock
+
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.ids.upgrade_id import UpgradeId
+
+from core.frame_plan import FramePlan
+from core.resource_ledger import BudgetCategory, ResourceLedger
+
+COSTS = {
+    UnitTypeId.SCV: (50, 0, 1),
+    UnitTypeId.MARINE: (50, 0, 1),
+    UnitTypeId.MARAUDER: (100, 25, 2),
+    UnitTypeId.COMMANDCENTER: (400, 0, 0),
+    UpgradeId.STIMPACK: (100, 100, 0),
+}
+
+
+def create_ledger(minerals: int, vespene: int = 0, supply_left: int = 200):
+    """Returns a ledger opened against a frame with the given bank."""
+    bot = MagicMock()
+
+    def calculate_cost(item):
+        cost = MagicMock()
+        cost.minerals, cost.vespene, _ = COSTS[item]
+        return cost
+
+    bot.calculate_cost.side_effect = calculate_cost
+    bot.calculate_supply_cost.side_effect = lambda item: COSTS[item][2]
+
+    cache = MagicMock()
+    cache.minerals, cache.vespene, cache.supply_left = minerals, vespene, supply_left
+    plan = FramePlan()
+    plan.set_budget(infrastructure=50, capabilities=50)
+
+    ledger = ResourceLedger(bot)
+    ledger.begin_frame(cache, plan)
+    return ledger, cache, plan
+
+
+class TestResourceLedger(unittest.TestCase):
+    """Tests the shared per-frame resource account."""
+
+    def test_reservations_are_cumulative(self):
+        ledger, _, _ = create_ledger(minerals=100)
+        ledger.close(BudgetCategory.INFRASTRUCTURE)
+
+        first = ledger.reserve(BudgetCategory.CAPABILITIES, UnitTypeId.MARINE)
+        second = ledger.reserve(BudgetCategory.CAPABILITIES, UnitTypeId.MARINE)
+        third = ledger.reserve(BudgetCategory.CAPABILITIES, UnitTypeId.MARINE)
+
+        self.assertTrue(first)
+        self.assertTrue(second)
+        self.assertFalse(third)
+
+    def test_budget_split_is_enforced_while_a_category_is_open(self):
+        ledger, _, _ = create_ledger(minerals=200)
+
+        # Capabilities may only take its 50% while infrastructure is spending.
+        self.assertTrue(ledger.reserve(BudgetCategory.CAPABILITIES, UnitTypeId.MARINE))
+        self.assertTrue(ledger.reserve(BudgetCategory.CAPABILITIES, UnitTypeId.MARINE))
+        self.assertFalse(ledger.reserve(BudgetCategory.CAPABILITIES, UnitTypeId.MARINE))
+        self.assertEqual(ledger.available(BudgetCategory.INFRASTRUCTURE).minerals, 100)
+
+    def test_closed_category_releases_its_unspent_share(self):
+        ledger, _, _ = create_ledger(minerals=200)
+        ledger.reserve(BudgetCategory.INFRASTRUCTURE, UnitTypeId.SCV)
+
+        ledger.close(BudgetCategory.INFRASTRUCTURE)
+
+        self.assertEqual(ledger.available(BudgetCategory.CAPABILITIES).minerals, 150)
+
+    def test_saving_category_keeps_its_share(self):
+        ledger, _, _ = create_ledger(minerals=300)
+        # Infrastructure wants a Command Center it cannot afford yet.
+        refused = ledger.reserve(
+            BudgetCategory.INFRASTRUCTURE, UnitTypeId.COMMANDCENTER
+        )
+
+        ledger.close(BudgetCategory.INFRASTRUCTURE)
+
+        self.assertFalse(refused)
+        self.assertEqual(ledger.available(BudgetCategory.CAPABILITIES).minerals, 150)
+
+    def test_supply_is_reserved_alongside_cost(self):
+        ledger, _, _ = create_ledger(minerals=1000, vespene=1000, supply_left=3)
+        ledger.close(BudgetCategory.INFRASTRUCTURE)
+
+        self.assertTrue(
+            ledger.reserve(BudgetCategory.CAPABILITIES, UnitTypeId.MARAUDER)
+        )
+        self.assertFalse(
+            ledger.reserve(BudgetCategory.CAPABILITIES, UnitTypeId.MARAUDER)
+        )
+        self.assertTrue(ledger.reserve(BudgetCategory.CAPABILITIES, UnitTypeId.MARINE))
+
+    def test_holds_persist_across_frames_until_released(self):
+        ledger, cache, plan = create_ledger(minerals=400)
+        self.assertTrue(ledger.hold("builder", BudgetCategory.INFRASTRUCTURE, 150))
+
+        # Next frame: the bank is unchanged because the builder is still walking.
+        ledger.begin_frame(cache, plan)
+        ledger.close(BudgetCategory.INFRASTRUCTURE)
+        held = ledger.available(BudgetCategory.CAPABILITIES).minerals
+        ledger.release("builder")
+        ledger.begin_frame(cache, plan)
+        ledger.close(BudgetCategory.INFRASTRUCTURE)
+        released = ledger.available(BudgetCategory.CAPABILITIES).minerals
+
+        self.assertEqual(held, 250)
+        self.assertEqual(released, 400)
+
+
+class TestSavingUnderTheBudgetSplit(unittest.TestCase):
+    """Tests saving up across frames while other categories keep spending."""
+
+    def setUp(self):
+        self.ledger, self.cache, self.plan = create_ledger(minerals=0)
+        self.plan.set_budget(infrastructure=30, capabilities=70)
+        self.marines = 0
+
+    def run_frame(self, wants_command_center: bool, income: int = 20) -> bool:
+        """
+        One frame of infrastructure asking for a Command Center and
+        capabilities training marines with everything it may spend.
+        :return: Whether the Command Center was paid for.
+        """
+        self.cache.minerals += income
+        self.ledger.begin_frame(self.cache, self.plan)
+        bought = wants_command_center and self.ledger.reserve(
+            BudgetCategory.INFRASTRUCTURE, UnitTypeId.COMMANDCENTER
+        )
+        self.ledger.close(BudgetCategory.INFRASTRUCTURE)
+        marines = 0
+        while self.ledger.reserve(BudgetCategory.CAPABILITIES, UnitTypeId.MARINE):
+            marines += 1
+        self.ledger.close(BudgetCategory.CAPABILITIES)
+        self.cache.minerals -= 50 * marines + (400 if bought else 0)
+        self.marines += marines
+        return bought
+
+    def test_saving_category_banks_its_share_of_the_income(self):
+        frames = next(frame for frame in range(1, 500) if self.run_frame(True))
+
+        # 30% of 20 minerals a frame pays for 400 minerals in ~67 frames;
+        # production keeps spending the other 70% meanwhile.
+        self.assertLess(frames, 80)
+        self.assertGreater(self.marines, 0.7 * 20 * frames / 50 - 2)
+
+    def test_savings_return_to_the_bank_when_saving_stops(self):
+        for _ in range(30):
+            self.run_frame(True)
+        before = self.marines
+
+        self.run_frame(False, income=0)
+        self.run_frame(False, income=0)
+
+        # Infrastructure's savings (~180 minerals) are spent on marines.
+        self.assertGreaterEqual(self.marines - before, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+from sc2.position import Point2
+
+from core.utilities.retreat_field import RetreatField
+
+
+def create_threat_map(enemy_x, enemy_y, size=40, radius=15):
+    """A cone of threat around one enemy, like create_threat_map builds."""
+    xs, ys = np.meshgrid(np.arange(size), np.arange(size), indexing="ij")
+    distance = np.hypot(xs - enemy_x, ys - enemy_y)
+    return np.clip(1 - distance / radius, 0, None).astype(np.float32) * 10
+
+
+class TestRetreatField(unittest.TestCase):
+    """Tests the safest-direction lookups derived from the threat map."""
+
+    def test_points_away_from_the_threat_on_open_ground(self):
+        field = RetreatField(create_threat_map(20, 20), np.ones((40, 40), bool))
+
+        directions = field.directions([Point2((24.5, 20.5)), Point2((20.5, 16.5))])
+
+        np.testing.assert_allclose(directions[0], [1, 0])
+        np.testing.assert_allclose(directions[1], [0, -1])
+
+    def test_retreat_slides_along_walls_instead_of_into_them(self):
+        pathable = np.ones((40, 40), bool)
+        pathable[26:, :] = False  # A cliff east of the unit.
+        field = RetreatField(create_threat_map(20, 20), pathable)
+
+        (point,) = field.retreat_points([Point2((24.5, 21.5))], 5)
+
+        self.assertLess(point.x, 26)
+        self.assertGreater(point.y, 21.5)
+        self.assertAlmostEqual(point.distance_to(Point2((24.5, 21.5))), 5)
+
+    def test_whole_groups_are_answered_at_once(self):
+        field = RetreatField(create_threat_map(20, 20), np.ones((40, 40), bool))
+        positions = [Point2((20.5 + dx, 25.5)) for dx in (-1, 0, 1)]
+
+        points = field.retreat_points(positions, 3)
+
+        self.assertEqual(len(points), 3)
+        for position, point in zip(positions, points):
+            self.assertGreater(point.y, position.y)
+
+    def test_no_way_out_where_nothing_threatens(self):
+        field = RetreatField(create_threat_map(5, 5, radius=3), np.ones((40, 40), bool))
+
+        self.assertEqual(field.retreat_points([Point2((30, 30))], 5), [None])
+        np.testing.assert_array_equal(field.directions([Point2((30, 30))]), [[0, 0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,293 @@
+import time
+import unittest
+from collections import Counter
+from types import SimpleNamespace
+
+from sc2.dicts.unit_research_abilities import RESEARCH_INFO
+from sc2.dicts.unit_train_build_abilities import TRAIN_INFO
+from sc2.ids.ability_id import AbilityId
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.ids.upgrade_id import UpgradeId
+from sc2.units import Units
+
+from core.utilities.unit_counts import UnitCounts
+from core.utilities.unit_types import TERRAN_PRODUCTION_TYPES, TOWNHALL_TYPES_TERRAN
+
+U = UnitTypeId
+BENCHMARK_FRAMES = 200
+
+
+def create_order(ability: AbilityId, progress: float = 0.5):
+    return SimpleNamespace(ability=SimpleNamespace(exact_id=ability), progress=progress)
+
+
+def train(producer: UnitTypeId, unit: UnitTypeId, progress: float = 0.5):
+    return create_order(TRAIN_INFO[producer][unit]["ability"], progress)
+
+
+def research(structure: UnitTypeId, upgrade: UpgradeId, progress: float = 0.5):
+    return create_order(RESEARCH_INFO[structure][upgrade]["ability"], progress)
+
+
+def create_unit(
+    type_id, is_ready=True, orders=(), has_reactor=False, is_structure=False
+):
+    return SimpleNamespace(
+        type_id=type_id,
+        is_ready=is_ready,
+        orders=list(orders),
+        has_reactor=has_reactor,
+        is_structure=is_structure,
+    )
+
+
+def midgame_units():
+    """A two-and-a-half base army with busy production, as one list."""
+    s = lambda *args, **kwargs: create_unit(*args, is_structure=True, **kwargs)
+    units = [create_unit(U.SCV) for _ in range(62)]
+    units += [
+        create_unit(U.SCV, orders=[train(U.SCV, U.SUPPLYDEPOT)]) for _ in range(3)
+    ]
+    units += [create_unit(U.SCV, orders=[train(U.SCV, U.BARRACKS)])]
+    units += [create_unit(U.MARINE) for _ in range(40)]
+    units += [create_unit(U.MARAUDER) for _ in range(12)]
+    units += [create_unit(U.MEDIVAC) for _ in range(6)]
+    units += [create_unit(U.SIEGETANKSIEGED) for _ in range(3)]
+    units += [
+        s(U.ORBITALCOMMAND, orders=[train(U.ORBITALCOMMAND, U.SCV)]),
+        s(U.ORBITALCOMMAND, orders=[train(U.ORBITALCOMMAND, U.SCV)]),
+        s(U.COMMANDCENTER, is_ready=False),
+    ]
+    for _ in range(3):
+        units += [
+            s(
+                U.BARRACKS,
+                orders=[train(U.BARRACKS, U.MARINE), train(U.BARRACKS, U.MARINE)],
+                has_reactor=True,
+            ),
+            s(U.BARRACKSREACTOR),
+        ]
+    units += [
+        s(U.BARRACKS, orders=[train(U.BARRACKS, U.MARAUDER)]),
+        s(
+            U.BARRACKSTECHLAB,
+            orders=[research(U.BARRACKSTECHLAB, UpgradeId.SHIELDWALL)],
+        ),
+        s(U.BARRACKS, is_ready=False),
+        s(U.FACTORY, orders=[train(U.FACTORY, U.SIEGETANK)]),
+        s(U.FACTORYTECHLAB),
+        s(U.STARPORT, orders=[create_order(AbilityId.BUILD_REACTOR_STARPORT)]),
+        s(U.STARPORTREACTOR, is_ready=False),
+        s(
+            U.ENGINEERINGBAY,
+            orders=[research(U.ENGINEERINGBAY, UpgradeId.TERRANINFANTRYWEAPONSLEVEL1)],
+        ),
+    ]
+    units += [s(U.SUPPLYDEPOTLOWERED) for _ in range(14)]
+    units += [s(U.SUPPLYDEPOT, is_ready=False) for _ in range(2)]
+    units += [s(U.REFINERY) for _ in range(4)]
+    return units
+
+
+class LegacyBot:
+    """
+    The counting the managers did before the census: `Units.of_type` scans
+    and a burnysc2-style `already_pending`, whose order histogram is cached
+    once per frame, and `already_pending_upgrade`, which scans structures.
+    """
+
+    CREATION_ABILITY = {
+        unit: info["ability"]
+        for trainer in TRAIN_INFO.values()
+        for unit, info in trainer.items()
+    }
+    RESEARCH_ABILITY = {
+        upgrade: info["ability"]
+        for researcher in RESEARCH_INFO.values()
+        for upgrade, info in researcher.items()
+    }
+
+    def __init__(self, units):
+        self.all_own_units = Units(units, None)
+        self.structures = self.all_own_units.filter(lambda u: u.is_structure)
+        self.upgrades = {UpgradeId.STIMPACK}
+        self._order_counts = None
+
+    def new_frame(self):
+        self._order_counts = None
+
+    def already_pending(self, unit_type: UnitTypeId) -> int:
+        if self._order_counts is None:
+            self._order_counts = Counter(
+                order.ability.exact_id
+                for unit in self.all_own_units
+                for order in unit.orders
+            )
+        ability = self.CREATION_ABILITY.get(unit_type)
+        return self._order_counts[ability]
+
+    def already_pending_upgrade(self, upgrade: UpgradeId) -> float:
+        if upgrade in self.upgrades:
+            return 1
+        ability = self.RESEARCH_ABILITY[upgrade]
+        for structure in self.structures.filter(lambda unit: unit.is_ready):
+            for order in structure.orders:
+                if order.ability.exact_id == ability:
+                    return order.progress
+        return 0
+
+
+TECH_TARGETS = [U.BARRACKS, U.FACTORY, U.STARPORT, U.ENGINEERINGBAY, U.ARMORY]
+ADDONS = [
+    U.BARRACKSTECHLAB,
+    U.BARRACKSREACTOR,
+    U.FACTORYTECHLAB,
+    U.FACTORYREACTOR,
+    U.STARPORTTECHLAB,
+    U.STARPORTREACTOR,
+]
+UPGRADES = [
+    UpgradeId.STIMPACK,
+    UpgradeId.SHIELDWALL,
+    UpgradeId.TERRANINFANTRYWEAPONSLEVEL1,
+    UpgradeId.TERRANINFANTRYARMORSLEVEL1,
+]
+ARMY_GOALS = [U.MARINE, U.MARAUDER, U.MEDIVAC, U.SIEGETANK, U.VIKINGFIGHTER]
+
+
+def legacy_frame(bot: LegacyBot):
+    """The per-frame counting of the directors and managers before the census."""
+    structures = bot.structures
+    bot.new_frame()
+    for building in TECH_TARGETS:
+        structures.of_type(building).amount + bot.already_pending(building)
+    for upgrade in UPGRADES:
+        bot.already_pending_upgrade(upgrade)
+    for addon in ADDONS:
+        structures.of_type(addon).amount + bot.already_pending(addon)
+    depots = structures.of_type(U.SUPPLYDEPOT).not_ready
+    structures.of_type(U.COMMANDCENTER).not_ready
+    bot.already_pending(U.SUPPLYDEPOT) - len(depots)
+    structures.of_type(TOWNHALL_TYPES_TERRAN).ready.amount
+    structures.of_type(U.REFINERY).amount + bot.already_pending(U.REFINERY)
+    bot.already_pending(U.COMMANDCENTER)
+    bot.already_pending(U.SCV)
+    army = Counter(unit.type_id for unit in bot.all_own_units if not unit.is_structure)
+    for structure in structures.of_type(TERRAN_PRODUCTION_TYPES):
+        army.update(order.ability.exact_id for order in structure.orders)
+    for unit in ARMY_GOALS:
+        army[unit]
+
+
+def census_frame(bot: LegacyBot, counts: UnitCounts):
+    """The same questions, answered by the census."""
+    counts.update(bot.all_own_units, bot.upgrades)
+    for building in TECH_TARGETS:
+        counts.total(building)
+    for upgrade in UPGRADES:
+        counts.upgrade_started(upgrade)
+    for addon in ADDONS:
+        counts.total(addon)
+    if counts.in_production(U.SUPPLYDEPOT):
+        bot.structures.of_type(U.SUPPLYDEPOT).not_ready
+    if counts.in_production(U.COMMANDCENTER):
+        bot.structures.of_type(U.COMMANDCENTER).not_ready
+    counts.queued(U.SUPPLYDEPOT)
+    counts.ready(TOWNHALL_TYPES_TERRAN)
+    counts.total(U.REFINERY)
+    counts.pending(U.COMMANDCENTER)
+    counts.pending(U.SCV)
+    for unit in ARMY_GOALS:
+        counts.total(unit)
+
+
+class TestUnitCounts(unittest.TestCase):
+    """Tests the once-per-frame census of our units and structures."""
+
+    def setUp(self):
+        self.counts = UnitCounts()
+        self.counts.update(midgame_units(), {UpgradeId.STIMPACK})
+
+    def test_alternate_forms_are_counted_as_their_built_type(self):
+        self.assertEqual(self.counts.ready(U.SUPPLYDEPOT), 14)
+        self.assertEqual(self.counts.ready(U.SIEGETANK), 3)
+        # Asking for an alias, or a set with both forms, does not double count.
+        self.assertEqual(self.counts.ready({U.SUPPLYDEPOT, U.SUPPLYDEPOTLOWERED}), 14)
+        self.assertEqual(self.counts.ready(U.SUPPLYDEPOTLOWERED), 14)
+
+    def test_structures_under_construction_are_not_counted_twice(self):
+        # Three builders are on a depot order, two depots are placed.
+        self.assertEqual(self.counts.in_production(U.SUPPLYDEPOT), 2)
+        self.assertEqual(self.counts.queued(U.SUPPLYDEPOT), 1)
+        self.assertEqual(self.counts.pending(U.SUPPLYDEPOT), 3)
+        self.assertEqual(self.counts.total(U.SUPPLYDEPOT), 17)
+        # The Barracks builder's site is the Barracks under construction.
+        self.assertEqual(self.counts.amount(U.BARRACKS), 5)
+        self.assertEqual(self.counts.queued(U.BARRACKS), 0)
+        # Addons follow the same rule through their parent's order.
+        self.assertEqual(self.counts.pending(U.STARPORTREACTOR), 1)
+
+    def test_reactors_train_two_units_and_the_rest_is_queued(self):
+        self.assertEqual(self.counts.in_production(U.MARINE), 6)
+        self.assertEqual(self.counts.queued(U.MARINE), 0)
+
+        counts = UnitCounts()
+        counts.update(
+            [
+                create_unit(
+                    U.BARRACKS,
+                    orders=[train(U.BARRACKS, U.MARINE)] * 3,
+                    has_reactor=True,
+                ),
+                create_unit(U.BARRACKS, orders=[train(U.BARRACKS, U.MARINE)] * 2),
+            ],
+            set(),
+        )
+        self.assertEqual(counts.in_production(U.MARINE), 3)
+        self.assertEqual(counts.queued(U.MARINE), 2)
+
+    def test_morph_orders_are_in_production_of_the_morphed_type(self):
+        counts = UnitCounts()
+        command_center = create_unit(
+            U.COMMANDCENTER,
+            orders=[
+                train(U.COMMANDCENTER, U.SCV),
+                train(U.COMMANDCENTER, U.ORBITALCOMMAND),
+            ],
+        )
+        counts.update([command_center], set())
+
+        self.assertEqual(counts.ready(U.COMMANDCENTER), 1)
+        self.assertEqual(counts.in_production(U.SCV), 1)
+        self.assertEqual(counts.queued(U.ORBITALCOMMAND), 1)
+
+    def test_upgrades_report_research_progress(self):
+        self.assertEqual(self.counts.upgrade_progress(UpgradeId.STIMPACK), 1)
+        self.assertEqual(self.counts.upgrade_progress(UpgradeId.SHIELDWALL), 0.5)
+        self.assertTrue(
+            self.counts.upgrade_started(UpgradeId.TERRANINFANTRYWEAPONSLEVEL1)
+        )
+        self.assertFalse(
+            self.counts.upgrade_started(UpgradeId.TERRANINFANTRYARMORSLEVEL1)
+        )
+        self.assertEqual(self.counts.upgrade_progress(UpgradeId.PUNISHERGRENADES), 0)
+
+    def test_census_is_faster_than_per_manager_scans(self):
+        bot = LegacyBot(midgame_units())
+        counts = UnitCounts()
+
+        start = time.perf_counter()
+        for _ in range(BENCHMARK_FRAMES):
+            legacy_frame(bot)
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(BENCHMARK_FRAMES):
+            census_frame(bot, counts)
+        census = time.perf_counter() - start
+
+        self.assertLess(census, legacy)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from types import SimpleNamespace
+
+from sc2.ids.unit_typeid import UnitTypeId
+
+from core.utilities.unit_arrays import UnitArrays
+from core.utilities.weapon_table import WeaponTable
+
+U = UnitTypeId
+GROUND, AIR, ANY = 1, 2, 3
+LIGHT, ARMORED = 1, 2
+
+
+def weapon(target_type, damage, attacks=1, bonus=(), range=5, speed=1.0):
+    return SimpleNamespace(
+        type=target_type,
+        damage=damage,
+        attacks=attacks,
+        damage_bonus=[SimpleNamespace(attribute=a, bonus=b) for a, b in bonus],
+        range=range,
+        speed=speed,
+    )
+
+
+def type_data(armor=0, attributes=(), weapons=()):
+    return SimpleNamespace(
+        _proto=SimpleNamespace(
+            armor=armor, attributes=list(attributes), weapons=list(weapons)
+        )
+    )
+
+
+def fake_game_data():
+    """Game data for a handful of types, with their real weapons."""
+    units = {
+        U.MARINE: type_data(0, [LIGHT], [weapon(ANY, 6, speed=0.61)]),
+        U.MARAUDER: type_data(
+            1, [ARMORED], [weapon(GROUND, 10, bonus=[(ARMORED, 10)], range=6)]
+        ),
+        U.VIKINGFIGHTER: type_data(
+            0, [ARMORED], [weapon(AIR, 10, attacks=2, bonus=[(ARMORED, 4)], range=9)]
+        ),
+        U.SIEGETANK: type_data(1, [ARMORED], [weapon(GROUND, 15, range=7)]),
+        U.ZERGLING: type_data(0, [LIGHT], [weapon(GROUND, 5, range=0.1)]),
+        U.ROACH: type_data(1, [ARMORED], [weapon(GROUND, 16, range=4)]),
+        U.ULTRALISK: type_data(2, [ARMORED], [weapon(GROUND, 35, range=1)]),
+        U.MUTALISK: type_data(0, [LIGHT], [weapon(ANY, 9, range=3)]),
+        U.COLOSSUS: type_data(1, [ARMORED], [weapon(GROUND, 10, attacks=2)]),
+        U.MEDIVAC: type_data(1, [ARMORED]),
+    }
+    return SimpleNamespace(units={key.value: data for key, data in units.items()})
+
+
+def create_unit(type_id, is_flying=False):
+    return SimpleNamespace(type_id=type_id, is_flying=is_flying)
+
+
+class TestWeaponTable(unittest.TestCase):
+    """Tests damage per shot against armor, attributes and air or ground."""
+
+    def setUp(self):
+        self.table = WeaponTable(fake_game_data())
+
+    def test_armor_and_attribute_bonuses_change_damage_per_shot(self):
+        self.assertEqual(self.table.damage(U.MARINE, U.ZERGLING, False), 6)
+        self.assertEqual(self.table.damage(U.MARINE, U.ROACH, False), 5)
+        self.assertEqual(self.table.damage(U.MARAUDER, U.ROACH, False), 19)
+        self.assertEqual(self.table.damage(U.MARAUDER, U.ZERGLING, False), 10)
+        # Every attack of a volley is counted.
+        self.assertEqual(self.table.damage(U.VIKINGFIGHTER, U.MEDIVAC, True), 26)
+
+    def test_weapons_only_hit_what_they_can_target(self):
+        self.assertEqual(self.table.stats(U.SIEGETANK, U.MUTALISK, True), (0, 0, 0, 0))
+        self.assertEqual(self.table.damage(U.VIKINGFIGHTER, U.ROACH, False), 0)
+        # Colossi can be shot by anti-air weapons.
+        self.assertEqual(self.table.damage(U.VIKINGFIGHTER, U.COLOSSUS, False), 26)
+        self.assertEqual(self.table.stats(U.MEDIVAC, U.ZERGLING, False), (0, 0, 0, 0))
+
+    def test_armor_never_reduces_an_attack_below_half_a_point(self):
+        table = WeaponTable(fake_game_data())
+        table.game_data.units[U.ULTRALISK.value]._proto.armor = 10
+        self.assertEqual(table.damage(U.MARINE, U.ULTRALISK, False), 0.5)
+
+    def test_matrices_expand_the_table_to_groups_of_units(self):
+        attackers = [create_unit(U.MARINE), create_unit(U.SIEGETANK)] * 2
+        targets = [create_unit(U.ZERGLING), create_unit(U.MUTALISK, is_flying=True)]
+
+        damage, cooldown, weapon_range = self.table.matrices(
+            UnitArrays(attackers), UnitArrays(targets)
+        )
+
+        self.assertEqual(damage.tolist(), [[6, 6], [15, 0], [6, 6], [15, 0]])
+        self.assertEqual([round(c, 2) for c in cooldown[0].tolist()], [0.61, 0.61])
+        self.assertEqual(weapon_range[1].tolist(), [7, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
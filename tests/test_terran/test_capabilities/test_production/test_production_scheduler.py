@@ -0,0 +1,149 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sc2.dicts.unit_train_build_abilities import TRAIN_INFO
+from sc2.ids.ability_id import AbilityId
+from sc2.ids.unit_typeid import UnitTypeId
+
+from core.frame_plan import FramePlan
+from core.utilities.unit_counts import UnitCounts
+from terran.capabilities.production.production_scheduler import ProductionScheduler
+
+
+def train_order(producer: UnitTypeId, unit: UnitTypeId):
+    ability = TRAIN_INFO[producer][unit]["ability"]
+    return SimpleNamespace(ability=SimpleNamespace(id=ability, exact_id=ability))
+
+
+def create_structure(tag, type_id, techlab=False, reactor=False, orders=()):
+    structure = MagicMock()
+    structure.tag, structure.type_id = tag, type_id
+    structure.has_techlab, structure.has_reactor = techlab, reactor
+    structure.orders = list(orders)
+    return structure
+
+
+class FakeLedger:
+    """A ledger with a fixed number of units' worth of money."""
+
+    def __init__(self, affordable: int = 100):
+        self.affordable = affordable
+
+    def reserve(self, category, item, count=1):
+        if self.affordable < count:
+            return False
+        self.affordable -= count
+        return True
+
+
+class TestProductionScheduler(unittest.IsolatedAsyncioTestCase):
+    """Tests the joint assignment of units to production structures."""
+
+    def setUp(self):
+        self.scheduler = ProductionScheduler(MagicMock())
+        self.structures = []
+        self.army = []
+        self.cache = MagicMock()
+
+        def of_type(types):
+            units = MagicMock()
+            units.__iter__.side_effect = lambda: iter(self.structures)
+            units.ready = self.structures
+            return units
+
+        self.cache.friendly_structures.of_type.side_effect = of_type
+        self.cache.unit_counts = UnitCounts()
+        self.plan = FramePlan()
+        self.plan.resource_ledger = FakeLedger()
+
+    def trained(self):
+        """(structure tag, unit, queued) of every train order issued."""
+        return [
+            (s.tag, call.args[0], call.kwargs["queue"])
+            for s in self.structures
+            for call in s.train.call_args_list
+        ]
+
+    def count_units(self):
+        self.cache.unit_counts.update(self.army + self.structures, set())
+
+    async def run_scheduler(self):
+        self.count_units()
+        for action in await self.scheduler.execute(self.cache, self.plan, MagicMock()):
+            action()
+
+    async def test_tech_lab_units_get_the_tech_labs_and_reactors_double_queue(self):
+        self.structures += [
+            create_structure(1, UnitTypeId.BARRACKS, techlab=True),
+            create_structure(2, UnitTypeId.BARRACKS, reactor=True),
+        ]
+        self.plan.unit_composition_goal = {UnitTypeId.MARINE: 5, UnitTypeId.MARAUDER: 5}
+
+        await self.run_scheduler()
+
+        self.assertCountEqual(
+            self.trained(),
+            [
+                (1, UnitTypeId.MARAUDER, False),
+                (2, UnitTypeId.MARINE, False),
+                (2, UnitTypeId.MARINE, True),
+            ],
+        )
+
+    async def test_marines_fill_reactors_before_tech_labs(self):
+        self.structures += [
+            create_structure(1, UnitTypeId.BARRACKS, techlab=True),
+            create_structure(2, UnitTypeId.BARRACKS, reactor=True),
+        ]
+        self.plan.unit_composition_goal = {UnitTypeId.MARINE: 2}
+
+        await self.run_scheduler()
+
+        self.assertEqual({tag for tag, _, _ in self.trained()}, {2})
+
+    async def test_deficit_counts_army_alternate_modes_and_production_queues(self):
+        tank = SimpleNamespace(
+            type_id=UnitTypeId.SIEGETANKSIEGED, is_ready=True, orders=[]
+        )
+        self.army += [tank]
+        busy = create_structure(
+            1,
+            UnitTypeId.FACTORY,
+            techlab=True,
+            orders=[train_order(UnitTypeId.FACTORY, UnitTypeId.SIEGETANK)],
+        )
+        self.structures += [busy, create_structure(2, UnitTypeId.FACTORY, techlab=True)]
+        self.plan.unit_composition_goal = {UnitTypeId.SIEGETANK: 3}
+
+        self.count_units()
+        deficits = self.scheduler.deficits(self.cache, self.plan.unit_composition_goal)
+        await self.run_scheduler()
+
+        self.assertEqual(deficits, {UnitTypeId.SIEGETANK: 1})
+        self.assertEqual(self.trained(), [(2, UnitTypeId.SIEGETANK, False)])
+
+    async def test_stops_at_the_budget_and_skips_busy_structures(self):
+        building_addon = SimpleNamespace(
+            ability=SimpleNamespace(
+                id=AbilityId.BUILD_TECHLAB, exact_id=AbilityId.BUILD_TECHLAB_BARRACKS
+            )
+        )
+        self.structures += [
+            create_structure(1, UnitTypeId.BARRACKS),
+            create_structure(2, UnitTypeId.BARRACKS),
+            create_structure(3, UnitTypeId.BARRACKS),
+            create_structure(4, UnitTypeId.BARRACKS, orders=[building_addon]),
+        ]
+        self.plan.busy_structure_tags.add(1)
+        self.plan.resource_ledger = FakeLedger(affordable=1)
+        self.plan.unit_composition_goal = {UnitTypeId.MARINE: 10}
+
+        await self.run_scheduler()
+
+        self.assertEqual(len(self.trained()), 1)
+        self.assertIn(self.trained()[0][0], {2, 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
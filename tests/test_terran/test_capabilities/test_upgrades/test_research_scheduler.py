@@ -0,0 +1,151 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sc2.ids.ability_id import AbilityId
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.ids.upgrade_id import UpgradeId
+
+from core.frame_plan import FramePlan
+from core.utilities.constants import GAME_LOOPS_PER_SECOND
+from core.utilities.unit_counts import UnitCounts
+from terran.capabilities.upgrades.research_scheduler import ResearchScheduler
+
+
+def create_structure(tag, type_id, orders=()):
+    structure = MagicMock()
+    structure.tag, structure.type_id = tag, type_id
+    structure.is_ready, structure.has_reactor = True, False
+    structure.orders = list(orders)
+    return structure
+
+
+class FakeLedger:
+    """A ledger with a fixed number of upgrades' worth of money."""
+
+    def __init__(self, affordable: int = 100):
+        self.affordable = affordable
+
+    def reserve(self, category, item, count=1):
+        if self.affordable < count:
+            return False
+        self.affordable -= count
+        return True
+
+
+class TestResearchScheduler(unittest.IsolatedAsyncioTestCase):
+    """Tests the parallel assignment of upgrades to research structures."""
+
+    def setUp(self):
+        self.scheduler = ResearchScheduler(MagicMock())
+        self.structures = []
+        self.cache = MagicMock()
+        self.cache.game_loop = 0
+        self.cache.friendly_upgrades = set()
+        self.cache.unit_counts = UnitCounts()
+        self.cache.friendly_structures.of_type.side_effect = lambda types: [
+            s for s in self.structures if s.type_id in types
+        ]
+        self.plan = FramePlan()
+        self.plan.resource_ledger = FakeLedger()
+        self.plan.upgrade_goal = [
+            UpgradeId.STIMPACK,
+            UpgradeId.TERRANINFANTRYWEAPONSLEVEL1,
+            UpgradeId.TERRANINFANTRYARMORSLEVEL1,
+            UpgradeId.TERRANINFANTRYWEAPONSLEVEL2,
+        ]
+
+    def researched(self):
+        """(structure tag, upgrade) of every research order issued."""
+        return [
+            (s.tag, call.args[0])
+            for s in self.structures
+            for call in s.research.call_args_list
+        ]
+
+    async def run_scheduler(self):
+        self.cache.unit_counts.update(self.structures, self.cache.friendly_upgrades)
+        for action in await self.scheduler.execute(self.cache, self.plan, MagicMock()):
+            action()
+
+    async def test_starts_research_on_every_idle_structure_at_once(self):
+        self.structures += [
+            create_structure(1, UnitTypeId.ENGINEERINGBAY),
+            create_structure(2, UnitTypeId.ENGINEERINGBAY),
+            create_structure(3, UnitTypeId.BARRACKSTECHLAB),
+        ]
+
+        await self.run_scheduler()
+
+        self.assertCountEqual(
+            [upgrade for _, upgrade in self.researched()],
+            [
+                UpgradeId.STIMPACK,
+                UpgradeId.TERRANINFANTRYWEAPONSLEVEL1,
+                UpgradeId.TERRANINFANTRYARMORSLEVEL1,
+            ],
+        )
+        self.assertEqual(len({tag for tag, _ in self.researched()}), 3)
+
+    async def test_next_level_waits_for_the_previous_one_and_an_armory(self):
+        self.cache.friendly_upgrades = {
+            UpgradeId.STIMPACK,
+            UpgradeId.TERRANINFANTRYWEAPONSLEVEL1,
+            UpgradeId.TERRANINFANTRYARMORSLEVEL1,
+        }
+        self.structures += [create_structure(1, UnitTypeId.ENGINEERINGBAY)]
+
+        await self.run_scheduler()
+        self.assertEqual(self.researched(), [])
+
+        self.structures += [create_structure(2, UnitTypeId.ARMORY)]
+        await self.run_scheduler()
+        self.assertEqual(
+            self.researched(), [(1, UpgradeId.TERRANINFANTRYWEAPONSLEVEL2)]
+        )
+
+    async def test_an_unaffordable_upgrade_holds_back_the_ones_behind_it(self):
+        self.structures += [
+            create_structure(1, UnitTypeId.ENGINEERINGBAY),
+            create_structure(2, UnitTypeId.BARRACKSTECHLAB),
+        ]
+        # Stimpack is first in line but we cannot pay for it yet.
+        self.plan.resource_ledger = MagicMock()
+        self.plan.resource_ledger.reserve.side_effect = (
+            lambda category, item: item != UpgradeId.STIMPACK
+        )
+
+        await self.run_scheduler()
+
+        self.assertEqual(self.researched(), [])
+
+    async def test_tracks_idle_time_of_structures_with_waiting_research(self):
+        busy = SimpleNamespace(
+            ability=SimpleNamespace(exact_id=AbilityId.RESEARCH_HISECAUTOTRACKING),
+            progress=0.5,
+        )
+        self.cache.friendly_upgrades = {
+            UpgradeId.STIMPACK,
+            UpgradeId.TERRANINFANTRYWEAPONSLEVEL1,
+        }
+        self.structures += [
+            # Waits for an Armory to research weapons level 2.
+            create_structure(1, UnitTypeId.ENGINEERINGBAY),
+            create_structure(2, UnitTypeId.ENGINEERINGBAY, orders=[busy]),
+            # Nothing in the goal for a Factory tech lab to research.
+            create_structure(3, UnitTypeId.FACTORYTECHLAB),
+        ]
+        self.plan.upgrade_goal = [UpgradeId.TERRANINFANTRYWEAPONSLEVEL2]
+
+        await self.run_scheduler()
+        self.cache.game_loop = int(10 * GAME_LOOPS_PER_SECOND)
+        await self.run_scheduler()
+
+        self.assertAlmostEqual(
+            self.scheduler.idle_seconds[UnitTypeId.ENGINEERINGBAY], 10, places=1
+        )
+        self.assertAlmostEqual(self.scheduler.total_idle_seconds, 10, places=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,6 +33,10 @@ class TestTerranGeneral(IsolatedAsyncioTestCase):
 
         # Create mock objects for the arguments passed to execute_step
         self.mock_cache = Mock(spec=GlobalCache)
+        # The General opens the resource ledger against the frame's bank.
+        self.mock_cache.minerals = 0
+        self.mock_cache.vespene = 0
+        self.mock_cache.supply_left = 0
         self.mock_plan = Mock(spec=FramePlan)
         self.mock_bus = Mock(spec=EventBus)
 
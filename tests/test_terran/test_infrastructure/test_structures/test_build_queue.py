@@ -0,0 +1,185 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from sc2.ids.unit_typeid import UnitTypeId
+
+from core.utilities.constants import (
+    BUILD_REQUEST_TIMEOUT_SECONDS,
+    EVENT_PRIORITY_HIGH,
+    EVENT_PRIORITY_NORMAL,
+    GAME_LOOPS_PER_SECOND,
+)
+from core.utilities.events import BuildRequestPayload, EventType
+from terran.infrastructure.structures.build_queue import (
+    COMPACTION_THRESHOLD,
+    BuildQueue,
+)
+from terran.infrastructure.structures.construction_manager import ConstructionManager
+
+
+class TestBuildQueue(unittest.TestCase):
+    """Tests the heap-backed build queue and its per-type count index."""
+
+    def test_pop_orders_by_priority_then_arrival(self):
+        queue = BuildQueue()
+        queue.push(
+            BuildRequestPayload(UnitTypeId.BARRACKS, priority=EVENT_PRIORITY_NORMAL)
+        )
+        queue.push(
+            BuildRequestPayload(UnitTypeId.SUPPLYDEPOT, priority=EVENT_PRIORITY_HIGH)
+        )
+        queue.push(
+            BuildRequestPayload(UnitTypeId.REFINERY, priority=EVENT_PRIORITY_NORMAL)
+        )
+
+        order = [queue.pop().item_id for _ in range(3)]
+
+        self.assertEqual(
+            order,
+            [UnitTypeId.SUPPLYDEPOT, UnitTypeId.BARRACKS, UnitTypeId.REFINERY],
+        )
+        self.assertFalse(queue)
+
+    def test_contains_tracks_push_pop_and_remove(self):
+        queue = BuildQueue()
+        first = queue.push(BuildRequestPayload(UnitTypeId.COMMANDCENTER))
+        queue.push(BuildRequestPayload(UnitTypeId.COMMANDCENTER))
+
+        self.assertEqual(queue.count(UnitTypeId.COMMANDCENTER), 2)
+        queue.remove(first)
+        self.assertTrue(queue.contains(UnitTypeId.COMMANDCENTER))
+        queue.pop()
+        self.assertFalse(queue.contains(UnitTypeId.COMMANDCENTER))
+        self.assertEqual(len(queue), 0)
+
+    def test_removed_entries_are_skipped(self):
+        queue = BuildQueue()
+        depot = queue.push(
+            BuildRequestPayload(UnitTypeId.SUPPLYDEPOT, priority=EVENT_PRIORITY_HIGH)
+        )
+        queue.push(BuildRequestPayload(UnitTypeId.BARRACKS))
+
+        queue.remove(depot)
+
+        self.assertEqual(queue.peek().item_id, UnitTypeId.BARRACKS)
+        self.assertEqual([r.item_id for r in queue], [UnitTypeId.BARRACKS])
+
+    def test_head_returns_only_the_most_urgent_live_requests(self):
+        queue = BuildQueue()
+        requests = [
+            queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT, priority=p))
+            for p in (5, 3, 4, 1, 2)
+        ]
+        queue.remove(requests[3])
+
+        head = queue.head(2)
+
+        self.assertEqual([r.priority for r in head], [2, 3])
+
+    def test_removed_entries_are_compacted_out_of_the_heap(self):
+        queue = BuildQueue()
+        # The most urgent request stays, so removals never surface at the top.
+        queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT, priority=0))
+        removed = [
+            queue.push(BuildRequestPayload(UnitTypeId.BARRACKS))
+            for _ in range(COMPACTION_THRESHOLD)
+        ]
+
+        for request in removed:
+            queue.remove(request)
+
+        self.assertEqual(len(queue._heap), 1)
+        self.assertEqual(len(queue), 1)
+        self.assertFalse(queue.contains(UnitTypeId.BARRACKS))
+
+    def test_stale_returns_only_long_blocked_requests(self):
+        queue = BuildQueue()
+        blocked = queue.push(BuildRequestPayload(UnitTypeId.BARRACKS), game_loop=0)
+        queue.push(BuildRequestPayload(UnitTypeId.COMMANDCENTER), game_loop=0)
+        recent = queue.push(BuildRequestPayload(UnitTypeId.FACTORY), game_loop=0)
+        blocked.mark_blocked(100)
+        recent.mark_blocked(900)
+
+        self.assertEqual(queue.stale(game_loop=1000, max_age=500), [blocked])
+
+    def test_mark_waiting_resets_the_clock(self):
+        request = BuildQueue().push(BuildRequestPayload(UnitTypeId.BARRACKS))
+        request.mark_blocked(100)
+        request.mark_blocked(200)
+        self.assertEqual(request.blocked_for(300), 200)
+
+        request.mark_waiting()
+
+        self.assertEqual(request.blocked_for(300), 0)
+
+
+class TestConstructionManagerEviction(unittest.IsolatedAsyncioTestCase):
+    """Tests that requests stuck in the queue are evicted and reported."""
+
+    def setUp(self):
+        self.bot = MagicMock()
+        self.bot.event_bus = None
+        self.bot.state.game_loop = 0
+        self.manager = ConstructionManager(self.bot)
+        self.timeout = int(BUILD_REQUEST_TIMEOUT_SECONDS * GAME_LOOPS_PER_SECOND)
+
+    async def test_stale_request_is_evicted_with_failure_event(self):
+        # Arrange
+        request = self.manager.build_queue.push(
+            BuildRequestPayload(UnitTypeId.BARRACKS, requester="build_order"),
+            game_loop=0,
+        )
+        request.mark_blocked(0)
+        cache = MagicMock()
+        cache.game_loop = self.timeout + 1
+        bus = MagicMock()
+
+        # Act
+        actions = await self.manager.execute(cache, MagicMock(), bus)
+
+        # Assert
+        self.assertEqual(actions, [])
+        self.assertFalse(self.manager.build_queue)
+        event = bus.publish.call_args.args[0]
+        self.assertEqual(event.event_type, EventType.INFRA_BUILD_REQUEST_FAILED)
+        self.assertEqual(event.payload.item_id, UnitTypeId.BARRACKS)
+        self.assertEqual(event.payload.requester, "build_order")
+
+    async def test_requests_waiting_for_money_are_never_evicted(self):
+        # Arrange: a CC being saved for, and a depot queued behind it.
+        self.manager.build_queue.push(
+            BuildRequestPayload(UnitTypeId.COMMANDCENTER, priority=EVENT_PRIORITY_HIGH)
+        )
+        self.manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+        plan = MagicMock()
+        plan.resource_ledger.can_afford.return_value = False
+        cache = MagicMock()
+        bus = MagicMock()
+
+        # Act
+        for game_loop in (0, self.timeout, 2 * self.timeout + 1):
+            cache.game_loop = game_loop
+            await self.manager.execute(cache, plan, bus)
+
+        # Assert
+        self.assertEqual(len(self.manager.build_queue), 2)
+        bus.publish.assert_not_called()
+
+    async def test_unplaceable_request_starts_aging(self):
+        # Arrange
+        request = self.manager.build_queue.push(
+            BuildRequestPayload(UnitTypeId.BARRACKS)
+        )
+        self.manager._find_placement = AsyncMock(return_value=None)
+        cache = MagicMock()
+        cache.game_loop = 50
+
+        # Act
+        await self.manager.execute(cache, MagicMock(), MagicMock())
+
+        # Assert
+        self.assertEqual(request.blocked_since, 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,362 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+
+from core.frame_plan import FramePlan
+from core.resource_ledger import BudgetCategory, ResourceLedger
+from core.utilities.constants import EVENT_PRIORITY_HIGH, GAME_LOOPS_PER_SECOND
+from core.utilities.events import (
+    BuildRequestPayload,
+    ConstructionStartedPayload,
+    Event,
+    EventType,
+    UnitDestroyedPayload,
+)
+from terran.infrastructure.structures.construction_manager import (
+    BUILDER_TRAVEL_TIMEOUT_SECONDS,
+    ConstructionManager,
+)
+
+COSTS = {
+    UnitTypeId.SUPPLYDEPOT: (100, 0),
+    UnitTypeId.BARRACKS: (150, 0),
+    UnitTypeId.ENGINEERINGBAY: (125, 0),
+    UnitTypeId.FACTORY: (150, 100),
+    UnitTypeId.COMMANDCENTER: (400, 0),
+    UnitTypeId.MARINE: (50, 0),
+}
+
+
+class FakeUnits(list):
+    """The subset of the burnysc2 Units API the ConstructionManager relies on."""
+
+    def filter(self, predicate):
+        return FakeUnits(u for u in self if predicate(u))
+
+    def closer_than(self, distance, position):
+        return FakeUnits(u for u in self if u.distance_to(position) < distance)
+
+    def closest_to(self, position):
+        return min(self, key=lambda u: u.distance_to(position))
+
+
+def create_worker(tag: int, position: Point2, orders=()) -> MagicMock:
+    worker = MagicMock()
+    worker.tag = tag
+    worker.position = position
+    worker.orders = list(orders)
+    worker.is_gathering = True
+    worker.is_idle = False
+    worker.is_carrying_resource = False
+    worker.distance_to = lambda p: position.distance_to(p)
+    return worker
+
+
+def build_order_of(bot: MagicMock) -> SimpleNamespace:
+    """An order with the build ability the mock game data gives every structure."""
+    ability = bot.game_data.units[UnitTypeId.SUPPLYDEPOT.value].creation_ability.id
+    return SimpleNamespace(ability=SimpleNamespace(id=ability))
+
+
+def create_mock_bot(minerals: int = 1000, vespene: int = 0, workers: int = 12):
+    bot = MagicMock()
+    bot.event_bus = None
+    bot.minerals = minerals
+    bot.vespene = vespene
+    bot.state.game_loop = 0
+    bot.start_location = Point2((20, 20))
+    # Every worker carries a build order, as a builder that is on its way would.
+    build_order = build_order_of(bot)
+    bot.workers = FakeUnits(
+        create_worker(tag, Point2((20 + tag, 20)), [build_order])
+        for tag in range(workers)
+    )
+
+    def calculate_cost(item_id):
+        cost = MagicMock()
+        cost.minerals, cost.vespene = COSTS[item_id]
+        return cost
+
+    bot.calculate_cost.side_effect = calculate_cost
+    bot.calculate_supply_cost.return_value = 0
+    bot.ledger = ResourceLedger(bot)
+    return bot
+
+
+def create_manager(bot: MagicMock, blocked=()) -> ConstructionManager:
+    """A manager whose placement hands out a fresh spot per request."""
+    manager = ConstructionManager(bot)
+    spots = iter(Point2((30 + 3 * i, 30)) for i in range(1000))
+
+    async def find_placement(request):
+        return None if request.item_id in blocked else next(spots)
+
+    manager._find_placement = AsyncMock(side_effect=find_placement)
+    return manager
+
+
+async def run_frame(manager: ConstructionManager, game_loop: int = 0):
+    """Runs one frame with the whole bank budgeted to infrastructure."""
+    bot = manager.bot
+    cache = MagicMock()
+    cache.game_loop = game_loop
+    cache.minerals, cache.vespene, cache.supply_left = bot.minerals, bot.vespene, 0
+    plan = FramePlan()
+    plan.set_budget(infrastructure=100, capabilities=0)
+    bot.ledger.begin_frame(cache, plan)
+    plan.resource_ledger = bot.ledger
+    return await manager.execute(cache, plan, MagicMock())
+
+
+class TestParallelConstruction(unittest.IsolatedAsyncioTestCase):
+    """Tests that several build requests are serviced in a single frame."""
+
+    async def test_dispatches_every_affordable_request_with_distinct_builders(self):
+        # Arrange
+        bot = create_mock_bot(minerals=350)
+        manager = create_manager(bot)
+        for item in (
+            UnitTypeId.SUPPLYDEPOT,
+            UnitTypeId.BARRACKS,
+            UnitTypeId.SUPPLYDEPOT,
+        ):
+            manager.build_queue.push(BuildRequestPayload(item))
+
+        # Act
+        actions = await run_frame(manager)
+
+        # Assert
+        self.assertEqual(len(actions), 3)
+        self.assertEqual(len(manager.in_flight), 3)
+        self.assertFalse(manager.build_queue)
+        self.assertEqual(bot.ledger.held_minerals, 350)
+
+    async def test_reservation_is_cumulative_and_respects_priority(self):
+        bot = create_mock_bot(minerals=300)
+        manager = create_manager(bot)
+        manager.build_queue.push(
+            BuildRequestPayload(UnitTypeId.SUPPLYDEPOT, priority=EVENT_PRIORITY_HIGH)
+        )
+        manager.build_queue.push(BuildRequestPayload(UnitTypeId.BARRACKS))
+        manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+
+        actions = await run_frame(manager)
+
+        # The second depot is affordable on its own, but not after the barracks.
+        self.assertEqual(len(actions), 2)
+        self.assertEqual(
+            [r.item_id for r in manager.build_queue], [UnitTypeId.SUPPLYDEPOT]
+        )
+
+    async def test_engine_rejected_layout_slot_is_not_retired(self):
+        # Arrange
+        bot = create_mock_bot()
+        bot.can_place_single = AsyncMock(return_value=False)
+        manager = ConstructionManager(bot)
+        manager.layout_planner = MagicMock()
+        manager.layout_planner.next_slot.return_value = Point2((30, 30))
+        manager.placement_grid = MagicMock()
+        manager.placement_grid.find_placement = AsyncMock(return_value=None)
+        request = manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+
+        # Act
+        position = await manager._find_placement(request)
+
+        # Assert: skipped for a while, never written into the grid.
+        self.assertIsNone(position)
+        manager.placement_grid.reject.assert_called_once_with(
+            UnitTypeId.SUPPLYDEPOT, Point2((30, 30))
+        )
+        manager.placement_grid.block.assert_not_called()
+
+    async def test_blocked_item_does_not_stall_the_queue(self):
+        bot = create_mock_bot(minerals=500)
+        manager = create_manager(bot, blocked={UnitTypeId.ENGINEERINGBAY})
+        manager.build_queue.push(
+            BuildRequestPayload(UnitTypeId.ENGINEERINGBAY, priority=EVENT_PRIORITY_HIGH)
+        )
+        manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+
+        actions = await run_frame(manager)
+
+        self.assertEqual(len(actions), 1)
+        self.assertEqual(
+            next(iter(manager.in_flight.values())).item_id, UnitTypeId.SUPPLYDEPOT
+        )
+        self.assertTrue(manager.build_queue.contains(UnitTypeId.ENGINEERINGBAY))
+
+    async def test_in_flight_reservation_holds_until_construction_starts(self):
+        bot = create_mock_bot(minerals=150)
+        manager = create_manager(bot)
+        manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+        manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+
+        # Frame 1: only one depot fits the budget.
+        await run_frame(manager)
+        # Frame 2: the bank has not changed because the builder is still walking.
+        second = await run_frame(manager, 1)
+        self.assertEqual(second, [])
+
+        build = next(iter(manager.in_flight.values()))
+        await manager.handle_construction_started(
+            Event(
+                EventType.INFRA_CONSTRUCTION_STARTED,
+                ConstructionStartedPayload(1, UnitTypeId.SUPPLYDEPOT, build.position),
+            )
+        )
+
+        self.assertEqual(manager.in_flight, {})
+        self.assertEqual(bot.ledger.held_minerals, 0)
+
+    async def test_killed_builder_requeues_its_request(self):
+        bot = create_mock_bot(minerals=100)
+        manager = create_manager(bot)
+        manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+        await run_frame(manager)
+        worker_tag = next(iter(manager.in_flight))
+
+        await manager.handle_unit_destroyed(
+            Event(
+                EventType.UNIT_DESTROYED,
+                UnitDestroyedPayload(worker_tag, UnitTypeId.SCV, Point2((0, 0))),
+            )
+        )
+
+        self.assertEqual(manager.in_flight, {})
+        self.assertTrue(manager.build_queue.contains(UnitTypeId.SUPPLYDEPOT))
+
+    async def test_slow_builder_still_walking_keeps_its_build(self):
+        # Arrange: a long walk to a far base, well past the old 20 s timeout.
+        bot = create_mock_bot(minerals=100)
+        manager = create_manager(bot)
+        manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+        await run_frame(manager)
+        worker_tag = next(iter(manager.in_flight))
+
+        # Act
+        actions = await run_frame(manager, int(30 * GAME_LOOPS_PER_SECOND))
+
+        # Assert: no second builder, no re-queued request, the hold stands.
+        self.assertEqual(actions, [])
+        self.assertEqual(list(manager.in_flight), [worker_tag])
+        self.assertFalse(manager.build_queue)
+        self.assertEqual(bot.ledger.held_minerals, 100)
+
+    async def test_builder_that_dropped_its_order_is_let_go(self):
+        bot = create_mock_bot(minerals=100)
+        manager = create_manager(bot)
+        manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+        await run_frame(manager)
+        worker_tag = next(iter(manager.in_flight))
+        next(w for w in bot.workers if w.tag == worker_tag).orders = []
+
+        await run_frame(manager, 8)
+
+        self.assertEqual(manager.in_flight, {})
+        self.assertTrue(manager.build_queue.contains(UnitTypeId.SUPPLYDEPOT))
+        next(w for w in bot.workers if w.tag == worker_tag).stop.assert_not_called()
+
+    async def test_stuck_builder_is_stopped_before_its_request_is_requeued(self):
+        bot = create_mock_bot(minerals=100)
+        manager = create_manager(bot)
+        manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+        await run_frame(manager)
+        worker_tag = next(iter(manager.in_flight))
+        worker = next(w for w in bot.workers if w.tag == worker_tag)
+
+        timeout = int(BUILDER_TRAVEL_TIMEOUT_SECONDS * GAME_LOOPS_PER_SECOND)
+        actions = await run_frame(manager, timeout + 1)
+        for action in actions:
+            action()
+
+        worker.stop.assert_called_once()
+        self.assertNotIn(worker_tag, manager.in_flight)
+
+    async def test_throughput_in_structures_started_per_minute(self):
+        """
+        Simulates one minute of macro at 1,200 minerals/min with a backlog of
+        depots and barracks behind an unplaceable engineering bay.
+        """
+        # Arrange
+        bot = create_mock_bot(minerals=400, workers=16)
+        manager = create_manager(bot, blocked={UnitTypeId.ENGINEERINGBAY})
+        manager.build_queue.push(
+            BuildRequestPayload(UnitTypeId.ENGINEERINGBAY, priority=EVENT_PRIORITY_HIGH)
+        )
+        for _ in range(6):
+            manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+            manager.build_queue.push(BuildRequestPayload(UnitTypeId.BARRACKS))
+
+        step = 8  # game loops per bot step
+        income_per_step = 1200 / 60 / GAME_LOOPS_PER_SECOND * step
+        started = 0
+
+        # Act
+        for game_loop in range(0, int(60 * GAME_LOOPS_PER_SECOND), step):
+            bot.minerals += income_per_step
+            await run_frame(manager, game_loop)
+            # Builders arrive instantly: pay for and start every in-flight build.
+            for build in list(manager.in_flight.values()):
+                bot.minerals -= build.minerals
+                started += 1
+                await manager.handle_construction_started(
+                    Event(
+                        EventType.INFRA_CONSTRUCTION_STARTED,
+                        ConstructionStartedPayload(0, build.item_id, build.position),
+                    )
+                )
+
+        # Assert: 400 banked + 1,200 income covers 6 depots and 6 barracks (1,500).
+        self.assertEqual(started, 12)
+        self.assertGreaterEqual(bot.minerals, 0)
+
+
+class TestSavingUnderTheBudgetSplit(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests construction against production under the director's real 30/70
+    split, with production spending everything it is allowed to.
+    """
+
+    async def run_frame(self, manager: ConstructionManager, game_loop: int):
+        bot = manager.bot
+        bot.minerals += 20
+        cache = MagicMock()
+        cache.game_loop = game_loop
+        cache.minerals, cache.vespene, cache.supply_left = bot.minerals, 0, 200
+        plan = FramePlan()
+        plan.set_budget(infrastructure=30, capabilities=70)
+        bot.ledger.begin_frame(cache, plan)
+        plan.resource_ledger = bot.ledger
+        await manager.execute(cache, plan, MagicMock())
+        bot.ledger.close(BudgetCategory.INFRASTRUCTURE)
+        while bot.ledger.reserve(BudgetCategory.CAPABILITIES, UnitTypeId.MARINE):
+            bot.minerals -= 50
+        bot.ledger.close(BudgetCategory.CAPABILITIES)
+
+    async def test_unaffordable_structures_are_saved_for(self):
+        # Arrange
+        bot = create_mock_bot(minerals=0)
+        manager = create_manager(bot)
+        manager.build_queue.push(
+            BuildRequestPayload(UnitTypeId.COMMANDCENTER, priority=EVENT_PRIORITY_HIGH)
+        )
+        manager.build_queue.push(BuildRequestPayload(UnitTypeId.SUPPLYDEPOT))
+        dispatched = {}
+
+        # Act
+        for frame in range(200):
+            await self.run_frame(manager, game_loop=frame)
+            for build in manager.in_flight.values():
+                dispatched.setdefault(build.item_id, frame)
+
+        # Assert: 30% of 20 minerals a frame buys the CC in ~67 frames, then
+        # the depot in ~17 more.
+        self.assertLess(dispatched[UnitTypeId.COMMANDCENTER], 80)
+        self.assertLess(dispatched[UnitTypeId.SUPPLYDEPOT], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
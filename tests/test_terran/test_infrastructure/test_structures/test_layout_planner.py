@@ -0,0 +1,150 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+
+from core.utilities.placement_grid import REJECTION_COOLDOWN_SECONDS, PlacementGrid
+from terran.infrastructure.structures import layout_planner
+from terran.infrastructure.structures.layout_planner import BaseLayoutPlanner
+
+MAIN_LOCATION = Point2((20.5, 20.5))
+NATURAL_LOCATION = Point2((60.5, 20.5))
+WALL_DEPOTS = [Point2((40, 40)), Point2((43, 37))]
+WALL_BARRACKS = Point2((36.5, 36.5))
+
+
+def create_mock_bot(size: int = 80) -> MagicMock:
+    """Builds a minimal bot with a flat, fully buildable map and two bases."""
+    bot = MagicMock()
+    bot.game_info.map_name = "TestMapLE"
+    bot.game_info.placement_grid.data_numpy = np.ones((size, size), dtype=np.uint8)
+    bot.game_info.terrain_height.data_numpy = np.full((size, size), 100, np.uint8)
+    bot.start_location = MAIN_LOCATION
+    bot.structures = []
+    bot.enemy_structures = []
+    bot.mineral_field = []
+    bot.vespene_geyser = []
+
+    main_resources = MagicMock()
+    main_resources.center = Point2((20.5, 28.0))
+    natural_resources = MagicMock()
+    natural_resources.center = Point2((60.5, 28.0))
+    bot.expansion_locations_dict = {
+        MAIN_LOCATION: main_resources,
+        NATURAL_LOCATION: natural_resources,
+    }
+    bot.main_base_ramp.corner_depots = set(WALL_DEPOTS)
+    bot.main_base_ramp.barracks_correct_placement = WALL_BARRACKS
+    return bot
+
+
+class TestBaseLayoutPlanner(unittest.TestCase):
+    """Tests the precomputed per-base layout slots and their disk cache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        patcher = patch.object(
+            layout_planner, "LAYOUT_CACHE_DIR", Path(self.temp_dir.name)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.bot = create_mock_bot()
+        self.grid = PlacementGrid(self.bot)
+        self.grid.initialize()
+        self.planner = BaseLayoutPlanner(self.bot, self.grid)
+
+    def test_plan_creates_non_overlapping_slots_for_every_base(self):
+        self.planner.plan()
+
+        self.assertEqual(set(self.planner.layouts), {MAIN_LOCATION, NATURAL_LOCATION})
+        main = self.planner.layouts[MAIN_LOCATION]
+        self.assertEqual(len(main.depots), layout_planner.MAIN_DEPOT_SLOTS)
+        self.assertEqual(len(main.production), layout_planner.MAIN_PRODUCTION_SLOTS)
+
+        # Placing every slot on a fresh grid must never collide.
+        check_grid = self.grid.copy()
+        for layout in self.planner.layouts.values():
+            for slot in layout.production:
+                self.assertTrue(check_grid.can_fit(UnitTypeId.BARRACKS, slot))
+                check_grid.block(slot, (3, 3))
+                check_grid.block(slot.offset((2.5, -0.5)), (2, 2))
+            for slot in list(layout.depots) + list(layout.turrets):
+                self.assertTrue(check_grid.can_fit(UnitTypeId.SUPPLYDEPOT, slot))
+                check_grid.block(slot, (2, 2))
+
+    def test_main_base_queues_start_with_the_ramp_wall(self):
+        self.planner.plan()
+
+        main = self.planner.layouts[MAIN_LOCATION]
+        self.assertEqual(list(main.depots)[:2], sorted(WALL_DEPOTS))
+        self.assertEqual(main.production[0], WALL_BARRACKS)
+        natural = self.planner.layouts[NATURAL_LOCATION]
+        self.assertNotIn(WALL_BARRACKS, natural.production)
+
+    def test_slots_stay_clear_of_townhall_spots(self):
+        self.planner.plan()
+
+        for layout in self.planner.layouts.values():
+            for slot in layout.depots:
+                for location in (MAIN_LOCATION, NATURAL_LOCATION):
+                    self.assertGreater(slot.distance_to(location), 2.5)
+
+    def test_plan_reuses_the_disk_cache(self):
+        self.planner.plan()
+        expected = {loc: l.to_dict() for loc, l in self.planner.layouts.items()}
+
+        second = BaseLayoutPlanner(self.bot, self.grid)
+        with patch.object(second, "_compute_layouts") as compute:
+            second.plan()
+
+        compute.assert_not_called()
+        self.assertEqual(
+            {loc: l.to_dict() for loc, l in second.layouts.items()}, expected
+        )
+
+    def test_next_slot_skips_blocked_slots_and_consume_pops_head(self):
+        self.planner.plan()
+        depots = self.planner.layouts[MAIN_LOCATION].depots
+        first, second = depots[0], depots[1]
+        self.grid.block(first, (2, 2))
+
+        slot = self.planner.next_slot(UnitTypeId.SUPPLYDEPOT, [MAIN_LOCATION])
+        self.planner.consume_slot(UnitTypeId.SUPPLYDEPOT, slot)
+
+        self.assertEqual(slot, second)
+        self.assertNotIn(first, depots)
+        self.assertNotIn(second, depots)
+
+    def test_engine_rejected_slots_are_passed_over_for_a_while(self):
+        self.planner.plan()
+        self.bot.time = 0
+        depots = self.planner.layouts[MAIN_LOCATION].depots
+        first, second = depots[0], depots[1]
+        self.grid.reject(UnitTypeId.SUPPLYDEPOT, first)
+
+        slot = self.planner.next_slot(UnitTypeId.SUPPLYDEPOT, [MAIN_LOCATION])
+        self.planner.consume_slot(UnitTypeId.SUPPLYDEPOT, slot)
+        self.bot.time = REJECTION_COOLDOWN_SECONDS
+
+        self.assertEqual(slot, second)
+        self.assertEqual(depots[0], first)
+        self.assertEqual(
+            self.planner.next_slot(UnitTypeId.SUPPLYDEPOT, [MAIN_LOCATION]), first
+        )
+
+    def test_owned_bases_orders_main_first(self):
+        self.planner.plan()
+
+        bases = self.planner.owned_bases([NATURAL_LOCATION, MAIN_LOCATION])
+
+        self.assertEqual(bases, [MAIN_LOCATION, NATURAL_LOCATION])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,241 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sc2.dicts.unit_train_build_abilities import TRAIN_INFO
+from sc2.ids.ability_id import AbilityId
+from sc2.ids.unit_typeid import UnitTypeId
+
+from core.frame_plan import EconomicStance, FramePlan
+from core.utilities.unit_counts import UnitCounts
+from core.utilities.unit_types import SUPPLY_DEPOT_SUPPLY, TERRAN_UNIT_PRODUCTION
+from terran.infrastructure.structures.supply_forecaster import (
+    DEPOT_LEAD_SECONDS,
+    SupplyForecaster,
+)
+from terran.infrastructure.structures.supply_manager import (
+    MAX_CONCURRENT_DEPOTS,
+    SupplyManager,
+)
+
+TRAINER = {
+    UnitTypeId.SCV: UnitTypeId.COMMANDCENTER,
+    UnitTypeId.MARINE: UnitTypeId.BARRACKS,
+    UnitTypeId.HELLION: UnitTypeId.FACTORY,
+    UnitTypeId.MEDIVAC: UnitTypeId.STARPORT,
+}
+
+# A scripted macro build: (second the producer is ready, unit, reactor).
+MACRO_BUILD = [
+    (0, UnitTypeId.SCV, False),
+    (40, UnitTypeId.MARINE, False),
+    (70, UnitTypeId.SCV, False),
+    (90, UnitTypeId.MARINE, True),
+    (100, UnitTypeId.MARINE, True),
+    (120, UnitTypeId.HELLION, False),
+    (150, UnitTypeId.MARINE, True),
+    (160, UnitTypeId.MEDIVAC, True),
+    (180, UnitTypeId.MARINE, True),
+    (200, UnitTypeId.MARINE, False),
+]
+OLD_SUPPLY_BUFFER_BASE = 4
+OLD_SUPPLY_BUFFER_PER_PRODUCTION_STRUCTURE = 2
+
+
+def create_order(unit: UnitTypeId, progress: float):
+    ability = TRAIN_INFO[TRAINER[unit]][unit]["ability"]
+    return SimpleNamespace(ability=SimpleNamespace(id=ability), progress=progress)
+
+
+def create_structure(type_id: UnitTypeId, orders=(), has_reactor=False):
+    return SimpleNamespace(
+        type_id=type_id, orders=list(orders), has_reactor=has_reactor
+    )
+
+
+class MacroSimulation:
+    """
+    A one-second-step model of continuous production against supply.
+    Each producer slot starts its unit whenever it is free and supply allows.
+    """
+
+    def __init__(self):
+        self.supply_used, self.supply_cap = 12, 15
+        self.depots = []  # Seconds left until each pending depot is done.
+        self.producers = []  # [unit, reactor, slots: [elapsed seconds or None]]
+        self.blocked_seconds = 0
+        self.depots_built = 0
+
+    def structures(self):
+        structures = []
+        for unit, reactor, slots in self.producers:
+            build_time = TERRAN_UNIT_PRODUCTION[unit][1]
+            orders = [
+                create_order(unit, elapsed / build_time)
+                for elapsed in slots
+                if elapsed is not None
+            ]
+            structures.append(create_structure(TRAINER[unit], orders, reactor))
+        return structures
+
+    def run(self, policy, seconds: int = 300) -> "MacroSimulation":
+        for second in range(seconds):
+            for ready_at, unit, reactor in MACRO_BUILD:
+                if ready_at == second:
+                    self.producers.append(
+                        [unit, reactor, [None] * (2 if reactor else 1)]
+                    )
+
+            for _ in range(policy(self)):
+                self.depots.append(DEPOT_LEAD_SECONDS)
+                self.depots_built += 1
+
+            blocked = False
+            for unit, _, slots in self.producers:
+                supply, build_time = TERRAN_UNIT_PRODUCTION[unit]
+                for i, elapsed in enumerate(slots):
+                    if elapsed is not None and elapsed >= build_time:
+                        slots[i] = elapsed = None
+                    if elapsed is None:
+                        if self.supply_used + supply <= self.supply_cap:
+                            self.supply_used += supply
+                            slots[i] = 0
+                        else:
+                            blocked = True
+                            continue
+                    slots[i] += 1
+            self.blocked_seconds += blocked
+
+            self.depots = [t - 1 for t in self.depots]
+            self.supply_cap += SUPPLY_DEPOT_SUPPLY * sum(
+                1 for t in self.depots if t <= 0
+            )
+            self.supply_cap = min(self.supply_cap, 200)
+            self.depots = [t for t in self.depots if t > 0]
+        return self
+
+
+def static_buffer_policy(sim: MacroSimulation) -> int:
+    """The previous rule: one depot at a time below a static buffer."""
+    if sim.depots:
+        return 0
+    production = sum(1 for unit, _, _ in sim.producers if unit != UnitTypeId.SCV)
+    buffer = (
+        OLD_SUPPLY_BUFFER_BASE + production * OLD_SUPPLY_BUFFER_PER_PRODUCTION_STRUCTURE
+    )
+    return 1 if sim.supply_cap - sim.supply_used < buffer else 0
+
+
+def forecast_policy(sim: MacroSimulation) -> int:
+    forecast = SupplyForecaster().forecast(
+        sim.structures(),
+        sim.supply_used,
+        sim.supply_cap,
+        [(t, SUPPLY_DEPOT_SUPPLY) for t in sim.depots],
+    )
+    return min(forecast.depots_needed, MAX_CONCURRENT_DEPOTS - len(sim.depots))
+
+
+class TestSupplyForecaster(unittest.TestCase):
+    """Tests the production-queue supply projection."""
+
+    def test_demand_counts_every_start_within_the_horizon(self):
+        # A reactor barracks halfway through two marines: each slot starts one
+        # more marine at 9 s; the next would start at 27 s, past the horizon.
+        barracks = create_structure(
+            UnitTypeId.BARRACKS,
+            [
+                create_order(UnitTypeId.MARINE, 0.5),
+                create_order(UnitTypeId.MARINE, 0.5),
+            ],
+            has_reactor=True,
+        )
+
+        self.assertEqual(SupplyForecaster().production_demand([barracks]), 2)
+
+    def test_queued_orders_have_already_paid_their_supply(self):
+        cc = create_structure(
+            UnitTypeId.COMMANDCENTER,
+            [create_order(UnitTypeId.SCV, 0.0), create_order(UnitTypeId.SCV, 0.0)],
+        )
+
+        # Starts at 12 s and 24 s; the queued SCV is the first of them.
+        self.assertEqual(SupplyForecaster().production_demand([cc]), 1)
+
+    def test_requests_several_depots_for_a_large_shortfall(self):
+        producers = [
+            create_structure(UnitTypeId.BARRACKS, has_reactor=True) for _ in range(5)
+        ]
+
+        forecast = SupplyForecaster().forecast(producers, 60, 62)
+
+        self.assertEqual(forecast.demand, 20)
+        self.assertEqual(forecast.depots_needed, 3)
+
+    def test_simulated_macro_build_is_blocked_less_than_with_a_static_buffer(self):
+        baseline = MacroSimulation().run(static_buffer_policy)
+        forecast = MacroSimulation().run(forecast_policy)
+
+        self.assertLess(forecast.blocked_seconds, baseline.blocked_seconds / 2)
+        self.assertGreater(forecast.supply_used, baseline.supply_used)
+
+
+class TestSupplyManager(unittest.IsolatedAsyncioTestCase):
+    """Tests that the manager turns the forecast into build requests."""
+
+    def setUp(self):
+        self.bot = MagicMock()
+        director = MagicMock()
+        director.construction_manager.build_queue.count.return_value = 0
+        self.manager = SupplyManager(self.bot, director)
+
+        self.producers = [
+            create_structure(UnitTypeId.BARRACKS, has_reactor=True) for _ in range(5)
+        ]
+        self.cache = MagicMock()
+        self.cache.supply_used, self.cache.supply_cap = 60, 62
+        self.cache.unit_counts = UnitCounts()
+
+        def of_type(types):
+            units = MagicMock()
+            units.ready = self.producers
+            units.not_ready = []
+            return units
+
+        self.cache.friendly_structures.of_type.side_effect = of_type
+        self.bus = MagicMock()
+
+    async def test_publishes_one_request_per_needed_depot(self):
+        await self.manager.execute(self.cache, FramePlan(), self.bus)
+
+        self.assertEqual(self.bus.publish.call_count, 3)
+        payload = self.bus.publish.call_args.args[0].payload
+        self.assertEqual(payload.item_id, UnitTypeId.SUPPLYDEPOT)
+        self.assertFalse(payload.unique)
+
+    async def test_pending_depots_are_counted_against_the_forecast(self):
+        # Two builders on their way to place a depot.
+        build_depot = SimpleNamespace(
+            ability=SimpleNamespace(exact_id=AbilityId.TERRANBUILD_SUPPLYDEPOT)
+        )
+        builders = [
+            SimpleNamespace(type_id=UnitTypeId.SCV, is_ready=True, orders=[build_depot])
+            for _ in range(2)
+        ]
+        self.cache.unit_counts.update(builders, set())
+
+        await self.manager.execute(self.cache, FramePlan(), self.bus)
+
+        self.assertEqual(self.bus.publish.call_count, 1)
+
+    async def test_only_one_depot_at_a_time_while_saving_for_expansion(self):
+        plan = FramePlan()
+        plan.set_economic_stance(EconomicStance.SAVING_FOR_EXPANSION)
+
+        await self.manager.execute(self.cache, plan, self.bus)
+
+        self.assertEqual(self.bus.publish.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
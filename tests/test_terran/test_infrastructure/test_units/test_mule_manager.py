@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import MagicMock
+
+from sc2.data import Race
+from sc2.ids.ability_id import AbilityId
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+
+from core.utilities.events import EnemyTechScoutedPayload, Event, EventType
+from terran.infrastructure.units.mule_manager import (
+    FAR_PATCH_MULE_EFFICIENCY,
+    MULE_YIELD,
+    MuleManager,
+)
+from tests.test_terran.test_infrastructure.test_units.test_worker_allocator import (
+    create_base,
+    create_unit,
+)
+
+
+def create_orbital(tag: int, energy: float) -> MagicMock:
+    orbital = create_unit(tag, Point2((50, 50)), energy=energy)
+    orbital.casts = []
+    orbital.side_effect = lambda ability, target, o=orbital: o.casts.append(
+        (ability, target.tag)
+    )
+    return orbital
+
+
+class TestMuleManager(unittest.IsolatedAsyncioTestCase):
+    """Tests the MULE scheduler."""
+
+    def setUp(self):
+        self.bot = MagicMock()
+        self.bot.race = Race.Terran
+        self.bot.event_bus = None
+        self.manager = MuleManager(self.bot)
+
+        self.townhall, self.patches = create_base(1, Point2((50, 50)))
+        for patch in self.patches:
+            patch.mineral_contents = 1800
+        self.bot.mineral_field = self.patches
+        self.orbitals = []
+
+        self.cache = MagicMock()
+        self.cache.game_loop = 0
+        self.cache.base_registry = None
+
+        def of_type(types):
+            units = MagicMock()
+            units.ready = (
+                self.orbitals if types == UnitTypeId.ORBITALCOMMAND else [self.townhall]
+            )
+            return units
+
+        self.cache.friendly_structures.of_type.side_effect = of_type
+
+    async def _drop(self):
+        actions = await self.manager.execute(self.cache, MagicMock(), MagicMock())
+        for action in actions:
+            action()
+        return [cast for oc in self.orbitals for cast in oc.casts]
+
+    async def test_every_eligible_orbital_drops_on_a_distinct_near_patch(self):
+        self.orbitals = [
+            create_orbital(10, 50),
+            create_orbital(11, 75),
+            create_orbital(12, 20),
+        ]
+
+        casts = await self._drop()
+
+        self.assertEqual(len(casts), 2)
+        self.assertTrue(all(a == AbilityId.CALLDOWNMULE_CALLDOWNMULE for a, _ in casts))
+        targets = [tag for _, tag in casts]
+        self.assertEqual(len(set(targets)), 2)
+        # The four closest patches of the line are the near half.
+        self.assertTrue(all(tag % 100 < 4 for tag in targets))
+        self.assertEqual(self.manager.expected_income, 2 * MULE_YIELD)
+
+    async def test_targets_expected_yield_not_raw_contents(self):
+        self.orbitals = [create_orbital(10, 50)]
+        for patch in self.patches:
+            patch.mineral_contents = 100 if patch.tag % 100 < 4 else 1800
+
+        casts = await self._drop()
+
+        # A nearly mined-out near patch yields less than a full far one.
+        self.assertGreaterEqual(casts[0][1] % 100, 4)
+        self.assertEqual(
+            self.manager.expected_income, int(MULE_YIELD * FAR_PATCH_MULE_EFFICIENCY)
+        )
+
+    async def test_active_mules_reduce_a_patch_expected_yield(self):
+        self.orbitals = [create_orbital(10, 50)]
+        self.patches[:] = self.patches[:1]
+        self.patches[0].mineral_contents = 300
+
+        await self._drop()
+        self.orbitals = [create_orbital(11, 50)]
+        casts = await self._drop()
+
+        # Only 75 minerals are left for a second MULE on the same patch.
+        self.assertEqual(casts, [(AbilityId.CALLDOWNMULE_CALLDOWNMULE, 100)])
+        self.assertEqual(self.manager.expected_income, MULE_YIELD + 75)
+
+    async def test_banks_scan_energy_when_detection_is_needed(self):
+        self.orbitals = [create_orbital(10, 50), create_orbital(11, 100)]
+        await self.manager.handle_tech_scouted(
+            Event(
+                EventType.TACTICS_ENEMY_TECH_SCOUTED,
+                EnemyTechScoutedPayload(UnitTypeId.DARKSHRINE),
+            )
+        )
+
+        casts = await self._drop()
+
+        # One scan is kept on the fullest orbital; the other still drops.
+        self.assertTrue(self.manager.detection_needed)
+        self.assertEqual(len(casts), 2)
+        self.orbitals = [create_orbital(12, 50)]
+        self.assertEqual(await self._drop(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
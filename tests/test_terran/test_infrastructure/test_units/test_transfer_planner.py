@@ -0,0 +1,111 @@
+import unittest
+from collections import Counter
+from unittest.mock import MagicMock
+
+from sc2.position import Point2
+
+from terran.infrastructure.units.scv_manager import SCVManager
+from terran.infrastructure.units.transfer_planner import (
+    MAX_TRANSFERS_PER_FRAME,
+    TransferPlanner,
+)
+from tests.test_terran.test_infrastructure.test_units.test_worker_allocator import (
+    FakeUnits,
+    create_base,
+    create_unit,
+    income_per_minute,
+)
+
+
+class TestTransferPlanner(unittest.TestCase):
+    """Tests the surplus/deficit matching."""
+
+    def test_matches_surplus_to_the_nearest_deficit(self):
+        positions = {1: Point2((0, 0)), 2: Point2((10, 0)), 3: Point2((100, 0))}
+
+        transfers = TransferPlanner().plan({1: 6, 2: -4, 3: -4}, positions)
+
+        self.assertEqual(
+            [(t.source, t.destination, t.count) for t in transfers],
+            [(1, 2, 4), (1, 3, 2)],
+        )
+
+    def test_respects_the_per_frame_budget(self):
+        positions = {1: Point2((0, 0)), 2: Point2((10, 0))}
+
+        transfers = TransferPlanner().plan({1: 20, 2: -16}, positions, budget=5)
+
+        self.assertEqual(sum(t.count for t in transfers), 5)
+
+    def test_ignores_small_imbalances(self):
+        positions = {1: Point2((0, 0)), 2: Point2((10, 0))}
+
+        self.assertEqual(TransferPlanner().plan({1: 1, 2: -1}, positions), [])
+
+
+class TestSCVManagerTransfers(unittest.TestCase):
+    """Simulates a new Command Center finishing next to an oversaturated main."""
+
+    def setUp(self):
+        bot = MagicMock()
+        bot.event_bus = None
+        self.manager = SCVManager(bot)
+        self.cache = MagicMock()
+
+        self.main, main_patches = create_base(1, Point2((50, 50)))
+        self.natural, natural_patches = create_base(2, Point2((80, 50)))
+        self.patches = FakeUnits(main_patches + natural_patches)
+        self.near = {
+            p.tag
+            for p in self.patches
+            if p.distance_to(self.main if p.tag < 200 else self.natural) < 7
+        }
+
+        # 24 workers, three on every patch of the main.
+        self.workers = []
+        for i, patch in enumerate(main_patches * 3):
+            worker = create_unit(1000 + i, patch.position, is_returning=False)
+            self._gather(worker, patch)
+            self.workers.append(worker)
+        self.cache.friendly_workers = self.workers
+
+    def _gather(self, worker, target):
+        worker.is_gathering = True
+        worker.order_target = target.tag
+        worker.gather = lambda t, w=worker: self._gather(w, t)
+
+    def _income(self) -> int:
+        mining = Counter(w.order_target for w in self.workers)
+        return income_per_minute(mining, self.near)
+
+    def test_new_townhall_triggers_bounded_transfers_until_balanced(self):
+        self.manager.allocator.update([self.main], self.patches, self.workers)
+        self.manager.allocator.lines_changed = False
+        income_before = self._income()
+
+        # Act: The natural finishes; simulate frames until transfers stop.
+        moved_per_frame = []
+        for _ in range(10):
+            self.manager.allocator.update(
+                [self.main, self.natural], self.patches, self.workers
+            )
+            actions = self.manager._handle_transfers(self.cache, [])
+            for action in actions:
+                action()
+            moved_per_frame.append(len(actions))
+            if not self.manager.rebalancing:
+                break
+
+        # Assert
+        self.assertFalse(self.manager.rebalancing)
+        self.assertTrue(all(n <= MAX_TRANSFERS_PER_FRAME for n in moved_per_frame))
+        self.assertEqual(sum(moved_per_frame), 8)
+        self.assertEqual(self.manager.allocator.deficit(1), 0)
+        self.assertEqual(self.manager.allocator.deficit(2), 8)
+        # Eight workers leave third-worker slots for fresh patches at the natural.
+        self.assertEqual(income_before, 4 * 136 + 4 * 125)
+        self.assertEqual(self._income(), (4 * 116 + 4 * 100) + 4 * 116)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+import unittest
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sc2.position import Point2
+
+from terran.infrastructure.units.worker_allocator import WorkerAllocator
+
+# Minerals per minute mined from one patch by 0, 1, 2 and 3 workers.
+NEAR_PATCH_INCOME = [0, 58, 116, 136]
+FAR_PATCH_INCOME = [0, 50, 100, 125]
+
+
+class FakeUnits(list):
+    """The subset of the burnysc2 Units API the WorkerAllocator relies on."""
+
+    def closer_than(self, distance, position):
+        return FakeUnits(u for u in self if u.distance_to(position) < distance)
+
+
+def create_unit(tag: int, position: Point2, **attributes) -> MagicMock:
+    unit = MagicMock()
+    unit.tag = tag
+    unit.position = position
+    unit.distance_to = lambda p: position.distance_to(
+        p.position if hasattr(p, "position") else p
+    )
+    for name, value in attributes.items():
+        setattr(unit, name, value)
+    return unit
+
+
+def create_base(townhall_tag: int, origin: Point2):
+    """A townhall with four near and four far patches in an arc above it."""
+    townhall = create_unit(townhall_tag, origin)
+    patches = FakeUnits()
+    for i in range(8):
+        distance = 6 if i < 4 else 7.5
+        x = origin.x - 3 + 2 * (i % 4)
+        y = origin.y + (distance**2 - (x - origin.x) ** 2) ** 0.5
+        patches.append(create_unit(townhall_tag * 100 + i, Point2((x, y))))
+    return townhall, patches
+
+
+def create_idle_workers(count: int, position: Point2, first_tag: int = 1000):
+    return [
+        create_unit(first_tag + i, position, is_gathering=False, is_returning=False)
+        for i in range(count)
+    ]
+
+
+def income_per_minute(workers_per_patch: Counter, near_patches: set) -> int:
+    income = 0
+    for patch, count in workers_per_patch.items():
+        table = NEAR_PATCH_INCOME if patch in near_patches else FAR_PATCH_INCOME
+        income += table[min(count, 3)]
+    return income
+
+
+def least_loaded_assignment(workers, patches) -> Counter:
+    """Each worker in turn takes the least-loaded patch, the closest on a tie."""
+    workers_per_patch = Counter({patch.tag: 0 for patch in patches})
+    for worker in workers:
+        patch = min(
+            patches,
+            key=lambda p: (workers_per_patch[p.tag], p.distance_to(worker.position)),
+        )
+        workers_per_patch[patch.tag] += 1
+    return workers_per_patch
+
+
+class TestWorkerAllocator(unittest.TestCase):
+    """Tests the per-patch saturation table and batch assignment."""
+
+    def setUp(self):
+        self.allocator = WorkerAllocator()
+        self.townhall, self.patches = create_base(1, Point2((50, 50)))
+        self.allocator.update([self.townhall], self.patches, [])
+        self.near = self.allocator.lines[1].near_patches
+
+    def test_batch_fills_near_patches_first_and_never_stacks(self):
+        workers = create_idle_workers(8, Point2((50, 50)))
+
+        orders = self.allocator.assign(workers)
+
+        counts = Counter(patch.tag for _, patch in orders)
+        self.assertEqual(len(orders), 8)
+        self.assertEqual(set(counts), self.near)
+        self.assertTrue(all(count == 2 for count in counts.values()))
+
+    def test_third_worker_only_after_every_patch_has_two(self):
+        workers = create_idle_workers(20, Point2((50, 50)))
+
+        orders = self.allocator.assign(workers)
+
+        counts = Counter(patch.tag for _, patch in orders)
+        self.assertEqual(len(orders), 20)
+        self.assertEqual(sorted(counts.values()), [2] * 4 + [3] * 4)
+        self.assertTrue(all(counts[tag] == 3 for tag in self.near))
+        self.assertEqual(self.allocator.deficit(1), -4)
+
+    def test_workers_go_to_the_closest_unsaturated_line(self):
+        second_th, second_patches = create_base(2, Point2((100, 50)))
+        self.allocator.update(
+            [self.townhall, second_th], FakeUnits(self.patches + second_patches), []
+        )
+        # Saturate the first base.
+        self.allocator.assign(create_idle_workers(16, Point2((50, 50))))
+
+        orders = self.allocator.assign(
+            create_idle_workers(2, Point2((52, 50)), first_tag=2000)
+        )
+
+        self.assertTrue(all(patch.tag // 100 == 2 for _, patch in orders))
+
+    def test_sync_releases_dead_and_mined_out_slots(self):
+        workers = create_idle_workers(2, Point2((50, 50)))
+        (worker, patch), _ = self.allocator.assign(workers)
+        worker.is_gathering, worker.order_target = True, patch.tag
+
+        # The patch is mined out; the survivors are re-synced.
+        remaining = FakeUnits(p for p in self.patches if p.tag != patch.tag)
+        self.allocator.update([self.townhall], remaining, [worker])
+
+        self.assertNotIn(worker.tag, self.allocator.assignments)
+        self.assertEqual(len(self.allocator.lines[1].patches), 7)
+        self.assertNotIn(workers[1].tag, self.allocator.assignments)
+
+    def test_income_benchmark_against_per_worker_least_loaded_choice(self):
+        """
+        The baseline sends each idle worker to the least-loaded patch, counting
+        the workers already sent that frame and preferring the closer patch on
+        a tie. It spreads a small batch one per patch over the far patches too,
+        where the allocator pairs workers up on the near ones first.
+        """
+        allocated_total = baseline_total = 0
+        for count in range(1, 25):
+            allocator = WorkerAllocator()
+            allocator.update([self.townhall], self.patches, [])
+            workers = create_idle_workers(count, Point2((50, 50)))
+
+            baseline = income_per_minute(
+                least_loaded_assignment(workers, self.patches), self.near
+            )
+            orders = allocator.assign(workers)
+            allocated = income_per_minute(
+                Counter(patch.tag for _, patch in orders), self.near
+            )
+
+            self.assertGreaterEqual(allocated, baseline, f"{count} workers")
+            allocated_total += allocated
+            baseline_total += baseline
+
+        self.assertGreater(allocated_total, baseline_total)
+
+
+class TestRemoteMining(unittest.TestCase):
+    """Tests long-distance mining of the expansions nobody holds."""
+
+    def test_surplus_workers_mine_the_nearest_free_expansion(self):
+        # Arrange: our main, a far and a near free expansion. The enemy's
+        # expansions are not listed as free by the registry.
+        townhall, patches = create_base(1, Point2((50, 50)))
+        _, far_patches = create_base(3, Point2((150, 50)))
+        _, near_patches = create_base(2, Point2((90, 50)))
+        far = SimpleNamespace(location=Point2((150, 50)), patches=far_patches)
+        near = SimpleNamespace(location=Point2((90, 50)), patches=near_patches)
+        registry = MagicMock()
+        registry.base_of_townhall.return_value = None
+        registry.free_bases.return_value = [far, near]
+        registry.mineral_fields.side_effect = lambda base: base.patches
+        allocator = WorkerAllocator()
+        allocator.update(
+            [townhall],
+            FakeUnits(patches + far_patches + near_patches),
+            [],
+            registry,
+        )
+        allocator.assign(create_idle_workers(24, Point2((50, 50))))
+
+        # Act
+        orders = allocator.assign(
+            create_idle_workers(3, Point2((50, 50)), first_tag=2000)
+        )
+
+        # Assert: two per patch, at the expansion closest to our townhall.
+        counts = Counter(patch.tag for _, patch in orders)
+        self.assertEqual(len(orders), 3)
+        self.assertTrue(all(tag // 100 == 2 for tag in counts))
+        self.assertEqual(sorted(counts.values()), [1, 2])
+
+    def test_no_remote_mining_without_a_registry(self):
+        townhall, patches = create_base(1, Point2((50, 50)))
+        _, other_patches = create_base(2, Point2((90, 50)))
+        allocator = WorkerAllocator()
+        allocator.update([townhall], FakeUnits(patches + other_patches), [])
+        allocator.assign(create_idle_workers(24, Point2((50, 50))))
+
+        orders = allocator.assign(
+            create_idle_workers(2, Point2((50, 50)), first_tag=2000)
+        )
+
+        self.assertEqual(orders, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
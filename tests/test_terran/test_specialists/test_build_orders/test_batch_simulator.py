@@ -0,0 +1,93 @@
+import random
+import time
+import unittest
+
+from sc2.ids.unit_typeid import UnitTypeId
+
+from terran.capabilities.capability_director import TARGET_UNIT_RATIOS
+from terran.specialists.build_orders.batch_simulator import simulate_batch
+from terran.specialists.build_orders.build_order_plan import load_build_order
+from terran.specialists.build_orders.economy_simulator import (
+    Goals,
+    Scenario,
+    director_goals,
+    simulate,
+)
+
+# The batch must play a wide search at least this many times faster per game
+# than playing its variants one by one.
+MIN_SPEEDUP = 4
+VARIANTS = 512
+SERIAL_SAMPLE = 16
+
+
+def ratio_variants(count: int, seed: int = 0):
+    """Director goals with randomly perturbed unit ratios, as a search makes."""
+    rng = random.Random(seed)
+    return [
+        Scenario(
+            goals=director_goals(
+                rng.choice([1, 2, 3]),
+                unit_ratios={
+                    unit: ratio * rng.uniform(0.5, 1.5)
+                    for unit, ratio in TARGET_UNIT_RATIOS.items()
+                },
+            ),
+            duration=600,
+        )
+        for _ in range(count)
+    ]
+
+
+class TestBatchSimulator(unittest.TestCase):
+    """Tests the economy simulator vectorized across variants."""
+
+    def test_batch_reports_equal_serial_reports(self):
+        steps = load_build_order("two_rax_reaper").steps
+        build_order = [(s.supply, s.item) for s in steps]
+        scenarios = [
+            Scenario(build_order=build_order, duration=300),
+            Scenario(
+                build_order=build_order,
+                step_dependencies=[s.dependencies for s in steps],
+                duration=300,
+            ),
+            Scenario(build_order=build_order, goals=director_goals(2), duration=600),
+            Scenario(goals=director_goals(3), duration=600, tick_seconds=4.0),
+            Scenario(goals=director_goals(2), duration=480, auto_supply=False),
+            Scenario(goals=director_goals(2), duration=480, use_mules=False),
+            Scenario(goals=director_goals(3), duration=900, auto_workers=False),
+            Scenario(
+                goals=Goals(
+                    units={UnitTypeId.MARINE: 100},
+                    structures={
+                        UnitTypeId.BARRACKS: 1,
+                        UnitTypeId.COMMANDCENTER: 2,
+                    },
+                ),
+                duration=300,
+            ),
+            Scenario(),
+        ] + ratio_variants(8)
+
+        reports = simulate_batch(scenarios)
+
+        for scenario, report in zip(scenarios, reports):
+            self.assertEqual(report, simulate(scenario))
+
+    def test_batch_is_faster_per_game_than_serial_simulation(self):
+        scenarios = ratio_variants(VARIANTS, seed=1)
+
+        start = time.perf_counter()
+        simulate_batch(scenarios)
+        batch_seconds = (time.perf_counter() - start) / VARIANTS
+        start = time.perf_counter()
+        for scenario in scenarios[:SERIAL_SAMPLE]:
+            simulate(scenario)
+        serial_seconds = (time.perf_counter() - start) / SERIAL_SAMPLE
+
+        self.assertLess(batch_seconds * MIN_SPEEDUP, serial_seconds)
+
+
+if __name__ == "__main__":
+    unittest.main()
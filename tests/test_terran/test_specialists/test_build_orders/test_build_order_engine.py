@@ -0,0 +1,213 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sc2.ids.ability_id import AbilityId
+from sc2.ids.unit_typeid import UnitTypeId
+
+from core.frame_plan import FramePlan
+from core.utilities.constants import GAME_LOOPS_PER_SECOND
+from core.utilities.events import BuildRequestFailedPayload, Event, EventType
+from core.utilities.unit_counts import UnitCounts
+from terran.specialists.build_orders.build_order_engine import (
+    BuildOrderEngine,
+    StepStatus,
+)
+from terran.specialists.build_orders.build_order_plan import compile_build_order
+
+OPENER = {
+    "name": "Test Opener",
+    "steps": [
+        {"supply": 14, "item": "SUPPLYDEPOT"},
+        {"supply": 15, "item": "BARRACKS"},
+        {"supply": 15, "item": "REFINERY"},
+        {"supply": 16, "item": "REAPER"},
+        {"supply": 16, "item": "REAPER"},
+        {"supply": 17, "item": "ORBITALCOMMAND"},
+    ],
+}
+DEPOT, BARRACKS, REFINERY, REAPER_1, REAPER_2, ORBITAL = range(6)
+
+
+class FakeStructures:
+    """Stands in for `Units` of structures: the world's units of some types."""
+
+    def __init__(self, world, types, ready_only=False):
+        self.units = [
+            unit
+            for unit in world.units
+            if unit.type_id in types and (unit.is_ready or not ready_only)
+        ]
+        self.world, self.types = world, types
+
+    @property
+    def ready(self):
+        return FakeStructures(self.world, self.types, ready_only=True)
+
+    def filter(self, predicate):
+        return [unit for unit in self.units if predicate(unit)]
+
+
+def create_unit(type_id, is_ready=True, orders=()):
+    return SimpleNamespace(
+        type_id=type_id, is_ready=is_ready, orders=list(orders), has_reactor=False
+    )
+
+
+def create_order(ability):
+    return SimpleNamespace(ability=SimpleNamespace(exact_id=ability), progress=0.0)
+
+
+class TestBuildOrderEngine(unittest.IsolatedAsyncioTestCase):
+    """Tests the dependency-aware execution of a build order."""
+
+    def setUp(self):
+        self.bot = MagicMock()
+        self.units = [create_unit(UnitTypeId.COMMANDCENTER)]
+        self.units += [create_unit(UnitTypeId.SCV) for _ in range(12)]
+
+        self.cache = MagicMock()
+        self.cache.supply_used = 12
+        self.cache.game_loop = 0
+        self.cache.friendly_upgrades = set()
+        self.cache.unit_counts = UnitCounts()
+        self.cache.friendly_structures.of_type.side_effect = (
+            lambda types: FakeStructures(
+                self, types if isinstance(types, set) else {types}
+            )
+        )
+        self.bus = MagicMock()
+
+        self.engine = BuildOrderEngine(self.bot, compile_build_order(OPENER))
+
+    async def asyncSetUp(self):
+        # The first frame records what we start the game with.
+        await self.execute(self.plan())
+        self.cache.supply_used = 14
+
+    async def execute(self, plan):
+        self.cache.unit_counts.update(self.units, self.cache.friendly_upgrades)
+        return await self.engine.execute(self.cache, plan, self.bus)
+
+    def add(self, *type_ids, is_ready=True):
+        for type_id in type_ids:
+            self.units.append(create_unit(type_id, is_ready))
+        return self.units[-1]
+
+    def plan(self):
+        plan = FramePlan()
+        plan.resource_ledger = MagicMock()
+        return plan
+
+    def requested_items(self):
+        return [
+            call.args[0].payload.item_id for call in self.bus.publish.call_args_list
+        ]
+
+    async def test_requests_a_structure_once_and_waits_for_it_to_start(self):
+        await self.execute(self.plan())
+        await self.execute(self.plan())
+
+        self.assertEqual(self.requested_items(), [UnitTypeId.SUPPLYDEPOT])
+        # Asked for, but not in the game yet: the step has not started.
+        self.assertIs(self.engine.status[DEPOT], StepStatus.DISPATCHED)
+        self.assertIs(self.engine.status[BARRACKS], StepStatus.PENDING)
+
+        self.add(UnitTypeId.SUPPLYDEPOT, is_ready=False)
+        await self.execute(self.plan())
+
+        self.assertIs(self.engine.status[DEPOT], StepStatus.STARTED)
+
+    async def test_independent_steps_are_dispatched_together(self):
+        self.add(UnitTypeId.SUPPLYDEPOT)
+        self.cache.supply_used = 15
+
+        await self.execute(self.plan())
+
+        self.assertEqual(
+            set(self.requested_items()), {UnitTypeId.BARRACKS, UnitTypeId.REFINERY}
+        )
+
+    async def fail(self, item_id, requester):
+        await self.engine.handle_build_request_failed(
+            Event(
+                EventType.INFRA_BUILD_REQUEST_FAILED,
+                BuildRequestFailedPayload(item_id, "timeout", requester),
+            )
+        )
+
+    async def test_a_failed_request_is_dispatched_again(self):
+        await self.execute(self.plan())
+        requester = self.bus.publish.call_args.args[0].payload.requester
+        await self.fail(UnitTypeId.SUPPLYDEPOT, requester)
+        await self.execute(self.plan())
+
+        self.assertEqual(self.requested_items(), [UnitTypeId.SUPPLYDEPOT] * 2)
+
+    async def test_failures_of_other_requesters_are_ignored(self):
+        await self.execute(self.plan())
+        # The SupplyManager's own depot request failed, not the build order's.
+        await self.fail(UnitTypeId.SUPPLYDEPOT, "supply_manager")
+        await self.fail(UnitTypeId.SUPPLYDEPOT, None)
+
+        self.assertIs(self.engine.status[DEPOT], StepStatus.DISPATCHED)
+
+    async def test_units_become_production_goals_once_their_producer_is_done(self):
+        self.cache.supply_used = 16
+        self.add(UnitTypeId.SUPPLYDEPOT)
+        barracks = self.add(UnitTypeId.BARRACKS, is_ready=False)
+        plan = self.plan()
+        await self.execute(plan)
+
+        self.assertEqual(plan.unit_composition_goal, {})
+
+        barracks.is_ready = True
+        plan = self.plan()
+        await self.execute(plan)
+        self.assertEqual(plan.unit_composition_goal, {UnitTypeId.REAPER: 1})
+
+        # The second Reaper follows once the first is queued.
+        barracks.orders = [create_order(AbilityId.BARRACKSTRAIN_REAPER)]
+        plan = self.plan()
+        await self.execute(plan)
+        self.assertEqual(plan.unit_composition_goal, {UnitTypeId.REAPER: 2})
+
+    async def test_morph_is_queued_behind_the_current_scv(self):
+        self.cache.supply_used = 17
+        townhall = MagicMock(type_id=UnitTypeId.COMMANDCENTER, is_ready=True)
+        townhall.orders = [create_order(AbilityId.COMMANDCENTERTRAIN_SCV)]
+        self.units[0] = townhall
+        self.add(UnitTypeId.SUPPLYDEPOT, UnitTypeId.BARRACKS, UnitTypeId.REFINERY)
+        self.add(UnitTypeId.REAPER, UnitTypeId.REAPER)
+
+        actions = await self.execute(self.plan())
+
+        self.assertEqual(len(actions), 1)
+        actions[0]()
+        townhall.build.assert_called_once_with(UnitTypeId.ORBITALCOMMAND, queue=True)
+        self.assertIs(self.engine.status[ORBITAL], StepStatus.DISPATCHED)
+
+    async def test_hands_off_once_every_step_has_started(self):
+        self.cache.supply_used = 17
+        self.add(UnitTypeId.SUPPLYDEPOT, UnitTypeId.BARRACKS, UnitTypeId.REFINERY)
+        self.add(UnitTypeId.REAPER, UnitTypeId.REAPER)
+        self.units[0].orders = [create_order(AbilityId.UPGRADETOORBITAL_ORBITALCOMMAND)]
+
+        await self.execute(self.plan())
+
+        self.assertTrue(self.engine.is_complete)
+        self.assertFalse(self.engine.abandoned)
+
+    async def test_abandons_a_step_far_behind_its_schedule(self):
+        late = self.engine.build_order.earliest_start[DEPOT] + 100
+        self.cache.game_loop = int(late * GAME_LOOPS_PER_SECOND)
+        self.cache.supply_used = 12
+
+        await self.execute(self.plan())
+
+        self.assertTrue(self.engine.abandoned)
+        self.assertTrue(self.engine.is_complete)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from sc2.ids.unit_typeid import UnitTypeId
+
+from terran.specialists.build_orders.build_order_plan import (
+    compile_build_order,
+    load_build_order,
+)
+
+
+class TestBuildOrderPlan(unittest.TestCase):
+    """Tests loading and compiling declarative build orders."""
+
+    def test_two_rax_reaper_compiles_with_implied_dependencies(self):
+        build_order = load_build_order("two_rax_reaper")
+        steps = {step.name: index for index, step in enumerate(build_order.steps)}
+        reaper = build_order.steps[steps["REAPER#2"]]
+        barracks = build_order.steps[steps["BARRACKS#1"]]
+
+        self.assertIn(steps["REAPER#1"], reaper.after)
+        self.assertIn(steps["BARRACKS#1"], reaper.requires)
+        self.assertIn(steps["SUPPLYDEPOT#1"], barracks.requires)
+        # Barracks and refinery only wait on supply, so they may overlap.
+        self.assertEqual(build_order.steps[steps["REFINERY#1"]].dependencies, ())
+
+    def test_earliest_starts_respect_every_dependency(self):
+        build_order = load_build_order("two_rax_reaper")
+
+        self.assertNotIn(None, build_order.earliest_start)
+        for index, step in enumerate(build_order.steps):
+            for dependency in step.dependencies:
+                self.assertLessEqual(
+                    build_order.earliest_start[dependency],
+                    build_order.earliest_start[index],
+                )
+
+    def test_compiled_plans_are_cached_until_the_file_changes(self):
+        self.assertIs(
+            load_build_order("two_rax_reaper"), load_build_order("two_rax_reaper")
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "opener.json"
+            path.write_text(
+                json.dumps({"steps": [{"supply": 14, "item": "SUPPLYDEPOT"}]})
+            )
+            first = load_build_order(path)
+            path.write_text(json.dumps({"steps": [{"supply": 14, "item": "BARRACKS"}]}))
+            mtime = path.stat().st_mtime_ns + 1_000_000_000
+            os.utime(path, ns=(mtime, mtime))
+            second = load_build_order(path)
+
+        self.assertEqual(first.steps[0].item, UnitTypeId.SUPPLYDEPOT)
+        self.assertEqual(second.steps[0].item, UnitTypeId.BARRACKS)
+
+    def test_rejects_unknown_items_and_forward_references(self):
+        with self.assertRaises(ValueError):
+            compile_build_order({"steps": [{"supply": 14, "item": "NOTAUNIT"}]})
+        with self.assertRaises(ValueError):
+            compile_build_order(
+                {"steps": [{"supply": 14, "item": "BARRACKS", "after": ["REFINERY#1"]}]}
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.ids.upgrade_id import UpgradeId
+
+from terran.specialists.build_orders.economy_simulator import (
+    EconomySimulator,
+    Goals,
+    Scenario,
+    StartStatus,
+    director_goals,
+    evaluate,
+    simulate,
+)
+from terran.specialists.build_orders.build_order_plan import load_build_order
+
+
+def two_rax_reaper() -> Scenario:
+    steps = load_build_order("two_rax_reaper").steps
+    return Scenario(build_order=[(s.supply, s.item) for s in steps], duration=300)
+
+
+class TestEconomySimulator(unittest.TestCase):
+    """Tests the offline build order and goal simulation."""
+
+    def test_every_two_rax_reaper_step_starts_in_order(self):
+        report = simulate(two_rax_reaper())
+
+        times = report.step_start_times
+        self.assertNotIn(None, times)
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(len(report.completions[UnitTypeId.REAPER]), 4)
+
+    def test_time_to_reports_the_nth_completion(self):
+        report = simulate(two_rax_reaper())
+
+        first, second = report.time_to(UnitTypeId.BARRACKS), report.time_to(
+            UnitTypeId.BARRACKS, 2
+        )
+        self.assertLess(first, second)
+        self.assertIsNone(report.time_to(UnitTypeId.BARRACKS, 3))
+        self.assertIsNone(report.time_to(UnitTypeId.FACTORY))
+
+    def test_forecast_supply_prevents_supply_blocks(self):
+        goals = director_goals(2)
+        managed = simulate(Scenario(goals=goals, duration=480))
+        unmanaged = simulate(Scenario(goals=goals, duration=480, auto_supply=False))
+
+        self.assertLess(
+            managed.supply_blocked_seconds, unmanaged.supply_blocked_seconds
+        )
+        self.assertGreater(managed.supply_used, unmanaged.supply_used)
+
+    def test_missing_tech_leaves_the_item_unavailable(self):
+        simulator = EconomySimulator(Scenario())
+        simulator.minerals = simulator.vespene = 1000
+
+        self.assertIs(simulator.try_start(UnitTypeId.FACTORY), StartStatus.UNAVAILABLE)
+        self.assertIs(simulator.try_start(UnitTypeId.BARRACKS), StartStatus.UNAVAILABLE)
+        self.assertIs(simulator.try_start(UnitTypeId.SUPPLYDEPOT), StartStatus.STARTED)
+
+    def test_saving_for_a_structure_holds_its_cost_against_units(self):
+        goals = Goals(
+            units={UnitTypeId.MARINE: 100},
+            structures={UnitTypeId.BARRACKS: 1, UnitTypeId.COMMANDCENTER: 2},
+        )
+        report = simulate(Scenario(goals=goals, duration=300))
+
+        self.assertIsNotNone(report.time_to(UnitTypeId.COMMANDCENTER))
+
+    def test_tech_lab_units_are_trained_once_a_tech_lab_finishes(self):
+        goals = Goals(
+            units={UnitTypeId.MARAUDER: 2},
+            structures={
+                UnitTypeId.REFINERY: 1,
+                UnitTypeId.BARRACKS: 1,
+                UnitTypeId.BARRACKSTECHLAB: 1,
+            },
+        )
+        simulator = EconomySimulator(Scenario(goals=goals, duration=300))
+        report = simulator.run()
+
+        barracks = [p for p in simulator.producers if p.type_id == UnitTypeId.BARRACKS]
+        self.assertEqual(barracks[0].addon, UnitTypeId.BARRACKSTECHLAB)
+        self.assertEqual(len(report.completions[UnitTypeId.MARAUDER]), 2)
+
+    def test_director_goals_grow_with_bases(self):
+        one_base, three_base = director_goals(1), director_goals(3)
+
+        self.assertGreater(sum(three_base.units.values()), sum(one_base.units.values()))
+        self.assertEqual(three_base.structures[UnitTypeId.COMMANDCENTER], 3)
+        self.assertIn(UpgradeId.STIMPACK, one_base.upgrades)
+
+    def test_coarse_ticks_stay_close_to_one_second_ticks(self):
+        goals = director_goals(2)
+        fine = simulate(Scenario(goals=goals, duration=480))
+        coarse = simulate(Scenario(goals=goals, duration=480, tick_seconds=4.0))
+
+        self.assertAlmostEqual(
+            coarse.minerals_mined, fine.minerals_mined, delta=0.05 * fine.minerals_mined
+        )
+        self.assertAlmostEqual(
+            coarse.supply_used, fine.supply_used, delta=0.05 * fine.supply_used
+        )
+
+    def test_evaluate_matches_serial_simulation(self):
+        scenarios = [two_rax_reaper(), Scenario(goals=director_goals(2), duration=240)]
+
+        reports = evaluate(scenarios, processes=2, chunksize=1)
+
+        for scenario, report in zip(scenarios, reports):
+            self.assertEqual(report, simulate(scenario))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import unittest
+from types import SimpleNamespace
+
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+
+from terran.specialists.micro.target_selector import TargetingProfile, select_targets
+
+U = UnitTypeId
+
+
+def create_friendly(tag, x, y, ground_range=5, air_range=5, damage=6):
+    return SimpleNamespace(
+        tag=tag,
+        position=Point2((x, y)),
+        radius=0.375,
+        ground_range=ground_range,
+        air_range=air_range,
+        can_attack_ground=ground_range > 0,
+        can_attack_air=air_range > 0,
+        calculate_damage_vs_target=lambda target: (damage, 0.61, ground_range),
+    )
+
+
+def create_enemy(
+    tag,
+    type_id,
+    x,
+    y,
+    health=100,
+    max_health=100,
+    is_flying=False,
+    is_light=False,
+    is_armored=False,
+    can_attack_air=True,
+    can_be_attacked=True,
+):
+    return SimpleNamespace(
+        tag=tag,
+        type_id=type_id,
+        position=Point2((x, y)),
+        radius=0.5,
+        health=health,
+        shield=0,
+        shield_health_percentage=health / max_health,
+        is_flying=is_flying,
+        is_light=is_light,
+        is_armored=is_armored,
+        can_attack_air=can_attack_air,
+        can_be_attacked=can_be_attacked,
+    )
+
+
+class TestSelectTargets(unittest.TestCase):
+    """Tests the vectorized choice of a target for every unit."""
+
+    def test_ranks_focus_fire_then_priorities_then_preferred_then_distance(self):
+        units = [create_friendly(1, 0, 0)]
+        zergling = create_enemy(10, U.ZERGLING, 2, 0, is_light=True)
+        roach = create_enemy(11, U.ROACH, 4, 0, is_armored=True)
+        baneling = create_enemy(12, U.BANELING, 5, 0)
+        queen = create_enemy(13, U.QUEEN, 5, 1)
+        profile = TargetingProfile(
+            priorities=[U.BANELING], preferred=lambda u: u.is_armored
+        )
+
+        def target(enemies, focus=None):
+            return select_targets(units, enemies, profile, focus)[0]
+
+        self.assertIs(target([zergling]), zergling)
+        self.assertIs(target([zergling, roach]), roach)
+        self.assertIs(target([zergling, roach, baneling]), baneling)
+        self.assertIs(target([zergling, roach, baneling, queen], queen), queen)
+
+    def test_only_enemies_in_weapon_range_are_candidates(self):
+        marine = create_friendly(1, 0, 0)
+        far_baneling = create_enemy(10, U.BANELING, 8, 0)
+        zergling = create_enemy(11, U.ZERGLING, 3, 0)
+        profile = TargetingProfile(priorities=[U.BANELING])
+
+        self.assertEqual(
+            select_targets([marine], [far_baneling, zergling], profile), [zergling]
+        )
+        # The range bonus lets the marine reach a little further.
+        reaching = TargetingProfile(priorities=[U.BANELING], range_bonus=2.5)
+        self.assertEqual(
+            select_targets([marine], [far_baneling, zergling], reaching),
+            [far_baneling],
+        )
+        self.assertEqual(select_targets([marine], [far_baneling], profile), [None])
+
+    def test_air_targets_need_an_anti_air_weapon(self):
+        tank = create_friendly(1, 0, 0, ground_range=7, air_range=0)
+        viking = create_friendly(2, 0, 0, ground_range=0, air_range=9)
+        mutalisk = create_enemy(10, U.MUTALISK, 3, 0, is_flying=True)
+        colossus = create_enemy(11, U.COLOSSUS, 4, 0)
+
+        targets = select_targets(
+            [tank, viking], [mutalisk, colossus], TargetingProfile()
+        )
+
+        self.assertEqual(targets, [colossus, mutalisk])
+        no_air = TargetingProfile(targets_air=False)
+        self.assertEqual(
+            select_targets([viking], [mutalisk, colossus], no_air), [colossus]
+        )
+
+    def test_focus_fire_can_be_conditional_and_preferred_only_skips_the_rest(self):
+        reaper = create_friendly(1, 0, 0)
+        stalker = create_enemy(10, U.STALKER, 2, 0, is_armored=True)
+        probe = create_enemy(11, U.PROBE, 4, 0, is_light=True)
+        profile = TargetingProfile(
+            preferred=lambda u: u.is_light,
+            preferred_only=True,
+            focus_fire_if=lambda u: u.is_light,
+        )
+
+        self.assertEqual(
+            select_targets([reaper], [stalker, probe], profile, stalker), [probe]
+        )
+        self.assertEqual(select_targets([reaper], [stalker], profile), [None])
+
+    def test_wounded_enemies_win_close_calls(self):
+        marine = create_friendly(1, 0, 0)
+        healthy = create_enemy(10, U.ZERGLING, 2, 0)
+        wounded = create_enemy(11, U.ZERGLING, 3, 0, health=10)
+
+        self.assertEqual(
+            select_targets([marine], [healthy, wounded], TargetingProfile()),
+            [wounded],
+        )
+
+    def test_overkill_avoidance_spreads_fire(self):
+        marines = [create_friendly(tag, 0, tag * 0.1, damage=6) for tag in range(4)]
+        # Two shots kill the first zergling; the other two go to the second.
+        dying = create_enemy(10, U.ZERGLING, 2, 0, health=12, max_health=35)
+        other = create_enemy(11, U.ZERGLING, 4, 0, health=35, max_health=35)
+
+        focused = select_targets(marines, [dying, other], TargetingProfile())
+        spread = select_targets(
+            marines, [dying, other], TargetingProfile(), avoid_overkill=True
+        )
+
+        self.assertEqual(focused, [dying] * 4)
+        self.assertEqual(spread, [dying, dying, other, other])
+
+    def test_assigned_targets_are_kept_when_the_profile_allows_them(self):
+        marines = [create_friendly(1, 0, 0), create_friendly(2, 0, 1)]
+        near = create_enemy(10, U.ZERGLING, 2, 0)
+        far = create_enemy(11, U.ZERGLING, 4, 0)
+        mutalisk = create_enemy(12, U.MUTALISK, 1, 0, is_flying=True)
+        no_air = TargetingProfile(targets_air=False)
+
+        targets = select_targets(
+            marines, [near, far, mutalisk], no_air, assigned={1: far, 2: mutalisk}
+        )
+
+        self.assertEqual(targets, [far, near])
+
+    def test_without_enemies_nobody_has_a_target(self):
+        units = [create_friendly(1, 0, 0), create_friendly(2, 1, 0)]
+        self.assertEqual(select_targets(units, [], TargetingProfile()), [None, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
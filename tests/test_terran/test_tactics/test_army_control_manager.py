@@ -0,0 +1,320 @@
+import unittest
+from collections import defaultdict
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+from sc2.units import Units
+
+from core.frame_plan import FramePlan
+from core.utilities.unit_arrays import UnitArrays
+from core.utilities.weapon_table import WeaponTable
+from terran.tactics.army_control_manager import ArmyControlManager
+from terran.tactics.micro_context import MicroContext
+from terran.tactics.squad import SquadGeometry, SquadObjective
+
+
+def create_type_data():
+    """Every type: no armor, one weapon hitting ground and air for 6."""
+    weapon = SimpleNamespace(
+        type=3, damage=6, attacks=1, damage_bonus=[], range=5, speed=0.61
+    )
+    return SimpleNamespace(
+        _proto=SimpleNamespace(armor=0, attributes=[], weapons=[weapon])
+    )
+
+
+class FakeCache(MagicMock):
+    """A cache whose unit columns are rebuilt from its units, as every frame."""
+
+    @property
+    def friendly_army_arrays(self):
+        return UnitArrays(self.friendly_army_units)
+
+    @property
+    def enemy_unit_arrays(self):
+        return UnitArrays(self.enemy_units)
+
+
+class FakeBot:
+    """Just enough of a BotAI for `Units` distance queries and weapon data."""
+
+    start_location = Point2((0, 0))
+    global_cache = SimpleNamespace(logger=MagicMock())
+    game_data = SimpleNamespace(units=defaultdict(create_type_data))
+
+    def _distance_units_to_pos(self, units, position):
+        return [unit.position.distance_to(position) for unit in units]
+
+
+def create_unit(tag, type_id, x, y, health=45, weapon_cooldown=0):
+    return SimpleNamespace(
+        tag=tag,
+        type_id=type_id,
+        position=Point2((x, y)),
+        _proto=SimpleNamespace(pos=SimpleNamespace(x=x, y=y)),
+        radius=0.5,
+        health=health,
+        shield=0,
+        is_flying=False,
+        can_be_attacked=True,
+        weapon_cooldown=weapon_cooldown,
+        attack=MagicMock(),
+    )
+
+
+class TestArmyControlManager(unittest.IsolatedAsyncioTestCase):
+    """Tests the single-pass distribution of the army to micro-controllers."""
+
+    def setUp(self):
+        self.bot = FakeBot()
+        self.manager = ArmyControlManager(self.bot)
+        self.contexts = {}
+        for controller in self.manager.controllers:
+            controller.execute = MagicMock(
+                side_effect=lambda context, c=controller: self._record(c, context)
+            )
+        self.cache = FakeCache()
+        self.cache.enemy_units = Units([], self.bot)
+        self.cache.weapon_table = WeaponTable(self.bot.game_data)
+        self.plan = FramePlan()
+        self.plan.rally_point = Point2((5, 5))
+
+    def _record(self, controller, context):
+        self.contexts[controller] = (context.units_to_control.tags, context)
+        return [], context.units_to_control.tags
+
+    def controller_for(self, type_id):
+        return self.manager.controller_of_type[type_id]
+
+    def add_squad(self, squad_id, units, target=Point2((50, 50))):
+        self.manager.create_squad(
+            squad_id, Units(units, self.bot), SquadObjective.ATTACK, target
+        )
+
+    async def test_runs_each_controller_once_with_only_its_units(self):
+        marines = [create_unit(i, UnitTypeId.MARINE, 10, 10) for i in range(3)]
+        sieged = create_unit(10, UnitTypeId.SIEGETANKSIEGED, 11, 10)
+        tank = create_unit(11, UnitTypeId.SIEGETANK, 12, 10)
+        self.add_squad("main_bio", marines)
+        self.add_squad("main_mech", [sieged, tank])
+        self.cache.friendly_army_units = Units(marines + [sieged, tank], self.bot)
+
+        await self.manager.execute(self.cache, self.plan, MagicMock())
+
+        marine_controller = self.controller_for(UnitTypeId.MARINE)
+        tank_controller = self.controller_for(UnitTypeId.SIEGETANK)
+        self.assertEqual(self.contexts[marine_controller][0], {0, 1, 2})
+        self.assertEqual(self.contexts[tank_controller][0], {10, 11})
+        marine_controller.execute.assert_called_once()
+        tank_controller.execute.assert_called_once()
+        ran = [c for c in self.manager.controllers if c.execute.called]
+        self.assertCountEqual(ran, [marine_controller, tank_controller])
+        # Other squads are passed along for coordination.
+        _, context = self.contexts[tank_controller]
+        self.assertEqual(context.bio_squad.tags, {0, 1, 2})
+
+    async def test_squads_follow_their_surviving_units(self):
+        marines = [create_unit(i, UnitTypeId.MARINE, 10, 10) for i in range(3)]
+        self.add_squad("main_bio", marines)
+        self.add_squad("harass", [create_unit(20, UnitTypeId.REAPER, 30, 30)])
+        self.cache.friendly_army_units = Units(marines[:2], self.bot)
+
+        await self.manager.execute(self.cache, self.plan, MagicMock())
+
+        self.assertEqual(self.manager.squads["main_bio"].tags, {0, 1})
+        self.assertNotIn("harass", self.manager.squads)
+
+    async def test_create_squad_moves_units_without_duplicates(self):
+        marines = [create_unit(i, UnitTypeId.MARINE, 10, 10) for i in range(3)]
+        self.add_squad("main_bio", marines)
+        self.add_squad("main_bio", marines[:2])
+        self.add_squad("harass", marines[2:])
+        self.cache.friendly_army_units = Units(marines, self.bot)
+
+        await self.manager.execute(self.cache, self.plan, MagicMock())
+
+        self.assertEqual(self.manager.squads["main_bio"].units.tags, {0, 1})
+        self.assertEqual(len(self.manager.squads["main_bio"].units), 2)
+        self.assertEqual(self.manager.roster.squad_of(2), "harass")
+
+    async def test_dissolved_squads_release_their_units(self):
+        marine = create_unit(1, UnitTypeId.MARINE, 10, 10)
+        self.add_squad("harass", [marine])
+        self.cache.friendly_army_units = Units([], self.bot)
+
+        await self.manager.execute(self.cache, self.plan, MagicMock())
+
+        self.assertNotIn(1, self.manager.roster)
+
+    async def test_forms_squads_from_units_of_no_squad(self):
+        west = [create_unit(i, UnitTypeId.MARINE, 10, 10 + i) for i in range(3)]
+        east = [create_unit(10 + i, UnitTypeId.MARINE, 60, 10 + i) for i in range(3)]
+        self.cache.friendly_army_units = Units(west + east, self.bot)
+        self.plan.target_location = Point2((80, 80))
+
+        await self.manager.execute(self.cache, self.plan, MagicMock())
+
+        formed = self.manager.formed_squads
+        self.assertEqual(
+            sorted(sorted(squad.units.tags) for squad in formed.values()),
+            [[0, 1, 2], [10, 11, 12]],
+        )
+        for squad in formed.values():
+            self.assertEqual(squad.target, Point2((80, 80)))
+            self.assertEqual(squad.objective, SquadObjective.DEFEND)
+        self.assertEqual(self.controller_for(UnitTypeId.MARINE).execute.call_count, 2)
+
+    async def test_formed_squads_keep_their_ids(self):
+        marines = [create_unit(i, UnitTypeId.MARINE, 10, 10 + i) for i in range(3)]
+        self.cache.friendly_army_units = Units(marines, self.bot)
+
+        await self.manager.execute(self.cache, self.plan, MagicMock())
+        first = set(self.manager.formed_squads)
+        await self.manager.execute(self.cache, self.plan, MagicMock())
+
+        self.assertEqual(set(self.manager.formed_squads), first)
+
+    async def test_shares_the_enemy_neighbourhood_of_the_squad(self):
+        marines = [
+            create_unit(1, UnitTypeId.MARINE, 0, 0),
+            create_unit(2, UnitTypeId.MARINE, 10, 0),
+        ]
+        near = create_unit(100, UnitTypeId.ZERGLING, 18, 0)
+        far = create_unit(101, UnitTypeId.ZERGLING, 60, 0)
+        self.add_squad("main_bio", marines)
+        self.cache.friendly_army_units = Units(marines, self.bot)
+        self.cache.enemy_units = Units([near, far], self.bot)
+
+        await self.manager.execute(self.cache, self.plan, MagicMock())
+
+        _, context = self.contexts[self.controller_for(UnitTypeId.MARINE)]
+        self.assertEqual(context.nearby_enemies.tags, {100})
+        # A marine at the edge of the squad sees the same enemies it would
+        # find among every known enemy.
+        self.assertEqual(context.enemies_near(15, Point2((10, 0))).tags, {100})
+
+    async def test_distributes_fire_without_overkill_across_the_army(self):
+        marines = [create_unit(i, UnitTypeId.MARINE, 0, i * 0.5) for i in range(4)]
+        reloading = create_unit(9, UnitTypeId.MARINE, 0, 2, weapon_cooldown=10)
+        # Two shots kill the wounded zergling; the rest go to the other one.
+        wounded = create_unit(100, UnitTypeId.ZERGLING, 3, 0, health=12)
+        healthy = create_unit(101, UnitTypeId.ZERGLING, 3, 1, health=35)
+        self.add_squad("main_bio", marines + [reloading])
+        self.cache.friendly_army_units = Units(marines + [reloading], self.bot)
+        self.cache.enemy_units = Units([wounded, healthy], self.bot)
+
+        await self.manager.execute(self.cache, self.plan, MagicMock())
+
+        _, context = self.contexts[self.controller_for(UnitTypeId.MARINE)]
+        assigned = {tag: target.tag for tag, target in context.assigned_targets.items()}
+        self.assertEqual(sorted(assigned.values()), [100, 100, 101, 101])
+        self.assertNotIn(9, assigned)
+
+
+class TestMicroContext(unittest.TestCase):
+    """Tests enemy lookups through the shared squad neighbourhood."""
+
+    def setUp(self):
+        self.bot = FakeBot()
+        self.cache = MagicMock()
+        self.cache.enemy_units = Units(
+            [
+                create_unit(1, UnitTypeId.ZERGLING, 5, 0),
+                create_unit(2, UnitTypeId.ZERGLING, 30, 0),
+            ],
+            self.bot,
+        )
+
+    def create_context(self, nearby_enemies):
+        return MicroContext(
+            units_to_control=Units([], self.bot),
+            target=Point2((0, 0)),
+            cache=self.cache,
+            plan=FramePlan(),
+            nearby_enemies=nearby_enemies,
+            neighbourhood_center=Point2((0, 0)),
+            neighbourhood_radius=20,
+        )
+
+    def test_uses_the_neighbourhood_when_the_circle_fits_inside(self):
+        neighbourhood = Units([self.cache.enemy_units[0]], self.bot)
+        context = self.create_context(neighbourhood)
+        self.cache.enemy_units = MagicMock()
+
+        self.assertEqual(context.enemies_near(10, Point2((5, 0))).tags, {1})
+        self.cache.enemy_units.closer_than.assert_not_called()
+
+    def test_falls_back_to_all_enemies_outside_the_neighbourhood(self):
+        context = self.create_context(Units([], self.bot))
+
+        self.assertEqual(context.enemies_near(10, Point2((25, 0))).tags, {2})
+
+    def test_falls_back_to_all_enemies_without_a_neighbourhood(self):
+        context = self.create_context(None)
+
+        self.assertEqual(context.enemies_near(10, Point2((0, 0))).tags, {1})
+
+    def test_retreat_positions_come_from_the_retreat_field(self):
+        context = self.create_context(None)
+        units = Units(
+            [
+                create_unit(10, UnitTypeId.MARINE, 2, 0),
+                create_unit(11, UnitTypeId.MARINE, 3, 0),
+            ],
+            self.bot,
+        )
+        self.cache.retreat_field = MagicMock()
+        self.cache.retreat_field.retreat_points.return_value = [Point2((0, 5)), None]
+
+        points = context.retreat_positions(units, 5, self.cache.enemy_units)
+
+        self.cache.retreat_field.retreat_points.assert_called_once()
+        self.assertEqual(points[0], Point2((0, 5)))
+        # Without a way out in the field, step away from the threats' center.
+        self.assertLess(points[1].x, 3)
+
+    def test_retreat_positions_without_a_field_step_away_from_threats(self):
+        context = self.create_context(None)
+        self.cache.retreat_field = None
+        marine = create_unit(10, UnitTypeId.MARINE, 5, 5)
+        zergling = create_unit(20, UnitTypeId.ZERGLING, 5, 8)
+
+        (point,) = context.retreat_positions(
+            Units([marine], self.bot), 2, Units([zergling], self.bot)
+        )
+
+        self.assertEqual(point, Point2((5, 3)))
+
+    def test_center_comes_from_the_squad_geometry_for_the_whole_squad(self):
+        marines = Units(
+            [create_unit(i, UnitTypeId.MARINE, 2 * i, 0) for i in range(3)], self.bot
+        )
+        context = self.create_context(None)
+        context.units_to_control = marines
+        # A stand-in geometry shows where the center was read from.
+        context.squad_geometry = SquadGeometry(
+            size=3, center=Point2((9, 9)), spread=0, radius=0, health_center=None
+        )
+        self.assertEqual(context.center, Point2((9, 9)))
+
+        # Only part of the squad: measured directly.
+        context.units_to_control = Units(marines[:2], self.bot)
+        self.assertEqual(context.center, Point2((1, 0)))
+
+    def test_main_army_center_prefers_bio(self):
+        context = self.create_context(None)
+        self.assertIsNone(context.main_army_center)
+        context.mech_geometry = SquadGeometry.of(
+            Units([create_unit(1, UnitTypeId.THOR, 10, 0)], self.bot)
+        )
+        self.assertEqual(context.main_army_center, Point2((10, 0)))
+        context.bio_geometry = SquadGeometry.of(
+            Units([create_unit(2, UnitTypeId.MARINE, 0, 10)], self.bot)
+        )
+        self.assertEqual(context.main_army_center, Point2((0, 10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
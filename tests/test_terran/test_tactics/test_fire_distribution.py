@@ -0,0 +1,149 @@
+import random
+import time
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+
+from core.utilities.unit_arrays import UnitArrays
+from terran.tactics.fire_distribution import FireDistribution
+
+U = UnitTypeId
+
+# A 150 versus 150 fight is meant to take under a millisecond on a desktop
+# core; the budget leaves room for slower test machines.
+BATTLE_SIZE = 150
+ASSIGN_BUDGET_SECONDS = 0.002
+TIMED_RUNS = 20
+
+
+class FakeWeaponTable:
+    """Damage per shot by attacker type; one range for everybody."""
+
+    def __init__(self, damage, weapon_range=5):
+        self.damage = damage
+        self.weapon_range = weapon_range
+
+    def matrices(self, attackers, targets):
+        per_attacker = np.array(
+            [self.damage[u.type_id] for u in attackers.units], dtype=np.float32
+        )
+        damage = np.repeat(per_attacker[:, None], len(targets), axis=1)
+        return damage, np.ones_like(damage), np.full_like(damage, self.weapon_range)
+
+
+def create_unit(tag, type_id, x, y, health=45, weapon_cooldown=0):
+    return SimpleNamespace(
+        tag=tag,
+        type_id=type_id,
+        position=Point2((x, y)),
+        radius=0.5,
+        health=health,
+        shield=0,
+        can_be_attacked=True,
+        weapon_cooldown=weapon_cooldown,
+    )
+
+
+class TestFireDistribution(unittest.TestCase):
+    """Tests the army-wide, overkill-aware choice of targets."""
+
+    def setUp(self):
+        self.distribution = FireDistribution()
+        self.table = FakeWeaponTable({U.MARINE: 6, U.SIEGETANKSIEGED: 40})
+
+    def assign(self, units, enemies, focus=()):
+        targets = self.distribution.assign(
+            UnitArrays(units),
+            UnitArrays(enemies),
+            self.table,
+            [target.tag for target in focus],
+        )
+        return {tag: target.tag for tag, target in targets.items()}
+
+    def test_damage_on_each_enemy_just_exceeds_its_health(self):
+        marines = [create_unit(i, U.MARINE, 0, i * 0.1) for i in range(12)]
+        zerglings = [
+            create_unit(100 + i, U.ZERGLING, 3, i * 0.2, health=35) for i in range(3)
+        ]
+
+        shots = list(self.assign(marines, zerglings).values())
+
+        # Six marine shots kill a zergling: twelve kill two, rather than
+        # wounding all three.
+        self.assertEqual(len(shots), 12)
+        self.assertEqual(sorted(shots.count(tag) for tag in set(shots)), [6, 6])
+
+    def test_one_big_hitter_kills_alone(self):
+        tank = create_unit(1, U.SIEGETANKSIEGED, 0, 0)
+        marine = create_unit(2, U.MARINE, 0, 1)
+        zergling = create_unit(100, U.ZERGLING, 3, 0, health=35)
+        roach = create_unit(101, U.ROACH, 3, 1, health=145)
+
+        self.assertEqual(
+            self.assign([tank, marine], [zergling, roach]), {1: 100, 2: 101}
+        )
+
+    def test_focus_fire_targets_are_served_first(self):
+        marines = [create_unit(i, U.MARINE, 0, 0) for i in range(3)]
+        zergling = create_unit(100, U.ZERGLING, 3, 0, health=5)
+        queen = create_unit(101, U.QUEEN, 3, 1, health=175)
+
+        # One shot finishes the zergling, the others are not wasted on it.
+        self.assertEqual(
+            sorted(self.assign(marines, [zergling, queen]).values()), [100, 101, 101]
+        )
+        self.assertEqual(
+            set(self.assign(marines, [zergling, queen], [queen]).values()), {101}
+        )
+
+    def test_only_loaded_weapons_and_enemies_in_reach_count(self):
+        loaded = create_unit(1, U.MARINE, 0, 0)
+        reloading = create_unit(2, U.MARINE, 0, 0, weapon_cooldown=12)
+        stranded = create_unit(3, U.MARINE, 30, 30)
+        zergling = create_unit(100, U.ZERGLING, 3, 0)
+
+        self.assertEqual(
+            self.assign([loaded, reloading, stranded], [zergling]), {1: 100}
+        )
+        self.assertEqual(self.assign([reloading], [zergling]), {})
+        self.assertEqual(self.assign([loaded], []), {})
+
+    def test_a_150_versus_150_fight_is_distributed_within_budget(self):
+        rng = random.Random(0)
+        army = [
+            create_unit(
+                i,
+                rng.choice([U.MARINE, U.SIEGETANKSIEGED]),
+                rng.uniform(0, 10),
+                rng.uniform(0, 20),
+            )
+            for i in range(BATTLE_SIZE)
+        ]
+        enemies = [
+            create_unit(
+                1000 + i,
+                rng.choice([U.ZERGLING, U.ROACH, U.HYDRALISK]),
+                rng.uniform(8, 18),
+                rng.uniform(0, 20),
+            )
+            for i in range(BATTLE_SIZE)
+        ]
+        # As in a game: the frame's columns are read once, by the cache.
+        units, enemy_arrays = UnitArrays(army), UnitArrays(enemies)
+        self.distribution.assign(units, enemy_arrays, self.table)
+
+        fastest = float("inf")
+        for _ in range(TIMED_RUNS):
+            start = time.perf_counter()
+            targets = self.distribution.assign(units, enemy_arrays, self.table)
+            fastest = min(fastest, time.perf_counter() - start)
+
+        self.assertGreater(len(targets), BATTLE_SIZE // 2)
+        self.assertLess(fastest, ASSIGN_BUDGET_SECONDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
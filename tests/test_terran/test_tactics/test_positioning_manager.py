@@ -0,0 +1,78 @@
+import unittest
+from unittest.mock import MagicMock
+
+from sc2.position import Point2
+
+from core.utilities.constants import GAME_LOOPS_PER_SECOND
+from terran.tactics.positioning_manager import (
+    STAGING_DISTANCE_FROM_TARGET,
+    STAGING_REPLAN_SECONDS,
+    PositioningManager,
+)
+
+TARGET = Point2((100, 50))
+
+
+class TestStagingRoute(unittest.TestCase):
+    """Tests that the staging point follows a route planned only now and then."""
+
+    def setUp(self):
+        self.manager = PositioningManager(MagicMock())
+        self.cache = MagicMock()
+        self.cache.game_loop = 0
+        # Around a wall: up, then across to the target.
+        self.cache.pathfinder.find_path.side_effect = lambda start, goal: [
+            Point2((start.x, 80)),
+            goal,
+        ]
+
+    def stage(self, army_center, target=TARGET):
+        return self.manager._staging_point_on_route(self.cache, army_center, target)
+
+    def searches(self):
+        return self.cache.pathfinder.find_path.call_count
+
+    def test_stages_along_the_route_short_of_the_target(self):
+        point = self.stage(Point2((10, 50)))
+
+        self.assertAlmostEqual(point.distance_to(TARGET), STAGING_DISTANCE_FROM_TARGET)
+        self.assertGreater(point.y, 50)
+
+    def test_route_is_reused_while_the_army_follows_it(self):
+        self.stage(Point2((10, 50)))
+        self.cache.game_loop = 100
+        # Partway up the first leg, and a little off it.
+        self.stage(Point2((13, 65)))
+
+        self.assertEqual(self.searches(), 1)
+
+    def test_route_is_planned_again_when_the_army_strays(self):
+        self.stage(Point2((10, 50)))
+        self.stage(Point2((40, 20)))
+
+        self.assertEqual(self.searches(), 2)
+
+    def test_route_is_planned_again_for_a_new_target_or_after_a_while(self):
+        self.stage(Point2((10, 50)))
+        self.stage(Point2((10, 50)), target=Point2((100, 20)))
+        self.assertEqual(self.searches(), 2)
+
+        self.cache.game_loop = STAGING_REPLAN_SECONDS * GAME_LOOPS_PER_SECOND
+        self.stage(Point2((10, 50)), target=Point2((100, 20)))
+        self.assertEqual(self.searches(), 3)
+
+    def test_straight_line_when_there_is_no_route(self):
+        self.cache.pathfinder.find_path.side_effect = None
+        self.cache.pathfinder.find_path.return_value = []
+
+        point = self.stage(Point2((10, 50)))
+        self.stage(Point2((10, 50)))
+
+        self.assertEqual(
+            point, TARGET.towards(Point2((10, 50)), STAGING_DISTANCE_FROM_TARGET)
+        )
+        self.assertEqual(self.searches(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
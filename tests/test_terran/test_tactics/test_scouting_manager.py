@@ -0,0 +1,67 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sc2.position import Point2
+
+from core.utilities.constants import GAME_LOOPS_PER_SECOND
+from terran.tactics.scouting_manager import SCOUT_REPLAN_SECONDS, ScoutingManager
+
+TARGET = Point2((100, 50))
+
+
+def create_scout(x, y):
+    position = Point2((x, y))
+    return SimpleNamespace(
+        position=position, is_flying=False, distance_to=position.distance_to
+    )
+
+
+class TestScoutRoute(unittest.TestCase):
+    """Tests that the scout follows a route planned only now and then."""
+
+    def setUp(self):
+        self.manager = ScoutingManager(MagicMock())
+        self.cache = MagicMock()
+        self.cache.game_loop = 0
+        # Around a wall: up, then across to the target.
+        self.cache.pathfinder.find_path.side_effect = lambda start, goal, air: [
+            Point2((start.x, 80)),
+            goal,
+        ]
+
+    def waypoint(self, scout, target=TARGET):
+        return self.manager._next_waypoint(scout, target, self.cache)
+
+    def searches(self):
+        return self.cache.pathfinder.find_path.call_count
+
+    def test_follows_the_route_while_the_threat_maps_change(self):
+        self.assertEqual(self.waypoint(create_scout(10, 50)), Point2((10, 80)))
+        for frame in range(1, 20):
+            # Moving enemies change the threat maps every frame.
+            self.cache.pathfinder.version = frame
+            self.cache.game_loop = frame
+            waypoint = self.waypoint(create_scout(10, 50 + frame * 1.6))
+
+        self.assertEqual(waypoint, TARGET)
+        self.assertEqual(self.searches(), 1)
+
+    def test_route_is_planned_again_when_the_scout_strays(self):
+        self.waypoint(create_scout(10, 50))
+        self.waypoint(create_scout(30, 40))
+
+        self.assertEqual(self.searches(), 2)
+
+    def test_route_is_planned_again_for_a_new_target_or_after_a_while(self):
+        self.waypoint(create_scout(10, 50))
+        self.waypoint(create_scout(10, 50), target=Point2((100, 20)))
+        self.assertEqual(self.searches(), 2)
+
+        self.cache.game_loop = SCOUT_REPLAN_SECONDS * GAME_LOOPS_PER_SECOND
+        self.waypoint(create_scout(10, 50), target=Point2((100, 20)))
+        self.assertEqual(self.searches(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
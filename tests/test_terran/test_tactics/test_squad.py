@@ -0,0 +1,57 @@
+# tests/test_terran/test_tactics/test_squad.py
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sc2.position import Point2
+from sc2.units import Units
+
+from terran.tactics.squad import Squad, SquadGeometry, SquadObjective
+
+
+def create_unit(tag, x, y, health=45):
+    return SimpleNamespace(tag=tag, position=Point2((x, y)), health=health, shield=0)
+
+
+class TestSquadGeometry(unittest.TestCase):
+    def setUp(self):
+        self.bot = MagicMock()
+
+    def test_measures_the_units_once(self):
+        units = Units(
+            [create_unit(1, 0, 0), create_unit(2, 4, 0, health=135)], self.bot
+        )
+        geometry = SquadGeometry.of(units, Point2((10, 0)))
+
+        self.assertEqual(geometry.size, 2)
+        self.assertEqual(geometry.center, Point2((2, 0)))
+        self.assertAlmostEqual(geometry.spread, 2.0)
+        self.assertAlmostEqual(geometry.radius, 2.0)
+        # Three quarters of the health stands at x = 4.
+        self.assertEqual(geometry.health_center, Point2((3, 0)))
+        self.assertEqual(geometry.front.tag, 2)
+
+    def test_no_front_without_a_target(self):
+        units = Units([create_unit(1, 0, 0)], self.bot)
+        self.assertIsNone(SquadGeometry.of(units).front)
+
+    def test_squad_caches_its_geometry_until_invalidated(self):
+        squad = Squad(
+            "bio", Units([create_unit(1, 0, 0)], self.bot), SquadObjective.ATTACK
+        )
+        first = squad.geometry
+        self.assertIs(squad.geometry, first)
+
+        squad.units = Units([create_unit(1, 6, 0)], self.bot)
+        self.assertIs(squad.geometry, first)
+        squad.invalidate_geometry()
+        self.assertEqual(squad.center, Point2((6, 0)))
+
+    def test_empty_squad_has_no_geometry(self):
+        squad = Squad("bio", Units([], self.bot))
+        self.assertIsNone(squad.geometry)
+        self.assertIsNone(squad.center)
+
+
+if __name__ == "__main__":
+    unittest.main()
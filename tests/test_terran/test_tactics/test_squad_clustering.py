@@ -0,0 +1,101 @@
+# tests/test_terran/test_tactics/test_squad_clustering.py
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+from sc2.position import Point2
+
+from terran.tactics.squad_clustering import SquadClusterer, grid_dbscan
+
+
+def create_unit(tag, x, y):
+    return SimpleNamespace(tag=tag, position=Point2((x, y)))
+
+
+def tag_groups(clusters):
+    return sorted(sorted(unit.tag for unit in cluster.units) for cluster in clusters)
+
+
+class TestGridDbscan(unittest.TestCase):
+    def test_separated_groups_are_separate_clusters(self):
+        points = np.array([(0, 0), (1, 0), (0, 1), (50, 50), (51, 50), (50, 51)])
+        labels = grid_dbscan(points, 4.0, 3)
+        self.assertEqual(len(set(labels[:3])), 1)
+        self.assertEqual(len(set(labels[3:])), 1)
+        self.assertNotEqual(labels[0], labels[3])
+
+    def test_chain_across_cells_is_one_cluster(self):
+        points = np.array([(x * 3.0, 0.0) for x in range(20)])
+        labels = grid_dbscan(points, 4.0, 3)
+        self.assertEqual(set(labels.tolist()), {0})
+
+    def test_isolated_points_get_labels_of_their_own(self):
+        points = np.array([(0, 0), (1, 0), (0, 1), (30, 0), (0, 30)])
+        labels = grid_dbscan(points, 4.0, 3)
+        self.assertEqual(len(set(labels.tolist())), 3)
+        self.assertNotEqual(labels[3], labels[4])
+
+    def test_border_point_joins_its_anchor(self):
+        # The last point has one neighbour and anchors nothing itself.
+        points = np.array([(0, 0), (1, 0), (2, 0), (5, 0)])
+        labels = grid_dbscan(points, 3.5, 3)
+        self.assertEqual(set(labels.tolist()), {0})
+
+    def test_matches_brute_force_neighbours(self):
+        rng = np.random.default_rng(3)
+        points = rng.uniform(0, 40, size=(200, 2))
+        labels = grid_dbscan(points, 4.0, 3)
+        distances = np.sqrt(((points[:, None] - points[None]) ** 2).sum(axis=2))
+        close = distances <= 4.0
+        anchors = close.sum(axis=1) >= 3
+        # Neighbouring anchors always share a cluster.
+        i, j = np.nonzero(close & anchors[:, None] & anchors[None, :])
+        self.assertTrue((labels[i] == labels[j]).all())
+
+
+class TestSquadClusterer(unittest.TestCase):
+    def setUp(self):
+        self.clusterer = SquadClusterer(radius=4.0, min_neighbours=3)
+
+    def test_geometry_of_each_squad(self):
+        units = [create_unit(1, 0, 0), create_unit(2, 2, 0), create_unit(3, 1, 0)]
+        (cluster,) = self.clusterer.cluster(units)
+        self.assertEqual(cluster.center, Point2((1, 0)))
+        self.assertAlmostEqual(cluster.radius, 1.0)
+
+    def test_no_units_no_squads(self):
+        self.assertEqual(self.clusterer.cluster([]), [])
+
+    def test_ids_persist_across_frames(self):
+        west = [create_unit(i, 0, i) for i in range(3)]
+        east = [create_unit(10 + i, 50, i) for i in range(3)]
+        first = {c.id: c.units for c in self.clusterer.cluster(west + east)}
+        # The units move, and a new one arrives.
+        moved = [create_unit(i, 5, i) for i in range(3)] + [create_unit(3, 5, 3)]
+        second = {c.id: c.units for c in self.clusterer.cluster(moved + east)}
+        west_id = next(key for key, units in first.items() if units[0].tag == 0)
+        self.assertEqual(sorted(unit.tag for unit in second[west_id]), [0, 1, 2, 3])
+        self.assertEqual(set(first), set(second))
+
+    def test_merged_squad_keeps_the_id_of_the_bigger_part(self):
+        big = [create_unit(i, 0, i) for i in range(5)]
+        small = [create_unit(10 + i, 50, i) for i in range(3)]
+        first = {c.units[0].tag: c.id for c in self.clusterer.cluster(big + small)}
+        together = [create_unit(10 + i, 1, i) for i in range(3)]
+        (merged,) = self.clusterer.cluster(big + together)
+        self.assertEqual(merged.id, first[0])
+
+    def test_split_squad_hands_its_id_to_the_bigger_half(self):
+        units = [create_unit(i, 0, i) for i in range(8)]
+        (whole,) = self.clusterer.cluster(units)
+        apart = units[:5] + [create_unit(5 + i, 50, i) for i in range(3)]
+        halves = {c.id: c for c in self.clusterer.cluster(apart)}
+        self.assertEqual(len(halves), 2)
+        self.assertEqual(
+            sorted(unit.tag for unit in halves[whole.id].units), [0, 1, 2, 3, 4]
+        )
+        self.assertEqual(tag_groups(halves.values()), [[0, 1, 2, 3, 4], [5, 6, 7]])
+
+
+if __name__ == "__main__":
+    unittest.main()
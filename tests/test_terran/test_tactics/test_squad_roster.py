@@ -0,0 +1,65 @@
+# tests/test_terran/test_tactics/test_squad_roster.py
+import unittest
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+
+from core.utilities.events import Event, EventType, UnitDestroyedPayload
+from terran.tactics.squad_roster import SquadRoster
+
+
+class TestSquadRoster(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.roster = SquadRoster()
+
+    def test_assign_indexes_both_ways(self):
+        self.roster.assign([1, 2], "bio")
+        self.roster.assign([3], "mech")
+
+        self.assertEqual(self.roster.squad_of(1), "bio")
+        self.assertEqual(self.roster.tags("bio"), {1, 2})
+        self.assertEqual(self.roster.tags("mech"), {3})
+        self.assertIsNone(self.roster.squad_of(4))
+        self.assertEqual(self.roster.tags("air"), set())
+        self.assertEqual(len(self.roster), 3)
+
+    def test_reassigning_moves_the_unit(self):
+        self.roster.assign([1, 2], "bio")
+        self.roster.assign([2, 2], "harass")
+
+        self.assertEqual(self.roster.squad_of(2), "harass")
+        self.assertEqual(self.roster.tags("bio"), {1})
+        self.assertEqual(self.roster.tags("harass"), {2})
+
+    def test_squad_left_by_everyone_is_forgotten(self):
+        self.roster.assign([1], "bio")
+        self.roster.assign([1], "harass")
+        self.roster.release([1])
+
+        self.assertNotIn(1, self.roster)
+        self.assertEqual(self.roster.tags("bio"), set())
+        self.assertEqual(self.roster.tags("harass"), set())
+
+    def test_dissolve_releases_all_units(self):
+        self.roster.assign([1, 2], "bio")
+        self.roster.assign([3], "mech")
+
+        self.assertEqual(self.roster.dissolve("bio"), {1, 2})
+        self.assertNotIn(1, self.roster)
+        self.assertEqual(self.roster.squad_of(3), "mech")
+        self.assertEqual(self.roster.dissolve("bio"), set())
+
+    async def test_destroyed_units_leave_their_squad(self):
+        self.roster.assign([1, 2], "bio")
+        event = Event(
+            EventType.UNIT_DESTROYED,
+            UnitDestroyedPayload(1, UnitTypeId.MARINE, Point2((0, 0))),
+        )
+
+        await self.roster.handle_unit_destroyed(event)
+
+        self.assertNotIn(1, self.roster)
+        self.assertEqual(self.roster.tags("bio"), {2})
+
+
+if __name__ == "__main__":
+    unittest.main()
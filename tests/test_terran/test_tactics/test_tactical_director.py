@@ -0,0 +1,108 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+from sc2.units import Units
+
+from core.frame_plan import ArmyStance, FramePlan
+from core.utilities.combat_simulator import CombatSimulator
+from core.utilities.ground_distance import GroundDistanceOracle
+from core.utilities.weapon_table import WeaponTable
+from terran.tactics.tactical_director import TacticalDirector
+from tests.test_core.test_weapon_table import fake_game_data
+
+U = UnitTypeId
+
+
+def create_unit(type_id, health):
+    return SimpleNamespace(
+        type_id=type_id,
+        is_flying=False,
+        attack_upgrade_level=0,
+        armor_upgrade_level=0,
+        health=health,
+        shield=0,
+    )
+
+
+class TestTacticalDirectorStance(unittest.TestCase):
+    """Tests attack and retreat decisions driven by the combat simulator."""
+
+    def setUp(self):
+        self.bot = MagicMock()
+        self.bot.enemy_start_locations = [Point2((100, 100))]
+        self.director = TacticalDirector(self.bot)
+        self.cache = MagicMock()
+        self.cache.base_is_under_attack = False
+        self.cache.supply_used = 60
+        self.cache.friendly_army_value = 0
+        self.cache.known_enemy_townhalls.exists = False
+        self.cache.known_enemy_structures.exists = False
+        self.cache.combat_simulator = CombatSimulator(WeaponTable(fake_game_data()))
+        self.cache.ground_distance = GroundDistanceOracle()
+        self.plan = FramePlan()
+
+    def set_armies(self, marines, zerglings, drones=0):
+        self.cache.friendly_army_units = Units(
+            [create_unit(U.MARINE, 45) for _ in range(marines)], self.bot
+        )
+        self.cache.enemy_units = Units(
+            [create_unit(U.ZERGLING, 35) for _ in range(zerglings)]
+            + [create_unit(U.DRONE, 40) for _ in range(drones)],
+            self.bot,
+        )
+
+    def decide(self):
+        self.director._determine_stance_and_target(self.cache, self.plan)
+        return self.plan.army_stance
+
+    def test_attacks_when_the_fight_is_won_comfortably(self):
+        self.set_armies(marines=20, zerglings=10, drones=30)
+
+        self.assertEqual(self.decide(), ArmyStance.AGGRESSIVE)
+        self.assertEqual(self.plan.target_location, Point2((100, 100)))
+
+    def test_holds_back_from_a_narrow_or_lost_fight(self):
+        self.set_armies(marines=10, zerglings=15)
+        self.assertEqual(self.decide(), ArmyStance.DEFENSIVE)
+
+        self.set_armies(marines=5, zerglings=20)
+        self.assertEqual(self.decide(), ArmyStance.DEFENSIVE)
+
+    def test_attack_is_called_off_once_the_fight_turns(self):
+        self.plan.set_army_stance(ArmyStance.AGGRESSIVE)
+        self.set_armies(marines=10, zerglings=15)
+        # Still won, though not by enough to start an attack.
+        self.assertEqual(self.decide(), ArmyStance.AGGRESSIVE)
+
+        self.set_armies(marines=10, zerglings=16)
+        self.assertEqual(self.decide(), ArmyStance.DEFENSIVE)
+
+    def test_an_unopposed_attack_needs_an_army_worth_sending(self):
+        self.set_armies(marines=5, zerglings=0, drones=10)
+        self.cache.friendly_army_value = 250
+        self.assertEqual(self.decide(), ArmyStance.DEFENSIVE)
+
+        self.cache.friendly_army_value = 2000
+        self.assertEqual(self.decide(), ArmyStance.AGGRESSIVE)
+
+    def test_attacks_the_enemy_base_closest_on_foot(self):
+        self.bot.start_location = Point2((10.5, 10.5))
+        # A cliff runs between our base and the nearer enemy base.
+        pathable = np.ones((60, 60), bool)
+        pathable[20, :50] = False
+        self.cache.ground_distance.build(pathable, [self.bot.start_location])
+        behind_cliff = SimpleNamespace(position=Point2((25.5, 10.5)))
+        around = SimpleNamespace(position=Point2((10.5, 40.5)))
+        self.cache.known_enemy_townhalls = Units([behind_cliff, around], self.bot)
+        self.set_armies(marines=20, zerglings=10)
+
+        self.assertEqual(self.decide(), ArmyStance.AGGRESSIVE)
+        self.assertEqual(self.plan.target_location, around.position)
+
+
+if __name__ == "__main__":
+    unittest.main()